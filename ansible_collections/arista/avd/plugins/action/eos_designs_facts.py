@@ -18,10 +18,15 @@ PLUGIN_NAME = "arista.avd.eos_designs_facts"
 
 try:
     from pyavd._eos_designs.eos_designs_facts import EosDesignsFacts
+    from pyavd._eos_designs.eos_designs_facts.uplink_peers_index import UplinkPeersIndex
+    from pyavd._eos_designs.eos_designs_facts.vteps_index import get_avd_vteps
     from pyavd._eos_designs.shared_utils import SharedUtils
+    from pyavd._eos_designs.shared_utils.connected_endpoints_index import ConnectedEndpointsIndex
+    from pyavd._eos_designs.shared_utils.fabric_facts import FabricFacts
+    from pyavd._eos_designs.shared_utils.tenants_index import TenantsIndex
     from pyavd._errors import AristaAvdError
 except ImportError as e:
-    EosDesignsFacts = SharedUtils = RaiseOnUse(
+    EosDesignsFacts = SharedUtils = UplinkPeersIndex = ConnectedEndpointsIndex = FabricFacts = TenantsIndex = get_avd_vteps = RaiseOnUse(
         AnsibleActionFail(
             f"The '{PLUGIN_NAME}' plugin requires the 'pyavd' Python library. Got import error",
             orig_exc=e,
@@ -93,6 +98,7 @@ class ActionModule(ActionBase):
             "avd_switch_facts": avd_switch_facts,
             "avd_overlay_peers": avd_overlay_peers,
             "avd_topology_peers": avd_topology_peers,
+            "avd_vteps": get_avd_vteps(avd_switch_facts),
         }
 
         if cprofile_file:
@@ -139,6 +145,14 @@ class ActionModule(ActionBase):
         )
 
         avd_switch_facts = {}
+        # Reverse index of uplink peers shared by all devices. Built on first use when all devices are added to avd_switch_facts.
+        avd_uplink_peers_index = UplinkPeersIndex(avd_switch_facts)
+        # Index of connected endpoints per switch shared by all devices. Devices with the same inputs share the same index.
+        avd_connected_endpoints_index = ConnectedEndpointsIndex()
+        # Facts of all devices with direct lookups and fabric-wide views shared by all devices.
+        avd_fabric_facts = FabricFacts(avd_switch_facts)
+        # Index of tenants shared by all devices. Devices with the same inputs share the same index.
+        avd_tenants_index = TenantsIndex()
         data_validation_errors = 0
         for host in fabric_hosts:
             # Fetch all templated Ansible vars for this host
@@ -158,6 +172,10 @@ class ActionModule(ActionBase):
             # Add reference to dict "avd_switch_facts".
             # This is used to access EosDesignsFacts objects of other switches during rendering of one switch.
             host_hostvars["avd_switch_facts"] = avd_switch_facts
+            host_hostvars["avd_uplink_peers_index"] = avd_uplink_peers_index
+            host_hostvars["avd_connected_endpoints_index"] = avd_connected_endpoints_index
+            host_hostvars["avd_fabric_facts"] = avd_fabric_facts
+            host_hostvars["avd_tenants_index"] = avd_tenants_index
 
             # Initialize SharedUtils class to be passed to EosDesignsFacts below.
             shared_utils = SharedUtils(hostvars=host_hostvars, templar=self.templar, schema=avdschematools.avdschema)
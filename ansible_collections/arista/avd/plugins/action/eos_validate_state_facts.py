@@ -0,0 +1,35 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from typing import Any
+
+from ansible.errors import AnsibleActionFail
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils import get_loopback_mappings
+
+
+class ActionModule(ActionBase):
+    def run(self, tmp: Any = None, task_vars: dict | None = None) -> dict:
+        self._supports_check_mode = True
+
+        if task_vars is None:
+            task_vars = {}
+
+        result = super().run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        # This is not all the hostvars, but just the Ansible Hostvars Manager object where we can retrieve hostvars for each host on-demand.
+        hostvars = task_vars["hostvars"]
+
+        try:
+            loopback_mappings = get_loopback_mappings(hostvars)
+        except Exception as error:
+            msg = f"Error during plugin execution: {error}"
+            raise AnsibleActionFail(msg) from error
+
+        # Since the plugin is run_once, Ansible sets the same fact on all hosts of the play.
+        result["ansible_facts"] = {"avd_validate_state_mappings": loopback_mappings}
+        return result
@@ -3,6 +3,8 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError, load
 from typing import TYPE_CHECKING, Any
 
@@ -14,10 +16,13 @@ from ansible_collections.arista.avd.plugins.plugin_utils.pyavd_wrappers import R
 from ansible_collections.arista.avd.plugins.plugin_utils.utils import get_validated_path, get_validated_value
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
+    from concurrent.futures import Future
     from pathlib import Path
 
 PLUGIN_NAME = "arista.avd.eos_validate_state_reports"
+MAX_WORKERS = 8
+"""Number of threads loading the test results files in parallel."""
 
 try:
     from pyavd._utils import get
@@ -30,22 +35,68 @@ except ImportError as e:
     )
 
 
-def _test_results_gen(input_path: Path) -> Generator[dict, None, None]:
-    """Generate test results from a JSON file for a specific host.
+def _load_test_results(input_path: Path) -> list[dict]:
+    """Load the test results from a JSON file for a specific host.
 
     This function opens the JSON results file created by the `eos_validate_state_runner` action plugin
-    and yields each test result as a dictionary.
+    and returns the test results.
 
     Args:
     ----
       input_path (Path): Path to the JSON file containing test results for a host.
 
+    Returns:
+    -------
+      list[dict]: Test results as dictionaries.
+    """
+    input_path = get_validated_path(path_input=input_path, parent=False)
+    with input_path.open(encoding="UTF-8") as file:
+        return load(file)
+
+
+def _test_results_gen(hosts: Iterable[str], test_results_dir: Path) -> Generator[tuple[str, list[dict] | None, Exception | None], None, None]:
+    """Generate the test results of the given hosts, loading the JSON files in parallel threads.
+
+    The results are generated in the order of the hosts. Only a limited number of files are loaded ahead
+    of the host being processed, so the results of all hosts are never held in memory at the same time.
+
+    Args:
+    ----
+      hosts (Iterable[str]): The hosts to load the test results for.
+      test_results_dir (Path): The test results directory where the results are saved by the `eos_validate_state_runner` action plugin.
+
     Yields:
     ------
-      Generator[dict, None, None]: Test result as a dictionary.
+      Generator[tuple[str, list[dict] | None, Exception | None], None, None]: The host with either its test results or the loading error.
     """
-    with input_path.open(encoding="UTF-8") as file:
-        yield from load(file)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pending = deque()
+        for host in hosts:
+            pending.append((host, executor.submit(_load_test_results, test_results_dir / f"{host}-results.json")))
+            if len(pending) > MAX_WORKERS * 2:
+                yield _pop_test_results(pending)
+        while pending:
+            yield _pop_test_results(pending)
+
+
+def _pop_test_results(pending: deque[tuple[str, Future]]) -> tuple[str, list[dict] | None, Exception | None]:
+    """Wait for the oldest pending test results file to be loaded.
+
+    The future is dropped here, so the test results are only referenced by the caller and can be released once processed.
+
+    Args:
+    ----
+      pending (deque[tuple[str, Future]]): The hosts and the futures loading their test results, in the order of the hosts.
+
+    Returns:
+    -------
+      tuple[str, list[dict] | None, Exception | None]: The host with either its test results or the loading error.
+    """
+    host, future = pending.popleft()
+    try:
+        return host, future.result(), None
+    except (JSONDecodeError, OSError, TypeError, FileNotFoundError) as error:
+        return host, None, error
 
 
 class ActionModule(ActionBase):
@@ -74,36 +125,40 @@ class ActionModule(ActionBase):
         # For now we support the existing behavior of eos_validate_state, all hosts from the play
         ansible_play_hosts_all = task_vars.get("ansible_play_hosts_all", [])
 
+        # Hosts marked as not deployed do not have any results
+        hosts = []
+        for host in sorted(ansible_play_hosts_all):
+            if not get(hostvars[host], "is_deployed", default=True):
+                display.warning(f"No test results for host {host} since 'is_deployed' is False")
+                continue
+            hosts.append(host)
+
         try:
             # Initialize an empty ResultsManager that will be used to store results and statistics
-            test_results = ResultsManager(only_failed_tests=only_failed_tests)
-            for host in sorted(ansible_play_hosts_all):
-                host_hostvars = hostvars[host]
-                # Hosts marked as not deployed do not have any results
-                if not get(host_hostvars, "is_deployed", default=True):
-                    display.warning(f"No test results for host {host} since 'is_deployed' is False")
-                    continue
-                try:
-                    # Getting the host results JSON file saved by eos_validate_state_runner action plugin
-                    result_path = get_validated_path(path_input=test_results_dir / f"{host}-results.json", parent=False)
+            with ResultsManager(only_failed_tests=only_failed_tests) as test_results:
+                # Getting the host results JSON files saved by eos_validate_state_runner action plugin
+                for host, host_results, load_error in _test_results_gen(hosts, test_results_dir):
+                    if load_error is not None:
+                        display.warning(f"Failed to load the test results of host {host}: {load_error}")
+                        continue
                     # Process the host test results
                     try:
-                        for test_result in _test_results_gen(input_path=result_path):
+                        for test_result in host_results:
                             test_results.update_results(test_result)
                     except TypeError as error:
                         display.warning(f"Failed to update the test results of host {host}: {error}")
-                except (JSONDecodeError, OSError, TypeError, FileNotFoundError) as error:
-                    display.warning(f"Failed to load the test results of host {host}: {error}")
-
-            # Generate the reports
-            if validation_report_csv:
-                with csv_report_path.open("w", encoding="UTF-8") as report_file:
-                    csv_report = CSVReport(report_file, test_results)
-                    csv_report.generate_report()
-            if validation_report_md:
-                with md_report_path.open("w", encoding="UTF-8") as report_file:
-                    md_report = MDReport(report_file, test_results)
-                    md_report.generate_report()
+                    # Release the host results before loading the next host
+                    del host_results
+
+                # Generate the reports
+                if validation_report_csv:
+                    with csv_report_path.open("w", encoding="UTF-8") as report_file:
+                        csv_report = CSVReport(report_file, test_results)
+                        csv_report.generate_report()
+                if validation_report_md:
+                    with md_report_path.open("w", encoding="UTF-8") as report_file:
+                        md_report = MDReport(report_file, test_results)
+                        md_report.generate_report()
 
         except Exception as error:
             msg = f"Error during plugin execution: {error}"
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+from asyncio import Semaphore
 from json import dump
 from typing import TYPE_CHECKING, Any
 
@@ -11,7 +12,14 @@ from ansible.errors import AnsibleActionFail
 from ansible.parsing.yaml.dumper import AnsibleDumper
 from ansible.plugins.action import ActionBase, display
 
-from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils import AnsibleEOSDevice, ConfigManager, get_anta_results
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils import (
+    AnsibleEOSDevice,
+    ConfigManager,
+    LimitedAsyncEOSDevice,
+    get_anta_results,
+    get_fabric_anta_results,
+    get_loopback_mappings,
+)
 from ansible_collections.arista.avd.plugins.plugin_utils.utils import (
     PythonToAnsibleContextFilter,
     PythonToAnsibleHandler,
@@ -27,6 +35,7 @@ LOGGER = logging.getLogger("ansible_collections.arista.avd")
 # ANTA currently add some RichHandler to the root logger so need to disable propagation
 LOGGER.propagate = False
 LOGGING_LEVELS = ["DEBUG", "INFO", "ERROR", "WARNING", "CRITICAL"]
+DEFAULT_MAX_CONCURRENCY = 100
 
 
 class AnsibleNoAliasDumper(AnsibleDumper):
@@ -52,18 +61,13 @@ class ActionModule(ActionBase):
         is_deployed = task_vars.get("is_deployed", True)
         # This is not all the hostvars, but just the Ansible Hostvars Manager object where we can retrieve hostvars for each host on-demand.
         hostvars = task_vars["hostvars"]
-
-        # Skip all tests if the device is marked as not deployed
-        if not is_deployed:
-            result["skipped"] = True
-            result["msg"] = f"Device {hostname} is marked as not deployed. Skipping all tests."
-            return result
-
-        # Setup module logging
-        setup_module_logging(hostname, result)
+        # Loopback mappings of the fabric precomputed by the eos_validate_state_facts plugin if available.
+        loopback_mappings = task_vars.get("avd_validate_state_mappings")
 
         # Get task arguments and validate them
         try:
+            single_run = get_validated_value(data=self._task.args, key="single_run", expected_type=bool, default_value=False)
+            max_concurrency = get_validated_value(data=self._task.args, key="max_concurrency", expected_type=int, default_value=DEFAULT_MAX_CONCURRENCY)
             logging_level = get_validated_value(
                 data=self._task.args,
                 key="logging_level",
@@ -73,16 +77,63 @@ class ActionModule(ActionBase):
             )
             skip_tests = get_validated_value(data=self._task.args, key="skip_tests", expected_type=list, default_value=[])
             save_catalog = get_validated_value(data=self._task.args, key="save_catalog", expected_type=bool, default_value=False)
-            catalog_path = get_validated_path(path_input=self._task.args.get("device_catalog_path"), parent=True) if save_catalog else None
+            if single_run:
+                test_catalogs_dir = get_validated_path(path_input=self._task.args.get("test_catalogs_dir"), parent=False) if save_catalog else None
+            else:
+                catalog_path = get_validated_path(path_input=self._task.args.get("device_catalog_path"), parent=True) if save_catalog else None
             test_results_dir = get_validated_path(path_input=self._task.args.get("test_results_dir"), parent=False)
             custom_anta_catalogs_dir = get_validated_path(path_input=self._task.args.get("custom_anta_catalogs_dir"), parent=False)
         except (TypeError, ValueError, FileNotFoundError) as error:
             msg = f"Failed to validate task arguments: {error}"
             raise AnsibleActionFail(msg) from error
 
+        if max_concurrency < 1:
+            msg = f"Failed to validate task arguments: 'max_concurrency' must be at least 1. Got {max_concurrency}."
+            raise AnsibleActionFail(msg)
+
+        if single_run:
+            # Setup module logging
+            setup_module_logging(hostname, result)
+
+            hostnames = [host for host in task_vars["ansible_play_hosts"] if hostvars[host].get("is_deployed", True)]
+            if skipped_hostnames := [host for host in task_vars["ansible_play_hosts"] if host not in hostnames]:
+                LOGGER.info("Devices %s are marked as not deployed. Skipping all tests for these devices.", ", ".join(skipped_hostnames))
+
+            try:
+                fabric_results = self.run_single(
+                    hostnames=hostnames,
+                    hostvars=hostvars,
+                    loopback_mappings=loopback_mappings,
+                    max_concurrency=max_concurrency,
+                    logging_level=logging_level,
+                    skip_tests=skip_tests,
+                    test_catalogs_dir=test_catalogs_dir,
+                    custom_anta_catalogs_dir=custom_anta_catalogs_dir,
+                    dry_run=ansible_check_mode,
+                )
+
+                # Write the results of each device to a JSON file
+                for device_name, anta_results in fabric_results.items():
+                    write_results(hostname=device_name, anta_results=anta_results, test_results_dir=test_results_dir)
+
+            except Exception as error:
+                msg = f"Error during plugin execution: {error}"
+                raise AnsibleActionFail(msg) from error
+
+            return result
+
+        # Skip all tests if the device is marked as not deployed
+        if not is_deployed:
+            result["skipped"] = True
+            result["msg"] = f"Device {hostname} is marked as not deployed. Skipping all tests."
+            return result
+
+        # Setup module logging
+        setup_module_logging(hostname, result)
+
         custom_anta_catalogs = get_custom_anta_catalogs(hostvars, hostname, custom_anta_catalogs_dir)
 
-        config_manager = ConfigManager(device_name=hostname, hostvars=hostvars)
+        config_manager = ConfigManager(device_name=hostname, hostvars=hostvars, loopback_mappings=loopback_mappings)
 
         try:
             anta_device = AnsibleEOSDevice(name=hostname, connection=ansible_connection, check_mode=ansible_check_mode)
@@ -107,6 +158,60 @@ class ActionModule(ActionBase):
 
         return result
 
+    def run_single(
+        self,
+        hostnames: list[str],
+        hostvars: Mapping,
+        loopback_mappings: Mapping | None,
+        max_concurrency: int,
+        logging_level: str,
+        skip_tests: list[dict],
+        test_catalogs_dir: Path | None,
+        custom_anta_catalogs_dir: Path,
+        *,
+        dry_run: bool,
+    ) -> dict[str, list[dict]]:
+        """Run ANTA for all the given devices in a single ANTA run.
+
+        The Ansible connection is only available for the host running the task, so the devices are
+        connected directly by ANTA using the same variables as the Ansible HttpApi connection plugin.
+        The number of concurrent eAPI requests across all devices is limited by `max_concurrency`.
+
+        Args:
+        ----
+          hostnames (list[str]): The inventory hostnames of the devices to test.
+          hostvars (Mapping): The Ansible Hostvars Manager object where we can retrieve hostvars for each host on-demand.
+          loopback_mappings (Mapping | None): The precomputed loopback mappings of the fabric. Computed once for all devices if not set.
+          max_concurrency (int): The maximum number of concurrent eAPI requests across all devices.
+          logging_level (str): The level at which ANTA should be logging.
+          skip_tests (list[dict]): A list of dictionary containing the categories and/or tests to skip.
+          test_catalogs_dir (Path | None): When set, the test catalog of each device is saved in this directory.
+          custom_anta_catalogs_dir (Path): The directory where the custom ANTA catalogs are stored.
+          dry_run (bool): If True, no test is actually run.
+
+        Returns:
+        -------
+          dict[str, list[dict]]: The ANTA results of each device keyed by inventory hostname.
+        """
+        semaphore = Semaphore(max_concurrency)
+        anta_devices = [LimitedAsyncEOSDevice.from_hostvars(name=hostname, hostvars=hostvars[hostname], semaphore=semaphore) for hostname in hostnames]
+        if loopback_mappings is None:
+            loopback_mappings = get_loopback_mappings(hostvars)
+        config_managers = {hostname: ConfigManager(device_name=hostname, hostvars=hostvars, loopback_mappings=loopback_mappings) for hostname in hostnames}
+        custom_anta_catalogs = {hostname: get_custom_anta_catalogs(hostvars, hostname, custom_anta_catalogs_dir) for hostname in hostnames}
+        save_catalog_names = {hostname: test_catalogs_dir / f"{hostname}-catalog.yml" for hostname in hostnames} if test_catalogs_dir is not None else None
+
+        return get_fabric_anta_results(
+            anta_devices=anta_devices,
+            config_managers=config_managers,
+            logging_level=logging_level,
+            skip_tests=skip_tests,
+            save_catalog_names=save_catalog_names,
+            custom_anta_catalogs=custom_anta_catalogs,
+            yaml_dumper=AnsibleNoAliasDumper,
+            dry_run=dry_run,
+        )
+
 
 def get_custom_anta_catalogs(hostvars: Mapping, hostname: str, custom_anta_catalogs_dir: Path) -> list[Path] | None:
     """Retrieve the custom ANTA catalogs for the current inventory device.
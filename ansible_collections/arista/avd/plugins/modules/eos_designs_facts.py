@@ -17,6 +17,8 @@ description:
       This list is built based on the `uplink_switches` from all other hosts.
     - Set `avd_overlay_peers` fact containing list of EVPN or MPLS overlay peers per host.
       This list is built based on the `evpn_route_servers` and `mpls_route_reflectors` from all other hosts.
+    - Set `avd_vteps` fact containing an index of all VTEPs and the VTEPs carrying each VLAN.
+      This index is used to build the HER flood lists of all hosts without parsing the VLANs of all other hosts per host.
 
   - The plugin is designed to `run_once`. With this, Ansible will set the same facts on all devices,
     so all devices can lookup values of any other device without using the slower `hostvars`.
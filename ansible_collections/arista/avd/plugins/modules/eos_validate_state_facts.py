@@ -0,0 +1,29 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+
+DOCUMENTATION = r"""
+---
+module: eos_validate_state_facts
+version_added: "5.0.0"
+author: Arista Ansible Team (@aristanetworks)
+short_description: Set eos_validate_state facts
+description:
+  - |-
+    The `arista.avd.eos_validate_state_facts` module is an Ansible Action Plugin providing the following capabilities:
+
+    - Set `avd_validate_state_mappings` fact containing the Loopback0, VTEP and DPS IP addresses of all hosts.
+      These mappings are used by the `eos_validate_state_runner` plugin to generate the connectivity and routing tests
+      of each host without parsing the structured configuration of all other hosts per host.
+
+  - The plugin is designed to `run_once`. With this, Ansible will set the same facts on all devices.
+  - The module is used in `arista.avd.eos_validate_state` before running the `eos_validate_state_runner` plugin for each device.
+"""
+
+EXAMPLES = r"""
+---
+- name: Set eos_validate_state facts
+  arista.avd.eos_validate_state_facts:
+  run_once: true
+  check_mode: false
+"""
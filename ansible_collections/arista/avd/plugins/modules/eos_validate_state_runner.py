@@ -20,7 +20,22 @@ description:
         - In check_mode, only the test catalog is generated, and a report is created to preview the tests that would be run against each device.
         - Saving per-device test catalogs and results in specified directories for use by the `eos_validate_state_reports` plugin.
         - Maintaining backward compatibility with existing ansible tags for eos_validate_state to filter test categories.
+        - Optionally running the tests of all play hosts in a single ANTA run with `single_run`, limiting the number of concurrent requests.
 options:
+  single_run:
+    description:
+      - Run the tests of all hosts in `ansible_play_hosts` in a single ANTA run from the host running the task.
+      - The task must be run with `run_once` and is usually delegated to `localhost`.
+      - ANTA connects directly to the devices using the `ansible_host`, `ansible_user`, `ansible_password`, `ansible_become`, `ansible_become_password`,
+        `ansible_httpapi_port`, `ansible_httpapi_use_ssl` and `ansible_httpapi_validate_certs` variables of each host.
+      - The test catalogs are saved in `test_catalogs_dir` instead of `device_catalog_path`.
+    type: bool
+    default: false
+  max_concurrency:
+    description:
+      - The maximum number of concurrent eAPI requests across all devices when `single_run` is set.
+    type: int
+    default: 100
   logging_level:
     description: Sets the log level for the ANTA library. Defaults to "WARNING" if not specified.
     type: str
@@ -35,6 +50,11 @@ options:
       - The absolute path where the device test catalog will be saved.
       - Required if `save_catalog` is set to `True`.
     type: str
+  test_catalogs_dir:
+    description:
+      - The directory where the test catalog of each host will be saved when `single_run` is set.
+      - Required if `save_catalog` and `single_run` are set to `True`.
+    type: str
   test_results_dir:
     description:
     - The directory where the test results JSON file for each host will be saved.
@@ -76,6 +96,8 @@ notes:
   - The file naming convention is hard coded as "<inventory_hostname>-results.json" and cannot be changed. This ensures that the report
     plugin can properly retrieve the files.
   - This module supports `check_mode`, allowing the generation of test reports without executing the tests.
+  - When the `avd_validate_state_mappings` fact set by the `eos_validate_state_facts` plugin is available, the Loopback0, VTEP and DPS
+    IP addresses of the fabric are read from the fact instead of the structured configuration of all other hosts.
   - Regardless of whether they are running in `check_mode` or not, the reports are generated by the `eos_validate_state_reports` plugin.
 """
 
@@ -93,4 +115,15 @@ EXAMPLES = r"""
         tests:
           - VerifyRoutingProtocolModel
   register: anta_results
+
+- name: Execute eos_validate_state_runner for all hosts in a single ANTA run
+  arista.avd.eos_validate_state_runner:
+    single_run: true
+    max_concurrency: 50
+    save_catalog: true
+    test_catalogs_dir: "/my_avd_project/intended/test_catalogs"
+    test_results_dir: "/my_avd_project/reports/test_results"
+    custom_anta_catalogs_dir: "/my_avd_project/custom_anta_catalogs"
+  delegate_to: localhost
+  run_once: true
 """
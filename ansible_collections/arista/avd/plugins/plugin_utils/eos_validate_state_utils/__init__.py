@@ -3,10 +3,22 @@
 # that can be found in the LICENSE file.
 from .ansible_eos_device import AnsibleEOSDevice
 from .avdtestbase import AvdTestBase
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, get_loopback_mappings
 from .csv_report import CSVReport
-from .get_anta_results import get_anta_results
+from .get_anta_results import get_anta_results, get_fabric_anta_results
+from .limited_async_eos_device import LimitedAsyncEOSDevice
 from .md_report import MDReport
 from .results_manager import ResultsManager
 
-__all__ = ["AnsibleEOSDevice", "get_anta_results", "AvdTestBase", "MDReport", "CSVReport", "ResultsManager", "ConfigManager"]
+__all__ = [
+    "AnsibleEOSDevice",
+    "LimitedAsyncEOSDevice",
+    "get_anta_results",
+    "get_fabric_anta_results",
+    "AvdTestBase",
+    "MDReport",
+    "CSVReport",
+    "ResultsManager",
+    "ConfigManager",
+    "get_loopback_mappings",
+]
@@ -3,7 +3,7 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
-from asyncio import get_event_loop
+from asyncio import Future, Task, gather, get_event_loop
 from functools import partial
 from json import JSONDecodeError, loads
 from logging import getLogger
@@ -41,12 +41,17 @@ except ImportError:
     AntaDevice = object
 
 if TYPE_CHECKING:
+    from asyncio import TimerHandle
     from collections.abc import Generator
 
     from ansible.plugins.connection import ConnectionBase
     from anta.models import AntaCommand
 
 ANSIBLE_EOS_PLUGIN_NAME = "ansible_collections.arista.eos.plugins.httpapi.eos"
+COLLECT_WINDOW = 0.05
+"""Seconds to wait for more commands before sending the commands collected concurrently as a single eAPI request."""
+COLLECT_MAX_COMMANDS = 50
+"""Maximum number of commands sent in a single eAPI request."""
 
 
 class AnsibleEOSDevice(AntaDevice):
@@ -77,6 +82,12 @@ class AnsibleEOSDevice(AntaDevice):
         super().__init__(name, tags, disable_cache=False)
         self.check_mode = check_mode
 
+        # Commands waiting to be sent, grouped by eAPI version and output format since these are set per request.
+        self._pending_commands: dict[tuple[int | str, str], list[tuple[AntaCommand, Future]]] = {}
+        self._pending_timers: dict[tuple[int | str, str], TimerHandle] = {}
+        # Keep references to the running batches, so they are not garbage collected before completion.
+        self._batch_tasks: set[Task] = set()
+
         # Check the ansible connection is defined
         if not self.check_mode and not hasattr(connection, "_sub_plugin"):
             raise AristaAvdError(
@@ -111,6 +122,9 @@ class AnsibleEOSDevice(AntaDevice):
 
         Supports outformat 'json' and 'text' as output structure.
 
+        Commands collected concurrently within `COLLECT_WINDOW` seconds with the same eAPI version and output format
+        are sent as a single eAPI request of up to `COLLECT_MAX_COMMANDS` commands.
+
         Args:
         ----
             command (AntaCommand): The command to collect.
@@ -122,29 +136,83 @@ class AnsibleEOSDevice(AntaDevice):
         if self.check_mode:
             logger.info("_collect was called in check_mode, doing nothing")
             return
-        commands = []
 
-        if command.revision:
-            commands.append({"cmd": command.command, "revision": command.revision})
-        else:
-            commands.append({"cmd": command.command})
+        loop = get_event_loop()
+        key = (command.version, command.ofmt)
+        future = loop.create_future()
+        pending_commands = self._pending_commands.setdefault(key, [])
+        pending_commands.append((command, future))
+
+        if len(pending_commands) >= COLLECT_MAX_COMMANDS:
+            self._flush_commands(key)
+        elif len(pending_commands) == 1:
+            self._pending_timers[key] = loop.call_later(COLLECT_WINDOW, self._flush_commands, key)
+
+        await future
+        logger.debug("%s: %s", self.name, command)
+
+    def _flush_commands(self, key: tuple[int | str, str]) -> None:
+        """Start sending the pending commands for the given eAPI version and output format."""
+        if (timer := self._pending_timers.pop(key, None)) is not None:
+            timer.cancel()
+        if not (pending_commands := self._pending_commands.pop(key, None)):
+            return
+
+        task = get_event_loop().create_task(self._send_commands(pending_commands))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_commands(self, pending_commands: list[tuple[AntaCommand, Future]]) -> None:
+        """Send the given commands as a single eAPI request and set the output or errors on each command.
+
+        eAPI stops at the first failing command, so if a request with multiple commands fails,
+        each command is sent separately to get the output or errors of each command.
+        """
+        commands = [command for command, _future in pending_commands]
+        try:
+            await self._send_request(commands)
+        except Exception as e:
+            logger.debug("%s: Request with %s commands failed, retrying each command separately: %s", self.name, len(commands), exc_to_str(e))
+            await gather(*(self._send_request([command]) for command in commands))
+        finally:
+            for _command, future in pending_commands:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _send_request(self, commands: list[AntaCommand]) -> None:
+        """Send the given commands with the same eAPI version and output format as one eAPI request and save the output of each command.
+
+        If the request contains a single command, errors are saved on the command. Otherwise errors are raised.
+        """
+        eapi_commands = [{"cmd": command.command, "revision": command.revision} if command.revision else {"cmd": command.command} for command in commands]
 
         # Run the synchronous function send_request() in a separate thread to not block the asyncio event loop
-        send_request = partial(self._connection.send_request, commands, version=command.version, output=command.ofmt)
+        send_request = partial(self._connection.send_request, eapi_commands, version=commands[0].version, output=commands[0].ofmt)
         loop = get_event_loop()
         try:
             response = await loop.run_in_executor(None, send_request)
+        except Exception as e:
+            if len(commands) > 1:
+                raise
+            commands[0].errors = [exc_to_str(e)]
+            logger.warning("Command '%s' failed: %s", commands[0].command, exc_to_str(e))
+            return
+
+        # send_request() returns a list with the output of each command unless there is only one command.
+        responses = response if len(commands) > 1 else [response]
+        for command, command_response in zip(commands, responses, strict=True):
+            self._save_command_output(command, command_response)
 
+    @staticmethod
+    def _save_command_output(command: AntaCommand, command_response: str) -> None:
+        """Save the output of the command from the response of send_request()."""
+        try:
             # Save the command result
-            command.output = loads(response) if command.ofmt == "json" else response
+            command.output = loads(command_response) if command.ofmt == "json" else command_response
         except JSONDecodeError:
             # Even if the outformat is 'json' send_request() sometimes returns a non-valid JSON depending on the output content
             # https://github.com/ansible-collections/arista.eos/blob/main/plugins/httpapi/eos.py#L194
-            command.output = {"messages": [response]}
-        except Exception as e:
-            command.errors = [exc_to_str(e)]
-            logger.warning("Command '%s' failed: %s", command.command, exc_to_str(e))
-        logger.debug("%s: %s", self.name, command)
+            command.output = {"messages": [command_response]}
 
     async def refresh(self) -> None:
         """Update attributes of an AnsibleEOSDevice instance.
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from functools import cached_property
 from ipaddress import ip_interface
 
@@ -36,7 +36,7 @@ class ConfigManager:
     It should be initialized per device and the instance should be passed to the AvdTestBase class.
     """
 
-    def __init__(self, device_name: str, hostvars: Mapping) -> None:
+    def __init__(self, device_name: str, hostvars: Mapping, loopback_mappings: Mapping | None = None) -> None:
         """Initialize the ConfigManager class.
 
         Args:
@@ -44,9 +44,12 @@ class ConfigManager:
             device_name (str): The current device name for which the plugin is being run.
             hostvars (Mapping): A mapping that contains a key for each device with a value of the structured_config.
                                       When using Ansible, this is the `task_vars['hostvars']` object.
+            loopback_mappings (Mapping | None): Optional loopback mappings of the fabric precomputed with `get_loopback_mappings`.
+                                      When not set, the mappings are computed from the structured_config of all devices in the hostvars.
         """
         self.device_name = device_name
         self.hostvars = hostvars
+        self._loopback_mappings = loopback_mappings
         self.structured_config = self.get_host_structured_config(host=device_name)
         self.loopback0_mapping = self.get_loopback0_mapping()
         self.vtep_mapping = self.get_vtep_mapping()
@@ -89,72 +92,106 @@ class ConfigManager:
         """Get the dps_mapping list."""
         return self._get_loopback_mappings["dps_mapping"]
 
-    def _get_ip_address(self, host: str, interfaces: list, vtep_interface: str) -> tuple[str, str] | None:
-        """Retrieve the IP address for a given VTEP interface on a host.
+    @cached_property
+    def _get_loopback_mappings(self) -> dict:
+        """Get the loopback mappings for the eos_validate_state tests, which are used in AvdTestBase subclasses.
 
-        Parameters
-        ----------
-        host: str
-            The hostname of the device.
-        interfaces: list
-            List of interface dictionaries.
-        vtep_interface: str
-            The name of the VTEP interface.
+        The precomputed mappings are used if given. Otherwise they are computed from the structured_config of all devices in the hostvars.
 
         Returns:
         -------
-        tuple | None
-            A tuple containing the hostname and IP address if found, else None.
+            dict: A dictionary containing the "loopback0_mapping", "vtep_mapping" and "dps_mapping" lists. See `get_loopback_mappings`.
         """
-        if (loopback_interface := get_item(interfaces, "name", vtep_interface)) is None:
-            LOGGER.warning("Host '%s' interface '%s' is missing.", host, vtep_interface)
-        elif (loopback_ip := loopback_interface.get("ip_address")) is None:
-            LOGGER.warning("Host '%s' variable 'ip_address' of interface '%s' is missing.", host, vtep_interface)
-        else:
-            return (host, str(ip_interface(loopback_ip).ip))
-        return None  # Ensure a value is always returned
+        if self._loopback_mappings is None:
+            return get_loopback_mappings(self.hostvars)
 
-    @cached_property
-    def _get_loopback_mappings(self) -> dict:
-        """Generate the loopback mappings for the eos_validate_state tests, which are used in AvdTestBase subclasses.
+        # Mappings set as Ansible facts may have been converted from tuples to lists.
+        return {key: [tuple(item) for item in self._loopback_mappings.get(key, [])] for key in ("loopback0_mapping", "vtep_mapping", "dps_mapping")}
 
-        Returns:
-        -------
-            dict: A dictionary containing:
-            - "loopback0_mapping": A list of tuples where each tuple contains a hostname and its Loopback0 IP address.
-            - "vtep_mapping": A list of tuples where each tuple contains a hostname and its VTEP IP address if `Vxlan1` is the source_interface.
-            - "dps_mapping": A list of tuples where each tuple contains a hostname and its VTEP IP address if `Dps` is in the source_interface.
-        """
-        results = {"loopback0_mapping": [], "vtep_mapping": [], "dps_mapping": []}
-
-        for host in self.hostvars:
-            host_struct_cfg = self.get_host_structured_config(host)
-            loopback_interfaces = host_struct_cfg.get("loopback_interfaces", [])
-            dps_interfaces = host_struct_cfg.get("dps_interfaces", [])
-
-            # Handle Loopback0 interface
-            if (loopback0 := get_item(loopback_interfaces, "name", "Loopback0")) is not None:
-                if (loopback_ip := loopback0.get("ip_address")) is None:
-                    LOGGER.warning("Host '%s' variable 'ip_address' of interface 'Loopback0' is missing.", host)
-                else:
-                    results["loopback0_mapping"].append((host, str(ip_interface(loopback_ip).ip)))
-
-            # If the host is a VTEP, add the VTEP IP to the mapping
-            # TODO: Remove the support of Vxlan1 in AVD 6.0.0 version
-            vtep_interface = default(
-                get(host_struct_cfg, "vxlan_interface.vxlan1.vxlan.source_interface"), get(host_struct_cfg, "vxlan_interface.Vxlan1.vxlan.source_interface")
-            )
-            if vtep_interface is None:
-                continue
-
-            # Determine the correct mapping based on the interface name
-            if "Dps" in vtep_interface:
-                ip_address = self._get_ip_address(host, dps_interfaces, vtep_interface)
-                if ip_address:
-                    results["dps_mapping"].append(ip_address)
+
+def get_loopback_mappings(hostvars: Mapping, hosts: Iterable[str] | None = None) -> dict:
+    """Generate the loopback mappings for the eos_validate_state tests of all devices.
+
+    The mappings are the same for all devices, so they should be computed once and given to the ConfigManager of each device.
+
+    Args:
+    ----
+        hostvars (Mapping): A mapping that contains a key for each device with a value of the structured_config.
+                                  When using Ansible, this is the `task_vars['hostvars']` object.
+        hosts (Iterable[str] | None): The devices to include in the mappings. Defaults to all devices in the hostvars.
+
+    Returns:
+    -------
+        dict: A dictionary containing:
+        - "loopback0_mapping": A list of tuples where each tuple contains a hostname and its Loopback0 IP address.
+        - "vtep_mapping": A list of tuples where each tuple contains a hostname and its VTEP IP address if `Vxlan1` is the source_interface.
+        - "dps_mapping": A list of tuples where each tuple contains a hostname and its VTEP IP address if `Dps` is in the source_interface.
+
+    Raises:
+    ------
+        AristaAvdError: If a host is not in hostvars or if its structured_config is not a mapping object.
+    """
+    results = {"loopback0_mapping": [], "vtep_mapping": [], "dps_mapping": []}
+
+    for host in hostvars if hosts is None else hosts:
+        if host not in hostvars:
+            raise AristaAvdError(message=f"Host '{host}' is missing from the hostvars.")
+        host_struct_cfg = hostvars[host]
+        if not isinstance(host_struct_cfg, Mapping):
+            raise AristaAvdError(message=f"Host '{host}' structured_config is not a dictionary or dictionary-like object.")
+
+        loopback_interfaces = host_struct_cfg.get("loopback_interfaces", [])
+        dps_interfaces = host_struct_cfg.get("dps_interfaces", [])
+
+        # Handle Loopback0 interface
+        if (loopback0 := get_item(loopback_interfaces, "name", "Loopback0")) is not None:
+            if (loopback_ip := loopback0.get("ip_address")) is None:
+                LOGGER.warning("Host '%s' variable 'ip_address' of interface 'Loopback0' is missing.", host)
             else:
-                ip_address = self._get_ip_address(host, loopback_interfaces, vtep_interface)
-                if ip_address:
-                    results["vtep_mapping"].append(ip_address)
+                results["loopback0_mapping"].append((host, str(ip_interface(loopback_ip).ip)))
+
+        # If the host is a VTEP, add the VTEP IP to the mapping
+        # TODO: Remove the support of Vxlan1 in AVD 6.0.0 version
+        vtep_interface = default(
+            get(host_struct_cfg, "vxlan_interface.vxlan1.vxlan.source_interface"), get(host_struct_cfg, "vxlan_interface.Vxlan1.vxlan.source_interface")
+        )
+        if vtep_interface is None:
+            continue
+
+        # Determine the correct mapping based on the interface name
+        if "Dps" in vtep_interface:
+            ip_address = _get_ip_address(host, dps_interfaces, vtep_interface)
+            if ip_address:
+                results["dps_mapping"].append(ip_address)
+        else:
+            ip_address = _get_ip_address(host, loopback_interfaces, vtep_interface)
+            if ip_address:
+                results["vtep_mapping"].append(ip_address)
+
+    return results
+
 
-        return results
+def _get_ip_address(host: str, interfaces: list, vtep_interface: str) -> tuple[str, str] | None:
+    """Retrieve the IP address for a given VTEP interface on a host.
+
+    Parameters
+    ----------
+    host: str
+        The hostname of the device.
+    interfaces: list
+        List of interface dictionaries.
+    vtep_interface: str
+        The name of the VTEP interface.
+
+    Returns:
+    -------
+    tuple | None
+        A tuple containing the hostname and IP address if found, else None.
+    """
+    if (loopback_interface := get_item(interfaces, "name", vtep_interface)) is None:
+        LOGGER.warning("Host '%s' interface '%s' is missing.", host, vtep_interface)
+    elif (loopback_ip := loopback_interface.get("ip_address")) is None:
+        LOGGER.warning("Host '%s' variable 'ip_address' of interface '%s' is missing.", host, vtep_interface)
+    else:
+        return (host, str(ip_interface(loopback_ip).ip))
+    return None  # Ensure a value is always returned
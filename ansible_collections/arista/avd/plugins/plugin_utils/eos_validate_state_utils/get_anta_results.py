@@ -92,16 +92,10 @@ def get_anta_results(
 
     device_name = anta_device.name
 
-    # Load and merge the custom catalogs for the device if any
-    custom_catalog = load_custom_catalogs(custom_anta_catalogs) if custom_anta_catalogs else None
-
     # Create the ANTA Catalog object with the appropriate skipped tests if any
-    tests = generate_tests(config_manager, skip_tests, custom_catalog)
+    tests = get_device_tests(config_manager, skip_tests, save_catalog_name, custom_anta_catalogs, yaml_dumper)
     anta_catalog = AntaCatalog.from_dict(data=tests) if tests else AntaCatalog()
 
-    if save_catalog_name is not None:
-        dump_to_file(tests, save_catalog_name, yaml_dumper)
-
     # Create the ANTA ResultManager object to store results
     manager = ResultManager()
 
@@ -117,9 +111,152 @@ def get_anta_results(
         run(anta_runner(manager, inventory, anta_catalog)) if len(anta_catalog.tests) > 0 else LOGGER.warning("Test catalog is empty!")
 
     # Convert the ANTA TestResult models to dictionaries, excluding default values
-    results = [result.model_dump(exclude_defaults=True) for result in manager.results]
+    return sort_results([result.model_dump(exclude_defaults=True) for result in manager.results])
+
+
+def get_fabric_anta_results(
+    anta_devices: list[AntaDevice],
+    config_managers: dict[str, ConfigManager],
+    logging_level: str,
+    skip_tests: list[dict],
+    save_catalog_names: dict[str, Path] | None = None,
+    custom_anta_catalogs: dict[str, list[Path] | None] | None = None,
+    yaml_dumper: Dumper | None = NoAliasDumper,
+    *,
+    dry_run: bool = False,
+) -> dict[str, list[dict]]:
+    """Get the ANTA results for all the given devices using a single ANTA run.
+
+    The catalogs of all devices are generated the same way as `get_anta_results` and combined into one ANTA catalog,
+    where each test is limited to its device using the device name tag. All devices are then tested concurrently
+    in a single ANTA inventory and event loop.
+
+    Args:
+    ----
+      anta_devices (list[AntaDevice]): Instantiated AntaDevices.
+      config_managers (dict[str, ConfigManager]): The ConfigManager object of each device, keyed by device name.
+      logging_level (str): The level at which ANTA should be logging.
+      skip_tests (list[dict]): A list of dictionary containing the categories and/or tests to skip.
+      save_catalog_names (dict[str, Path]): When set, the generated catalog of each device is saved to a file using the name for the device.
+      custom_anta_catalogs (dict[str, list[Path]]): An optional list of custom ANTA catalog files for each device to merge with the generated catalog.
+      yaml_dumper (Dumper): Dumper to use to dump the ANTA catalog. Default is NoAliasDumper to avoid anchors.
+      dry_run (bool): If True, no test is actually run. Useful in conjunction with `save_catalog_names`.
+
+    Returns:
+    -------
+      results (dict[str, list[dict]]): A dictionary keyed by device name with a list of dictionary containing the ANTA results for the device.
+    """
+    if not HAS_ANTA:
+        raise AristaAvdError(message="AVD could not import the required 'anta' Python library")
+
+    # Setup ANTA logging
+    setup_logging(level=logging_level)
+
+    save_catalog_names = save_catalog_names or {}
+    custom_anta_catalogs = custom_anta_catalogs or {}
+
+    # Create the ANTA Catalog objects for each device with the appropriate skipped tests if any
+    anta_catalogs = {}
+    for anta_device in anta_devices:
+        tests = get_device_tests(
+            config_managers[anta_device.name],
+            skip_tests,
+            save_catalog_names.get(anta_device.name),
+            custom_anta_catalogs.get(anta_device.name),
+            yaml_dumper,
+        )
+        anta_catalogs[anta_device.name] = AntaCatalog.from_dict(data=filter_tests_by_device(tests, anta_device.name)) if tests else AntaCatalog()
+
+    # Create the ANTA ResultManager object to store results
+    manager = ResultManager()
+
+    if dry_run:
+        LOGGER.info("DRY RUN - Generating empty results")
+        for device_name, anta_catalog in anta_catalogs.items():
+            create_dry_run_report(device_name, anta_catalog, manager)
+    else:
+        # Create the ANTA Catalog object with the tests of all devices
+        anta_catalog = AntaCatalog(tests=[test for device_catalog in anta_catalogs.values() for test in device_catalog.tests])
+
+        # Create the ANTA Inventory object and add all the devices to it
+        inventory = AntaInventory()
+        for anta_device in anta_devices:
+            inventory.add_device(anta_device)
 
-    # Return sorted results
+        # Run ANTA
+        run(anta_runner(manager, inventory, anta_catalog)) if len(anta_catalog.tests) > 0 else LOGGER.warning("Test catalog is empty!")
+
+    # Convert the ANTA TestResult models to dictionaries, excluding default values, and split them per device
+    results = {anta_device.name: [] for anta_device in anta_devices}
+    for result in manager.results:
+        results[result.name].append(result.model_dump(exclude_defaults=True))
+
+    return {device_name: sort_results(device_results) for device_name, device_results in results.items()}
+
+
+def get_device_tests(
+    config_manager: ConfigManager,
+    skip_tests: list[dict],
+    save_catalog_name: Path | None = None,
+    custom_anta_catalogs: list[Path] | None = None,
+    yaml_dumper: Dumper | None = NoAliasDumper,
+) -> RawCatalogInput:
+    """Generate the tests of a device merged with the custom catalogs of the device, and save them to a file if requested.
+
+    Args:
+    ----
+      config_manager (ConfigManager): The device ConfigManager object containing data to be used by the tests.
+      skip_tests (list[dict]): A list of dictionary containing the categories and/or tests to skip.
+      save_catalog_name (str): When set, the generated catalog is saved to a file using this name.
+      custom_anta_catalogs (list[Path]): An optional list of custom ANTA catalog files to merge with the generated catalog.
+      yaml_dumper (Dumper): Dumper to use to dump the ANTA catalog. Default is NoAliasDumper to avoid anchors.
+
+    Returns:
+    -------
+      RawCatalogInput: The catalog of the device.
+    """
+    # Load and merge the custom catalogs for the device if any
+    custom_catalog = load_custom_catalogs(custom_anta_catalogs) if custom_anta_catalogs else None
+
+    tests = generate_tests(config_manager, skip_tests, custom_catalog)
+
+    if save_catalog_name is not None:
+        dump_to_file(tests, save_catalog_name, yaml_dumper)
+
+    return tests
+
+
+def filter_tests_by_device(tests: RawCatalogInput, device_name: str) -> RawCatalogInput:
+    """Limit the given tests to the given device using the device name tag, which is added by ANTA to all devices.
+
+    Tests already filtered on tags are only kept if the device name is one of the tags,
+    since these would not run on the device in a single device ANTA run either.
+
+    Args:
+    ----
+      tests (RawCatalogInput): The catalog of the device.
+      device_name (str): The name of the device.
+
+    Returns:
+    -------
+      RawCatalogInput: A new catalog where each test is filtered on the device name tag.
+    """
+    device_tests = {}
+    for module_name, module_tests in tests.items():
+        device_module_tests = []
+        for test in module_tests:
+            test_name, test_inputs = next(iter(test.items()))
+            test_inputs = test_inputs or {}
+            filters = test_inputs.get("filters") or {}
+            if (test_tags := filters.get("tags")) and device_name not in test_tags:
+                continue
+            device_module_tests.append({test_name: {**test_inputs, "filters": {**filters, "tags": [device_name]}}})
+        device_tests[module_name] = device_module_tests
+    return device_tests
+
+
+def sort_results(results: list[dict]) -> list[dict]:
+    """Sort the ANTA results of a device by category, test and custom field."""
     return sorted(
         results,
         key=lambda result: (
@@ -0,0 +1,97 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.parsing.convert_bool import boolean
+
+from ansible_collections.arista.avd.plugins.plugin_utils.pyavd_wrappers import RaiseOnUse
+
+PLUGIN_NAME = "arista.avd.eos_validate_state"
+
+try:
+    from pyavd._errors import AristaAvdError
+except ImportError as e:
+    AristaAvdError = RaiseOnUse(
+        AnsibleActionFail(
+            f"The '{PLUGIN_NAME}' plugin requires the 'pyavd' Python library. Got import error",
+            orig_exc=e,
+        ),
+    )
+
+try:
+    from anta.device import AsyncEOSDevice
+
+    HAS_ANTA = True
+except ImportError:
+    HAS_ANTA = False
+    # Next line to make ansible-test sanity happy
+    AsyncEOSDevice = object
+
+if TYPE_CHECKING:
+    from asyncio import Semaphore
+    from collections.abc import Mapping
+
+    from anta.models import AntaCommand
+
+
+class LimitedAsyncEOSDevice(AsyncEOSDevice):
+    """Implementation of the ANTA AsyncEOSDevice sharing a limit of concurrent eAPI requests with other devices."""
+
+    def __init__(self, *args: Any, semaphore: Semaphore, **kwargs: Any) -> None:
+        """Initialize an instance of the LimitedAsyncEOSDevice class.
+
+        Args:
+        ----
+            *args: Positional arguments passed to AsyncEOSDevice.
+            semaphore (Semaphore): Semaphore shared by all devices of the ANTA run to limit the number of concurrent eAPI requests.
+            **kwargs: Keyword arguments passed to AsyncEOSDevice.
+
+        Raises:
+        ------
+            AristaAvdError: Raised if ANTA is not imported.
+        """
+        if not HAS_ANTA:
+            raise AristaAvdError(message="AVD could not import the required 'anta' Python library")
+
+        super().__init__(*args, **kwargs)
+        self._semaphore = semaphore
+
+    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        """Collect device command output while holding the shared semaphore."""
+        async with self._semaphore:
+            await super()._collect(command, collection_id=collection_id)
+
+    @classmethod
+    def from_hostvars(cls, name: str, hostvars: Mapping, semaphore: Semaphore) -> LimitedAsyncEOSDevice:
+        """Create an instance using the same variables as the Ansible HttpApi connection plugin for EOS.
+
+        Args:
+        ----
+            name (str): Name of the device. Usually the inventory hostname.
+            hostvars (Mapping): The hostvars of the device.
+            semaphore (Semaphore): Semaphore shared by all devices of the ANTA run to limit the number of concurrent eAPI requests.
+
+        Returns:
+        -------
+            LimitedAsyncEOSDevice: The device instance.
+        """
+        use_ssl = boolean(hostvars.get("ansible_httpapi_use_ssl", False))
+        password = hostvars.get("ansible_password", hostvars.get("ansible_httpapi_pass"))
+        enable_password = hostvars.get("ansible_become_password", hostvars.get("ansible_become_pass"))
+        port = hostvars.get("ansible_httpapi_port")
+        return cls(
+            host=str(hostvars.get("ansible_host", name)),
+            username=str(hostvars.get("ansible_user", "")),
+            password=str(password) if password is not None else "",
+            name=name,
+            enable_password=str(enable_password) if enable_password is not None else None,
+            port=int(port) if port is not None else (443 if use_ssl else 80),
+            proto="https" if use_ssl else "http",
+            enable=boolean(hostvars.get("ansible_become", False)),
+            insecure=not boolean(hostvars.get("ansible_httpapi_validate_certs", True)),
+            semaphore=semaphore,
+        )
@@ -4,11 +4,21 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from json import dumps, loads
+from os import SEEK_END
+from tempfile import TemporaryFile
+from typing import TYPE_CHECKING
 
 from ansible_collections.arista.avd.roles.eos_validate_state.python_modules.constants import ACRONYM_CATEGORIES
 
 from .constants import RESULTS_MAPPING, STATS_MAPPING
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from io import TextIOWrapper
+    from types import TracebackType
+    from typing import Self
+
 
 class ResultsManager:
     """Manages and stores test results from eos_validate_state running ANTA.
@@ -16,6 +26,10 @@ class ResultsManager:
     This class processes individual test result and maintains statistics like total tests passed, failed, and skipped.
 
     An instance of this class holding all results and statistics can be used to generate the validation reports.
+
+    Only the statistics are kept in memory. The parsed test results are spooled to temporary files as JSON lines
+    and streamed back when generating the reports, so the memory usage does not grow with the number of tests.
+    The instance should be used as a context manager or closed with `close` to remove the temporary files.
     """
 
     def __init__(self, *, only_failed_tests: bool = True) -> None:
@@ -53,9 +67,21 @@ class ResultsManager:
                 "tests_not_run": 0,
             },
         )
-        self.failed_tests = []
-        self.all_tests = []
         self.only_failed_tests = only_failed_tests
+        self._failed_tests_file = TemporaryFile(mode="w+", encoding="UTF-8")
+        self._all_tests_file = None if only_failed_tests else TemporaryFile(mode="w+", encoding="UTF-8")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close and remove the temporary files holding the test results."""
+        self._failed_tests_file.close()
+        if self._all_tests_file is not None:
+            self._all_tests_file.close()
 
     def _parse_result(self, result: dict) -> dict:
         """Parse a single test result and converts it into a standardized format for the reports.
@@ -130,10 +156,47 @@ class ResultsManager:
 
         self._increment_stats(test_status, dut, categories)
 
+        line = dumps(parsed_result) + "\n"
         if test_status == "FAIL":
-            self.failed_tests.append(parsed_result)
-        if not self.only_failed_tests:
-            self.all_tests.append(parsed_result)
+            self._failed_tests_file.write(line)
+        if self._all_tests_file is not None:
+            self._all_tests_file.write(line)
+
+    @property
+    def failed_tests(self) -> Generator[dict, None, None]:
+        """Generate the failed test results in the order they were added.
+
+        Results must not be added while iterating.
+
+        Yields:
+        ------
+            Generator[dict, None, None]: The parsed failed test results.
+        """
+        yield from self._read_results(self._failed_tests_file)
+
+    @property
+    def all_tests(self) -> Generator[dict, None, None]:
+        """Generate all test results in the order they were added. Nothing is generated if `only_failed_tests` is set.
+
+        Results must not be added while iterating.
+
+        Yields:
+        ------
+            Generator[dict, None, None]: The parsed test results.
+        """
+        if self._all_tests_file is not None:
+            yield from self._read_results(self._all_tests_file)
+
+    @staticmethod
+    def _read_results(results_file: TextIOWrapper) -> Generator[dict, None, None]:
+        """Stream the parsed test results from one of the temporary files, then move back to the end of the file for new results."""
+        results_file.flush()
+        results_file.seek(0)
+        try:
+            for line in results_file:
+                yield loads(line)
+        finally:
+            results_file.seek(0, SEEK_END)
 
     @property
     def total_tests(self) -> int:
@@ -0,0 +1,120 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("anta")
+
+from anta.models import AntaCommand  # noqa: E402
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils.ansible_eos_device import (  # noqa: E402
+    ANSIBLE_EOS_PLUGIN_NAME,
+    COLLECT_MAX_COMMANDS,
+    AnsibleEOSDevice,
+)
+
+
+class FakeConnection:
+    """Fake Ansible HttpApi connection recording the requests and returning the command as output like eAPI."""
+
+    _sub_plugin = {"name": ANSIBLE_EOS_PLUGIN_NAME}  # noqa: RUF012
+    _options = {"host": "device1", "use_ssl": True, "network_os": "eos"}  # noqa: RUF012
+
+    def __init__(self, failing_commands: tuple[str, ...] = ()) -> None:
+        self.failing_commands = failing_commands
+        self.requests = []
+
+    def send_request(self, commands: list[dict], version: int | str, output: str) -> list[str] | str:
+        self.requests.append((commands, version, output))
+        if failing_command := next((command["cmd"] for command in commands if command["cmd"] in self.failing_commands), None):
+            msg = f"Command '{failing_command}' failed"
+            raise ConnectionError(msg)
+
+        responses = [json.dumps({"command": command["cmd"]}) if output == "json" else f"output of {command['cmd']}" for command in commands]
+        # Like the Ansible eos httpapi plugin, the output is not a list for a single command.
+        return responses if len(responses) > 1 else responses[0]
+
+
+async def collect(device: AnsibleEOSDevice, commands: list[AntaCommand]) -> None:
+    """Collect the commands concurrently like ANTA does for the tests of a device."""
+    await asyncio.gather(*(device._collect(command) for command in commands))
+
+
+def test_collect_batches_concurrent_commands() -> None:
+    connection = FakeConnection()
+    device = AnsibleEOSDevice("device1", connection)
+    commands = [
+        AntaCommand(command="show version"),
+        AntaCommand(command="show interfaces", revision=2),
+        AntaCommand(command="show running-config", ofmt="text"),
+        AntaCommand(command="show bgp summary"),
+        AntaCommand(command="show hostname", version=1),
+    ]
+
+    asyncio.run(collect(device, commands))
+
+    # One request per eAPI version and output format, with the revision set per command.
+    assert sorted(connection.requests, key=str) == sorted(
+        [
+            ([{"cmd": "show version"}, {"cmd": "show interfaces", "revision": 2}, {"cmd": "show bgp summary"}], "latest", "json"),
+            ([{"cmd": "show running-config"}], "latest", "text"),
+            ([{"cmd": "show hostname"}], 1, "json"),
+        ],
+        key=str,
+    )
+    # The outputs of the batched requests are given back to each command.
+    for command in commands:
+        assert command.output == ({"command": command.command} if command.ofmt == "json" else f"output of {command.command}")
+        assert not command.errors
+
+
+def test_collect_max_commands_per_request() -> None:
+    connection = FakeConnection()
+    device = AnsibleEOSDevice("device1", connection)
+    commands = [AntaCommand(command=f"show interfaces Ethernet{index}") for index in range(COLLECT_MAX_COMMANDS + 1)]
+
+    asyncio.run(collect(device, commands))
+
+    assert sorted(len(request[0]) for request in connection.requests) == [1, COLLECT_MAX_COMMANDS]
+    assert [command.output for command in commands] == [{"command": command.command} for command in commands]
+
+
+def test_collect_retries_each_command_on_batch_error() -> None:
+    connection = FakeConnection(failing_commands=("show ip bgp",))
+    device = AnsibleEOSDevice("device1", connection)
+    commands = [AntaCommand(command="show version"), AntaCommand(command="show ip bgp"), AntaCommand(command="show hostname")]
+
+    asyncio.run(collect(device, commands))
+
+    # The batch fails, then each command is sent separately.
+    assert len(connection.requests) == 4
+    assert connection.requests[0][0] == [{"cmd": "show version"}, {"cmd": "show ip bgp"}, {"cmd": "show hostname"}]
+    assert sorted(request[0][0]["cmd"] for request in connection.requests[1:]) == ["show hostname", "show ip bgp", "show version"]
+    # Only the failing command has errors.
+    assert commands[0].output == {"command": "show version"}
+    assert commands[2].output == {"command": "show hostname"}
+    assert commands[1].output is None
+    assert commands[1].errors
+    assert "show ip bgp" in commands[1].errors[0]
+
+
+def test_collect_invalid_json() -> None:
+    command = AntaCommand(command="show version")
+    AnsibleEOSDevice._save_command_output(command, "not json")
+    assert command.output == {"messages": ["not json"]}
+
+
+def test_collect_check_mode() -> None:
+    connection = FakeConnection()
+    device = AnsibleEOSDevice("device1", connection, check_mode=True)
+    command = AntaCommand(command="show version")
+
+    asyncio.run(collect(device, [command]))
+
+    assert connection.requests == []
+    assert command.output is None
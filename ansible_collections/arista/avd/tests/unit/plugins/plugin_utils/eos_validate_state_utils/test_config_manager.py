@@ -0,0 +1,108 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils import config_manager
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils.config_manager import ConfigManager, get_loopback_mappings
+from pyavd._errors import AristaAvdError
+
+HOSTVARS = {
+    "spine1": {
+        "loopback_interfaces": [{"name": "Loopback0", "ip_address": "192.168.255.1/32"}],
+    },
+    "leaf1": {
+        "loopback_interfaces": [
+            {"name": "Loopback0", "ip_address": "192.168.255.3/32"},
+            {"name": "Loopback1", "ip_address": "192.168.254.3/32"},
+        ],
+        "vxlan_interface": {"vxlan1": {"vxlan": {"source_interface": "Loopback1"}}},
+    },
+    # The Vxlan1 key is still supported until AVD 6.0.0.
+    "leaf2": {
+        "loopback_interfaces": [
+            {"name": "Loopback0", "ip_address": "192.168.255.4/32"},
+            {"name": "Loopback1", "ip_address": "192.168.254.4/32"},
+        ],
+        "vxlan_interface": {"Vxlan1": {"vxlan": {"source_interface": "Loopback1"}}},
+    },
+    "wan1": {
+        "loopback_interfaces": [{"name": "Loopback0", "ip_address": "192.168.255.5/32"}],
+        "dps_interfaces": [{"name": "Dps1", "ip_address": "192.168.42.5/32"}],
+        "vxlan_interface": {"vxlan1": {"vxlan": {"source_interface": "Dps1"}}},
+    },
+    # Missing IP addresses or interfaces are left out of the mappings.
+    "leaf3": {
+        "loopback_interfaces": [{"name": "Loopback0"}],
+        "vxlan_interface": {"vxlan1": {"vxlan": {"source_interface": "Loopback1"}}},
+    },
+    "wan2": {
+        "vxlan_interface": {"vxlan1": {"vxlan": {"source_interface": "Dps1"}}},
+    },
+    "server1": {},
+}
+
+# The mappings computed by each device's ConfigManager before they could be precomputed.
+EXPECTED_LOOPBACK_MAPPINGS = {
+    "loopback0_mapping": [("spine1", "192.168.255.1"), ("leaf1", "192.168.255.3"), ("leaf2", "192.168.255.4"), ("wan1", "192.168.255.5")],
+    "vtep_mapping": [("leaf1", "192.168.254.3"), ("leaf2", "192.168.254.4")],
+    "dps_mapping": [("wan1", "192.168.42.5")],
+}
+
+
+def test_get_loopback_mappings() -> None:
+    assert get_loopback_mappings(HOSTVARS) == EXPECTED_LOOPBACK_MAPPINGS
+
+
+def test_get_loopback_mappings_hosts() -> None:
+    assert get_loopback_mappings(HOSTVARS, hosts=["leaf1", "wan1"]) == {
+        "loopback0_mapping": [("leaf1", "192.168.255.3"), ("wan1", "192.168.255.5")],
+        "vtep_mapping": [("leaf1", "192.168.254.3")],
+        "dps_mapping": [("wan1", "192.168.42.5")],
+    }
+
+
+@pytest.mark.parametrize(
+    ("hostvars", "hosts", "expected_error"),
+    [
+        pytest.param(HOSTVARS, ["leaf4"], "Host 'leaf4' is missing from the hostvars.", id="missing_host"),
+        pytest.param({"leaf1": ["not", "a", "mapping"]}, None, "Host 'leaf1' structured_config is not a dictionary", id="invalid_structured_config"),
+    ],
+)
+def test_get_loopback_mappings_errors(hostvars: dict, hosts: list | None, expected_error: str) -> None:
+    with pytest.raises(AristaAvdError, match=expected_error):
+        get_loopback_mappings(hostvars, hosts=hosts)
+
+
+def test_config_manager_without_loopback_mappings() -> None:
+    for device_name in HOSTVARS:
+        manager = ConfigManager(device_name=device_name, hostvars=HOSTVARS)
+        assert manager.loopback0_mapping == EXPECTED_LOOPBACK_MAPPINGS["loopback0_mapping"]
+        assert manager.vtep_mapping == EXPECTED_LOOPBACK_MAPPINGS["vtep_mapping"]
+        assert manager.dps_mapping == EXPECTED_LOOPBACK_MAPPINGS["dps_mapping"]
+
+
+def test_config_manager_with_loopback_mappings(monkeypatch: pytest.MonkeyPatch) -> None:
+    loopback_mappings_calls = []
+    original_get_loopback_mappings = config_manager.get_loopback_mappings
+
+    def get_loopback_mappings(hostvars: dict) -> dict:
+        loopback_mappings_calls.append(hostvars)
+        return original_get_loopback_mappings(hostvars)
+
+    monkeypatch.setattr(config_manager, "get_loopback_mappings", get_loopback_mappings)
+    # Like the avd_validate_state_mappings fact, which Ansible converts to JSON types.
+    loopback_mappings = json.loads(json.dumps(original_get_loopback_mappings(HOSTVARS)))
+
+    for device_name in HOSTVARS:
+        manager = ConfigManager(device_name=device_name, hostvars=HOSTVARS, loopback_mappings=loopback_mappings)
+        assert manager.loopback0_mapping == EXPECTED_LOOPBACK_MAPPINGS["loopback0_mapping"]
+        assert manager.vtep_mapping == EXPECTED_LOOPBACK_MAPPINGS["vtep_mapping"]
+        assert manager.dps_mapping == EXPECTED_LOOPBACK_MAPPINGS["dps_mapping"]
+
+    # The precomputed mappings are used instead of scanning the hostvars for each device.
+    assert loopback_mappings_calls == []
@@ -0,0 +1,98 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+from ansible.errors import AnsibleActionFail
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.arista.avd.plugins.action import eos_validate_state_facts, eos_validate_state_runner
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils import config_manager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+HOSTVARS = {
+    f"leaf{index}": {
+        "loopback_interfaces": [
+            {"name": "Loopback0", "ip_address": f"192.168.255.{index}/32"},
+            {"name": "Loopback1", "ip_address": f"192.168.254.{index}/32"},
+        ],
+        "vxlan_interface": {"vxlan1": {"vxlan": {"source_interface": "Loopback1"}}},
+    }
+    for index in range(1, 4)
+}
+
+
+@pytest.fixture
+def loopback_mappings_calls(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Record the calls to get_loopback_mappings from the plugins and the ConfigManager."""
+    calls = []
+    original_get_loopback_mappings = config_manager.get_loopback_mappings
+
+    def get_loopback_mappings(hostvars: dict) -> dict:
+        calls.append(hostvars)
+        return original_get_loopback_mappings(hostvars)
+
+    for module in (config_manager, eos_validate_state_facts, eos_validate_state_runner):
+        monkeypatch.setattr(module, "get_loopback_mappings", get_loopback_mappings)
+    monkeypatch.setattr(ActionBase, "run", lambda _self, _tmp=None, _task_vars=None: {})
+    return calls
+
+
+def run_action(action_class: type[ActionBase], task_args: dict, task_vars: dict) -> dict:
+    action = action_class(task=SimpleNamespace(args=task_args), connection=None, play_context=None, loader=None, templar=None, shared_loader_obj=None)
+    return action.run(task_vars=task_vars)
+
+
+def test_eos_validate_state_facts(loopback_mappings_calls: list) -> None:
+    result = run_action(eos_validate_state_facts.ActionModule, {}, {"hostvars": HOSTVARS})
+
+    assert result["ansible_facts"] == {
+        "avd_validate_state_mappings": {
+            "loopback0_mapping": [("leaf1", "192.168.255.1"), ("leaf2", "192.168.255.2"), ("leaf3", "192.168.255.3")],
+            "vtep_mapping": [("leaf1", "192.168.254.1"), ("leaf2", "192.168.254.2"), ("leaf3", "192.168.254.3")],
+            "dps_mapping": [],
+        },
+    }
+    assert len(loopback_mappings_calls) == 1
+
+
+@pytest.mark.usefixtures("loopback_mappings_calls")
+def test_eos_validate_state_facts_error() -> None:
+    with pytest.raises(AnsibleActionFail, match="Error during plugin execution: Host 'leaf1' structured_config is not a dictionary"):
+        run_action(eos_validate_state_facts.ActionModule, {}, {"hostvars": {"leaf1": None}})
+
+
+def test_eos_validate_state_runner_uses_facts(monkeypatch: pytest.MonkeyPatch, loopback_mappings_calls: list, tmp_path: Path) -> None:
+    """The mappings are computed once by eos_validate_state_facts, then given to the ConfigManager of each device by the runner."""
+    config_managers = []
+
+    def get_anta_results(config_manager: config_manager.ConfigManager, **_kwargs: object) -> list[dict]:
+        config_managers.append(config_manager)
+        return []
+
+    monkeypatch.setattr(eos_validate_state_runner, "AnsibleEOSDevice", lambda **_kwargs: None)
+    monkeypatch.setattr(eos_validate_state_runner, "get_anta_results", get_anta_results)
+    monkeypatch.setattr(eos_validate_state_runner, "get_custom_anta_catalogs", lambda *_args: None)
+
+    facts = run_action(eos_validate_state_facts.ActionModule, {}, {"hostvars": HOSTVARS})["ansible_facts"]
+    # Ansible converts the facts to JSON types.
+    facts = json.loads(json.dumps(facts))
+    task_args = {"test_results_dir": str(tmp_path), "custom_anta_catalogs_dir": str(tmp_path)}
+    for hostname in HOSTVARS:
+        run_action(eos_validate_state_runner.ActionModule, task_args, {"inventory_hostname": hostname, "hostvars": HOSTVARS, **facts})
+
+    assert len(loopback_mappings_calls) == 1
+    # The mappings of each device are the same as the ones computed by each device without the facts.
+    expected_manager = config_manager.ConfigManager(device_name="leaf1", hostvars=HOSTVARS)
+    assert [manager.device_name for manager in config_managers] == list(HOSTVARS)
+    for manager in config_managers:
+        assert manager.loopback0_mapping == expected_manager.loopback0_mapping
+        assert manager.vtep_mapping == expected_manager.vtep_mapping
+        assert manager.dps_mapping == expected_manager.dps_mapping
@@ -0,0 +1,73 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import json
+from json import JSONDecodeError
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.arista.avd.plugins.action import eos_validate_state_reports
+from ansible_collections.arista.avd.plugins.action.eos_validate_state_reports import MAX_WORKERS, ActionModule, _test_results_gen
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+HOSTS = [f"leaf{index}" for index in range(MAX_WORKERS * 3)]
+
+
+def write_results(test_results_dir: Path, hosts: list[str]) -> None:
+    for host in hosts:
+        results = [{"name": host, "test": "VerifyReloadCause", "categories": ["system"], "result": "failure", "messages": [f"{host} reloaded"]}]
+        (test_results_dir / f"{host}-results.json").write_text(json.dumps(results), encoding="UTF-8")
+
+
+def test_test_results_gen(tmp_path: Path) -> None:
+    write_results(tmp_path, HOSTS[:-2])
+    (tmp_path / f"{HOSTS[-2]}-results.json").write_text("not json", encoding="UTF-8")
+
+    test_results = list(_test_results_gen(HOSTS, tmp_path))
+
+    # The results are generated in the order of the hosts, with the loading errors.
+    assert [host for host, _host_results, _load_error in test_results] == HOSTS
+    for host, host_results, load_error in test_results[:-2]:
+        assert host_results == [{"name": host, "test": "VerifyReloadCause", "categories": ["system"], "result": "failure", "messages": [f"{host} reloaded"]}]
+        assert load_error is None
+    assert test_results[-2][1] is None
+    assert isinstance(test_results[-2][2], JSONDecodeError)
+    assert test_results[-1][1] is None
+    assert isinstance(test_results[-1][2], FileNotFoundError)
+
+
+def test_eos_validate_state_reports(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    warnings = []
+    monkeypatch.setattr(eos_validate_state_reports.display, "warning", warnings.append)
+    monkeypatch.setattr(ActionBase, "run", lambda _self, _tmp=None, _task_vars=None: {})
+    # leaf2 has no results file and leaf3 is not deployed.
+    write_results(tmp_path, ["leaf0", "leaf1"])
+    task_args = {
+        "csv_report_path": str(tmp_path / "report.csv"),
+        "md_report_path": str(tmp_path / "report.md"),
+        "test_results_dir": str(tmp_path),
+    }
+    task_vars = {
+        "hostvars": {"leaf0": {}, "leaf1": {}, "leaf2": {}, "leaf3": {"is_deployed": False}},
+        "ansible_play_hosts_all": ["leaf3", "leaf2", "leaf1", "leaf0"],
+    }
+    action = ActionModule(task=SimpleNamespace(args=task_args), connection=None, play_context=None, loader=None, templar=None, shared_loader_obj=None)
+
+    action.run(task_vars=task_vars)
+
+    assert len(warnings) == 2
+    assert warnings[0] == "No test results for host leaf3 since 'is_deployed' is False"
+    assert warnings[1].startswith("Failed to load the test results of host leaf2:")
+    csv_report = (tmp_path / "report.csv").read_text(encoding="UTF-8")
+    assert "leaf0 reloaded" in csv_report
+    assert "leaf1 reloaded" in csv_report
+    assert csv_report.index("leaf0 reloaded") < csv_report.index("leaf1 reloaded")
+    assert "leaf1 reloaded" in (tmp_path / "report.md").read_text(encoding="UTF-8")
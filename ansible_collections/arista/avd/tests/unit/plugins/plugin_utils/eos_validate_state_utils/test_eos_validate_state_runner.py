@@ -0,0 +1,148 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+pytest.importorskip("anta")
+
+from ansible.errors import AnsibleActionFail  # noqa: E402
+from ansible.plugins.action import ActionBase  # noqa: E402
+
+from ansible_collections.arista.avd.plugins.action import eos_validate_state_runner  # noqa: E402
+from ansible_collections.arista.avd.plugins.action.eos_validate_state_runner import ActionModule  # noqa: E402
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils import LimitedAsyncEOSDevice  # noqa: E402
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class FakeHostvars(dict):
+    """Hostvars with the inventory used to look up the groups of the devices for the custom catalogs."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        group = SimpleNamespace(get_name=lambda: "FABRIC")
+        self._inventory = SimpleNamespace(get_host=lambda _hostname: SimpleNamespace(get_groups=lambda: [group]))
+
+
+def get_hostvars() -> FakeHostvars:
+    return FakeHostvars(
+        {
+            hostname: {
+                "ansible_host": f"192.0.2.{index}",
+                "ansible_user": "admin",
+                "ansible_password": "admin",
+                "loopback_interfaces": [{"name": "Loopback0", "ip_address": f"10.0.0.{index}/32"}],
+            }
+            for index, hostname in enumerate(["leaf1", "leaf2"], start=1)
+        }
+        | {"leaf3": {"is_deployed": False}},
+    )
+
+
+@pytest.fixture
+def fabric_anta_results_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Record the calls to get_fabric_anta_results and return one result per device."""
+    calls = []
+
+    def get_fabric_anta_results(**kwargs: object) -> dict[str, list[dict]]:
+        calls.append(kwargs)
+        return {anta_device.name: [{"name": anta_device.name, "test": "VerifyUptime", "result": "success"}] for anta_device in kwargs["anta_devices"]}
+
+    monkeypatch.setattr(eos_validate_state_runner, "get_fabric_anta_results", get_fabric_anta_results)
+    monkeypatch.setattr(ActionBase, "run", lambda _self, _tmp=None, _task_vars=None: {})
+    return calls
+
+
+def run_action(task_args: dict, task_vars: dict) -> dict:
+    action = ActionModule(task=SimpleNamespace(args=task_args), connection=None, play_context=None, loader=None, templar=None, shared_loader_obj=None)
+    return action.run(task_vars=task_vars)
+
+
+def get_task_vars(hostvars: FakeHostvars, **kwargs: object) -> dict:
+    return {"inventory_hostname": "leaf1", "hostvars": hostvars, "ansible_play_hosts": ["leaf1", "leaf2", "leaf3"], **kwargs}
+
+
+def test_single_run(monkeypatch: pytest.MonkeyPatch, fabric_anta_results_calls: list[dict], tmp_path: Path) -> None:
+    loopback_mappings_calls = []
+    original_get_loopback_mappings = eos_validate_state_runner.get_loopback_mappings
+
+    def get_loopback_mappings(hostvars: FakeHostvars) -> dict:
+        loopback_mappings_calls.append(hostvars)
+        return original_get_loopback_mappings(hostvars)
+
+    monkeypatch.setattr(eos_validate_state_runner, "get_loopback_mappings", get_loopback_mappings)
+
+    test_results_dir = tmp_path / "results"
+    test_catalogs_dir = tmp_path / "catalogs"
+    custom_anta_catalogs_dir = tmp_path / "custom"
+    for directory in (test_results_dir, test_catalogs_dir, custom_anta_catalogs_dir):
+        directory.mkdir()
+    (custom_anta_catalogs_dir / "FABRIC.yml").write_text("anta.tests.system:\n- VerifyReloadCause:\n", encoding="UTF-8")
+    task_args = {
+        "single_run": True,
+        "max_concurrency": 5,
+        "save_catalog": True,
+        "test_catalogs_dir": str(test_catalogs_dir),
+        "test_results_dir": str(test_results_dir),
+        "custom_anta_catalogs_dir": str(custom_anta_catalogs_dir),
+    }
+
+    result = run_action(task_args, get_task_vars(get_hostvars(), ansible_check_mode=True))
+
+    assert not result.get("failed")
+    # A single ANTA run for all deployed devices of the play.
+    assert len(fabric_anta_results_calls) == 1
+    call = fabric_anta_results_calls[0]
+    assert [anta_device.name for anta_device in call["anta_devices"]] == ["leaf1", "leaf2"]
+    assert all(isinstance(anta_device, LimitedAsyncEOSDevice) for anta_device in call["anta_devices"])
+    # The devices share the same limit of concurrent eAPI requests.
+    semaphore = call["anta_devices"][0]._semaphore
+    assert call["anta_devices"][1]._semaphore is semaphore
+    assert semaphore._value == 5
+    # The loopback mappings are computed once for all devices.
+    assert list(call["config_managers"]) == ["leaf1", "leaf2"]
+    assert call["config_managers"]["leaf1"].loopback0_mapping == [("leaf1", "10.0.0.1"), ("leaf2", "10.0.0.2")]
+    assert call["config_managers"]["leaf2"].loopback0_mapping == [("leaf1", "10.0.0.1"), ("leaf2", "10.0.0.2")]
+    assert len(loopback_mappings_calls) == 1
+    assert call["save_catalog_names"] == {hostname: test_catalogs_dir / f"{hostname}-catalog.yml" for hostname in ("leaf1", "leaf2")}
+    assert call["custom_anta_catalogs"] == {hostname: [custom_anta_catalogs_dir / "FABRIC.yml"] for hostname in ("leaf1", "leaf2")}
+    assert call["dry_run"] is True
+
+    # The results are written per device, like when running the task per device.
+    for hostname in ("leaf1", "leaf2"):
+        with (test_results_dir / f"{hostname}-results.json").open(encoding="UTF-8") as results_file:
+            assert json.load(results_file) == [{"name": hostname, "test": "VerifyUptime", "result": "success"}]
+    assert not (test_results_dir / "leaf3-results.json").exists()
+
+
+def test_single_run_precomputed_loopback_mappings(monkeypatch: pytest.MonkeyPatch, fabric_anta_results_calls: list[dict], tmp_path: Path) -> None:
+    def get_loopback_mappings(_hostvars: object) -> None:
+        pytest.fail("The loopback mappings must not be computed when given as a fact.")
+
+    monkeypatch.setattr(eos_validate_state_runner, "get_loopback_mappings", get_loopback_mappings)
+    # Ansible facts convert the tuples to lists.
+    loopback_mappings = {"loopback0_mapping": [["leaf1", "10.0.0.11"]], "vtep_mapping": [], "dps_mapping": []}
+    task_args = {"single_run": True, "test_results_dir": str(tmp_path), "custom_anta_catalogs_dir": str(tmp_path)}
+
+    run_action(task_args, get_task_vars(get_hostvars(), avd_validate_state_mappings=loopback_mappings))
+
+    call = fabric_anta_results_calls[0]
+    assert call["config_managers"]["leaf2"].loopback0_mapping == [("leaf1", "10.0.0.11")]
+    assert call["save_catalog_names"] is None
+    assert call["custom_anta_catalogs"] == {"leaf1": None, "leaf2": None}
+    assert call["dry_run"] is False
+    assert call["anta_devices"][0]._semaphore._value == eos_validate_state_runner.DEFAULT_MAX_CONCURRENCY
+
+
+@pytest.mark.usefixtures("fabric_anta_results_calls")
+def test_single_run_invalid_max_concurrency(tmp_path: Path) -> None:
+    task_args = {"single_run": True, "max_concurrency": 0, "test_results_dir": str(tmp_path), "custom_anta_catalogs_dir": str(tmp_path)}
+    with pytest.raises(AnsibleActionFail, match="'max_concurrency' must be at least 1"):
+        run_action(task_args, get_task_vars(get_hostvars()))
@@ -0,0 +1,139 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from importlib import import_module
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+from yaml import CSafeLoader, load
+
+pytest.importorskip("anta")
+
+from anta.device import AsyncEOSDevice  # noqa: E402
+from anta.result_manager.models import TestResult as AntaTestResult  # noqa: E402
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils.get_anta_results import (  # noqa: E402
+    filter_tests_by_device,
+    get_fabric_anta_results,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# The package exports a function with the same name as the module.
+get_anta_results_module = import_module("ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils.get_anta_results")
+
+DEVICE_TESTS = {
+    "leaf1": {
+        "anta.tests.system": [
+            {"VerifyUptime": {"minimum": 86400}},
+            {"VerifyReloadCause": {"result_overwrite": {"custom_field": "leaf1 reload cause"}}},
+        ],
+        # Tests already filtered on another device are not run on leaf1.
+        "anta.tests.software": [{"VerifyEOSVersion": {"versions": ["4.31.1F"], "filters": {"tags": ["leaf2"]}}}],
+    },
+    "leaf2": {
+        "anta.tests.software": [{"VerifyEOSVersion": {"versions": ["4.31.1F"]}}],
+    },
+    "leaf3": {},
+}
+
+
+@pytest.fixture
+def anta_devices() -> list[AsyncEOSDevice]:
+    return [AsyncEOSDevice(host="192.0.2.1", username="admin", password="admin", name=name) for name in DEVICE_TESTS]  # noqa: S106
+
+
+@pytest.fixture
+def config_managers(monkeypatch: pytest.MonkeyPatch) -> dict[str, SimpleNamespace]:
+    """Return fake ConfigManagers and generate the tests of each device from DEVICE_TESTS."""
+    monkeypatch.setattr(
+        get_anta_results_module, "generate_tests", lambda config_manager, _skip_tests, _custom_catalog: DEVICE_TESTS[config_manager.device_name]
+    )
+    return {name: SimpleNamespace(device_name=name) for name in DEVICE_TESTS}
+
+
+def test_filter_tests_by_device() -> None:
+    tests = {
+        "anta.tests.system": [
+            {"VerifyUptime": {"minimum": 86400}},
+            {"VerifyReloadCause": None},
+            {"VerifyNTP": {"filters": {"tags": ["leaf1", "leaf2"]}}},
+            {"VerifyCoredump": {"filters": {"tags": ["leaf2"]}}},
+        ],
+    }
+    assert filter_tests_by_device(tests, "leaf1") == {
+        "anta.tests.system": [
+            {"VerifyUptime": {"minimum": 86400, "filters": {"tags": ["leaf1"]}}},
+            {"VerifyReloadCause": {"filters": {"tags": ["leaf1"]}}},
+            {"VerifyNTP": {"filters": {"tags": ["leaf1"]}}},
+        ],
+    }
+    # The given tests are not modified.
+    assert tests["anta.tests.system"][0] == {"VerifyUptime": {"minimum": 86400}}
+
+
+def test_get_fabric_anta_results_dry_run(anta_devices: list[AsyncEOSDevice], config_managers: dict[str, SimpleNamespace], tmp_path: Path) -> None:
+    save_catalog_names = {name: tmp_path / f"{name}-catalog.yml" for name in ("leaf1", "leaf2")}
+
+    results = get_fabric_anta_results(anta_devices, config_managers, "WARNING", [], save_catalog_names=save_catalog_names, dry_run=True)
+
+    assert {name: [(result["name"], result["test"], result.get("custom_field")) for result in device_results] for name, device_results in results.items()} == {
+        "leaf1": [("leaf1", "VerifyReloadCause", "leaf1 reload cause"), ("leaf1", "VerifyUptime", None)],
+        "leaf2": [("leaf2", "VerifyEOSVersion", None)],
+        "leaf3": [],
+    }
+    # The saved catalogs are the tests of the device, without the device name tag.
+    for name, catalog_path in save_catalog_names.items():
+        with catalog_path.open(encoding="UTF-8") as catalog_file:
+            assert load(catalog_file, Loader=CSafeLoader) == DEVICE_TESTS[name]
+    assert not (tmp_path / "leaf3-catalog.yml").exists()
+
+
+def test_get_fabric_anta_results(monkeypatch: pytest.MonkeyPatch, anta_devices: list[AsyncEOSDevice], config_managers: dict[str, SimpleNamespace]) -> None:
+    runs = []
+
+    async def anta_runner(manager: object, inventory: dict, catalog: object) -> None:
+        """Record the ANTA run and add a result to each device matching the tags of each test."""
+        runs.append((sorted(inventory), [(test.test.name, test.inputs.filters.tags) for test in catalog.tests]))
+        for test in catalog.tests:
+            for name in sorted(test.inputs.filters.tags):
+                manager.add(
+                    AntaTestResult(name=name, test=test.test.name, categories=test.test.categories, description=test.test.description, result="success")
+                )
+
+    monkeypatch.setattr(get_anta_results_module, "anta_runner", anta_runner)
+
+    results = get_fabric_anta_results(anta_devices, config_managers, "WARNING", [])
+
+    # All devices are tested in one ANTA run, where each test is limited to its device.
+    assert runs == [
+        (
+            ["leaf1", "leaf2", "leaf3"],
+            [("VerifyUptime", {"leaf1"}), ("VerifyReloadCause", {"leaf1"}), ("VerifyEOSVersion", {"leaf2"})],
+        ),
+    ]
+    assert {name: [(result["test"], result["result"]) for result in device_results] for name, device_results in results.items()} == {
+        "leaf1": [("VerifyReloadCause", "success"), ("VerifyUptime", "success")],
+        "leaf2": [("VerifyEOSVersion", "success")],
+        "leaf3": [],
+    }
+
+
+def test_get_fabric_anta_results_empty_catalog(monkeypatch: pytest.MonkeyPatch, anta_devices: list[AsyncEOSDevice]) -> None:
+    runs = []
+
+    async def anta_runner(*args: object) -> None:
+        runs.append(args)
+
+    monkeypatch.setattr(get_anta_results_module, "anta_runner", anta_runner)
+    monkeypatch.setattr(get_anta_results_module, "generate_tests", lambda _config_manager, _skip_tests, _custom_catalog: {})
+    config_managers = {name: SimpleNamespace(device_name=name) for name in DEVICE_TESTS}
+
+    results = get_fabric_anta_results(anta_devices, config_managers, "WARNING", [])
+
+    assert runs == []
+    assert results == {"leaf1": [], "leaf2": [], "leaf3": []}
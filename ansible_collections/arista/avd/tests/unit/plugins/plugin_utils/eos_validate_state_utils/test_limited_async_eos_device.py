@@ -0,0 +1,123 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("anta")
+
+from anta.device import AsyncEOSDevice  # noqa: E402
+from anta.models import AntaCommand  # noqa: E402
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils.limited_async_eos_device import LimitedAsyncEOSDevice  # noqa: E402
+
+
+@pytest.fixture
+def device_kwargs(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Record the arguments given to AsyncEOSDevice instead of creating the eAPI client."""
+    calls = []
+
+    def init(self: AsyncEOSDevice, **kwargs: object) -> None:
+        calls.append(kwargs)
+        self.name = kwargs["name"]
+
+    monkeypatch.setattr(AsyncEOSDevice, "__init__", init)
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("hostvars", "expected_kwargs"),
+    [
+        pytest.param(
+            {
+                "ansible_host": "192.0.2.1",
+                "ansible_user": "admin",
+                "ansible_password": "password",
+                "ansible_httpapi_use_ssl": True,
+                "ansible_httpapi_validate_certs": False,
+                "ansible_httpapi_port": "8443",
+                "ansible_become": "yes",
+                "ansible_become_password": "enable",
+            },
+            {
+                "host": "192.0.2.1",
+                "username": "admin",
+                "password": "password",
+                "name": "leaf1",
+                "enable_password": "enable",
+                "port": 8443,
+                "proto": "https",
+                "enable": True,
+                "insecure": True,
+            },
+            id="all_variables",
+        ),
+        pytest.param(
+            {"ansible_httpapi_pass": "password", "ansible_httpapi_use_ssl": "true", "ansible_become_pass": "enable"},
+            {
+                "host": "leaf1",
+                "username": "",
+                "password": "password",
+                "name": "leaf1",
+                "enable_password": "enable",
+                "port": 443,
+                "proto": "https",
+                "enable": False,
+                "insecure": False,
+            },
+            id="aliases_default_https_port",
+        ),
+        pytest.param(
+            {},
+            {
+                "host": "leaf1",
+                "username": "",
+                "password": "",
+                "name": "leaf1",
+                "enable_password": None,
+                "port": 80,
+                "proto": "http",
+                "enable": False,
+                "insecure": False,
+            },
+            id="defaults",
+        ),
+    ],
+)
+def test_from_hostvars(device_kwargs: list[dict], hostvars: dict, expected_kwargs: dict) -> None:
+    semaphore = asyncio.Semaphore(1)
+    device = LimitedAsyncEOSDevice.from_hostvars(name="leaf1", hostvars=hostvars, semaphore=semaphore)
+    assert device_kwargs == [expected_kwargs]
+    assert device.name == "leaf1"
+    assert device._semaphore is semaphore
+
+
+@pytest.mark.usefixtures("device_kwargs")
+def test_collect_shares_semaphore(monkeypatch: pytest.MonkeyPatch) -> None:
+    collected = []
+    running = 0
+    max_running = 0
+
+    async def collect(self: AsyncEOSDevice, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001)
+        collected.append((self.name, command.command, collection_id))
+        running -= 1
+
+    monkeypatch.setattr(AsyncEOSDevice, "_collect", collect)
+
+    async def collect_all() -> None:
+        semaphore = asyncio.Semaphore(2)
+        devices = [LimitedAsyncEOSDevice.from_hostvars(name=name, hostvars={}, semaphore=semaphore) for name in ("leaf1", "leaf2")]
+        await asyncio.gather(*(device._collect(AntaCommand(command=f"show version {index}"), collection_id="id") for device in devices for index in range(5)))
+
+    asyncio.run(collect_all())
+
+    # At most two commands are collected at the same time across both devices.
+    assert max_running == 2
+    assert sorted(collected) == sorted((name, f"show version {index}", "id") for name in ("leaf1", "leaf2") for index in range(5))
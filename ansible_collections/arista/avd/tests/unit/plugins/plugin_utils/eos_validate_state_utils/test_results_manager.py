@@ -0,0 +1,119 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_validate_state_utils import ResultsManager
+
+ANTA_RESULTS = [
+    {"name": "leaf1", "test": "VerifyBGPSpecificPeers", "categories": ["bgp"], "description": "BGP peers", "result": "success", "custom_field": "peer 1"},
+    {"name": "leaf1", "test": "VerifyLLDPNeighbors", "categories": ["lldp"], "result": "failure", "messages": ["Neighbor missing"]},
+    {"name": "leaf2", "test": "VerifyRoutingTableEntry", "categories": ["routing"], "result": "error", "messages": ["Command failed"]},
+    {"name": "leaf2", "test": "VerifyStunClient", "categories": ["stun"], "result": "skipped"},
+    {"name": "leaf2", "test": "VerifyReloadCause", "categories": ["system"]},
+]
+
+
+def get_parsed_result(test_id: int, dut: str, category: str, test: str, result: str, messages: list | None = None, **kwargs: str) -> dict:
+    return {
+        "id": test_id,
+        "dut": dut,
+        "categories": [category],
+        "test": test,
+        "description": kwargs.get("description", ""),
+        "inputs": kwargs.get("inputs"),
+        "result": result,
+        "messages": messages or [],
+    }
+
+
+PARSED_RESULTS = [
+    get_parsed_result(1, "leaf1", "BGP", "VerifyBGPSpecificPeers", "PASS", description="BGP peers", inputs="peer 1"),
+    get_parsed_result(2, "leaf1", "LLDP", "VerifyLLDPNeighbors", "FAIL", ["Neighbor missing"]),
+    get_parsed_result(3, "leaf2", "Routing", "VerifyRoutingTableEntry", "FAIL", ["Command failed"]),
+    get_parsed_result(4, "leaf2", "STUN", "VerifyStunClient", "SKIPPED"),
+    get_parsed_result(5, "leaf2", "System", "VerifyReloadCause", "NOT RUN"),
+]
+
+
+def test_results_manager_only_failed_tests() -> None:
+    with ResultsManager(only_failed_tests=True) as results_manager:
+        for result in ANTA_RESULTS:
+            results_manager.update_results(result)
+
+        assert list(results_manager.failed_tests) == [PARSED_RESULTS[1], PARSED_RESULTS[2]]
+        assert list(results_manager.all_tests) == []
+        assert results_manager._all_tests_file is None
+
+
+def test_results_manager_all_tests() -> None:
+    with ResultsManager(only_failed_tests=False) as results_manager:
+        for result in ANTA_RESULTS:
+            results_manager.update_results(result)
+
+        assert list(results_manager.all_tests) == PARSED_RESULTS
+        assert list(results_manager.failed_tests) == [PARSED_RESULTS[1], PARSED_RESULTS[2]]
+        # The spooled results can be streamed again, for example for each report.
+        assert list(results_manager.all_tests) == PARSED_RESULTS
+
+
+def test_results_manager_update_after_streaming() -> None:
+    with ResultsManager(only_failed_tests=False) as results_manager:
+        results_manager.update_results(ANTA_RESULTS[0])
+        results_manager.update_results(ANTA_RESULTS[1])
+        assert list(results_manager.failed_tests) == [PARSED_RESULTS[1]]
+
+        # New results are appended after the ones already streamed.
+        results_manager.update_results(ANTA_RESULTS[2])
+        assert list(results_manager.failed_tests) == [PARSED_RESULTS[1], PARSED_RESULTS[2]]
+        assert list(results_manager.all_tests) == PARSED_RESULTS[:3]
+
+
+def test_results_manager_stats() -> None:
+    with ResultsManager(only_failed_tests=True) as results_manager:
+        for result in ANTA_RESULTS:
+            results_manager.update_results(result)
+
+        assert results_manager.total_tests == 5
+        assert results_manager.total_tests_passed == 1
+        assert results_manager.total_tests_failed == 2
+        assert results_manager.total_tests_skipped == 1
+        assert results_manager.total_tests_not_run == 1
+        assert results_manager.dut_stats["leaf1"] == {
+            "tests_passed": 1,
+            "tests_failed": 1,
+            "tests_skipped": 0,
+            "tests_not_run": 0,
+            "categories_failed": {"LLDP"},
+            "categories_skipped": set(),
+        }
+        assert results_manager.dut_stats["leaf2"] == {
+            "tests_passed": 0,
+            "tests_failed": 1,
+            "tests_skipped": 1,
+            "tests_not_run": 1,
+            "categories_failed": {"Routing"},
+            "categories_skipped": {"STUN"},
+        }
+        assert list(results_manager.sorted_category_stats) == ["BGP", "LLDP", "Routing", "STUN", "System"]
+        assert results_manager.sorted_category_stats["Routing"] == {"tests_passed": 0, "tests_failed": 1, "tests_skipped": 0, "tests_not_run": 0}
+
+
+def test_results_manager_invalid_result() -> None:
+    with ResultsManager(only_failed_tests=False) as results_manager:
+        with pytest.raises(TypeError, match="must be dictionary, got list"):
+            results_manager.update_results(["not", "a", "dict"])
+        results_manager.update_results(ANTA_RESULTS[1])
+
+        # The invalid result is not spooled, but still counts for the test ids.
+        assert [result["id"] for result in results_manager.all_tests] == [2]
+
+
+def test_results_manager_close() -> None:
+    with ResultsManager(only_failed_tests=False) as results_manager:
+        results_manager.update_results(ANTA_RESULTS[1])
+    # The temporary files are removed when leaving the context.
+    assert results_manager._failed_tests_file.closed
+    assert results_manager._all_tests_file.closed
@@ -1,6 +1,7 @@
 # Copyright (c) 2023-2024 Arista Networks, Inc.
 # Use of this source code is governed by the Apache License 2.0
 # that can be found in the LICENSE file.
+from .build_fabric import DeviceBuildResult, build_fabric
 from .get_avd_facts import get_avd_facts
 from .get_device_config import get_device_config
 from .get_device_doc import get_device_doc
@@ -20,11 +21,13 @@ __license__ = "Apache 2.0"
 __version__ = "5.0.0rc2"
 
 __all__ = [
+    "build_fabric",
     "get_avd_facts",
     "get_device_config",
     "get_device_doc",
     "get_device_structured_config",
     "validate_inputs",
     "validate_structured_config",
+    "DeviceBuildResult",
     "ValidationResult",
 ]
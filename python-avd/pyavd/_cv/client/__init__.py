@@ -6,13 +6,15 @@ from __future__ import annotations
 import ssl
 from typing import TYPE_CHECKING
 
-from grpclib.client import Channel
-from requests import JSONDecodeError, get, post
+from requests import JSONDecodeError, RequestException, Response, Session
 
 from .change_control import ChangeControlMixin
+from .channel_pool import ChannelPool
 from .configlet import ConfigletMixin
+from .constants import DEFAULT_REST_TIMEOUT
 from .exceptions import CVClientException
 from .inventory import InventoryMixin
+from .scheduler import AdaptiveScheduler
 from .studio import StudioMixin
 from .swg import SwgMixin
 from .tag import TagMixin
@@ -24,6 +26,8 @@ if TYPE_CHECKING:
     from types import TracebackType
     from typing import Self
 
+    from .channel_pool import PooledChannel
+
 
 class CVClient(
     ChangeControlMixin,
@@ -35,7 +39,8 @@ class CVClient(
     UtilsMixin,
     WorkspaceMixin,
 ):
-    _channel: Channel | None = None
+    _channel_pool: ChannelPool | None = None
+    _session: Session | None = None
     _metadata: dict
     _servers: list[str]
     _port: int
@@ -44,6 +49,7 @@ class CVClient(
     _username: str | None
     _password: str | None
     _cv_version: CvVersion | None = None
+    _scheduler: AdaptiveScheduler
 
     def __init__(
         self,
@@ -61,7 +67,7 @@ class CVClient(
             `async with CVClient(servers="myserver", token="mytoken") as cv_client:`
 
         Parameters:
-            servers: A single FQDN for CVaaS or a list of FQDNs for one CVP cluster.
+            servers: A single FQDN for CVaaS or a list of FQDNs for one CVP cluster. Calls are spread across all servers of the cluster.
             token: Token defined in CloudVision under service-accounts.
             username: Username to use for authentication if token is not set.
             password: Password to use for authentication if token is not set.
@@ -78,6 +84,8 @@ class CVClient(
         self._username = username
         self._password = password
         self._verify_certs = verify_certs
+        # Shared by all batched API calls, so the number of parallel calls adapts to the load on CloudVision.
+        self._scheduler = AdaptiveScheduler()
 
     async def __aenter__(self) -> Self:
         """Using asynchronous context manager since grpclib must be initialized inside an asyncio loop."""
@@ -85,24 +93,35 @@ class CVClient(
         return self
 
     async def __aexit__(self, _exc_type: type[BaseException] | None, _exc_val: BaseException | None, _exc_tb: TracebackType | None) -> None:
-        self._channel.close()
-        self._channel = None
+        self._channel_pool.close()
+        self._channel_pool = None
+        self._session.close()
+        self._session = None
+
+    @property
+    def _channel(self) -> PooledChannel:
+        """Return the next healthy gRPC channel from the pool, spreading the calls across all servers of the cluster."""
+        return self._channel_pool.get_channel()
 
     def _connect(self) -> None:
         # TODO: Verify connection
-        # TODO: Handle multinode clusters
 
         # Ensure that the default ssl context is initialized before doing any requests.
         ssl_context = self._ssl_context()
 
+        if self._session is None:
+            # A single HTTP session is reused for all REST calls.
+            self._session = Session()
+            self._session.verify = self._verify_certs
+
+        if self._channel_pool is None:
+            self._channel_pool = ChannelPool(servers=self._servers, port=self._port, ssl_context=ssl_context)
+
         if not self._token:
             self._set_token()
 
         self._set_version()
 
-        if self._channel is None:
-            self._channel = Channel(host=self._servers[0], port=self._port, ssl=ssl_context)
-
         self._metadata = {"authorization": "Bearer " + self._token}
 
     def _ssl_context(self) -> ssl.SSLContext | bool:
@@ -123,13 +142,39 @@ class CVClient(
             context = True
         return context
 
+    def _rest_request(self, method: str, path: str, **kwargs: object) -> Response:
+        """
+        Perform a REST request against the first responding server of the cluster.
+
+        Servers failing to respond are marked as unhealthy in the channel pool, so gRPC calls will also avoid them.
+        """
+        last_exception = None
+        for server in self._channel_pool.get_servers():
+            response, last_exception = self._rest_request_to_server(server, method, path, **kwargs)
+            if response is not None:
+                return response
+
+        msg = f"Unable to connect to any of the CloudVision servers {self._servers}."
+        raise CVClientException(msg) from last_exception
+
+    def _rest_request_to_server(self, server: str, method: str, path: str, **kwargs: object) -> tuple[Response | None, RequestException | None]:
+        """
+        Perform a REST request against the given server.
+
+        Returns a tuple of the response and None, or of None and the exception if the server failed to respond.
+        The server is then marked as unhealthy in the channel pool.
+        """
+        try:
+            return self._session.request(method, f"https://{server}{path}", timeout=DEFAULT_REST_TIMEOUT, **kwargs), None
+        except RequestException as e:
+            self._channel_pool.mark_unhealthy(server)
+            return None, e
+
     def _set_token(self) -> None:
         """
         Uses username/password for authenticating via REST.
 
         Sets the session token into self._token to be used for gRPC channel.
-
-        TODO: Handle multinode clusters
         """
         if self._token:
             return
@@ -139,10 +184,10 @@ class CVClient(
             raise CVClientException(msg)
 
         try:
-            response = post(  # noqa: S113 TODO: Add configurable timeout
-                "https://" + self._servers[0] + "/cvpservice/login/authenticate.do",
+            response = self._rest_request(
+                "POST",
+                "/cvpservice/login/authenticate.do",
                 auth=(self._username, self._password),
-                verify=self._verify_certs,
                 json={},
             )
 
@@ -156,18 +201,16 @@ class CVClient(
         Fetch the CloudVision version via REST and set self._cv_version.
 
         This version is used to decide which APIs to use later.
-
-        TODO: Handle multinode clusters
         """
         if not self._token:
             msg = "Unable to get version from CloudVision server. Missing token."
             raise CVClientException(msg)
 
         try:
-            response = get(  # noqa: S113 TODO: Add configurable timeout
-                "https://" + self._servers[0] + "/cvpservice/cvpInfo/getCvpInfo.do",
+            response = self._rest_request(
+                "GET",
+                "/cvpservice/cvpInfo/getCvpInfo.do",
                 headers={"Authorization": f"Bearer {self._token}"},
-                verify=self._verify_certs,
                 json={},
             )
 
@@ -0,0 +1,89 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from logging import getLogger
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from grpclib.client import Channel
+
+if TYPE_CHECKING:
+    import ssl
+
+    from grpclib.protocol import H2Protocol
+
+LOGGER = getLogger(__name__)
+
+UNHEALTHY_RETRY_INTERVAL = 30.0
+"""Seconds before a server is used again after failing to connect."""
+
+
+class PooledChannel(Channel):
+    """grpclib Channel recording the time of the last failed connection attempt."""
+
+    failed_at: float | None = None
+
+    async def __connect__(self) -> H2Protocol:
+        try:
+            protocol = await super().__connect__()
+        except Exception:
+            LOGGER.info("PooledChannel: Failed to connect to CloudVision server '%s'.", self._host)
+            self.failed_at = monotonic()
+            raise
+
+        self.failed_at = None
+        return protocol
+
+
+class ChannelPool:
+    """
+    Pool of gRPC channels to all servers of a CloudVision cluster.
+
+    Channels are handed out round-robin, so independent calls are spread across all servers.
+    Servers failing to connect are skipped for `UNHEALTHY_RETRY_INTERVAL` seconds, unless all servers are unhealthy.
+
+    Must be created inside an asyncio loop, since grpclib binds the channels to the running loop.
+
+    Parameters:
+        servers: List of FQDNs of the servers in the cluster.
+        port: TCP port to use for the connections.
+        ssl_context: SSL context or True passed to grpclib.
+    """
+
+    def __init__(self, servers: list[str], port: int, ssl_context: ssl.SSLContext | bool) -> None:
+        self.channels = [PooledChannel(host=server, port=port, ssl=ssl_context) for server in servers]
+        self._next_index = 0
+
+    def get_channel(self) -> PooledChannel:
+        """Return the next healthy channel. If no channel is healthy, return the next channel to let the call retry the connection."""
+        channels_count = len(self.channels)
+        for offset in range(channels_count):
+            channel = self.channels[(self._next_index + offset) % channels_count]
+            if self.is_healthy(channel):
+                self._next_index = (self._next_index + offset + 1) % channels_count
+                return channel
+
+        channel = self.channels[self._next_index]
+        self._next_index = (self._next_index + 1) % channels_count
+        return channel
+
+    def get_servers(self) -> list[str]:
+        """Return the servers of the pool with the healthy servers first, starting from the next channel in the round-robin."""
+        channels_count = len(self.channels)
+        channels = [self.channels[(self._next_index + offset) % channels_count] for offset in range(channels_count)]
+        return [channel._host for channel in sorted(channels, key=lambda channel: not self.is_healthy(channel))]
+
+    def is_healthy(self, channel: PooledChannel) -> bool:
+        return channel.failed_at is None or monotonic() - channel.failed_at > UNHEALTHY_RETRY_INTERVAL
+
+    def mark_unhealthy(self, server: str) -> None:
+        """Mark the given server as unhealthy, for example after failing a REST call."""
+        for channel in self.channels:
+            if channel._host == server:
+                channel.failed_at = monotonic()
+
+    def close(self) -> None:
+        for channel in self.channels:
+            channel.close()
@@ -3,7 +3,7 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
-from asyncio import gather
+from functools import partial
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
@@ -25,11 +25,11 @@ from pyavd._cv.api.arista.configlet.v1 import (
     ConfigletKey,
     ConfigletServiceStub,
     ConfigletStreamRequest,
+    Filter,
     MatchPolicy,
 )
 from pyavd._cv.api.arista.time import TimeBounds
 from pyavd._cv.api.fmp import RepeatedString
-from pyavd._utils import batch
 
 from .async_decorators import LimitCvVersion, grpc_msg_size_handler
 from .constants import DEFAULT_API_TIMEOUT
@@ -45,7 +45,6 @@ ASSIGNMENT_MATCH_POLICY_MAP = {
     "match_all": MatchPolicy.MATCH_ALL,
     None: MatchPolicy.UNSPECIFIED,
 }
-PARALLEL_COROUTINES = 20
 
 LOGGER = getLogger(__name__)
 
@@ -188,7 +187,7 @@ class ConfigletMixin:
         timeout: float = DEFAULT_API_TIMEOUT,
     ) -> list[ConfigletAssignmentKey]:
         """
-        Create batches of containers and do parallel calls to set_configlet_container for each batch.
+        Do parallel calls to set_configlet_container for each container using the shared scheduler of the client.
 
         Parameters:
             workspace_id: Unique identifier of the Workspace for which the information is fetched.
@@ -199,8 +198,9 @@ class ConfigletMixin:
         Returns:
             ConfigletAssignmentKey objects after being set including any server-generated values.
         """
-        coroutines = [
-            self.set_configlet_container(
+        calls = [
+            partial(
+                self.set_configlet_container,
                 workspace_id=workspace_id,
                 container_id=container_id,
                 display_name=display_name,
@@ -214,19 +214,10 @@ class ConfigletMixin:
             for container_id, display_name, description, configlet_ids, query, child_assignment_ids, match_policy in containers
         ]
 
-        configlet_configs = []
-
-        LOGGER.info("set_configlet_containers: Deploying %s configlet assignments / containers in batches of %s.", len(coroutines), PARALLEL_COROUTINES)
-        for index, batch_coroutines in enumerate(batch(coroutines, PARALLEL_COROUTINES), start=1):
-            LOGGER.info("set_configlet_containers: Batch %s", index)
-            configlet_configs.extend(await gather(*batch_coroutines))
-
-        return [
-            await self.set_configlet_container(
-                workspace_id, container_id, display_name, description, configlet_ids, query, child_assignment_ids, match_policy, timeout
-            )
-            for container_id, display_name, description, configlet_ids, query, child_assignment_ids, match_policy in containers
-        ]
+        LOGGER.info(
+            "set_configlet_containers: Deploying %s configlet assignments / containers with up to %s parallel calls.", len(calls), self._scheduler.limit
+        )
+        return await self._scheduler.run(calls)
 
     async def delete_configlet_container(
         self: CVClient,
@@ -264,6 +255,7 @@ class ConfigletMixin:
         workspace_id: str,
         configlet_ids: list[str] | None = None,
         time: datetime | None = None,
+        include_body: bool = False,
         timeout: float = DEFAULT_API_TIMEOUT,
     ) -> list[Configlet]:
         """
@@ -275,12 +267,13 @@ class ConfigletMixin:
             workspace_id: Unique identifier of the Workspace for which the information is fetched. Use "" for mainline.
             configlet_ids: Unique identifiers for Configlets. If not set the function will return all configlets.
             time: Timestamp from which the information is fetched. `now()` if not set.
+            include_body: Include the body of the Configlets. Otherwise the server is asked to leave out the body.
             timeout: Timeout in seconds.
 
         Returns:
             List of matching Configlet objects.
         """
-        request = ConfigletStreamRequest(partial_eq_filter=[], time=TimeBounds(start=None, end=time))
+        request = ConfigletStreamRequest(partial_eq_filter=[], filter=Filter(include_body=include_body), time=TimeBounds(start=None, end=time))
         if configlet_ids:
             for configlet_id in configlet_ids:
                 request.partial_eq_filter.append(Configlet(key=ConfigletKey(workspace_id=workspace_id, configlet_id=configlet_id)))
@@ -425,7 +418,7 @@ class ConfigletMixin:
         timeout: float = DEFAULT_API_TIMEOUT,
     ) -> list[ConfigletKey]:
         """
-        Create batches of configlets and do parallel calls to set_configlet_from_file for each batch.
+        Do parallel calls to set_configlet_from_file for each configlet using the shared scheduler of the client.
 
         Parameters:
             workspace_id: Unique identifier of the Workspace for which the information is fetched.
@@ -435,8 +428,9 @@ class ConfigletMixin:
         Returns:
             List of ConfigletConfig objects after being set including any server-generated values.
         """
-        coroutines = [
-            self.set_configlet_from_file(
+        calls = [
+            partial(
+                self.set_configlet_from_file,
                 workspace_id=workspace_id,
                 configlet_id=configlet_id,
                 file=file,
@@ -447,12 +441,8 @@ class ConfigletMixin:
             for configlet_id, display_name, description, file in configlets
         ]
 
-        configlet_configs = []
-
-        LOGGER.info("set_configlets_from_files: Deploying %s configlets in batches of %s.", len(coroutines), PARALLEL_COROUTINES)
-        for index, batch_coroutines in enumerate(batch(coroutines, PARALLEL_COROUTINES), start=1):
-            LOGGER.info("set_configlets_from_files: Batch %s", index)
-            configlet_configs.extend(await gather(*batch_coroutines))
+        LOGGER.info("set_configlets_from_files: Deploying %s configlets with up to %s parallel calls.", len(calls), self._scheduler.limit)
+        return await self._scheduler.run(calls)
 
     @grpc_msg_size_handler("configlet_ids")
     async def delete_configlets(
@@ -5,4 +5,7 @@
 DEFAULT_API_TIMEOUT = 600.0
 """Default API timeout in seconds"""
 
+DEFAULT_REST_TIMEOUT = 30.0
+"""Default timeout in seconds for REST calls used for authentication and version discovery"""
+
 CVAAS_VERSION_STRING = "CVaaS"
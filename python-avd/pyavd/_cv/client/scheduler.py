@@ -0,0 +1,183 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from asyncio import FIRST_EXCEPTION, Future, Task, create_task, get_running_loop, sleep, wait
+from logging import getLogger
+from random import uniform
+from time import monotonic
+from typing import TYPE_CHECKING, TypeVar
+
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from .exceptions import CVTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+T = TypeVar("T")
+
+LOGGER = getLogger(__name__)
+
+TRANSIENT_GRPC_STATUSES = frozenset((Status.RESOURCE_EXHAUSTED, Status.UNAVAILABLE, Status.DEADLINE_EXCEEDED))
+"""gRPC statuses considered transient. Calls failing with these are retried and the concurrency is reduced."""
+
+
+def is_transient_error(exception: Exception) -> bool:
+    """Return True if the given exception is a transient error from CloudVision which is worth retrying."""
+    if isinstance(exception, (CVTimeoutError, ConnectionError)):
+        return True
+    return isinstance(exception, GRPCError) and exception.status in TRANSIENT_GRPC_STATUSES
+
+
+class AdaptiveScheduler:
+    """
+    Run API calls concurrently, keeping up to `limit` calls in flight at any time.
+
+    A new call is started as soon as any running call completes, so a slow call only occupies one slot instead of
+    holding back a whole batch.
+
+    The limit is adjusted from the observed latency and errors:
+    - Every `limit` successful calls, the limit is increased by one if the average latency is below `latency_tolerance` times the lowest
+      observed latency. Otherwise the limit is decreased by one.
+    - A transient error (RESOURCE_EXHAUSTED, UNAVAILABLE, DEADLINE_EXCEEDED, timeout or connection error) halves the limit, and the call
+      is retried after an exponential backoff with full jitter, up to `max_retries` times. The retry uses the next healthy channel of the
+      client, so calls fail over to other servers of the cluster.
+
+    One instance is shared by all calls of a CVClient, so concurrent workflows together respect the limit.
+    Calls run by the scheduler must not run other calls through the same scheduler, since they would hold a slot while waiting.
+
+    Parameters:
+        initial_limit: Number of calls in flight when starting.
+        min_limit: Lowest number of calls in flight.
+        max_limit: Highest number of calls in flight.
+        latency_tolerance: Factor of the lowest observed latency above which the limit is decreased.
+        max_retries: Number of times a call is retried on transient errors.
+        backoff_base: Base of the exponential backoff in seconds.
+        backoff_max: Maximum backoff in seconds.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+    ) -> None:
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._in_flight = 0
+        self._successes = 0
+        self._min_latency: float | None = None
+        self._avg_latency: float | None = None
+        self._waiters: list[Future] = []
+
+    async def run(self, calls: Iterable[Callable[[], Awaitable[T]]]) -> list[T]:
+        """
+        Run the given calls concurrently and return the results in the order of the calls.
+
+        Each call is a function without arguments returning a new awaitable, like `partial(cv_client.set_studio_inputs, ...)`,
+        so it can be called again when retrying.
+
+        If a call fails with a non-transient error or runs out of retries, the remaining calls are cancelled and the error is raised.
+        """
+        tasks: list[Task] = []
+        failed_tasks: list[Task] = []
+
+        def on_done(task: Task) -> None:
+            self._release()
+            if not task.cancelled() and task.exception() is not None:
+                failed_tasks.append(task)
+
+        try:
+            for call in calls:
+                await self._acquire()
+                # Stop starting new calls if any call has failed.
+                if failed_tasks:
+                    self._release()
+                    break
+                task = create_task(self._run_call(call))
+                task.add_done_callback(on_done)
+                tasks.append(task)
+
+            if tasks and not failed_tasks:
+                await wait(tasks, return_when=FIRST_EXCEPTION)
+            if failed_tasks:
+                raise failed_tasks[0].exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return [task.result() for task in tasks]
+
+    async def _acquire(self) -> None:
+        while self._in_flight >= self.limit:
+            waiter = get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+        self._in_flight += 1
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        # Wake up all waiting calls. They will check the limit again, since it may have been changed.
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _run_call(self, call: Callable[[], Awaitable[T]]) -> T:
+        attempt = 0
+        while True:
+            start = monotonic()
+            try:
+                result = await call()
+            except Exception as e:
+                if not is_transient_error(e) or attempt >= self.max_retries:
+                    raise
+                self._on_transient_error()
+                backoff = uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))  # noqa: S311 - Not used for security.
+                LOGGER.info("AdaptiveScheduler: Retrying call in %.2f seconds after transient error: %s", backoff, e)
+                attempt += 1
+                await sleep(backoff)
+                continue
+
+            self._on_success(monotonic() - start)
+            return result
+
+    def _on_success(self, latency: float) -> None:
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+
+        # Exponentially weighted moving average to smooth out single slow calls.
+        self._avg_latency = latency if self._avg_latency is None else 0.8 * self._avg_latency + 0.2 * latency
+
+        # Adjust the limit once per window of `limit` calls, so each adjustment is based on calls started with the previous limit.
+        self._successes += 1
+        if self._successes < self.limit:
+            return
+
+        self._successes = 0
+        if self._avg_latency > self._min_latency * self.latency_tolerance:
+            self._set_limit(self.limit - 1)
+        else:
+            self._set_limit(self.limit + 1)
+
+    def _on_transient_error(self) -> None:
+        self._successes = 0
+        self._set_limit(self.limit // 2)
+
+    def _set_limit(self, limit: int) -> None:
+        limit = max(self.min_limit, min(self.max_limit, limit))
+        if limit != self.limit:
+            LOGGER.debug("AdaptiveScheduler: Changing the number of parallel calls from %s to %s.", self.limit, limit)
+            self.limit = limit
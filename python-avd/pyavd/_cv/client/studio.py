@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+from functools import partial
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -372,6 +373,38 @@ class StudioMixin:
 
         return response.value
 
+    async def set_multiple_studio_inputs(
+        self: CVClient,
+        workspace_id: str,
+        studio_inputs: list[tuple[str, Any, list[str] | None]],
+        timeout: float = DEFAULT_API_TIMEOUT,
+    ) -> list[InputsConfig]:
+        """
+        Do parallel calls to set_studio_inputs for each studio inputs using the shared scheduler of the client.
+
+        Parameters:
+            workspace_id: Unique identifier of the Workspace for which the information is set.
+            studio_inputs: List of Tuples with the format `(studio_id, inputs, input_path)`.
+            timeout: Timeout in seconds.
+
+        Returns:
+            List of InputsConfig objects after being set including any server-generated values.
+        """
+        calls = [
+            partial(
+                self.set_studio_inputs,
+                studio_id=studio_id,
+                workspace_id=workspace_id,
+                inputs=inputs,
+                input_path=input_path,
+                timeout=timeout,
+            )
+            for studio_id, inputs, input_path in studio_inputs
+        ]
+
+        LOGGER.info("set_multiple_studio_inputs: Deploying %s studio inputs with up to %s parallel calls.", len(calls), self._scheduler.limit)
+        return await self._scheduler.run(calls)
+
     async def get_topology_studio_inputs(
         self: CVClient,
         workspace_id: str,
@@ -27,6 +27,7 @@ from pyavd._cv.api.arista.tag.v2 import (
 )
 from pyavd._cv.api.arista.time import TimeBounds
 
+from .async_decorators import grpc_msg_size_handler
 from .constants import DEFAULT_API_TIMEOUT
 from .exceptions import get_cv_client_exception
 
@@ -62,6 +63,7 @@ class TagMixin:
         creator_type: Literal["user", "system", "external"] | None = None,
         time: datetime | None = None,
         timeout: float = 30.0,
+        labels: list[str] | None = None,
     ) -> list[Tag]:
         """
         Get Tags using arista.tag.v2.TagServiceStub.GetAll arista.tag.v2.TagConfigServiceStub.GetAll APIs.
@@ -75,39 +77,42 @@ class TagMixin:
             creator_type: Optionally filter tags on creator type.
             time: Timestamp from which the information is fetched. `now()` if not set.
             timeout: Timeout in seconds.
+            labels: Optionally filter tags on labels. All labels are filtered server-side in the same request.
 
         TODO: Consider if we should add sub_type.
 
         Returns:
             List of Tag objects.
         """
-        request = TagStreamRequest(
-            partial_eq_filter=Tag(
-                # Notice the "" for workspace, since we are fetching mainline.
-                key=TagKey(workspace_id="", element_type=ELEMENT_TYPE_MAP[element_type]),
-                creator_type=CREATOR_TYPE_MAP[creator_type],
-            ),
-            time=TimeBounds(start=None, end=time),
-        )
+        request = TagStreamRequest(partial_eq_filter=[], time=TimeBounds(start=None, end=time))
+        for label in labels or [None]:
+            request.partial_eq_filter.append(
+                Tag(
+                    # Notice the "" for workspace, since we are fetching mainline.
+                    key=TagKey(workspace_id="", element_type=ELEMENT_TYPE_MAP[element_type], label=label),
+                    creator_type=CREATOR_TYPE_MAP[creator_type],
+                ),
+            )
         client = TagServiceStub(self._channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
-            tags = [response.value async for response in responses]
+            tags = {self._tag_key(response.value): response.value async for response in responses}
         except Exception as e:
             raise get_cv_client_exception(e, f"Workspace ID '' (main), Element Type '{element_type}', Creator Type '{creator_type}'") or e
 
         # Now tags contain all mainline tags.
         if workspace_id == "" or creator_type in ["system", "external"]:
-            return tags
+            return list(tags.values())
 
         # Next up fetch the tags config from the workspace if workspace is not "".
-        request = TagConfigStreamRequest(
-            partial_eq_filter=TagConfig(
-                # This time fetch for the actual workspace we are interested in.
-                key=TagKey(workspace_id=workspace_id, element_type=ELEMENT_TYPE_MAP[element_type]),
-            ),
-            time=TimeBounds(start=None, end=time),
-        )
+        request = TagConfigStreamRequest(partial_eq_filter=[], time=TimeBounds(start=None, end=time))
+        for label in labels or [None]:
+            request.partial_eq_filter.append(
+                TagConfig(
+                    # This time fetch for the actual workspace we are interested in.
+                    key=TagKey(workspace_id=workspace_id, element_type=ELEMENT_TYPE_MAP[element_type], label=label),
+                ),
+            )
         client = TagConfigServiceStub(self._channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
@@ -117,14 +122,17 @@ class TagMixin:
                 # Recreating a full tag object. Since this was in the workspace, it *must* be a user created tag.
                 tag = Tag(key=tag_config.key, creator_type=CreatorType.USER)
                 if tag_config.remove:
-                    self._remove_item_from_list(tag, tags, self._match_tags)
+                    # Ignore if we are told to remove a tag that is not present.
+                    # This happens if you add a tag in a workspace and then remove it again.
+                    tags.pop(self._tag_key(tag), None)
                 else:
-                    self._upsert_item_in_list(tag, tags, self._match_tags)
+                    tags[self._tag_key(tag)] = tag
         except Exception as e:
             raise get_cv_client_exception(e, f"Workspace ID '{workspace_id}', Element Type '{element_type}', Creator Type '{creator_type}'") or e
 
-        return tags
+        return list(tags.values())
 
+    @grpc_msg_size_handler("tags")
     async def set_tags(
         self: CVClient,
         workspace_id: str,
@@ -176,6 +184,8 @@ class TagMixin:
         creator_type: Literal["user", "system", "external"] | None = None,
         time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        labels: list[str] | None = None,
+        device_ids: list[str] | None = None,
     ) -> list[TagAssignment]:
         """
         Get Tags using arista.tag.v2.TagAssignmentServiceStub.GetAll arista.tag.v2.TagAssignmentConfigServiceStub.GetAll APIs.
@@ -189,39 +199,51 @@ class TagMixin:
             creator_type: Optionally filter tag assignments on tag creator type.
             time: Timestamp from which the information is fetched. `now()` if not set.
             timeout: Timeout in seconds.
+            labels: Optionally filter tag assignments on labels. All labels are filtered server-side in the same request.
+            device_ids: Optionally filter tag assignments on device ids. All device ids are filtered server-side in the same request.
+                Ignored if labels are set.
 
         TODO: Consider if we should add sub_type.
 
         Returns:
-            Workspace object matching the workspace_id
+            List of TagAssignment objects.
         """
-        request = TagAssignmentStreamRequest(
-            partial_eq_filter=TagAssignment(
-                # Notice the "" for workspace, since we are fetching mainline.
-                key=TagAssignmentKey(workspace_id="", element_type=ELEMENT_TYPE_MAP[element_type]),
-                tag_creator_type=CREATOR_TYPE_MAP[creator_type],
-            ),
-            time=TimeBounds(start=None, end=time),
-        )
+        if labels:
+            key_filters = [{"label": label} for label in labels]
+        elif device_ids:
+            key_filters = [{"device_id": device_id} for device_id in device_ids]
+        else:
+            key_filters = [{}]
+
+        request = TagAssignmentStreamRequest(partial_eq_filter=[], time=TimeBounds(start=None, end=time))
+        for key_filter in key_filters:
+            request.partial_eq_filter.append(
+                TagAssignment(
+                    # Notice the "" for workspace, since we are fetching mainline.
+                    key=TagAssignmentKey(workspace_id="", element_type=ELEMENT_TYPE_MAP[element_type], **key_filter),
+                    tag_creator_type=CREATOR_TYPE_MAP[creator_type],
+                ),
+            )
         client = TagAssignmentServiceStub(self._channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
-            tag_assignments = [response.value async for response in responses]
+            tag_assignments = {self._tag_assignment_key(response.value): response.value async for response in responses}
         except Exception as e:
             raise get_cv_client_exception(e, f"Workspace ID '' (main), Element Type '{element_type}', Creator Type '{creator_type}'") or e
 
         # Now tags contain all mainline tags.
         if workspace_id == "" or creator_type in ["system", "external"]:
-            return tag_assignments
+            return list(tag_assignments.values())
 
         # Next up fetch the tags config from the workspace if workspace is not "".
-        request = TagAssignmentConfigStreamRequest(
-            partial_eq_filter=TagAssignmentConfig(
-                # This time fetch for the actual workspace we are interested in.
-                key=TagKey(workspace_id=workspace_id, element_type=ELEMENT_TYPE_MAP[element_type]),
-            ),
-            time=TimeBounds(start=None, end=time),
-        )
+        request = TagAssignmentConfigStreamRequest(partial_eq_filter=[], time=TimeBounds(start=None, end=time))
+        for key_filter in key_filters:
+            request.partial_eq_filter.append(
+                TagAssignmentConfig(
+                    # This time fetch for the actual workspace we are interested in.
+                    key=TagAssignmentKey(workspace_id=workspace_id, element_type=ELEMENT_TYPE_MAP[element_type], **key_filter),
+                ),
+            )
         client = TagAssignmentConfigServiceStub(self._channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
@@ -231,14 +253,17 @@ class TagMixin:
                 # Recreating a full tag object. Since this was in the workspace, it *must* be a user created tag assignment.
                 tag_assignment = TagAssignment(key=tag_assignment_config.key, tag_creator_type=CreatorType.USER)
                 if tag_assignment_config.remove:
-                    self._remove_item_from_list(tag_assignment, tag_assignments, self._match_tag_assignments)
+                    # Ignore if we are told to remove a tag assignment that is not present.
+                    # This happens if you add a tag assignment in a workspace and then remove it again.
+                    tag_assignments.pop(self._tag_assignment_key(tag_assignment), None)
                 else:
-                    self._upsert_item_in_list(tag_assignment, tag_assignments, self._match_tag_assignments)
+                    tag_assignments[self._tag_assignment_key(tag_assignment)] = tag_assignment
         except Exception as e:
             raise get_cv_client_exception(e, f"Workspace ID '{workspace_id}', Element Type '{element_type}', Creator Type '{creator_type}'") or e
 
-        return tag_assignments
+        return list(tag_assignments.values())
 
+    @grpc_msg_size_handler("tag_assignments")
     async def set_tag_assignments(
         self: CVClient,
         workspace_id: str,
@@ -284,6 +309,7 @@ class TagMixin:
 
         return tag_assignment_keys
 
+    @grpc_msg_size_handler("tag_assignments")
     async def delete_tag_assignments(
         self: CVClient,
         workspace_id: str,
@@ -331,19 +357,12 @@ class TagMixin:
         return tag_assignment_keys
 
     @staticmethod
-    def _match_tags(a: Tag, b: Tag) -> bool:
-        """Match up the properties of two tags without looking at the Workspace and Creator Type fields."""
-        return all([a.key.element_type == b.key.element_type, a.key.label == b.key.label, a.key.value == b.key.value])
+    def _tag_key(tag: Tag) -> tuple:
+        """Return hashable key of the properties of a tag without the Workspace and Creator Type fields."""
+        return (tag.key.element_type, tag.key.label, tag.key.value)
 
     @staticmethod
-    def _match_tag_assignments(a: TagAssignment, b: TagAssignment) -> bool:
-        """Match up the properties of two tag assignments without looking at the Workspace and Creator Type fields."""
-        return all(
-            [
-                a.key.element_type == b.key.element_type,
-                a.key.label == b.key.label,
-                a.key.value == b.key.value,
-                a.key.device_id == b.key.device_id,
-                a.key.interface_id == b.key.interface_id,
-            ],
-        )
+    def _tag_assignment_key(tag_assignment: TagAssignment) -> tuple:
+        """Return hashable key of the properties of a tag assignment without the Workspace and Creator Type fields."""
+        key = tag_assignment.key
+        return (key.element_type, key.label, key.value, key.device_id, key.interface_id)
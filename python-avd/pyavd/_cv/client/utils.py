@@ -6,43 +6,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
     from . import CVClient
 
 
 class UtilsMixin:
     """Only to be used as mixin on CVClient class."""
 
-    @staticmethod
-    def _remove_item_from_list(itm: Any, lst: list, matcher: Callable) -> None:
-        """
-        Remove one item from the given list.
-
-        Used for Tags and TagAssignments.
-
-        Ignore if we are told to remove an item that is not present.
-        This happens if you add a tag in a workspace and then remove it again.
-        """
-        for index, item in enumerate(lst):
-            if matcher(item, itm):
-                lst.pop(index)
-                return
-
-    @staticmethod
-    def _upsert_item_in_list(itm: Any, lst: list, matcher: Callable) -> None:
-        """
-        Update or append one item from the given list.
-
-        Used for Tags and TagAssignments.
-        """
-        for index, item in enumerate(lst):
-            if matcher(item, itm):
-                lst[index] = itm
-                return
-
-        lst.append(itm)
-
     def _set_value_from_path(self: CVClient, path: list[str], data: list | dict, value: Any) -> None:
         """
         Recursive function to walk through data to set value on path, creating any level needed.
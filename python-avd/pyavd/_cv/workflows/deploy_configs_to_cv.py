@@ -3,7 +3,9 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
+from hashlib import sha256
 from logging import getLogger
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,6 +19,8 @@ CONFIGLET_ID_PREFIX = "avd-"
 CONFIGLET_NAME_PREFIX = "AVD_"
 CONFIGLET_CONTAINER_ID = f"{CONFIGLET_ID_PREFIX}configlets"
 STATIC_CONFIGLET_STUDIO_ID = "studio-static-configlet"
+# Number of characters read at a time when calculating the digest of a config file.
+DIGEST_CHUNK_SIZE = 1024 * 1024
 
 
 async def deploy_configs_to_cv(configs: list[CVEosConfig], result: DeployToCvResult, cv_client: CVClient) -> None:
@@ -24,9 +28,7 @@ async def deploy_configs_to_cv(configs: list[CVEosConfig], result: DeployToCvRes
     Deploy given configs using "Static Configlet Studio".
 
     - Create/verify a single configuration container named "AVD Configurations".
-    - Upload Configlets and assign to devices.
-
-    TODO: See if this can be optimized to check if the configlets are already in place and correct. A hash would have been nice.
+    - Upload changed Configlets and assign to devices.
     """
     LOGGER.info("deploy_configs_to_cv: %s", len(configs))
 
@@ -53,9 +55,11 @@ async def deploy_configs_to_cv(configs: list[CVEosConfig], result: DeployToCvRes
 
 async def deploy_configlets_to_cv(configs: list[CVEosConfig], workspace_id: str, cv_client: CVClient) -> None:
     """
-    Bluntly setting configs like nothing was there. Only create missing containers.
+    Create or update Configlets for the given configs.
 
-    TODO: Fetch config checksums for existing configs and only upload what is needed.
+    Existing Configlets are fetched from the workspace with a filter leaving out the body, so only the sha256 digest
+    CloudVision keeps for each body is transferred. Only Configlets where the name, description or the digest of the body
+    differ from the local file are uploaded.
     """
     configlets = [
         (
@@ -66,8 +70,45 @@ async def deploy_configlets_to_cv(configs: list[CVEosConfig], workspace_id: str,
         )
         for config in configs
     ]
-    LOGGER.info("deploy_configs_to_cv: Deploying %s configlets.", len(configlets))
-    await cv_client.set_configlets_from_files(workspace_id=workspace_id, configlets=configlets)
+    existing_configlets = await cv_client.get_configlets(
+        workspace_id=workspace_id, configlet_ids=[configlet[0] for configlet in configlets], include_body=False
+    )
+    # Create dict keyed by configlet id with value of tuple containing key configlet parameters. Used later to detect changes.
+    existing_configlets_by_id = {
+        cv_configlet.key.configlet_id: (cv_configlet.display_name, cv_configlet.description, cv_configlet.digest) for cv_configlet in existing_configlets
+    }
+    LOGGER.info("deploy_configs_to_cv: %s existing configlets.", len(existing_configlets_by_id))
+
+    update_configlets = [
+        configlet
+        for configlet in configlets
+        if (existing_configlet := existing_configlets_by_id.get(configlet[0])) is None
+        or existing_configlet[:2] != configlet[1:3]
+        # The digest is not returned by older CloudVision versions, in which case the configlet is always uploaded.
+        or not existing_configlet[2]
+        or existing_configlet[2].lower() != get_config_file_digest(configlet[3])
+    ]
+    LOGGER.info("deploy_configs_to_cv: %s unchanged configlets.", len(configlets) - len(update_configlets))
+
+    if not update_configlets:
+        return
+
+    LOGGER.info("deploy_configs_to_cv: Deploying %s configlets.", len(update_configlets))
+    await cv_client.set_configlets_from_files(workspace_id=workspace_id, configlets=update_configlets)
+
+
+def get_config_file_digest(file: str) -> str:
+    """
+    Return the sha256 hex digest of the given config file in the same way as CloudVision calculates the digest of a Configlet body.
+
+    The file is read in chunks with the same decoding and newline handling as the body uploaded by `set_configlets_from_files`,
+    so the full file is never held in memory.
+    """
+    digest = sha256()
+    with Path(file).open(encoding="UTF-8") as config_file:
+        while chunk := config_file.read(DIGEST_CHUNK_SIZE):
+            digest.update(chunk.encode("UTF-8"))
+    return digest.hexdigest()
 
 
 async def get_existing_device_container_ids_from_root_container(workspace_id: str, cv_client: CVClient) -> list[str]:
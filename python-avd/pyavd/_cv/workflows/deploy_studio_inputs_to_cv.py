@@ -3,12 +3,9 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
-from asyncio import gather
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from pyavd._utils import batch
-
 if TYPE_CHECKING:
     from pyavd._cv.client import CVClient
 
@@ -37,20 +34,11 @@ async def deploy_studio_inputs_to_cv(studio_inputs: list[CVStudioInputs], result
     if not studio_inputs:
         return
 
-    studio_inputs_coroutines = [
-        cv_client.set_studio_inputs(
-            studio_id=studio_input.studio_id,
-            workspace_id=result.workspace.id,
-            inputs=studio_input.inputs,
-            input_path=studio_input.input_path,
-        )
-        for studio_input in studio_inputs
-    ]
-
-    # Deploy studio inputs in parallel in batches of 20.
-    LOGGER.info("deploy_studio_inputs_to_cv: Deploying %s Studio Inputs in batches of 20.", len(studio_inputs_coroutines))
-    for index, coroutines in enumerate(batch(studio_inputs_coroutines, 20), start=1):
-        LOGGER.info("deploy_studio_inputs_to_cv: Batch %s", index)
-        await gather(*coroutines)
+    # Deploy studio inputs in parallel using the shared scheduler of the client.
+    LOGGER.info("deploy_studio_inputs_to_cv: Deploying %s Studio Inputs.", len(studio_inputs))
+    await cv_client.set_multiple_studio_inputs(
+        workspace_id=result.workspace.id,
+        studio_inputs=[(studio_input.studio_id, studio_input.inputs, studio_input.input_path) for studio_input in studio_inputs],
+    )
 
     result.deployed_studio_inputs.extend(studio_inputs)
@@ -35,9 +35,8 @@ async def deploy_tags_to_cv(
       - Always remove other tag assignments with the same label as given tags.
       - TODO: Remove deassociated tags if they are no longer associated with any device.
 
-    TODO: Refactor CVDeviceTag / CVInterfaceTag to produce a stable hash so we can use it with set() methods.
-          Then improve logic below using sets.
-
+    Only tags and tag assignments with the labels of the given tags are fetched from CloudVision.
+    If "strict" == True, all tag assignments of the devices of the given tags are fetched instead.
 
     In-place updates skipped_tags, deployed_tags, removed_tags, warnings so they can be given directly from the results object.
     """
@@ -57,25 +56,42 @@ async def deploy_tags_to_cv(
     if not todo_tags:
         return
 
-    # Get existing interface tags. Use this to only add the missing. We will *not* remove any tags. (Assignment are removed later)
-    LOGGER.info("deploy_tags_to_cv: Getting existing tags")
-    existing_tags = await cv_client.get_tags(workspace_id=workspace.id, element_type=tag_type, creator_type="user")
-    existing_tags_tuples = [(tag.key.label, tag.key.value) for tag in existing_tags]
+    # Get existing tags with the labels we manage. Use this to only add the missing. We will *not* remove any tags. (Assignment are removed later)
+    labels = sorted({tag.label for tag in todo_tags})
+    LOGGER.info("deploy_tags_to_cv: Getting existing tags for %s labels", len(labels))
+    existing_tags = await cv_client.get_tags(workspace_id=workspace.id, element_type=tag_type, creator_type="user", labels=labels)
+    existing_tags_tuples = {(tag.key.label, tag.key.value) for tag in existing_tags}
     LOGGER.info("deploy_tags_to_cv: Got %s tags", len(existing_tags_tuples))
-    tags_to_add = [tag for tag in todo_tags if (tag.label, tag.value) not in existing_tags_tuples]
+    # Using dict to remove duplicates while keeping the order.
+    tags_to_add = list(dict.fromkeys((tag.label, tag.value) for tag in todo_tags if (tag.label, tag.value) not in existing_tags_tuples))
     LOGGER.info("deploy_tags_to_cv: Creating %s tags", len(tags_to_add))
     if tags_to_add:
-        await cv_client.set_tags(workspace_id=workspace.id, tags=[(tag.label, tag.value) for tag in tags_to_add], element_type=tag_type)
+        await cv_client.set_tags(workspace_id=workspace.id, tags=tags_to_add, element_type=tag_type)
 
     # Remove entries with no assignment from TODO: and add to deployed.
     deployed_tags.extend(tag for tag in todo_tags if tag.device is None)
     todo_tags = [tag for tag in todo_tags if tag.device is not None]
 
+    # No need to continue if we have nothing to assign.
+    if not todo_tags:
+        return
+
+    # Build dict of serial numbers for devices
+    devices_by_serial_number = {tag.device.serial_number: tag.device for tag in todo_tags}
+    assignment_labels = {tag.label for tag in todo_tags}
+
     # At this point we know that all tags are present in the workspace, so we can start assigning them where we need it.
+    # If strict, we need all assignments of the devices. If not strict, we only need the assignments with the labels we manage.
     LOGGER.info("deploy_tags_to_cv: Getting existing tag assignments")
-    cv_existing_assignments = await cv_client.get_tag_assignments(workspace_id=workspace.id, element_type=tag_type, creator_type="user")
-    # Build list of tuples with existing tag assignments
-    existing_assignments = [
+    cv_existing_assignments = await cv_client.get_tag_assignments(
+        workspace_id=workspace.id,
+        element_type=tag_type,
+        creator_type="user",
+        labels=None if strict else sorted(assignment_labels),
+        device_ids=list(devices_by_serial_number) if strict else None,
+    )
+    # Build dict of tuples with existing tag assignments. Using dict instead of set to keep the order.
+    existing_assignments = dict.fromkeys(
         (
             assignment.key.label,
             assignment.key.value,
@@ -83,52 +99,39 @@ async def deploy_tags_to_cv(
             str(assignment.key.interface_id).rsplit("@", maxsplit=1)[0] if assignment.key.interface_id is not None else None,
         )
         for assignment in cv_existing_assignments
-    ]
+    )
     LOGGER.info("deploy_tags_to_cv: Got %s tag assignments", len(existing_assignments))
 
+    # Build list of tuples for the tags to deploy.
+    todo_tags_tuples = [(tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) for tag in todo_tags]
+
     # Move all existing assignments from TODO: to deployed.
-    deployed_tags.extend(tag for tag in todo_tags if (tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) in existing_assignments)
-    todo_tags = [tag for tag in todo_tags if (tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) not in existing_assignments]
+    deployed_tags.extend(tag for tag, tag_tuple in zip(todo_tags, todo_tags_tuples, strict=True) if tag_tuple in existing_assignments)
+    todo_tags, todo_tags_tuples = (
+        [tag for tag, tag_tuple in zip(todo_tags, todo_tags_tuples, strict=True) if tag_tuple not in existing_assignments],
+        [tag_tuple for tag_tuple in todo_tags_tuples if tag_tuple not in existing_assignments],
+    )
 
     if todo_tags:
         LOGGER.info("deploy_tags_to_cv: Creating %s tag assignments", len(todo_tags))
-        await cv_client.set_tag_assignments(
-            workspace_id=workspace.id,
-            tag_assignments=[(tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) for tag in todo_tags],
-            element_type=tag_type,
-        )
+        await cv_client.set_tag_assignments(workspace_id=workspace.id, tag_assignments=todo_tags_tuples, element_type=tag_type)
 
     # Move all TODO: to deployed.
     deployed_tags.extend(todo_tags)
 
-    # Now we start removing assignments depending on strict_tags or not.
-
     # Build set of tuples for deployed tags.
     deployed_tags_tuples = {
         (tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) for tag in deployed_tags if tag.device is not None
     }
 
-    # Build set of serial numbers for devices
-    devices_by_serial_number = {tag.device.serial_number: tag.device for tag in deployed_tags if tag.device is not None}
-
-    # If strict, we remove any assignments not specified in the inputs.
-    # If not strict, we remove any assignments with the same labels but not specified in the inputs.
-    if strict:
-        assignments_to_unassign = [
-            (label, value, device_serial_number, interface)
-            for label, value, device_serial_number, interface in existing_assignments
-            if device_serial_number in devices_by_serial_number and (label, value, device_serial_number, interface) not in deployed_tags_tuples
-        ]
-    else:
-        # Build set of tag labels we have assigned so we know which ones to remove.
-        deployed_tags_labels = {tag_tuple[0] for tag_tuple in deployed_tags_tuples}
-        assignments_to_unassign = [
-            (label, value, device_serial_number, interface)
-            for label, value, device_serial_number, interface in existing_assignments
-            if device_serial_number in devices_by_serial_number
-            and label in deployed_tags_labels
-            and (label, value, device_serial_number, interface) not in deployed_tags_tuples
-        ]
+    # Now we start removing assignments depending on strict_tags or not.
+    # If strict, we remove any assignments of the devices not specified in the inputs.
+    # If not strict, we remove any assignments of the devices with the same labels but not specified in the inputs.
+    assignments_to_unassign = [
+        assignment
+        for assignment in existing_assignments
+        if assignment[2] in devices_by_serial_number and (strict or assignment[0] in assignment_labels) and assignment not in deployed_tags_tuples
+    ]
 
     if assignments_to_unassign:
         LOGGER.info("deploy_tags_to_cv: Deleting %s tag assignments", len(assignments_to_unassign))
@@ -14,23 +14,42 @@ class AvdFacts:
     _hostvars: dict
     shared_utils: SharedUtils
 
+    _keys: list[str]
+    """Names of the public cached_properties of the class. Computed once per class by __init_subclass__."""
+    _internal_keys: list[str]
+    """Names of the internal cached_properties of the class. Computed once per class by __init_subclass__."""
+    _keys_set: frozenset[str]
+    """Set of the names in _keys for constant time lookups in get()."""
+
     def __init__(self, hostvars: dict, shared_utils: SharedUtils) -> None:
         self._hostvars = hostvars
         self.shared_utils = shared_utils
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Compute the public and internal keys once per class, since walking the MRO is too costly to do for every lookup.
+
+        Attributes added to the class after it has been created are not included in the keys.
+        """
+        super().__init_subclass__(**kwargs)
+        keys = cls.__keys()
+        cls._keys = [key for key in keys if not key.startswith("_")]
+        cls._internal_keys = [key for key in keys if key.startswith("_")]
+        cls._keys_set = frozenset(cls._keys)
+
     @classmethod
     def __keys(cls) -> list[str]:  # pylint: disable=bad-option-value, unused-private-member # CH Sep-22: Some pylint bug.
         """
-        Get all class attributes including those of base Classes and Mixins.
+        Get all class attributes using cached_property class including those of base Classes and Mixins.
 
         Using MRO, which is the same way Python resolves attributes.
         """
-        keys = []
+        keys = {}
         for c in cls.mro():
-            c_keys = [key for key in c.__dict__ if key not in keys]
-            keys.extend(c_keys)
+            for key in c.__dict__:
+                keys.setdefault(key, None)
 
-        return keys
+        return [key for key in keys if isinstance(getattr(cls, key), cached_property)]
 
     @classmethod
     def keys(cls) -> list[str]:
@@ -39,17 +58,18 @@ class AvdFacts:
 
         Actually the returned list are the names of attributes not starting with "_" and using cached_property class.
         The "_" check is added to allow support for "internal" cached_properties storing temporary values.
+        A copy is returned, so the keys computed for the class cannot be modified by the caller.
         """
-        return [key for key in cls.__keys() if not key.startswith("_") and isinstance(getattr(cls, key), cached_property)]
+        return list(cls._keys)
 
     @classmethod
     def internal_keys(cls) -> list[str]:
         """Return a list containing the names of attributes starting with "_" and using cached_property class."""
-        return [key for key in cls.__keys() if key.startswith("_") and isinstance(getattr(cls, key), cached_property)]
+        return list(cls._internal_keys)
 
     def get(self, key: str, default_value: Any = None) -> Any:
         """Emulate the builtin dict .get method."""
-        if key in self.keys():
+        if key in self._keys_set:
             return getattr(self, key)
         return default_value
 
@@ -61,8 +81,8 @@ class AvdFacts:
         If the value is not cached, it will be resolved by the attribute function first.
         Empty values are removed from the returned data.
         """
-        return {key: getattr(self, key) for key in self.keys() if getattr(self, key) is not None}
+        return {key: value for key in self._keys if (value := getattr(self, key)) is not None}
 
     def clear_cache(self) -> None:
-        for key in self.keys() + self.internal_keys():
+        for key in self._keys + self._internal_keys:
             self.__dict__.pop(key, None)
@@ -0,0 +1,38 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from functools import cached_property
+
+
+class UplinkPeersIndex:
+    """
+    Reverse index of the "uplink_peers" of all devices in the fabric.
+
+    One instance is shared by all EosDesignsFacts instances of the fabric through `hostvars.avd_uplink_peers_index`.
+    The index is built on first use by reading "uplink_peers" from every device once, so looking up the downstream
+    switches of a device does not require a scan of the full fabric.
+
+    Parameters
+    ----------
+    avd_switch_facts : dict
+        The shared dict of EosDesignsFacts instances like `{"<hostname>": {"switch": <EosDesignsFacts>}}`.
+        The dict may be filled after the index has been created, as long as it is complete before the first lookup.
+    """
+
+    def __init__(self, avd_switch_facts: dict) -> None:
+        self._avd_switch_facts = avd_switch_facts
+
+    @cached_property
+    def _downstream_switches(self) -> dict[str, list[str]]:
+        """Return dict of uplink switch to list of switches having that uplink switch in "uplink_peers"."""
+        downstream_switches = {}
+        for hostname, facts in self._avd_switch_facts.items():
+            for uplink_peer in facts["switch"].uplink_peers:
+                downstream_switches.setdefault(uplink_peer, []).append(hostname)
+        return downstream_switches
+
+    def downstream_switches(self, hostname: str) -> list[str]:
+        """Return list of switches having the given switch in "uplink_peers". The order follows the fabric devices."""
+        return self._downstream_switches.get(hostname, [])
@@ -3,15 +3,16 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
-import re
 from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyavd._utils import get
-from pyavd.j2filters import list_compress, range_expand
+from pyavd.j2filters import list_compress
+from pyavd.j2filters.range_expand import range_expand_to_int_set
 
 if TYPE_CHECKING:
     from . import EosDesignsFacts
+    from .uplink_peers_index import UplinkPeersIndex
 
 
 class VlansMixin:
@@ -41,7 +42,7 @@ class VlansMixin:
         vlans = set()
         trunk_groups = set(adapter_settings.get("trunk_groups", []))
         if "vlans" in adapter_settings and adapter_settings["vlans"] not in ["all", "", None]:
-            vlans.update(map(int, range_expand(str(adapter_settings["vlans"]))))
+            vlans.update(range_expand_to_int_set(str(adapter_settings["vlans"])))
         elif adapter_settings.get("mode", "") == "trunk" and not trunk_groups:
             # No vlans or trunk_groups defined, but this is a trunk, so default is all vlans allowed
             # No need to check further, since the list is now containing all vlans.
@@ -83,46 +84,33 @@ class VlansMixin:
         if self.shared_utils.configure_inband_mgmt:
             vlans.add(self.shared_utils.inband_mgmt_vlan)
 
+        connected_endpoints_index = self.shared_utils.connected_endpoints_index
         for connected_endpoints_key in self.shared_utils.connected_endpoints_keys:
-            connected_endpoints = get(self._hostvars, connected_endpoints_key["key"], default=[])
-            for connected_endpoint in connected_endpoints:
-                for index, adapter in enumerate(connected_endpoint.get("adapters", [])):
-                    adapter["context"] = f"{connected_endpoints_key['key']}[name={connected_endpoint['name']}].adapters[{index}]"
-                    adapter_settings = self.shared_utils.get_merged_adapter_settings(adapter)
-                    if self.shared_utils.hostname not in adapter_settings.get("switches", []):
-                        # This switch is not connected to this endpoint. Skipping.
-                        continue
-
-                    adapter_vlans, adapter_trunk_groups = self._parse_adapter_settings(adapter_settings)
-                    vlans.update(adapter_vlans)
-                    trunk_groups.update(adapter_trunk_groups)
-                    if len(vlans) >= 4094:
-                        # No need to check further, since the set is now containing all vlans.
-                        # The trunk group list may not be complete, but it will not matter, since we will
-                        # configure all vlans anyway.
-                        return vlans, trunk_groups
-
-        network_ports = get(self._hostvars, "network_ports", default=[])
-        for index, network_port_item in enumerate(network_ports):
-            for switch_regex in network_port_item.get("switches", []):
-                # The match test is built on Python re.match which tests from the beginning of the string #}
-                # Since the user would not expect "DC1-LEAF1" to also match "DC-LEAF11" we will force ^ and $ around the regex
-                raw_switch_regex = rf"^{switch_regex}$"
-                if not re.match(raw_switch_regex, self.shared_utils.hostname):
-                    # Skip entry if no match
-                    continue
-
-                network_port_item["context"] = f"network_ports[{index}]"
-                adapter_settings = self.shared_utils.get_merged_adapter_settings(network_port_item)
+            for _connected_endpoint, _adapter_index, adapter in connected_endpoints_index.connected_endpoint_adapters(
+                self.shared_utils, connected_endpoints_key
+            ):
+                adapter_settings = self.shared_utils.get_merged_adapter_settings(adapter)
                 adapter_vlans, adapter_trunk_groups = self._parse_adapter_settings(adapter_settings)
                 vlans.update(adapter_vlans)
                 trunk_groups.update(adapter_trunk_groups)
                 if len(vlans) >= 4094:
-                    # No need to check further, since the list is now containing all vlans.
+                    # No need to check further, since the set is now containing all vlans.
                     # The trunk group list may not be complete, but it will not matter, since we will
                     # configure all vlans anyway.
                     return vlans, trunk_groups
 
+        # Only matching the "switches" set directly on the network port.
+        for _index, network_port_item in connected_endpoints_index.network_ports(self.shared_utils, include_profile_switches=False):
+            adapter_settings = self.shared_utils.get_merged_adapter_settings(network_port_item)
+            adapter_vlans, adapter_trunk_groups = self._parse_adapter_settings(adapter_settings)
+            vlans.update(adapter_vlans)
+            trunk_groups.update(adapter_trunk_groups)
+            if len(vlans) >= 4094:
+                # No need to check further, since the list is now containing all vlans.
+                # The trunk group list may not be complete, but it will not matter, since we will
+                # configure all vlans anyway.
+                return vlans, trunk_groups
+
         return vlans, trunk_groups
 
     @cached_property
@@ -137,9 +125,10 @@ class VlansMixin:
 
         vlans = set()
         trunk_groups = set()
-        for fabric_switch in self.shared_utils.all_fabric_devices:
+        uplink_peers_index: UplinkPeersIndex = get(self._hostvars, "avd_uplink_peers_index", required=True)
+        for fabric_switch in uplink_peers_index.downstream_switches(self.shared_utils.hostname):
             fabric_switch_facts: EosDesignsFacts = self.shared_utils.get_peer_facts(fabric_switch, required=True)
-            if fabric_switch_facts.shared_utils.uplink_type == "port-channel" and self.shared_utils.hostname in fabric_switch_facts.uplink_peers:
+            if fabric_switch_facts.shared_utils.uplink_type == "port-channel":
                 fabric_switch_endpoint_vlans, fabric_switch_endpoint_trunk_groups = fabric_switch_facts._endpoint_vlans_and_trunk_groups
                 vlans.update(fabric_switch_endpoint_vlans)
                 trunk_groups.update(fabric_switch_endpoint_trunk_groups)
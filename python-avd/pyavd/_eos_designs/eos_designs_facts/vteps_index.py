@@ -0,0 +1,50 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from pyavd.j2filters import natural_sort, range_expand
+
+
+def get_avd_vteps(avd_switch_facts: dict) -> dict:
+    """
+    Build the fabric-wide index of VTEPs and the vlans of each VTEP, used for HER flood lists.
+
+    The index is built once for the fabric, so the flood lists of each device can be looked up without parsing the vlans of all
+    other devices.
+
+    Args:
+        avd_switch_facts: Nested Dictionaried with rendered "avd_switch_facts" per device.
+            ```python
+            {
+                "<hostname1>": {"switch": dict},
+                "<hostname2>": {"switch": dict},
+                ...
+            }
+            ```
+
+    Returns:
+        Dictionary with all devices with a VTEP IP sorted naturally on the VTEP IP, and the indexes of the VTEPs having each vlan.
+        The vlans are strings to keep the facts compatible with JSON.
+            ```python
+            {
+                "vteps": [{"hostname": str, "vtep_ip": str, "dc_name": str | None}, ...],
+                "vlans": {"<vlan>": [<index in vteps>, ...], ...},
+            }
+            ```
+    """
+    vteps = natural_sort(
+        [
+            {"hostname": hostname, "vtep_ip": facts["switch"]["vtep_ip"], "dc_name": facts["switch"].get("dc_name")}
+            for hostname, facts in avd_switch_facts.items()
+            if facts["switch"].get("vtep_ip") is not None
+        ],
+        sort_key="vtep_ip",
+    )
+
+    vlans = {}
+    for index, vtep in enumerate(vteps):
+        for vlan in range_expand(avd_switch_facts[vtep["hostname"]]["switch"].get("vlans", [])):
+            vlans.setdefault(str(int(vlan)), []).append(index)
+
+    return {"vteps": vteps, "vlans": vlans}
@@ -0,0 +1,106 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from . import SharedUtils
+
+T = TypeVar("T")
+
+
+class ConnectedEndpointsIndex:
+    """
+    Index of connected endpoint adapters per switch and of network ports with precompiled switch regexes.
+
+    One instance is shared by all devices of the fabric through `hostvars.avd_connected_endpoints_index`.
+    The index is built once per distinct content of the input lists (connected endpoints, "network_ports" and "port_profiles"),
+    so devices with the same inputs, like inputs set for the whole fabric, share the index built by the first device.
+    Other devices only compare their inputs with the indexed inputs using the built-in equality, instead of visiting every adapter.
+
+    Building the index does not merge port profiles onto the adapters. The switches of an adapter are taken from the adapter
+    or from the merged port profile. The full adapter settings are only merged for the adapters of the switch being looked up.
+
+    The indexed adapters and network ports are copies with "context" added, so the inputs are not updated.
+    """
+
+    def __init__(self) -> None:
+        # Per connected endpoints key, a list of (inputs, adapters per switch) for each distinct content of the inputs.
+        self._adapters_per_switch: dict[str, list[tuple[tuple[list, list], dict[str, list[tuple[dict, int, dict]]]]]] = {}
+        # List of (inputs, indexed network ports) for each distinct content of the inputs.
+        self._network_ports: list[tuple[tuple[list, list], list[tuple[int, dict, list[re.Pattern], bool]]]] = []
+
+    def connected_endpoint_adapters(self, shared_utils: SharedUtils, connected_endpoints_key: dict) -> list[tuple[dict, int, dict]]:
+        """
+        Return adapters connected to the switch of the given SharedUtils instance, under the given connected endpoints key.
+
+        Returns:
+            List of tuples with (connected_endpoint, adapter_index, adapter) in the order of the inputs.
+            The adapter is the raw adapter with "context" but without port profiles applied.
+        """
+        inputs = (shared_utils.hostvars.get(connected_endpoints_key["key"]) or [], shared_utils.port_profiles)
+        indexes = self._adapters_per_switch.setdefault(connected_endpoints_key["key"], [])
+        if (adapters_per_switch := _find_index(indexes, inputs)) is None:
+            adapters_per_switch = {}
+            for connected_endpoint in inputs[0]:
+                for adapter_index, adapter in enumerate(connected_endpoint.get("adapters", [])):
+                    context = f"{connected_endpoints_key['key']}[name={connected_endpoint['name']}].adapters[{adapter_index}]"
+                    indexed_adapter = {**adapter, "context": context}
+                    # Using dict.fromkeys to only add the adapter once per switch, even if the switch is listed multiple times.
+                    for switch in dict.fromkeys(self._get_switches(shared_utils, indexed_adapter) or []):
+                        adapters_per_switch.setdefault(switch, []).append((connected_endpoint, adapter_index, indexed_adapter))
+
+            indexes.append((inputs, adapters_per_switch))
+
+        return adapters_per_switch.get(shared_utils.hostname, [])
+
+    def network_ports(self, shared_utils: SharedUtils, *, include_profile_switches: bool = True) -> list[tuple[int, dict]]:
+        """
+        Return network ports where one of the "switches" regexes match the full hostname of the given SharedUtils instance.
+
+        Args:
+            shared_utils: SharedUtils instance of the switch.
+            include_profile_switches: Also match "switches" inherited from port profiles.
+
+        Returns:
+            List of tuples with (index, network_port) in the order of the inputs.
+            The network port is the raw network port with "context" but without port profiles applied.
+        """
+        inputs = (shared_utils.hostvars.get("network_ports") or [], shared_utils.port_profiles)
+        if (indexed_network_ports := _find_index(self._network_ports, inputs)) is None:
+            indexed_network_ports = []
+            for index, network_port in enumerate(inputs[0]):
+                indexed_network_port = {**network_port, "context": f"network_ports[{index}]"}
+                # The regex must match the full hostname. Since the user would not expect "DC1-LEAF1" to also match "DC-LEAF11"
+                # we will force ^ and $ around the regex.
+                switch_regexes = [re.compile(rf"^{switch_regex}$") for switch_regex in self._get_switches(shared_utils, indexed_network_port) or []]
+                indexed_network_ports.append((index, indexed_network_port, switch_regexes, "switches" in network_port))
+
+            self._network_ports.append((inputs, indexed_network_ports))
+
+        hostname = shared_utils.hostname
+        return [
+            (index, network_port)
+            for index, network_port, switch_regexes, has_own_switches in indexed_network_ports
+            if (include_profile_switches or has_own_switches) and any(switch_regex.match(hostname) for switch_regex in switch_regexes)
+        ]
+
+    @staticmethod
+    def _get_switches(shared_utils: SharedUtils, adapter_or_network_port: dict) -> list | None:
+        """Return "switches" of the adapter or network port. If not set, "switches" is taken from the port profile if any."""
+        if "switches" in adapter_or_network_port or (profile_name := adapter_or_network_port.get("profile")) is None:
+            return adapter_or_network_port.get("switches")
+
+        return shared_utils.get_merged_port_profile(profile_name, adapter_or_network_port["context"]).get("switches")
+
+
+def _find_index(indexes: list[tuple[Any, T]], inputs: Any) -> T | None:
+    """
+    Return the index built from inputs with the same content as the given inputs or None if not found.
+
+    The comparison is done by the built-in list and dict equality, which skips items that are the same objects.
+    """
+    return next((index for indexed_inputs, index in indexes if indexed_inputs == inputs), None)
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 
 from pyavd._utils import get
 
+from .connected_endpoints_index import ConnectedEndpointsIndex
+
 if TYPE_CHECKING:
     from . import SharedUtils
 
@@ -32,3 +34,13 @@ class ConnectedEndpointsKeysMixin:
         default_connected_endpoint_keys = self.schema.get_default_value(["connected_endpoints_keys"])
         connected_endpoints_keys = get(self.hostvars, "connected_endpoints_keys", default=default_connected_endpoint_keys)
         return [entry for entry in connected_endpoints_keys if entry.get("key") is not None and self.hostvars.get(entry["key"]) is not None]
+
+    @cached_property
+    def connected_endpoints_index(self: SharedUtils) -> ConnectedEndpointsIndex:
+        """
+        Return the index of connected endpoint adapters and network ports per switch.
+
+        The index is shared between all devices when given as "avd_connected_endpoints_index" in hostvars, otherwise a new index is created for this device.
+        Devices with the same inputs share the same index.
+        """
+        return get(self.hostvars, "avd_connected_endpoints_index") or ConnectedEndpointsIndex()
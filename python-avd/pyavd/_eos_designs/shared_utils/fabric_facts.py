@@ -0,0 +1,85 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyavd._errors import AristaAvdInvalidInputsError
+
+from .tenants_index import TenantsIndex
+
+if TYPE_CHECKING:
+    from pyavd._eos_designs.eos_designs_facts import EosDesignsFacts
+
+
+class FabricFacts:
+    """
+    Facts of all devices in the fabric with direct lookup of peer facts and precomputed fabric-wide views.
+
+    One instance is shared by all devices of the fabric through `hostvars.avd_fabric_facts`.
+    `pyavd.get_avd_facts` returns the instance as part of the avd_facts, so it is also shared when building
+    the structured config of all devices. Otherwise SharedUtils creates an instance for the device.
+
+    The fabric-wide views are built on first use by reading the facts of every device once. They must only be used once
+    all facts can be resolved, so during structured config or from facts of other devices, not to resolve facts of the
+    device itself. Since all facts are read, a device using a view depends on the facts of all devices,
+    also for the incremental builds of `pyavd.build_fabric`.
+
+    Parameters
+    ----------
+    avd_switch_facts : dict
+        The dict of EosDesignsFacts instances or rendered facts like `{"<hostname>": {"switch": <EosDesignsFacts | dict>}}`.
+        The dict may be filled after the instance has been created, as long as it is complete before the first lookup.
+    """
+
+    def __init__(self, avd_switch_facts: dict) -> None:
+        self._avd_switch_facts = avd_switch_facts
+
+    @property
+    def hostnames(self) -> list[str]:
+        """Return the hostnames of all devices in the fabric in the order of the fabric."""
+        return list(self._avd_switch_facts.keys())
+
+    def get_peer_facts(self, peer_name: str, required: bool = True) -> EosDesignsFacts | dict | None:
+        """
+        Return the facts of the given device, i.e. `avd_switch_facts.<peer_name>.switch`.
+
+        Raises AristaAvdInvalidInputsError if the facts cannot be found and required is True.
+        """
+        # Using .get() since avd_switch_facts may be wrapped by build_fabric to record the peers being read.
+        if (peer_facts := self._avd_switch_facts.get(peer_name)) is not None and (switch_facts := peer_facts.get("switch")) is not None:
+            return switch_facts
+
+        if required:
+            msg = (
+                f"Facts not found for node '{peer_name}'. Something in the input vars is pointing to this node. "
+                f"Check that '{peer_name}' is in the inventory and is part of the group set by 'fabric_name'. Node is required."
+            )
+            raise AristaAvdInvalidInputsError(msg)
+
+        return None
+
+    def _devices_by(self, key: str) -> dict[str, list[str]]:
+        """Return dict of value of the given fact to list of hostnames in the order of the fabric. Devices without the fact are left out."""
+        devices = {}
+        for hostname in self.hostnames:
+            if (value := self.get_peer_facts(hostname).get(key)) is not None:
+                devices.setdefault(value, []).append(hostname)
+        return devices
+
+    @cached_property
+    def devices_by_evpn_role(self) -> dict[str, list[str]]:
+        """Return dict of evpn_role to list of hostnames, like `{"server": [<evpn route servers>], "client": [...]}`."""
+        return self._devices_by("evpn_role")
+
+    @cached_property
+    def devices_by_mpls_overlay_role(self) -> dict[str, list[str]]:
+        """Return dict of mpls_overlay_role to list of hostnames, like `{"server": [<mpls route reflectors>], "client": [...]}`."""
+        return self._devices_by("mpls_overlay_role")
+
+    @cached_property
+    def tenants_index(self) -> TenantsIndex:
+        """Return the index of tenants shared by the devices using this instance when "avd_tenants_index" is not given in hostvars."""
+        return TenantsIndex()
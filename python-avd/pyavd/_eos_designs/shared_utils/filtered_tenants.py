@@ -8,10 +8,12 @@ from typing import TYPE_CHECKING
 
 from pyavd._errors import AristaAvdError, AristaAvdInvalidInputsError
 from pyavd._utils import default, get, get_item, merge, unique
-from pyavd.j2filters import natural_sort, range_expand
+from pyavd.j2filters import natural_sort
+from pyavd.j2filters.range_expand import range_expand_to_int_set
 
 if TYPE_CHECKING:
     from . import SharedUtils
+    from .tenants_index import IndexedTenant, TenantsIndex, VlansIndex
 
 
 class FilteredTenantsMixin:
@@ -22,6 +24,19 @@ class FilteredTenantsMixin:
     Using type-hint on self to get proper type-hints on attributes across all Mixins.
     """
 
+    @cached_property
+    def tenants_index(self: SharedUtils) -> TenantsIndex:
+        """
+        Return the index of tenants with VRFs, l2vlans and SVIs.
+
+        The index is shared between all devices when given as "avd_tenants_index" in hostvars,
+        otherwise the index is shared between devices with the same FabricFacts instance.
+        """
+        if (tenants_index := get(self.hostvars, "avd_tenants_index")) is not None:
+            return tenants_index
+
+        return self.fabric_facts.tenants_index
+
     @cached_property
     def filtered_tenants(self: SharedUtils) -> list[dict]:
         """
@@ -33,15 +48,11 @@ class FilteredTenantsMixin:
         if not self.any_network_services:
             return []
 
-        filtered_tenants = []
-        filter_tenants = self.filter_tenants
-        for network_services_key in self.network_services_keys:
-            tenants = get(self.hostvars, network_services_key["name"])
-            filtered_tenants.extend(
-                {**tenant, "l2vlans": self.filtered_l2vlans(tenant), "vrfs": self.filtered_vrfs(tenant)}
-                for tenant in tenants
-                if tenant["name"] in filter_tenants or "all" in filter_tenants
-            )
+        # Only the tenants matching filter_tenants are returned from the index, so other tenants are not visited.
+        filtered_tenants = [
+            {**indexed_tenant.tenant, "l2vlans": self.filtered_l2vlans(indexed_tenant), "vrfs": self.filtered_vrfs(indexed_tenant)}
+            for indexed_tenant in self.tenants_index.get_tenants(self)
+        ]
 
         no_vrf_default = all(vrf["name"] != "default" for tenant in filtered_tenants for vrf in tenant["vrfs"])
         if self.is_wan_router and no_vrf_default:
@@ -79,30 +90,38 @@ class FilteredTenantsMixin:
 
         return natural_sort(filtered_tenants, "name")
 
-    def filtered_l2vlans(self: SharedUtils, tenant: dict) -> list[dict]:
+    def filtered_l2vlans(self: SharedUtils, indexed_tenant: IndexedTenant) -> list[dict]:
         """
-        Return sorted and filtered l2vlan list from given tenant.
+        Return sorted and filtered l2vlan list from given indexed tenant.
 
         Filtering based on l2vlan tags.
         """
         if not self.network_services_l2:
             return []
 
-        if "l2vlans" not in tenant:
+        tenant = indexed_tenant.tenant
+        if not tenant.get("l2vlans"):
             return []
 
-        l2vlans: list[dict] = natural_sort(tenant["l2vlans"], "id")
+        # Only the l2vlans in accepted_vlans and with one of the filter_tags are returned from the index, so other l2vlans are not visited.
+        l2vlans = indexed_tenant.l2vlans.get(self.accepted_vlans, self.filter_tags)
 
-        if tenant_evpn_vlan_bundle := get(tenant, "evpn_vlan_bundle"):
-            for l2vlan in l2vlans:
-                l2vlan["evpn_vlan_bundle"] = get(l2vlan, "evpn_vlan_bundle", default=tenant_evpn_vlan_bundle)
+        tenant_evpn_vlan_bundle = get(tenant, "evpn_vlan_bundle")
+        filtered_l2vlans = []
+        for original_l2vlan in l2vlans:
+            if not self.is_accepted_vlan(original_l2vlan) or not (
+                "all" in self.filter_tags or set(original_l2vlan.get("tags", ["all"])).intersection(self.filter_tags)
+            ):
+                continue
 
-        return [
             # Copy and set tenant key on all l2vlans
-            {**l2vlan, "tenant": tenant["name"]}
-            for l2vlan in l2vlans
-            if self.is_accepted_vlan(l2vlan) and ("all" in self.filter_tags or set(l2vlan.get("tags", ["all"])).intersection(self.filter_tags))
-        ]
+            l2vlan = {**original_l2vlan}
+            if tenant_evpn_vlan_bundle:
+                l2vlan["evpn_vlan_bundle"] = get(l2vlan, "evpn_vlan_bundle", default=tenant_evpn_vlan_bundle)
+            l2vlan["tenant"] = tenant["name"]
+            filtered_l2vlans.append(l2vlan)
+
+        return filtered_l2vlans
 
     def is_accepted_vlan(self: SharedUtils, vlan: dict) -> bool:
         """
@@ -122,13 +141,10 @@ class FilteredTenantsMixin:
         if vlan_id in self.endpoint_vlans:
             return True
 
-        # Picking this up from facts so this would fail if accessed when shared_utils is run before facts
-        # TODO: see if this can be optimized
-        endpoint_trunk_groups = set(self.get_switch_fact("endpoint_trunk_groups", required=False) or [])
-        return self.enable_trunk_groups and vlan.get("trunk_groups") and endpoint_trunk_groups.intersection(vlan["trunk_groups"])
+        return self.enable_trunk_groups and vlan.get("trunk_groups") and self.endpoint_trunk_groups.intersection(vlan["trunk_groups"])
 
     @cached_property
-    def accepted_vlans(self: SharedUtils) -> list[int]:
+    def accepted_vlans(self: SharedUtils) -> frozenset[int]:
         """
         The 'vlans' switch fact is a string representing a vlan range (ex. "1-200").
 
@@ -137,9 +153,8 @@ class FilteredTenantsMixin:
         """
         switch_vlans = self.get_switch_fact("vlans", required=False)
         if not switch_vlans:
-            return []
-        switch_vlans_list = range_expand(switch_vlans)
-        accepted_vlans = [int(vlan) for vlan in switch_vlans_list]
+            return frozenset()
+        accepted_vlans = range_expand_to_int_set(switch_vlans)
         if self.uplink_type != "port-channel":
             return accepted_vlans
 
@@ -148,9 +163,7 @@ class FilteredTenantsMixin:
         for uplink_switch in uplink_switches:
             uplink_switch_facts = self.get_peer_facts(uplink_switch, required=True)
             uplink_switch_vlans = uplink_switch_facts.get("vlans", [])
-            uplink_switch_vlans_list = range_expand(uplink_switch_vlans)
-            uplink_switch_vlans_list = [int(vlan) for vlan in uplink_switch_vlans_list]
-            accepted_vlans = [vlan for vlan in accepted_vlans if vlan in uplink_switch_vlans_list]
+            accepted_vlans = accepted_vlans.intersection(range_expand_to_int_set(uplink_switch_vlans))
 
         return accepted_vlans
 
@@ -182,17 +195,19 @@ class FilteredTenantsMixin:
 
         return vrf["name"] in (self.get_switch_fact("uplink_switch_vrfs", required=False) or [])
 
-    def filtered_vrfs(self: SharedUtils, tenant: dict) -> list[dict]:
+    def filtered_vrfs(self: SharedUtils, indexed_tenant: IndexedTenant) -> list[dict]:
         """
-        Return sorted and filtered vrf list from given tenant.
+        Return sorted and filtered vrf list from given indexed tenant.
 
         Filtering based on svi tags, l3interfaces, loopbacks or self.is_forced_vrf() check.
         Keys of VRF data model will be converted to lists.
         """
         filtered_vrfs = []
 
-        vrfs: list[dict] = natural_sort(tenant.get("vrfs", []), "name")
-        for original_vrf in vrfs:
+        tenant = indexed_tenant.tenant
+        # The VRFs are sorted by the index.
+        for indexed_vrf in indexed_tenant.vrfs:
+            original_vrf = indexed_vrf.vrf
             if not self.is_accepted_vrf(original_vrf):
                 continue
 
@@ -205,7 +220,7 @@ class FilteredTenantsMixin:
             vrf["ipv6_static_routes"] = [
                 route for route in get(vrf, "ipv6_static_routes", default=[]) if self.hostname in get(route, "nodes", default=[self.hostname])
             ]
-            vrf["svis"] = self.filtered_svis(vrf)
+            vrf["svis"] = self.filtered_svis(vrf, indexed_vrf.svis)
             vrf["l3_interfaces"] = [
                 l3_interface
                 for l3_interface in get(vrf, "l3_interfaces", default=[])
@@ -332,9 +347,9 @@ class FilteredTenantsMixin:
         merged_svi.pop("parent_profile", None)
         return merged_svi
 
-    def filtered_svis(self: SharedUtils, vrf: dict) -> list[dict]:
+    def filtered_svis(self: SharedUtils, vrf: dict, indexed_svis: VlansIndex) -> list[dict]:
         """
-        Return sorted and filtered svi list from given tenant vrf.
+        Return sorted and filtered svi list from given tenant vrf and the index of the SVIs of the vrf.
 
         Filtering based on accepted vlans since eos_designs_facts already
         filtered that on tags and trunk_groups.
@@ -342,7 +357,12 @@ class FilteredTenantsMixin:
         if not (self.network_services_l2 or self.network_services_l2_as_subint):
             return []
 
-        svis: list[dict] = natural_sort(vrf.get("svis", []), "id")
+        if not vrf.get("svis"):
+            return []
+
+        # Only the SVIs in accepted_vlans are returned from the index, so other SVIs are not visited.
+        # The tags are not used for the lookup, since tags can also be set in SVI profiles.
+        svis = indexed_svis.get(self.accepted_vlans)
         svis = [svi for svi in svis if self.is_accepted_vlan(svi)]
 
         # Handle svi_profile inheritance
@@ -358,11 +378,16 @@ class FilteredTenantsMixin:
         return svis
 
     @cached_property
-    def endpoint_vlans(self: SharedUtils) -> list:
+    def endpoint_trunk_groups(self: SharedUtils) -> frozenset[str]:
+        # Picking this up from facts so this would fail if accessed when shared_utils is run before facts
+        return frozenset(self.get_switch_fact("endpoint_trunk_groups", required=False) or [])
+
+    @cached_property
+    def endpoint_vlans(self: SharedUtils) -> frozenset[int]:
         endpoint_vlans = self.get_switch_fact("endpoint_vlans", required=False)
         if not endpoint_vlans:
-            return []
-        return [int(vlan_id) for vlan_id in range_expand(endpoint_vlans)]
+            return frozenset()
+        return range_expand_to_int_set(endpoint_vlans)
 
     @staticmethod
     def get_vrf_id(vrf: dict, required: bool = True) -> int | None:
@@ -11,6 +11,8 @@ from pyavd._errors import AristaAvdError, AristaAvdInvalidInputsError
 from pyavd._utils import default, get
 from pyavd.j2filters import natural_sort, range_expand
 
+from .fabric_facts import FabricFacts
+
 if TYPE_CHECKING:
     from pyavd._eos_designs.eos_designs_facts import EosDesignsFacts
 
@@ -25,10 +27,22 @@ class MiscMixin:
     Using type-hint on self to get proper type-hints on attributes across all Mixins.
     """
 
+    @cached_property
+    def fabric_facts(self: SharedUtils) -> FabricFacts:
+        """
+        Return the FabricFacts instance used to look up facts of any device in the fabric.
+
+        The instance is shared between all devices when given as "avd_fabric_facts" in hostvars,
+        otherwise a new instance is created for this device from "avd_switch_facts".
+        """
+        if (fabric_facts := get(self.hostvars, "avd_fabric_facts")) is not None:
+            return fabric_facts
+
+        return FabricFacts(get(self.hostvars, "avd_switch_facts", required=True))
+
     @cached_property
     def all_fabric_devices(self: SharedUtils) -> list[str]:
-        avd_switch_facts: dict = get(self.hostvars, "avd_switch_facts", required=True)
-        return list(avd_switch_facts.keys())
+        return self.fabric_facts.hostnames
 
     @cached_property
     def hostname(self: SharedUtils) -> str:
@@ -358,7 +372,7 @@ class MiscMixin:
 
         We need to go via avd_switch_facts since PyAVD does not expose "switch.*" in get_avdfacts.
         """
-        return get(self.hostvars, f"avd_switch_facts..{self.hostname}..switch..{key}", required=required, org_key=f"switch.{key}", separator="..")
+        return get(self.fabric_facts.get_peer_facts(self.hostname, required=required) or {}, key, required=required, org_key=f"switch.{key}", separator="..")
 
     @cached_property
     def evpn_multicast(self: SharedUtils) -> bool:
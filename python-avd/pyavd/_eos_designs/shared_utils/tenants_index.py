@@ -0,0 +1,102 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from pyavd.j2filters import natural_sort
+
+from .connected_endpoints_index import _find_index
+
+if TYPE_CHECKING:
+    from . import SharedUtils
+
+
+class VlansIndex:
+    """Index of a list of l2vlans or SVIs, sorted once and keyed by vlan id and by tag."""
+
+    def __init__(self, vlans: list[dict]) -> None:
+        self._vlans_by_id: dict[int, list[dict]] = {}
+        self._vlan_ids_by_tag: dict[str, set[int]] = {}
+        for vlan in natural_sort(vlans, "id"):
+            vlan_id = int(vlan["id"])
+            self._vlans_by_id.setdefault(vlan_id, []).append(vlan)
+            # Vlans without tags are matched by the tag "all", like in the filtering of the device.
+            for tag in vlan.get("tags", ["all"]):
+                self._vlan_ids_by_tag.setdefault(tag, set()).add(vlan_id)
+
+        self._vlan_ids = frozenset(self._vlans_by_id)
+
+    def get(self, vlan_ids: frozenset[int], tags: list[str] | None = None) -> list[dict]:
+        """
+        Return the vlans having one of the given vlan ids and, if tags are given, one of the given tags.
+
+        Tags containing "all" match all vlans. The vlans are returned in the natural sort order of the "id" key without copying.
+        Several vlans can have the same id, so the caller must still check the tags of each vlan when filtering on tags.
+        """
+        candidate_vlan_ids = self._vlan_ids.intersection(vlan_ids)
+        if tags is not None and "all" not in tags:
+            candidate_vlan_ids = candidate_vlan_ids.intersection(chain.from_iterable(self._vlan_ids_by_tag.get(tag, ()) for tag in tags))
+
+        return [vlan for vlan_id in sorted(candidate_vlan_ids) for vlan in self._vlans_by_id[vlan_id]]
+
+
+@dataclass(frozen=True)
+class IndexedVrf:
+    vrf: dict
+    svis: VlansIndex
+
+
+@dataclass(frozen=True)
+class IndexedTenant:
+    tenant: dict
+    l2vlans: VlansIndex
+    vrfs: list[IndexedVrf]
+    """VRFs in the natural sort order of the "name" key."""
+
+
+class TenantsIndex:
+    """
+    Index of the tenants of all network services keys, with VRFs sorted once and l2vlans and SVIs keyed by vlan id and tag.
+
+    One instance is shared by all devices of the fabric through `hostvars.avd_tenants_index`.
+    The index is built once per distinct content of the tenant lists of the network services keys, so devices with the same inputs,
+    like network services set for the whole fabric, share the index built by the first device. Other devices only compare their inputs
+    with the indexed inputs using the built-in equality. Only the inputs of the first device with a given content are kept in the index.
+
+    A device gets its tenants, l2vlans and SVIs through set intersections with its tenant filter, accepted vlans and tags,
+    so tenants and vlans not relevant for the device are never visited.
+    """
+
+    def __init__(self) -> None:
+        # List of (inputs, indexed tenants, positions of the indexed tenants per tenant name) for each distinct content of the inputs.
+        self._tenants: list[tuple[list[list[dict]], tuple[list[IndexedTenant], dict[str, list[int]]]]] = []
+
+    def get_tenants(self, shared_utils: SharedUtils) -> list[IndexedTenant]:
+        """
+        Return the tenants of all network services keys matching the tenant filter of the switch of the given SharedUtils instance.
+
+        The tenants are returned in the order of the sorted network services keys and the order of the inputs.
+        """
+        inputs = [shared_utils.hostvars[network_services_key["name"]] for network_services_key in shared_utils.network_services_keys]
+        if (index := _find_index(self._tenants, inputs)) is None:
+            indexed_tenants = []
+            positions_by_name: dict[str, list[int]] = {}
+            for position, tenant in enumerate(chain.from_iterable(inputs)):
+                positions_by_name.setdefault(tenant["name"], []).append(position)
+                vrfs = [IndexedVrf(vrf, VlansIndex(vrf.get("svis") or [])) for vrf in natural_sort(tenant.get("vrfs", []), "name")]
+                indexed_tenants.append(IndexedTenant(tenant, VlansIndex(tenant.get("l2vlans") or []), vrfs))
+
+            index = (indexed_tenants, positions_by_name)
+            self._tenants.append((inputs, index))
+
+        indexed_tenants, positions_by_name = index
+        filter_tenants = shared_utils.filter_tenants
+        if "all" in filter_tenants:
+            return indexed_tenants
+
+        positions = chain.from_iterable(positions_by_name[name] for name in positions_by_name.keys() & set(filter_tenants))
+        return [indexed_tenants[position] for position in sorted(positions)]
@@ -7,7 +7,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pyavd._errors import AristaAvdError
-from pyavd._utils import get, get_item, merge, template_var
+from pyavd._utils import get_item, merge, template_var
 
 if TYPE_CHECKING:
     from pyavd._eos_designs.eos_designs_facts import EosDesignsFacts
@@ -30,18 +30,9 @@ class UtilsMixin:
         returns avd_switch_facts.{peer_name}.switch
 
         by default required is True and so the function will raise is peer_facts cannot be found
-        using the separator `..` to be able to handle hostnames with `.` inside
+        the lookup is done directly on the shared FabricFacts, so hostnames with `.` inside are supported
         """
-        return get(
-            self.hostvars,
-            f"avd_switch_facts..{peer_name}..switch",
-            separator="..",
-            required=required,
-            custom_error_msg=(
-                f"Facts not found for node '{peer_name}'. Something in the input vars is pointing to this node. "
-                f"Check that '{peer_name}' is in the inventory and is part of the group set by 'fabric_name'. Node is required."
-            ),
-        )
+        return self.fabric_facts.get_peer_facts(peer_name, required=required)
 
     def template_var(self: SharedUtils, template_file: str, template_vars: dict) -> str:
         """Run the simplified templater using the passed Ansible "templar" engine."""
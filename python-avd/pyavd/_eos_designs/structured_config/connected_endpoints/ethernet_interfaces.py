@@ -9,7 +9,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyavd._errors import AristaAvdError, AristaAvdInvalidInputsError
-from pyavd._utils import append_if_not_duplicate, default, get, replace_or_append_item, strip_null_from_data
+from pyavd._utils import IndexedList, append_if_not_duplicate, default, get, strip_null_from_data
 from pyavd.api.interface_descriptions import InterfaceDescriptionData
 from pyavd.j2filters import range_expand
 
@@ -36,11 +36,11 @@ class EthernetInterfacesMixin(UtilsMixin):
         - Silently overwrite duplicate network_ports with connected_endpoints.
         - Do NOT overwrite connected_endpoints with other connected_endpoints. Instead we raise a duplicate error.
         """
-        ethernet_interfaces = []
+        ethernet_interfaces = IndexedList("name")
 
         # List of ethernet_interfaces used for duplicate checks.
 
-        non_overwritable_ethernet_interfaces = []
+        non_overwritable_ethernet_interfaces = IndexedList("name")
 
         for network_port in self._filtered_network_ports:
             connected_endpoint = {
@@ -57,7 +57,7 @@ class EthernetInterfacesMixin(UtilsMixin):
                     network_port,
                 )
                 ethernet_interface = self._get_ethernet_interface_cfg(tmp_network_port, 0, connected_endpoint)
-                replace_or_append_item(ethernet_interfaces, "name", ethernet_interface)
+                ethernet_interfaces.replace_or_append(ethernet_interface)
 
         for connected_endpoint in self._filtered_connected_endpoints:
             for adapter in connected_endpoint["adapters"]:
@@ -74,10 +74,10 @@ class EthernetInterfacesMixin(UtilsMixin):
                         context_keys=["name", "peer_interface"],
                     )
 
-                    replace_or_append_item(ethernet_interfaces, "name", ethernet_interface)
+                    ethernet_interfaces.replace_or_append(ethernet_interface)
 
         if ethernet_interfaces:
-            return ethernet_interfaces
+            return ethernet_interfaces.to_list()
 
         return None
 
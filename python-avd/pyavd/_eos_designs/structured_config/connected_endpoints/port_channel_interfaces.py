@@ -8,7 +8,7 @@ from collections import ChainMap
 from functools import cached_property
 from typing import TYPE_CHECKING
 
-from pyavd._utils import append_if_not_duplicate, get, short_esi_to_route_target, strip_null_from_data
+from pyavd._utils import IndexedList, append_if_not_duplicate, get, short_esi_to_route_target, strip_null_from_data
 from pyavd.api.interface_descriptions import InterfaceDescriptionData
 from pyavd.j2filters import range_expand
 
@@ -34,7 +34,7 @@ class PortChannelInterfacesMixin(UtilsMixin):
         - Silently ignore duplicate port-channels if they contain _exactly_ the same configuration
         - Raise a duplicate error for any other duplicate port-channel interface
         """
-        port_channel_interfaces = []
+        port_channel_interfaces = IndexedList("name")
         for connected_endpoint in self._filtered_connected_endpoints:
             for adapter in connected_endpoint["adapters"]:
                 if get(adapter, "port_channel.mode") is None:
@@ -110,7 +110,7 @@ class PortChannelInterfacesMixin(UtilsMixin):
                 )
 
         if port_channel_interfaces:
-            return port_channel_interfaces
+            return port_channel_interfaces.to_list()
 
         return None
 
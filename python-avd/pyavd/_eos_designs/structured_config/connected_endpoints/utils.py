@@ -31,64 +31,43 @@ class UtilsMixin:
         """
         filtered_connected_endpoints = []
         for connected_endpoints_key in self.shared_utils.connected_endpoints_keys:
-            connected_endpoints = get(self._hostvars, connected_endpoints_key["key"], default=[])
-            for connected_endpoint in connected_endpoints:
-                if "adapters" not in connected_endpoint:
-                    continue
-
-                filtered_adapters = []
-                for adapter_index, adapter in enumerate(connected_endpoint["adapters"]):
-                    adapter["context"] = f"{connected_endpoints_key['key']}[name={connected_endpoint['name']}].adapters[{adapter_index}]"
-                    adapter_settings = self.shared_utils.get_merged_adapter_settings(adapter)
-
-                    if self.shared_utils.hostname not in adapter_settings.get("switches", []):
-                        continue
-
-                    # Verify that length of all lists are the same
-                    nodes_length = len(adapter_settings["switches"])
-                    endpoint_ports = adapter_settings.get("endpoint_ports")
-                    if len(adapter_settings["switch_ports"]) != nodes_length or (endpoint_ports is not None and len(endpoint_ports) != nodes_length):
-                        msg = (
-                            f"Length of lists 'switches', 'switch_ports', 'endpoint_ports' (if used) did not match on adapter {adapter_index} on"
-                            f" connected_endpoint '{connected_endpoint['name']}' under '{connected_endpoints_key['key']}'."
-                            " Notice that some or all of these variables could be inherited from 'port_profiles'"
-                        )
-                        raise AristaAvdError(msg)
-
-                    filtered_adapters.append(adapter_settings)
-
-                if filtered_adapters:
-                    filtered_connected_endpoints.append(
-                        {
-                            **connected_endpoint,
-                            "adapters": filtered_adapters,
-                            "type": connected_endpoints_key["type"],
-                        },
+            # Adapters connected to this switch, grouped per connected endpoint in the order of the inputs.
+            filtered_adapters_per_endpoint: dict[int, tuple[dict, list]] = {}
+            connected_endpoint_adapters = self.shared_utils.connected_endpoints_index.connected_endpoint_adapters(self.shared_utils, connected_endpoints_key)
+            for connected_endpoint, adapter_index, adapter in connected_endpoint_adapters:
+                adapter_settings = self.shared_utils.get_merged_adapter_settings(adapter)
+
+                # Verify that length of all lists are the same
+                nodes_length = len(adapter_settings["switches"])
+                endpoint_ports = adapter_settings.get("endpoint_ports")
+                if len(adapter_settings["switch_ports"]) != nodes_length or (endpoint_ports is not None and len(endpoint_ports) != nodes_length):
+                    msg = (
+                        f"Length of lists 'switches', 'switch_ports', 'endpoint_ports' (if used) did not match on adapter {adapter_index} on"
+                        f" connected_endpoint '{connected_endpoint['name']}' under '{connected_endpoints_key['key']}'."
+                        " Notice that some or all of these variables could be inherited from 'port_profiles'"
                     )
+                    raise AristaAvdError(msg)
+
+                filtered_adapters_per_endpoint.setdefault(id(connected_endpoint), (connected_endpoint, []))[1].append(adapter_settings)
+
+            filtered_connected_endpoints.extend(
+                {
+                    **connected_endpoint,
+                    "adapters": filtered_adapters,
+                    "type": connected_endpoints_key["type"],
+                }
+                for connected_endpoint, filtered_adapters in filtered_adapters_per_endpoint.values()
+            )
 
         return filtered_connected_endpoints
 
     @cached_property
     def _filtered_network_ports(self: AvdStructuredConfigConnectedEndpoints) -> list:
         """Return list of endpoints defined under "network_ports" which are connected to this switch."""
-        filtered_network_ports = []
-        for index, network_port in enumerate(get(self._hostvars, "network_ports", default=[])):
-            network_port["context"] = f"network_ports[{index}]"
-            network_port_settings = self.shared_utils.get_merged_adapter_settings(network_port)
-            if not self._match_regexes(network_port_settings.get("switches"), self.shared_utils.hostname):
-                continue
-
-            filtered_network_ports.append(network_port_settings)
-
-        return filtered_network_ports
-
-    def _match_regexes(self: AvdStructuredConfigConnectedEndpoints, regexes: list, value: str) -> bool:
-        """
-        Match a list of regexes with the supplied value.
-
-        Regex must match the full value to pass, so regex is wrapped in ^$.
-        """
-        return any(re.match(rf"^{regex}$", value) for regex in regexes)
+        return [
+            self.shared_utils.get_merged_adapter_settings(network_port)
+            for _index, network_port in self.shared_utils.connected_endpoints_index.network_ports(self.shared_utils)
+        ]
 
     def _get_short_esi(
         self: AvdStructuredConfigConnectedEndpoints,
@@ -36,6 +36,6 @@ class IpNatMixin(UtilsMixin):
                 ip_nat["profiles"].append(profile)
 
         if ip_nat:
-            return ip_nat
+            return dict(ip_nat)
 
         return None
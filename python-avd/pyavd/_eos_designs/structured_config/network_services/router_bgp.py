@@ -10,7 +10,7 @@ from re import fullmatch as re_fullmatch
 from typing import TYPE_CHECKING
 
 from pyavd._errors import AristaAvdInvalidInputsError
-from pyavd._utils import AvdStringFormatter, append_if_not_duplicate, default, get, get_item, merge, strip_empties_from_dict
+from pyavd._utils import AvdStringFormatter, IndexedList, append_if_not_duplicate, default, get, get_item, merge, strip_empties_from_dict
 from pyavd.j2filters import list_compress, natural_sort
 
 from .utils import UtilsMixin
@@ -147,6 +147,7 @@ class RouterBgpMixin(UtilsMixin):
             return {}
 
         router_bgp = {"vrfs": []}
+        bgp_vrfs = IndexedList("name")
 
         for tenant in self.shared_utils.filtered_tenants:
             for vrf in tenant["vrfs"]:
@@ -184,7 +185,7 @@ class RouterBgpMixin(UtilsMixin):
                         # RD/RT and/or eos_cli/struct_cfg which should go under the vrf default context.
                         # Any peers added later will be put directly under router_bgp
                         append_if_not_duplicate(
-                            list_of_dicts=router_bgp["vrfs"],
+                            list_of_dicts=bgp_vrfs,
                             primary_key="name",
                             new_dict={"name": vrf_name, **bgp_vrf},
                             context="BGP VRFs defined under network services",
@@ -268,12 +269,14 @@ class RouterBgpMixin(UtilsMixin):
                     router_bgp.update(bgp_vrf)
                 else:
                     append_if_not_duplicate(
-                        list_of_dicts=router_bgp["vrfs"],
+                        list_of_dicts=bgp_vrfs,
                         primary_key="name",
                         new_dict={"name": vrf_name, **bgp_vrf},
                         context="BGP VRFs defined under network services",
                         context_keys=["name"],
                     )
+
+        router_bgp["vrfs"] = bgp_vrfs.to_list()
         return strip_empties_from_dict(router_bgp)
 
     def _update_router_bgp_vrf_evpn_or_mpls_cfg(self: AvdStructuredConfigNetworkServices, bgp_vrf: dict, vrf: dict, vrf_address_families: list) -> None:
@@ -423,7 +426,7 @@ class RouterBgpMixin(UtilsMixin):
         ):
             return None
 
-        vlans = []
+        vlans = IndexedList("id")
         for tenant in self.shared_utils.filtered_tenants:
             for vrf in tenant["vrfs"]:
                 for svi in tenant_svis_l2vlans_dict[tenant["name"]]["svi_non_bundle"][vrf["name"]]:
@@ -453,7 +456,7 @@ class RouterBgpMixin(UtilsMixin):
                             context_keys=["id", "tenant"],
                             ignore_keys={"tenant"},
                         )
-        return vlans or None
+        return vlans.to_list() or None
 
     def _router_bgp_vlans_vlan(self: AvdStructuredConfigNetworkServices, vlan: dict, tenant: dict, vrf: dict) -> dict | None:
         """Return structured config for one given vlan under router_bgp.vlans."""
@@ -7,7 +7,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyavd._errors import AristaAvdInvalidInputsError
-from pyavd._utils import append_if_not_duplicate, default, get, strip_empties_from_dict
+from pyavd._utils import IndexedList, append_if_not_duplicate, default, get, strip_empties_from_dict
 from pyavd.api.interface_descriptions import InterfaceDescriptionData
 
 from .utils import UtilsMixin
@@ -33,7 +33,7 @@ class VlanInterfacesMixin(UtilsMixin):
         if not (self.shared_utils.network_services_l2 and self.shared_utils.network_services_l3):
             return None
 
-        vlan_interfaces = []
+        vlan_interfaces = IndexedList("name")
         for tenant in self.shared_utils.filtered_tenants:
             for vrf in tenant["vrfs"]:
                 for svi in vrf["svis"]:
@@ -63,7 +63,7 @@ class VlanInterfacesMixin(UtilsMixin):
                 )
 
         if vlan_interfaces:
-            return vlan_interfaces
+            return vlan_interfaces.to_list()
 
         return None
 
@@ -6,7 +6,7 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING
 
-from pyavd._utils import AvdStringFormatter, append_if_not_duplicate
+from pyavd._utils import AvdStringFormatter, IndexedList, append_if_not_duplicate
 from pyavd.j2filters import natural_sort
 
 from .utils import UtilsMixin
@@ -35,7 +35,7 @@ class VlansMixin(UtilsMixin):
         if not self.shared_utils.network_services_l2:
             return None
 
-        vlans = []
+        vlans = IndexedList("id")
         for tenant in self.shared_utils.filtered_tenants:
             for vrf in tenant["vrfs"]:
                 for svi in vrf["svis"]:
@@ -84,7 +84,7 @@ class VlansMixin(UtilsMixin):
                 )
 
         if vlans:
-            return vlans
+            return vlans.to_list()
 
         return None
 
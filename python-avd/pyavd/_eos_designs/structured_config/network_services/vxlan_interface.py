@@ -6,9 +6,9 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING, NoReturn
 
+from pyavd._eos_designs.eos_designs_facts.vteps_index import get_avd_vteps
 from pyavd._errors import AristaAvdError, AristaAvdInvalidInputsError
-from pyavd._utils import append_if_not_duplicate, default, get, get_item, unique
-from pyavd.j2filters import natural_sort, range_expand
+from pyavd._utils import IndexedList, append_if_not_duplicate, default, get, get_item
 
 from .utils import UtilsMixin
 
@@ -49,16 +49,16 @@ class VxlanInterfaceMixin(UtilsMixin):
         if self.shared_utils.mlag_l3 and self.shared_utils.network_services_l3 and self.shared_utils.overlay_evpn:
             vxlan["virtual_router_encapsulation_mac_address"] = "mlag-system-id"
 
-        if self.shared_utils.overlay_her and self._overlay_her_flood_list_per_vni is False and (common := self._overlay_her_flood_lists.get("common")):
-            vxlan["flood_vteps"] = natural_sort(unique(common))
+        if self.shared_utils.overlay_her and self._overlay_her_flood_list_per_vni is False and (common := self._get_overlay_her_flood_list()):
+            vxlan["flood_vteps"] = common
 
         if self.shared_utils.overlay_cvx:
             vxlan["controller_client"] = {"enabled": True}
 
-        vlans = []
-        vrfs = []
+        vlans = IndexedList("id")
+        vrfs = IndexedList("name")
         # vnis is a list of dicts only used for duplication checks across multiple types of objects all having "vni" as a key.
-        vnis = []
+        vnis = IndexedList("vni")
 
         for tenant in self.shared_utils.filtered_tenants:
             for vrf in tenant["vrfs"]:
@@ -110,10 +110,10 @@ class VxlanInterfaceMixin(UtilsMixin):
                 )
 
         if vlans:
-            vxlan["vlans"] = vlans
+            vxlan["vlans"] = vlans.to_list()
 
         if vrfs:
-            vxlan["vrfs"] = vrfs
+            vxlan["vrfs"] = vrfs.to_list()
 
         return {
             "vxlan1": {
@@ -122,7 +122,9 @@ class VxlanInterfaceMixin(UtilsMixin):
             },
         }
 
-    def _get_vxlan_interface_config_for_vrf(self: AvdStructuredConfigNetworkServices, vrf: dict, tenant: dict, vrfs: list, vlans: list, vnis: list) -> None:
+    def _get_vxlan_interface_config_for_vrf(
+        self: AvdStructuredConfigNetworkServices, vrf: dict, tenant: dict, vrfs: IndexedList, vlans: IndexedList, vnis: IndexedList
+    ) -> None:
         """In place updates of the vlans, vnis and vrfs list."""
         if self.shared_utils.network_services_l2:
             for svi in vrf["svis"]:
@@ -250,8 +252,8 @@ class VxlanInterfaceMixin(UtilsMixin):
                 underlay_l2_multicast_group_ipv4_pool_offset,
             )
 
-        if self.shared_utils.overlay_her and self._overlay_her_flood_list_per_vni and (vlan_id_entry := self._overlay_her_flood_lists.get(vlan_id)):
-            vxlan_interface_vlan["flood_vteps"] = natural_sort(unique(vlan_id_entry))
+        if self.shared_utils.overlay_her and self._overlay_her_flood_list_per_vni and (vlan_id_entry := self._get_overlay_her_flood_list(vlan_id)):
+            vxlan_interface_vlan["flood_vteps"] = vlan_id_entry
 
         return vxlan_interface_vlan
 
@@ -260,53 +262,61 @@ class VxlanInterfaceMixin(UtilsMixin):
         return get(self._hostvars, "overlay_her_flood_list_per_vni") is True
 
     @cached_property
-    def _overlay_her_flood_lists(self: AvdStructuredConfigNetworkServices) -> dict[list]:
+    def _overlay_her_flood_list_dc_name(self: AvdStructuredConfigNetworkServices) -> str | None:
         """
-        Returns a dict with HER Flood Lists.
-
-        Only used when overlay_route_protocol == 'HER'
-
-        If "overlay_her_flood_list_per_vni" is True:
-        - return {<vlan>: [<peer_vtep>, <peer_vtep>, ...], ...}
-        Else
-        - return {common: [<peer_vtep>, <peer_vtep> ...]}
+        Return the dc_name used to limit the HER Flood Lists to peers in the same DC, or None if all peers in the fabric are used.
 
         Uses "overlay_her_flood_list_scope" to find the peer switches
         If overlay_her_flood_list_scope == "dc"
           - dc_name *must* be set.
           - Otherwise an error will be raised
         """
-        overlay_her_flood_lists = {}
-        overlay_her_flood_list_scope = get(self._hostvars, "overlay_her_flood_list_scope")
+        if get(self._hostvars, "overlay_her_flood_list_scope") != "dc":
+            return None
 
-        if overlay_her_flood_list_scope == "dc" and self.shared_utils.dc_name is None:
+        if self.shared_utils.dc_name is None:
             msg = "'dc_name' is required with 'overlay_her_flood_list_scope: dc'"
             raise AristaAvdInvalidInputsError(msg)
 
-        for peer in self.shared_utils.all_fabric_devices:
-            if peer == self.shared_utils.hostname:
-                continue
+        return self.shared_utils.dc_name
 
-            peer_facts = self.shared_utils.get_peer_facts(peer, required=True)
+    @cached_property
+    def _avd_vteps(self: AvdStructuredConfigNetworkServices) -> dict:
+        """
+        Return the fabric-wide index of VTEPs built by `get_avd_facts` / `eos_designs_facts`.
 
-            if overlay_her_flood_list_scope == "dc" and peer_facts.get("dc_name") != self.shared_utils.dc_name:
-                continue
+        The index is built from the peer facts if not available, for example when avd_facts were generated by an older version.
+        """
+        if (avd_vteps := get(self._hostvars, "avd_vteps")) is not None:
+            return avd_vteps
 
-            if (vtep_ip := peer_facts.get("vtep_ip")) is None:
-                continue
+        return get_avd_vteps(get(self._hostvars, "avd_switch_facts", required=True))
 
-            if not self._overlay_her_flood_list_per_vni:
-                # Use common flood list
-                overlay_her_flood_lists.setdefault("common", []).append(vtep_ip)
-                continue
+    def _get_overlay_her_flood_list(self: AvdStructuredConfigNetworkServices, vlan_id: int | None = None) -> list[str]:
+        """
+        Returns a HER Flood List with the VTEP IPs of the peers sorted naturally.
+
+        Only used when overlay_route_protocol == 'HER'
 
-            # Use flood lists per vlan
-            peer_vlans = peer_facts.get("vlans", [])
-            peer_vlans_list = range_expand(peer_vlans)
-            for vlan in peer_vlans_list:
-                overlay_her_flood_lists.setdefault(int(vlan), []).append(vtep_ip)
+        If vlan_id is set, only peers with the vlan are included. This is used when "overlay_her_flood_list_per_vni" is True.
+        Otherwise all peers are included.
 
-        return overlay_her_flood_lists
+        The peers are limited to the same DC if "overlay_her_flood_list_scope" is "dc".
+        """
+        # Evaluating the DC name first, to raise on missing dc_name even if there are no peers.
+        dc_name = self._overlay_her_flood_list_dc_name
+        vteps = self._avd_vteps["vteps"]
+        vtep_indexes = range(len(vteps)) if vlan_id is None else self._avd_vteps["vlans"].get(str(vlan_id), [])
+
+        # The vteps are already sorted, so we only need to remove duplicates like the shared VTEP IP of an MLAG peer.
+        hostname = self.shared_utils.hostname
+        return list(
+            dict.fromkeys(
+                vteps[index]["vtep_ip"]
+                for index in vtep_indexes
+                if vteps[index]["hostname"] != hostname and (dc_name is None or vteps[index]["dc_name"] == dc_name)
+            )
+        )
 
     def _raise_duplicate_vni_error(self: AvdStructuredConfigNetworkServices, vni: int, context: str, tenant: str, duplicate_vni_tenant: str) -> NoReturn:
         msg = f"Duplicate VXLAN VNI '{vni}' found in Tenant(s) '{tenant}' during configuration of {context}."
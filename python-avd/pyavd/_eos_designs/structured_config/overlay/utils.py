@@ -178,7 +178,12 @@ class UtilsMixin:
 
         mpls_mesh_pe = {}
 
+        # Only devices with a client role can be MPLS clients, so other devices are skipped without checking their facts further.
+        fabric_facts = self.shared_utils.fabric_facts
+        client_candidates = {*fabric_facts.devices_by_mpls_overlay_role.get("client", []), *fabric_facts.devices_by_evpn_role.get("client", [])}
         for fabric_switch in self.shared_utils.all_fabric_devices:
+            if fabric_switch not in client_candidates:
+                continue
             if self._mpls_route_reflectors is not None and fabric_switch in self._mpls_route_reflectors:
                 continue
             if fabric_switch == self.shared_utils.hostname:
@@ -7,7 +7,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyavd._errors import AristaAvdError
-from pyavd._utils import append_if_not_duplicate, get, strip_null_from_data
+from pyavd._utils import IndexedList, append_if_not_duplicate, get, strip_null_from_data
 from pyavd.api.interface_descriptions import InterfaceDescriptionData
 from pyavd.j2filters import encrypt, natural_sort
 
@@ -27,7 +27,7 @@ class EthernetInterfacesMixin(UtilsMixin):
     @cached_property
     def ethernet_interfaces(self: AvdStructuredConfigUnderlay) -> list | None:
         """Return structured config for ethernet_interfaces."""
-        ethernet_interfaces = []
+        ethernet_interfaces = IndexedList("name")
 
         for link in self._underlay_links:
             # common values
@@ -296,7 +296,7 @@ class EthernetInterfacesMixin(UtilsMixin):
             )
 
         if ethernet_interfaces:
-            return ethernet_interfaces
+            return ethernet_interfaces.to_list()
 
         return None
 
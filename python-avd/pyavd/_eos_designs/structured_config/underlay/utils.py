@@ -9,7 +9,8 @@ from typing import TYPE_CHECKING
 from pyavd._errors import AristaAvdError
 from pyavd._utils import default, get, get_ip_from_ip_prefix, get_item, strip_empties_from_dict
 from pyavd.api.interface_descriptions import InterfaceDescriptionData
-from pyavd.j2filters import natural_sort, range_expand
+from pyavd.j2filters import natural_sort
+from pyavd.j2filters.range_expand import range_expand_to_int_set
 
 if TYPE_CHECKING:
     from . import AvdStructuredConfigUnderlay
@@ -209,7 +210,7 @@ class UtilsMixin:
 
     def _get_l3_uplink_with_l2_as_subint(self: AvdStructuredConfigUnderlay, link: dict) -> tuple[dict, list[dict]]:
         """Return a tuple with main uplink interface, list of subinterfaces representing each SVI."""
-        vlans = [int(vlan) for vlan in range_expand(link["vlans"])]
+        vlans = range_expand_to_int_set(link["vlans"])
 
         # Main interface
         # Routed interface with no config unless there is an SVI matching the native-vlan, then it will contain the config for that SVI
@@ -6,8 +6,9 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING
 
-from pyavd._utils import get, get_item
+from pyavd._utils import get
 from pyavd.j2filters import natural_sort, range_expand
+from pyavd.j2filters.range_expand import range_expand_to_int_set
 
 from .utils import UtilsMixin
 
@@ -33,27 +34,20 @@ class VlansMixin(UtilsMixin):
 
         The function also creates uplink_native_vlan for this switch or downstream switches.
         """
-        vlans = []
-        # TODO: - can probably do this with sets but need list in the end so not sure it is worth it
+        # Keyed by vlan id to avoid scanning the list for every vlan. Insertion order is kept for the returned list.
+        vlans_by_id: dict[int, dict] = {}
         for vlan_trunk_group in self._underlay_vlan_trunk_groups:
             for vlan in range_expand(vlan_trunk_group["vlan_list"]):
-                if (found_vlan := get_item(vlans, "id", int(vlan))) is None:
-                    new_vlan = {
-                        "id": int(vlan),
-                        "trunk_groups": [],
-                    }
-                    new_vlan["trunk_groups"].extend(vlan_trunk_group["trunk_groups"])
-                    vlans.append(new_vlan)
-                else:
-                    found_vlan["trunk_groups"].extend(vlan_trunk_group["trunk_groups"])
+                vlans_by_id.setdefault(int(vlan), {"id": int(vlan), "trunk_groups": []})["trunk_groups"].extend(vlan_trunk_group["trunk_groups"])
 
+        vlans = list(vlans_by_id.values())
         for vlan in vlans:
             vlan["trunk_groups"] = natural_sort(set(vlan["trunk_groups"]))
 
         # Add configuration for uplink or peer's uplink_native_vlan if it is not defined as part of network services
-        switch_vlans = range_expand(get(self._hostvars, "switch.vlans"))
+        switch_vlans = range_expand_to_int_set(get(self._hostvars, "switch.vlans"))
         uplink_native_vlans = natural_sort(
-            {link["native_vlan"] for link in self._underlay_links if "native_vlan" in link and str(link["native_vlan"]) not in switch_vlans},
+            {link["native_vlan"] for link in self._underlay_links if "native_vlan" in link and int(link["native_vlan"]) not in switch_vlans},
         )
         vlans.extend(
             {
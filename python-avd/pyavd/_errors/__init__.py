@@ -8,6 +8,14 @@ class AristaAvdError(Exception):
         self.message = message
         super().__init__(self.message)
 
+    def __reduce__(self) -> tuple:
+        """
+        Support pickling of errors, so they can be returned from worker processes.
+
+        The default pickling calls `__init__` with `self.args`, which does not match the arguments of most subclasses.
+        """
+        return (_restore_error, (self.__class__, self.args, self.__dict__))
+
     def _json_path_to_string(self, json_path: list[str | int]) -> str:
         path = ""
         for index, elem in enumerate(json_path):
@@ -96,3 +104,11 @@ class AristaAvdDuplicateDataError(AristaAvdError):
             f"Found duplicate objects with conflicting data while generating configuration for {context}. {context_item_a} conflicts with {context_item_b}."
         )
         super().__init__(self.message)
+
+
+def _restore_error(cls: type[AristaAvdError], args: tuple, state: dict) -> AristaAvdError:
+    """Restore a pickled error without calling `__init__`."""
+    error = cls.__new__(cls)
+    error.args = args
+    error.__dict__.update(state)
+    return error
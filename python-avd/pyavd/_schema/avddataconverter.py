@@ -29,177 +29,235 @@ if TYPE_CHECKING:
 
 
 class AvdDataConverter:
-    """AvdDataConverter is used to convert AVD Data Types based on schema options."""
+    """
+    AvdDataConverter is used to convert AVD Data Types based on schema options.
+
+    The schema is compiled into a tree of ConverterNode objects held by the instance.
+    Child nodes are compiled when they are first used, so only the parts of the schema covering actual data are compiled.
+    """
 
     def __init__(self, schema: dict) -> None:
         self.schema = schema
-
-        # We run through all the regular keys first, to ensure that all data has been converted
-        # in case some of it is referenced in "dynamic_keys" below
-        self.converters = {
-            "items": self.convert_items,
-            "keys": self.convert_keys,
-            "dynamic_keys": self.convert_dynamic_keys,
-            "deprecation": self.deprecation,
-        }
+        self._node = ConverterNode(schema)
 
     def convert_data(self, data: Any, schema: dict | None = None, path: list[str | int] | None = None, parent_dict: dict | None = None) -> Generator:
         """
         Perform in-place conversion of data according to the provided schema.
 
-        Main entry function which is recursively called from the child functions performing the actual conversion of keys/items.
+        Main entry function running the compiled ConverterNode for the schema.
         """
-        if schema is None:
-            schema = self.schema
+        node = self._node if schema is None or schema is self.schema else ConverterNode(schema)
         if path is None:
             path = []
 
-        for key, converter in self.converters.items():
-            if key not in schema:
-                # Ignore keys not in schema
-                continue
+        yield from node.convert_data(data, path, parent_dict)
 
-            # Converters will do inplace update of data. Any returns will be yielded conversion messages.
-            yield from converter(schema[key], data, schema, path, parent_dict)
 
-    def convert_keys(self, keys: dict, data: dict, _schema: dict, path: list[str | int], _parent_dict: dict | None) -> Generator:
-        """This function performs conversion on each key with the relevant subschema."""
-        if not isinstance(data, dict):
-            return
+class ConverterNode:
+    """
+    Compiled converter for one level of the schema.
 
-        for key, childschema in keys.items():
-            if key not in data:
-                # Skip key since there is nothing to convert if the key is not set in data
-                continue
+    Holds the conversion options for the schema and the child nodes, which are compiled on first use.
+    """
+
+    __slots__ = (
+        "_child_nodes",
+        "_dynamic_key_nodes",
+        "_items_node",
+        "convert_to_lower_case",
+        "convert_types",
+        "deprecation",
+        "key_positions",
+        "schema",
+        "type",
+    )
 
-            # Perform type conversion of the data for the child key if required based on "convert_types"
-            if "convert_types" in childschema:
-                self.convert_types(childschema["convert_types"], data, key, childschema, [*path, key])
+    def __init__(self, schema: dict) -> None:
+        self.schema = schema
+        self.type: str | None = schema.get("type")
+        self.convert_types: list[str] | None = schema.get("convert_types")
+        self.convert_to_lower_case: bool = bool(schema.get("convert_to_lower_case"))
+        self.deprecation: dict | None = schema.get("deprecation")
+        self.key_positions = {key: position for position, key in enumerate(schema.get("keys", {}))}
 
-            # Convert to lower case if set in schema and value is a string
-            if childschema.get("convert_to_lower_case") and isinstance(data[key], str):
-                data[key] = data[key].lower()
+        self._child_nodes: dict[str, ConverterNode] = {}
+        self._dynamic_key_nodes: dict[str, ConverterNode] = {}
+        self._items_node: ConverterNode | None = None
 
-            yield from self.convert_data(data[key], childschema, [*path, key], data)
+    def convert_data(self, data: Any, path: list[str | int], parent_dict: dict | None) -> Generator:
+        """
+        Perform in-place conversion of data.
 
-    def convert_dynamic_keys(self, dynamic_keys: dict, data: dict, schema: dict, path: list[str | int], parent_dict: dict | None) -> Generator:
+        We run through all the regular keys first, to ensure that all data has been converted
+        in case some of it is referenced in "dynamic_keys" below.
+        """
+        if "items" in self.schema:
+            yield from self.convert_items(data, path, parent_dict)
+        if self.key_positions:
+            yield from self.convert_keys(data, path)
+        if "dynamic_keys" in self.schema:
+            yield from self.convert_dynamic_keys(data, path)
+        if self.deprecation is not None:
+            yield from deprecation_warning(self.deprecation, path, parent_dict)
+
+    def child_node(self, key: str) -> ConverterNode:
+        if (node := self._child_nodes.get(key)) is None:
+            node = self._child_nodes[key] = ConverterNode(self.schema["keys"][key])
+        return node
+
+    def dynamic_key_node(self, dynamic_key: str) -> ConverterNode:
+        if (node := self._dynamic_key_nodes.get(dynamic_key)) is None:
+            node = self._dynamic_key_nodes[dynamic_key] = ConverterNode(self.schema["dynamic_keys"][dynamic_key])
+        return node
+
+    def convert_keys(self, data: dict, path: list[str | int]) -> Generator:
+        """
+        This function performs conversion on each key with the relevant child node.
+
+        Only keys set in data are visited, in the same order as the keys of the schema.
+        """
+        if not isinstance(data, dict):
+            return
+
+        key_positions = self.key_positions
+        for key in sorted((key for key in data if key in key_positions), key=key_positions.__getitem__):
+            yield from self.convert_key(self.child_node(key), data, key, path)
+
+    def convert_dynamic_keys(self, data: dict, path: list[str | int]) -> Generator:
         """
         This function resolves "dynamic_keys" by looking in the actual data.
 
-        Then calls convert_keys to performs conversion on each resolved key with the relevant subschema.
+        Then performs conversion on each resolved key with the relevant child node.
         """
         if not isinstance(data, dict):
             return
 
         # Resolve "keys" from schema "dynamic_keys" by looking for the dynamic key in data.
         keys = {}
-        for dynamic_key, childschema in dynamic_keys.items():
-            data_with_defaults = get_instance_with_defaults(data, dynamic_key, schema)
+        for dynamic_key in self.schema["dynamic_keys"]:
+            data_with_defaults = get_instance_with_defaults(data, dynamic_key, self.schema)
             resolved_keys = get_all(data_with_defaults, dynamic_key)
             for resolved_key in resolved_keys:
-                keys.setdefault(resolved_key, childschema)
+                keys.setdefault(resolved_key, dynamic_key)
 
-        # Reuse convert_keys to perform the actual conversion on the resolved dynamic keys
-        yield from self.convert_keys(keys, data, schema, path, parent_dict)
+        for key, dynamic_key in keys.items():
+            if key not in data:
+                # Skip key since there is nothing to convert if the key is not set in data
+                continue
 
-    def convert_items(self, items: dict, data: list, _schema: dict, path: list[str | int], parent_dict: dict | None) -> Generator:
-        """This function performs conversion on each item with the items subschema."""
+            yield from self.convert_key(self.dynamic_key_node(dynamic_key), data, key, path)
+
+    def convert_key(self, node: ConverterNode, data: dict, key: str, path: list[str | int]) -> Generator:
+        """This function performs conversion of one key with the given child node."""
+        # Perform type conversion of the data for the child key if required based on "convert_types"
+        if node.convert_types is not None:
+            convert_types(node.convert_types, data, key, node.type)
+
+        # Convert to lower case if set in schema and value is a string
+        if node.convert_to_lower_case and isinstance(data[key], str):
+            data[key] = data[key].lower()
+
+        yield from node.convert_data(data[key], [*path, key], data)
+
+    def convert_items(self, data: list, path: list[str | int], parent_dict: dict | None) -> Generator:
+        """This function performs conversion on each item with the items node."""
         if not isinstance(data, list):
             return
 
+        if (node := self._items_node) is None:
+            node = self._items_node = ConverterNode(self.schema["items"])
+
         for index, item in enumerate(data):
             # Perform type conversion of the items data if required based on "convert_types"
-            if "convert_types" in items:
-                self.convert_types(items["convert_types"], data, index, items, [*path, index])
+            if node.convert_types is not None:
+                convert_types(node.convert_types, data, index, node.type)
 
             # Convert to lower case if set in schema and item is a string
-            if items.get("convert_to_lower_case") and isinstance(item, str):
+            if node.convert_to_lower_case and isinstance(item, str):
                 data[index] = item.lower()
 
             # Dive in to child items/schema
-            yield from self.convert_data(item, items, [*path, index], parent_dict)
-
-    def convert_types(self, convert_types: list, data: dict | list, index: str | int, schema: dict, _path: list[str | int]) -> None:
-        """
-        This function performs type conversion if necessary on a single data instance.
-
-        It is invoked for child keys during "keys" conversion and for child items during
-        "items" conversion.
-
-        "data" is either the parent dict or the parent list.
-        "index" is either the key of the parent dict or the index of the parent list.
-
-        Conversion is performed in-place using the provided "data" and "index"
-
-        Any conversion errors are ignored and the original value is returned
-        """
-        schema_type = schema.get("type")
-
-        # Get value from input data
-        value = data[index]
-
-        # For simple conversions, skip conversion if the value is of the correct type
-        # Avoid corner case where we want to convert bool to int. Bool is a subclass of Int so it passes the check above.
-        if (
-            schema_type in SIMPLE_CONVERTERS
-            and isinstance(value, SCHEMA_TO_PY_TYPE_MAP.get(schema_type))
-            and not (schema_type == "int" and isinstance(value, bool))
-        ):
-            return
-
-        for convert_type in convert_types:
-            if isinstance(value, SCHEMA_TO_PY_TYPE_MAP.get(convert_type)) and schema_type in SIMPLE_CONVERTERS:
-                try:
-                    data[index] = SIMPLE_CONVERTERS[schema_type](value)
-                except Exception:  # pylint: disable=broad-exception-caught
-                    # Ignore errors
-                    # TODO: Log message
-                    return
-
-    def deprecation(
-        self, deprecation: dict, _data: Any, _schema: dict, path: list[str | int], parent_dict: dict | None
-    ) -> Generator[AvdDeprecationWarning, None, None]:
-        """
-        deprecation.
-
-          warning: bool, default = True
-          new_key: str
-          removed: bool
-          remove_in_version: str
-          remove_after_date: str
-          url: str
-
-            Yields AvdDeprecationWarning
-
-        """
-        if not deprecation.get("warning", True):
-            return
-
-        new_key = deprecation.get("new_key")
-        removed = deprecation.get("removed", False)
-
-        # If new_key set, we can check for collision where both new and old key are set.
-        # If we have a space in the new_key, we will skip the check and just produce the deprecation warning with new_key.
-        # New key is assumed to be relative to the parent dict.
-        conflict = False
-        if not removed and new_key and parent_dict is not None:
-            for one_new_key in new_key.split(" or "):
-                if " " in one_new_key:
-                    continue
-                if get(parent_dict, one_new_key) is not None:
-                    conflict = True
-                    # Overriding new_key to direct the error message to the relevant key in case the original new_key contained multiple keys.
-                    new_key = one_new_key
-                    break
-
-        deprecation_warning = AvdDeprecationWarning(
-            key=path,
-            new_key=new_key,
-            remove_in_version=deprecation.get("remove_in_version"),
-            remove_after_date=deprecation.get("remove_after_date"),
-            url=deprecation.get("url"),
-            removed=removed,
-            conflict=conflict,
-        )
-
-        yield deprecation_warning
+            yield from node.convert_data(item, [*path, index], parent_dict)
+
+
+def convert_types(convert_types: list, data: dict | list, index: str | int, schema_type: str | None) -> None:
+    """
+    This function performs type conversion if necessary on a single data instance.
+
+    It is invoked for child keys during "keys" conversion and for child items during
+    "items" conversion.
+
+    "data" is either the parent dict or the parent list.
+    "index" is either the key of the parent dict or the index of the parent list.
+
+    Conversion is performed in-place using the provided "data" and "index"
+
+    Any conversion errors are ignored and the original value is returned
+    """
+    # Get value from input data
+    value = data[index]
+
+    # For simple conversions, skip conversion if the value is of the correct type
+    # Avoid corner case where we want to convert bool to int. Bool is a subclass of Int so it passes the check above.
+    if (
+        schema_type in SIMPLE_CONVERTERS
+        and isinstance(value, SCHEMA_TO_PY_TYPE_MAP.get(schema_type))
+        and not (schema_type == "int" and isinstance(value, bool))
+    ):
+        return
+
+    for convert_type in convert_types:
+        if isinstance(value, SCHEMA_TO_PY_TYPE_MAP.get(convert_type)) and schema_type in SIMPLE_CONVERTERS:
+            try:
+                data[index] = SIMPLE_CONVERTERS[schema_type](value)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Ignore errors
+                # TODO: Log message
+                return
+
+
+def deprecation_warning(deprecation: dict, path: list[str | int], parent_dict: dict | None) -> Generator[AvdDeprecationWarning, None, None]:
+    """
+    Yield deprecation warning for the data at the given path, based on the "deprecation" options of the schema.
+
+      warning: bool, default = True
+      new_key: str
+      removed: bool
+      remove_in_version: str
+      remove_after_date: str
+      url: str
+
+        Yields AvdDeprecationWarning
+
+    """
+    if not deprecation.get("warning", True):
+        return
+
+    new_key = deprecation.get("new_key")
+    removed = deprecation.get("removed", False)
+
+    # If new_key set, we can check for collision where both new and old key are set.
+    # If we have a space in the new_key, we will skip the check and just produce the deprecation warning with new_key.
+    # New key is assumed to be relative to the parent dict.
+    conflict = False
+    if not removed and new_key and parent_dict is not None:
+        for one_new_key in new_key.split(" or "):
+            if " " in one_new_key:
+                continue
+            if get(parent_dict, one_new_key) is not None:
+                conflict = True
+                # Overriding new_key to direct the error message to the relevant key in case the original new_key contained multiple keys.
+                new_key = one_new_key
+                break
+
+    deprecation_warning = AvdDeprecationWarning(
+        key=path,
+        new_key=new_key,
+        remove_in_version=deprecation.get("remove_in_version"),
+        remove_after_date=deprecation.get("remove_after_date"),
+        url=deprecation.get("url"),
+        removed=removed,
+        conflict=conflict,
+    )
+
+    yield deprecation_warning
@@ -55,19 +55,26 @@ class AvdSchema:
         schema_id : str, optional
             ID of AVD Schema. Either 'eos_cli_config_gen' or 'eos_designs'
         """
+        store_schema_id = None
         if not schema and schema_id:
             if schema_id not in self.store:
                 msg = f"Schema id {schema_id} not found in store. Must be one of {self.store.keys()}"
                 raise AristaAvdError(msg)
 
             schema = self.store[schema_id]
+            store_schema_id = schema_id
         elif not schema:
             schema = DEFAULT_SCHEMA
 
         self._schema = schema
         try:
-            self._validator = AvdValidator(schema)
-            self._dataconverter = AvdDataConverter(schema)
+            if store_schema_id is not None:
+                # Reuse the schemas compiled once per store, which is kept for the lifetime of the process.
+                self._validator = self.store.get_compiled(store_schema_id, AvdValidator)
+                self._dataconverter = self.store.get_compiled(store_schema_id, AvdDataConverter)
+            else:
+                self._validator = AvdValidator(schema)
+                self._dataconverter = AvdDataConverter(schema)
         except Exception as e:
             msg = "An error occurred during creation of the validator"
             raise AristaAvdError(msg) from e
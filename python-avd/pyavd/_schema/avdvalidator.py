@@ -1,66 +1,184 @@
 # Copyright (c) 2023-2024 Arista Networks, Inc.
 # Use of this source code is governed by the Apache License 2.0
 # that can be found in the LICENSE file.
+from __future__ import annotations
+
 from collections import ChainMap
-from collections.abc import Generator
-from re import fullmatch, match
-from typing import Any, Literal, NoReturn
+from functools import lru_cache
+from ipaddress import IPv6Address
+from re import compile as re_compile
+from typing import TYPE_CHECKING, Any, NoReturn
 
 from pyavd._errors import AvdValidationError
 from pyavd._utils import get_all, get_all_with_path, get_indices_of_duplicate_items
 
+from .store import LazySchemaKeys
 from .utils import get_instance_with_defaults
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+SCHEMA_TYPE_TO_PY_TYPES = {
+    "int": int,
+    "str": str,
+    "bool": bool,
+    "dict": (dict, ChainMap),
+    "list": list,
+}
+
+# Matching for format 01:23:45:67:89:AB
+MAC_ADDRESS_PATTERN = re_compile(r"([0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}|([0-9a-fA-F]{4}.){2}[0-9a-fA-F]{4}")
+
+# Matching for format 10.0.0.1. Octets must be 0-255 without leading zeros.
+_IPV4_OCTET = r"(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+IPV4_ADDRESS_PATTERN = re_compile(rf"{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}")
+
+# Prefix lengths must be without leading zeros.
+IPV4_PREFIX_LENGTH_PATTERN = re_compile(r"3[0-2]|[12]?[0-9]")
+IPV6_PREFIX_LENGTH_PATTERN = re_compile(r"12[0-8]|(?:1[01]|[1-9])?[0-9]")
+
 
 class AvdValidator:
+    """
+    AvdValidator is used to validate data according to an AVD schema.
+
+    The schema is compiled into a tree of ValidatorNode objects held by the instance.
+    Child nodes are compiled when they are first used, so only the parts of the schema covering actual data are compiled.
+    """
+
     def __init__(self, schema: dict) -> None:
         self.schema = schema
-        self.validators = {
-            # Note type_validator is not included here since we first check that before spending energy on the rest
-            "max": self.max_validator,
-            "min": self.min_validator,
-            "max_length": self.max_length_validator,
-            "min_length": self.min_length_validator,
-            "format": self.format_validator,
-            "pattern": self.pattern_validator,
-            "valid_values": self.valid_values_validator,
-            "keys": self.keys_validator,
-            "dynamic_keys": self.dynamic_keys_validator,
-            "items": self.items_validator,
-            "primary_key": self.primary_key_validator,
-            "unique_keys": self.unique_keys_validator,
-            "$ref": self.ref_validator,
-        }
+        self._node = ValidatorNode(schema)
 
     def validate(self, instance: Any, schema: dict | None = None, path: list[str | int] | None = None) -> Generator:
-        if schema is None:
-            schema = self.schema
+        node = self._node if schema is None or schema is self.schema else ValidatorNode(schema)
         if path is None:
             path = []
 
-        type_errors = list(self.type_validator(schema["type"], instance, schema, path))
-        if type_errors:
-            yield from (type_error for type_error in type_errors)
-            # Skip further validation since the type is wrong.
-            return
+        yield from node.validate(instance, path)
+
+
+class ValidatorNode:
+    """
+    Compiled validator for one level of the schema.
 
+    The validators relevant for the schema are resolved once, with precompiled patterns and precomputed key information.
+    Validators are run in the same order as the keys in the schema.
+    """
+
+    __slots__ = (
+        "_child_nodes",
+        "_dynamic_key_nodes",
+        "_items_node",
+        "dynamic_valid_values",
+        "key_positions",
+        "py_types",
+        "required",
+        "required_keys",
+        "schema",
+        "type",
+        "valid_values_index",
+        "validators",
+    )
+
+    def __init__(self, schema: dict) -> None:
+        self.schema = schema
+        self.type: str = schema["type"]
+        self.py_types = SCHEMA_TYPE_TO_PY_TYPES.get(self.type)
+        self.required: bool = bool(schema.get("required"))
+        self.dynamic_valid_values: list[str] | None = schema.get("dynamic_valid_values")
+
+        keys: dict = schema.get("keys") or {}
+        self.key_positions = {key: position for position, key in enumerate(keys)}
+        if isinstance(keys, LazySchemaKeys):
+            # Avoid loading all the key schemas of a lazily loaded schema.
+            self.required_keys = keys.required_keys
+        else:
+            self.required_keys = frozenset(key for key, childschema in keys.items() if childschema.get("required"))
+
+        self._child_nodes: dict[str, ValidatorNode] = {}
+        self._dynamic_key_nodes: dict[str, ValidatorNode] = {}
+        self._items_node: ValidatorNode | None = None
+
+        self.validators: list[tuple[Callable[..., Generator], Any]] = []
         for schema_key, schema_value in schema.items():
-            if (validator := self.validators.get(schema_key)) is None or schema_value is None:
+            if schema_value is None:
                 continue
-            yield from validator(schema_value, instance, schema, path)
 
-    def type_validator(self, schema_type: str, instance: Any, _schema: dict, path: list[str | int]) -> Generator:
-        if not self.is_type(instance, schema_type):
+            match schema_key:
+                case "max":
+                    self.validators.append((self.max_validator, schema_value))
+                case "min":
+                    self.validators.append((self.min_validator, schema_value))
+                case "max_length":
+                    self.validators.append((self.max_length_validator, schema_value))
+                case "min_length":
+                    self.validators.append((self.min_length_validator, schema_value))
+                case "format":
+                    self.validators.append((self.format_validator, schema_value))
+                case "pattern":
+                    self.validators.append((self.pattern_validator, (schema_value, re_compile(schema_value).match)))
+                case "valid_values":
+                    self.validators.append((self.valid_values_validator, schema_value))
+                case "keys":
+                    self.validators.append((self.keys_validator, keys))
+                case "dynamic_keys" if "keys" not in schema:
+                    # Trigger the regular "keys" validator in case only dynamic_keys is set.
+                    self.validators.append((self.keys_validator, keys))
+                case "items":
+                    self.validators.append((self.items_validator, schema_value))
+                case "primary_key":
+                    self.validators.append((self.primary_key_validator, schema_value))
+                case "unique_keys":
+                    self.validators.append((self.unique_keys_validator, schema_value))
+                case "$ref":
+                    self.validators.append((self.ref_validator, schema_value))
+
+        if self.dynamic_valid_values is not None and "valid_values" not in schema:
+            # The resolved dynamic valid values are validated after all other validators.
+            self.validators.append((self.valid_values_validator, []))
+
+        self.valid_values_index = next((index for index, (validator, _) in enumerate(self.validators) if validator == self.valid_values_validator), None)
+
+    def validate(self, instance: Any, path: list[str | int], dynamic_valid_values: list | None = None) -> Generator:
+        """
+        Validate the instance.
+
+        "dynamic_valid_values" are the valid values resolved by the parent "keys" validator and are added to "valid_values".
+        """
+        if self.py_types is None:
+            msg = f"Unable to check type '{self.type}'"
+            raise NotImplementedError(msg)
+
+        if not isinstance(instance, self.py_types):
             yield AvdValidationError(
-                f"Invalid type '{type(instance).__name__}'. Expected a '{schema_type}'.",
+                f"Invalid type '{type(instance).__name__}'. Expected a '{self.type}'.",
                 path=path,
             )
+            # Skip further validation since the type is wrong.
+            return
+
+        for index, (validator, schema_value) in enumerate(self.validators):
+            if index == self.valid_values_index and dynamic_valid_values is not None:
+                yield from validator([*schema_value, *dynamic_valid_values], instance, path)
+                continue
+            yield from validator(schema_value, instance, path)
+
+    def child_node(self, key: str) -> ValidatorNode:
+        if (node := self._child_nodes.get(key)) is None:
+            node = self._child_nodes[key] = ValidatorNode(self.schema["keys"][key])
+        return node
+
+    def dynamic_key_node(self, dynamic_key: str) -> ValidatorNode:
+        if (node := self._dynamic_key_nodes.get(dynamic_key)) is None:
+            node = self._dynamic_key_nodes[dynamic_key] = ValidatorNode(self.schema["dynamic_keys"][dynamic_key])
+        return node
 
-    def unique_keys_validator(self, unique_keys: list[str], instance: list, _schema: dict, path: list[str | int]) -> Generator:
+    def unique_keys_validator(self, unique_keys: list[str], instance: list, path: list[str | int]) -> Generator:
         if not instance:
             return
 
-        if not all(self.is_type(element, "dict") for element in instance):
+        if not all(isinstance(element, (dict, ChainMap)) for element in instance):
             return
 
         for unique_key in unique_keys:
@@ -82,23 +200,23 @@ class AvdValidator:
                         path=[*path, *paths[duplicate_index], key],
                     )
 
-    def primary_key_validator(self, primary_key: str, instance: list, schema: dict, path: list[str | int]) -> Generator:
+    def primary_key_validator(self, primary_key: str, instance: list, path: list[str | int]) -> Generator:
         if not instance:
             return
 
-        if not all(self.is_type(element, "dict") for element in instance):
+        if not all(isinstance(element, (dict, ChainMap)) for element in instance):
             return
 
         if not all(element.get(primary_key) is not None for element in instance):
             yield AvdValidationError(f"Primary key '{primary_key}' is not set on all items as required.", path=path)
 
-        if not schema.get("allow_duplicate_primary_key"):
+        if not self.schema.get("allow_duplicate_primary_key"):
             # Reusing the unique keys validator
-            yield from self.unique_keys_validator([primary_key], instance, schema, path)
+            yield from self.unique_keys_validator([primary_key], instance, path)
 
-    def keys_validator(self, keys: dict, instance: dict, schema: dict, path: list[str | int]) -> Generator:
+    def keys_validator(self, keys: dict, instance: dict, path: list[str | int]) -> Generator:
         """
-        This function validates each key with the relevant subschema.
+        This function validates each key with the relevant child node.
 
         It also includes various child key validations,
         which can only be implemented with access to the parent "keys" instance.
@@ -106,127 +224,153 @@ class AvdValidator:
         - Validate "allow_other_keys" (default is false)
         - Validate "required" under child keys
         - Expand "dynamic_valid_values" under child keys (don't perform validation).
+
+        Only keys set in the instance and required keys are visited, in the same order as the keys of the schema.
+        Resolved dynamic keys are visited first.
         """
-        # Compile schema_dynamic_keys and add to "dynamic_keys"
-        schema_dynamic_keys = schema.get("dynamic_keys", {})
+        # Resolve dynamic keys. Keeping the first dynamic key resolving to a given key.
         dynamic_keys = {}
-        for dynamic_key, childschema in schema_dynamic_keys.items():
-            instance_with_defaults = get_instance_with_defaults(instance, dynamic_key, schema)
+        for dynamic_key in self.schema.get("dynamic_keys", {}):
+            instance_with_defaults = get_instance_with_defaults(instance, dynamic_key, self.schema)
             resolved_keys = get_all(instance_with_defaults, dynamic_key)
             for resolved_key in resolved_keys:
-                dynamic_keys.setdefault(resolved_key, childschema)
-
-        all_keys = ChainMap(keys, dynamic_keys)
+                dynamic_keys.setdefault(resolved_key, dynamic_key)
 
         # Validation of "allow_other_keys"
-        if not schema.get("allow_other_keys", False):
+        if not self.schema.get("allow_other_keys", False):
             # Check that instance only contains the schema keys
-            invalid_keys = ", ".join([key for key in instance if key not in all_keys and key[0] != "_"])
+            invalid_keys = ", ".join([key for key in instance if key not in keys and key not in dynamic_keys and key[0] != "_"])
             if invalid_keys:
                 yield AvdValidationError(f"Unexpected key(s) '{invalid_keys}' found in dict.", path=path)
 
-        # Run over child keys and check for required and update child schema with dynamic valid values before
-        # descending into validation of child schema.
-        for key in all_keys:
-            childschema = all_keys[key].copy()
-            if instance.get(key) is None:
+        key_positions = self.key_positions
+        static_keys = sorted(
+            {key for key in instance if key in key_positions and key not in dynamic_keys}.union(self.required_keys.difference(dynamic_keys)),
+            key=key_positions.__getitem__,
+        )
+
+        # Run over child keys and check for required and resolve dynamic valid values before
+        # descending into validation of child node.
+        for key in [*dynamic_keys, *static_keys]:
+            node = self.child_node(key) if key in keys else self.dynamic_key_node(dynamic_keys[key])
+            if (value := instance.get(key)) is None:
                 # Validation of "required" on child keys
-                if childschema.get("required"):
+                if node.required:
                     yield AvdValidationError(f"Required key '{key}' is not set in dict.", path=path)
 
                 # Skip further validation since there is nothing to validate.
                 continue
 
-            # Expand "dynamic_valid_values" in child schema and add to "valid_values"
-            if "dynamic_valid_values" in childschema:
-                for dynamic_valid_value in childschema["dynamic_valid_values"]:
-                    instance_with_defaults = get_instance_with_defaults(instance, dynamic_valid_value, schema)
-                    childschema.setdefault("valid_values", []).extend(get_all(instance_with_defaults, dynamic_valid_value))
-
-            # Perform regular validation of the child schema.
-            yield from self.validate(
-                instance[key],
-                childschema,
-                path=[*path, key],
-            )
+            # Resolve "dynamic_valid_values" for the child node
+            dynamic_valid_values = None
+            if node.dynamic_valid_values is not None:
+                dynamic_valid_values = []
+                for dynamic_valid_value in node.dynamic_valid_values:
+                    instance_with_defaults = get_instance_with_defaults(instance, dynamic_valid_value, self.schema)
+                    dynamic_valid_values.extend(get_all(instance_with_defaults, dynamic_valid_value))
 
-    def dynamic_keys_validator(self, _dynamic_keys: dict, instance: dict, schema: dict, path: list[str | int]) -> Generator:
-        """This function triggers the regular "keys" validator in case only dynamic_keys is set."""
-        if "keys" not in schema:
-            yield from self.keys_validator({}, instance, schema, path=path)
+            # Perform regular validation of the child node.
+            yield from node.validate(value, [*path, key], dynamic_valid_values)
+
+    def items_validator(self, items: dict, instance: list, path: list[str | int]) -> Generator:
+        if (node := self._items_node) is None:
+            node = self._items_node = ValidatorNode(items)
 
-    def items_validator(self, items: dict, instance: list, _schema: dict, path: list[str | int]) -> Generator:
         for index, item in enumerate(instance):
-            yield from self.validate(item, items, path=[*path, index])
+            yield from node.validate(item, [*path, index])
 
-    def ref_validator(self, _ref: str, _instance: dict, _schema: dict, _path: list[str | int]) -> NoReturn:
+    def ref_validator(self, _ref: str, _instance: dict, _path: list[str | int]) -> NoReturn:
         msg = "$ref must be resolved before using AvdValidator"
         raise NotImplementedError(msg)
 
-    def max_validator(self, schema_max: int, instance: int, _schema: dict, path: list[str | int]) -> Generator:
+    def max_validator(self, schema_max: int, instance: int, path: list[str | int]) -> Generator:
         if instance > schema_max:
             yield AvdValidationError(f"'{instance}' is higher than the allowed maximum of {schema_max}.", path=path)
 
-    def min_validator(self, schema_min: int, instance: int, _schema: dict, path: list[str | int]) -> Generator:
+    def min_validator(self, schema_min: int, instance: int, path: list[str | int]) -> Generator:
         if instance < schema_min:
             yield AvdValidationError(f"'{instance}' is lower than the allowed minimum of {schema_min}.", path=path)
 
-    def max_length_validator(self, schema_max_length: int, instance: str | list, _schema: dict, path: list[str | int]) -> Generator:
+    def max_length_validator(self, schema_max_length: int, instance: str | list, path: list[str | int]) -> Generator:
         if len(instance) > schema_max_length:
             yield AvdValidationError(f"The value is longer ({len(instance)}) than the allowed maximum of {schema_max_length}.", path=path)
 
-    def min_length_validator(self, schema_min_length: int, instance: str | list, _schema: dict, path: list[str | int]) -> Generator:
+    def min_length_validator(self, schema_min_length: int, instance: str | list, path: list[str | int]) -> Generator:
         if len(instance) < schema_min_length:
             yield AvdValidationError(f"The value is shorter ({len(instance)}) than the allowed minimum of {schema_min_length}.", path=path)
 
-    def valid_values_validator(self, valid_values: list, instance: Any, _schema: dict, path: list[str | int]) -> Generator:
+    def valid_values_validator(self, valid_values: list, instance: Any, path: list[str | int]) -> Generator:
         """This function validates if the instance conforms to the "valid_values"."""
         if instance not in valid_values:
             yield AvdValidationError(f"'{instance}' is not one of {valid_values}", path=path)
 
-    def format_validator(self, schema_format: str, instance: str, _schema: dict, path: list[str | int]) -> Generator:
+    def format_validator(self, schema_format: str, instance: str, path: list[str | int]) -> Generator:
         match schema_format:
             case "ipv4":
-                # TODO: Figure out how to do this efficiently since ipaddress is slow
-                return
+                if not is_ipv4_address(instance):
+                    yield AvdValidationError(f"The value '{instance}' is not a valid IPv4 address.", path=path)
             case "ipv4_cidr":
-                # TODO: Figure out how to do this efficiently since ipaddress is slow
-                return
+                if not is_ipv4_cidr(instance):
+                    yield AvdValidationError(
+                        f"The value '{instance}' is not a valid IPv4 CIDR (Expecting an address and prefix length like 10.0.0.1/24).", path=path
+                    )
             case "ipv6":
-                # TODO: Figure out how to do this efficiently since ipaddress is slow
-                return
+                if not is_ipv6_address(instance):
+                    yield AvdValidationError(f"The value '{instance}' is not a valid IPv6 address.", path=path)
             case "ipv6_cidr":
-                # TODO: Figure out how to do this efficiently since ipaddress is slow
-                return
+                if not is_ipv6_cidr(instance):
+                    yield AvdValidationError(
+                        f"The value '{instance}' is not a valid IPv6 CIDR (Expecting an address and prefix length like 2001:db8::1/64).", path=path
+                    )
             case "ip":
-                # TODO: Figure out how to do this efficiently since ipaddress is slow
-                return
+                if not (is_ipv4_address(instance) or is_ipv6_address(instance)):
+                    yield AvdValidationError(f"The value '{instance}' is not a valid IPv4 or IPv6 address.", path=path)
             case "cidr":
-                # TODO: Figure out how to do this efficiently since ipaddress is slow
-                return
+                if not (is_ipv4_cidr(instance) or is_ipv6_cidr(instance)):
+                    yield AvdValidationError(
+                        f"The value '{instance}' is not a valid IPv4 or IPv6 CIDR (Expecting an address and prefix length like 10.0.0.1/24).", path=path
+                    )
             case "mac":
-                # Matching for format 01:23:45:67:89:AB
-                if fullmatch(r"([0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}|([0-9a-fA-F]{4}.){2}[0-9a-fA-F]{4}", instance) is None:
+                if MAC_ADDRESS_PATTERN.fullmatch(instance) is None:
                     yield AvdValidationError(
                         f"The value '{instance}' is not a valid MAC address (Expecting bytes separated by colons like 01:23:45:67:89:AB).", path=path
                     )
 
-    def pattern_validator(self, pattern: str, instance: str, _schema: dict, path: list[str | int]) -> Generator:
-        if match(pattern, instance) is None:
-            yield AvdValidationError(f"The value '{instance}' is not matching the pattern '{pattern}'.", path=path)
-
-    def is_type(self, instance: Any, type_str: Literal["dict", "int", "str", "bool"]) -> bool:
-        match type_str:
-            case "int":
-                return isinstance(instance, int)
-            case "str":
-                return isinstance(instance, str)
-            case "bool":
-                return isinstance(instance, bool)
-            case "dict":
-                return isinstance(instance, (dict, ChainMap))
-            case "list":
-                return isinstance(instance, list)
-
-        msg = f"Unable to check type '{type_str}'"
-        raise NotImplementedError(msg)
+    def pattern_validator(self, pattern: tuple[str, Callable], instance: str, path: list[str | int]) -> Generator:
+        pattern_str, pattern_match = pattern
+        if pattern_match(instance) is None:
+            yield AvdValidationError(f"The value '{instance}' is not matching the pattern '{pattern_str}'.", path=path)
+
+
+def is_ipv4_address(value: str) -> bool:
+    """Return True if the value is a valid IPv4 address like 10.0.0.1."""
+    return IPV4_ADDRESS_PATTERN.fullmatch(value) is not None
+
+
+def is_ipv4_cidr(value: str) -> bool:
+    """Return True if the value is a valid IPv4 address and prefix length like 10.0.0.1/24. Host bits are allowed."""
+    address, _, prefix_length = value.partition("/")
+    return IPV4_PREFIX_LENGTH_PATTERN.fullmatch(prefix_length) is not None and IPV4_ADDRESS_PATTERN.fullmatch(address) is not None
+
+
+@lru_cache(maxsize=4096)
+def is_ipv6_address(value: str) -> bool:
+    """
+    Return True if the value is a valid IPv6 address like 2001:db8::1.
+
+    Parsing IPv6 addresses is complex, so we use ipaddress and cache the results, since the same addresses
+    are commonly found many times in the data. Scoped addresses like fe80::1%eth0 are not valid.
+    """
+    if "%" in value:
+        return False
+    try:
+        IPv6Address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def is_ipv6_cidr(value: str) -> bool:
+    """Return True if the value is a valid IPv6 address and prefix length like 2001:db8::1/64. Host bits are allowed."""
+    address, _, prefix_length = value.partition("/")
+    return IPV6_PREFIX_LENGTH_PATTERN.fullmatch(prefix_length) is not None and is_ipv6_address(address)
@@ -1,21 +1,172 @@
 # Copyright (c) 2023-2024 Arista Networks, Inc.
 # Use of this source code is governed by the Apache License 2.0
 # that can be found in the LICENSE file.
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
 from functools import lru_cache
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
-from pickle import load
+from pickle import HIGHEST_PROTOCOL, dumps, load, loads
+from typing import IO, Any, TypeVar
 
 from .constants import PICKLED_SCHEMAS
 
+T = TypeVar("T")
+
+INDEXED_SCHEMA_MAGIC = b"AVDSCHM1"
+"""Marker at the beginning of a pickled schema file written in the indexed format."""
+_HEADER_LENGTH_SIZE = 8
+
 
 @lru_cache
-def create_store(*, load_from_yaml: bool = False) -> dict:
+def create_store(*, load_from_yaml: bool = False) -> SchemaStore:
+    """
+    Create and return a schema store.
+
+    The schemas are not loaded until they are accessed in the store.
+    The pickled schema files written in the indexed format are memory-mapped, and the top-level keys of each schema are
+    unpickled on demand. This way processes only pay for the schemas and top-level keys they actually use, and the
+    pages of the schema files are shared between processes through the OS page cache.
+    """
     if load_from_yaml:
         msg = "'load_from_yaml' not supported for create_store under PyAVD"
         raise NotImplementedError(msg)
-    store = {}
-    for schema_id, schema_file in PICKLED_SCHEMAS.items():
-        with Path(schema_file).open("rb") as file:
-            store[schema_id] = load(file)  # noqa: S301
 
-    return store
+    return SchemaStore(PICKLED_SCHEMAS)
+
+
+class SchemaStore(Mapping):
+    """
+    Read-only mapping of schema IDs to schemas, loading each schema from the given file on first access.
+
+    Parameters
+    ----------
+    schema_files : dict
+        Mapping of schema ID to the path of the pickled schema file.
+    """
+
+    def __init__(self, schema_files: Mapping[str, Path]) -> None:
+        self._schema_files = dict(schema_files)
+        self._schemas: dict[str, dict] = {}
+        self._compiled: dict[tuple[str, Callable], Any] = {}
+
+    def __getitem__(self, schema_id: str) -> dict:
+        if schema_id not in self._schemas:
+            self._schemas[schema_id] = load_schema(self._schema_files[schema_id])
+        return self._schemas[schema_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema_files)
+
+    def get_compiled(self, schema_id: str, compiler: Callable[[dict], T]) -> T:
+        """
+        Return the schema compiled with the given compiler like AvdValidator.
+
+        The result is kept for the lifetime of the store, so the compiled schema is shared by all users of the store.
+        """
+        if (key := (schema_id, compiler)) not in self._compiled:
+            self._compiled[key] = compiler(self[schema_id])
+        return self._compiled[key]
+
+    def __len__(self) -> int:
+        return len(self._schema_files)
+
+
+class LazySchemaKeys(Mapping):
+    """
+    Read-only mapping of the top-level "keys" of a schema, unpickling each key schema from the memory-mapped file on first access.
+
+    Membership tests, iteration and "required_keys" only use the header of the file, so the key schemas are not loaded.
+    Copying or pickling the object produces a regular dict with all the keys loaded.
+
+    Parameters
+    ----------
+    buffer : mmap
+        Memory-mapped schema file.
+    index : dict
+        Mapping of key name to the (start, end) positions of the pickled key schema in the buffer.
+    required_keys : frozenset
+        Names of the keys with "required: true" in their schema.
+    """
+
+    __slots__ = ("_buffer", "_index", "_loaded", "required_keys")
+
+    def __init__(self, buffer: mmap, index: dict[str, tuple[int, int]], required_keys: frozenset[str]) -> None:
+        self._buffer = buffer
+        self._index = index
+        self._loaded: dict[str, dict] = {}
+        self.required_keys = required_keys
+
+    def __getitem__(self, key: str) -> dict:
+        if key not in self._loaded:
+            start, end = self._index[key]
+            self._loaded[key] = loads(self._buffer[start:end])  # noqa: S301
+        return self._loaded[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __reduce__(self) -> tuple:
+        return (dict, (dict(self.items()),))
+
+
+def dump_schema(schema: dict, stream: IO[bytes]) -> None:
+    """
+    Write a resolved schema to the given binary stream in the indexed format read by `load_schema`.
+
+    The file starts with INDEXED_SCHEMA_MAGIC and the length of a pickled header. The header holds the schema with a placeholder
+    for the top-level "keys", the names of the required top-level keys and an index of the positions of each top-level key schema,
+    which are pickled separately after the header.
+    """
+    keys = schema.get("keys") or {}
+    pickled_keys = {key: dumps(key_schema, HIGHEST_PROTOCOL) for key, key_schema in keys.items()}
+
+    # Positions are relative to the end of the header.
+    index = {}
+    position = 0
+    for key, pickled_key in pickled_keys.items():
+        index[key] = (position, position + len(pickled_key))
+        position += len(pickled_key)
+
+    # Keeping the "keys" placeholder in place to retain the order of the schema.
+    header_schema = {key: None if key == "keys" else value for key, value in schema.items()}
+    required_keys = [key for key, key_schema in keys.items() if key_schema.get("required")]
+    header = dumps({"schema": header_schema, "keys": index, "required_keys": required_keys}, HIGHEST_PROTOCOL)
+    stream.write(INDEXED_SCHEMA_MAGIC)
+    stream.write(len(header).to_bytes(_HEADER_LENGTH_SIZE, "big"))
+    stream.write(header)
+    for pickled_key in pickled_keys.values():
+        stream.write(pickled_key)
+
+
+def load_schema(schema_file: Path, *, lazy: bool = True) -> dict:
+    """
+    Load a pickled schema file.
+
+    Files in the indexed format written by `dump_schema` are memory-mapped, and the top-level "keys" are loaded on demand
+    unless "lazy" is False. Other files are loaded as a regular pickle.
+    """
+    with Path(schema_file).open("rb") as file:
+        if file.read(len(INDEXED_SCHEMA_MAGIC)) != INDEXED_SCHEMA_MAGIC:
+            file.seek(0)
+            return load(file)  # noqa: S301
+
+        # The memory map stays valid after the file is closed.
+        buffer = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+    header_start = len(INDEXED_SCHEMA_MAGIC) + _HEADER_LENGTH_SIZE
+    header_end = header_start + int.from_bytes(buffer[len(INDEXED_SCHEMA_MAGIC) : header_start], "big")
+    header: dict[str, Any] = loads(buffer[header_start:header_end])  # noqa: S301
+    schema = header["schema"]
+    if "keys" in schema:
+        index = {key: (header_end + start, header_end + end) for key, (start, end) in header["keys"].items()}
+        keys = LazySchemaKeys(buffer, index, frozenset(header["required_keys"]))
+        schema["keys"] = keys if lazy else dict(keys.items())
+    return schema
@@ -13,6 +13,7 @@ from .get_ip_from_ip_prefix import get_ip_from_ip_prefix
 from .get_ip_from_pool import get_ip_from_pool
 from .get_item import get_item
 from .groupby import groupby
+from .indexed_list import IndexedList
 from .load_python_class import load_python_class
 from .merge import merge
 from .replace_or_append_item import replace_or_append_item
@@ -24,6 +25,7 @@ from .unique import unique
 
 __all__ = [
     "AvdStringFormatter",
+    "IndexedList",
     "append_if_not_duplicate",
     "batch",
     "compare_dicts",
@@ -8,10 +8,11 @@ from pyavd._errors import AristaAvdDuplicateDataError
 from .compare_dicts import compare_dicts
 from .get import get
 from .get_item import get_item
+from .indexed_list import IndexedList
 
 
 def append_if_not_duplicate(
-    list_of_dicts: list[dict],
+    list_of_dicts: list[dict] | IndexedList,
     primary_key: str,
     new_dict: dict,
     context: str,
@@ -26,8 +27,11 @@ def append_if_not_duplicate(
 
     Parameters
     ----------
-    list_of_dicts : list(dict)
+    list_of_dicts : list(dict) | IndexedList
         List of Dictionaries to look for duplicate item.
+        For large lists use an IndexedList with the same primary_key to avoid scanning the full list on every call.
+        If the primary_key of the IndexedList differs, the list is scanned and an item with the same value for the primary_key
+        of the IndexedList is also considered a duplicate.
     primary_key : str
         Dictionary Key to match on.
     new_dict : dict
@@ -50,7 +54,13 @@ def append_if_not_duplicate(
     AristaAvdDuplicateDataError
         If a duplicate is found.
     """
-    if (found_dict := get_item(list_of_dicts, primary_key, new_dict[primary_key])) is None:
+    found_dict = get_item(list_of_dicts, primary_key, new_dict[primary_key])
+    if found_dict is None and isinstance(list_of_dicts, IndexedList) and primary_key != list_of_dicts.primary_key:
+        # The IndexedList cannot hold two items with the same value of its own primary key,
+        # so an item matching on that key is also handled as a duplicate.
+        found_dict = list_of_dicts.get(new_dict[list_of_dicts.primary_key])
+
+    if found_dict is None:
         list_of_dicts.append(new_dict)
         return
 
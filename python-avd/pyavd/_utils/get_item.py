@@ -5,9 +5,11 @@ from typing import Any
 
 from pyavd._errors import AristaAvdInvalidInputsError, AristaAvdMissingVariableError
 
+from .indexed_list import IndexedList
+
 
 def get_item(
-    list_of_dicts: list,
+    list_of_dicts: list | IndexedList,
     key: Any,
     value: Any,
     default: Any = None,
@@ -26,8 +28,9 @@ def get_item(
 
     Parameters
     ----------
-    list_of_dicts : list(dict)
-        List of Dictionaries to get list item from
+    list_of_dicts : list(dict) | IndexedList
+        List of Dictionaries to get list item from.
+        If an IndexedList is given and key is the primary_key of the IndexedList, the lookup is done using the index.
     key : any
         Dictionary Key to match on
     value : any
@@ -56,6 +59,16 @@ def get_item(
     if var_name is None:
         var_name = key
 
+    if isinstance(list_of_dicts, IndexedList):
+        if key != list_of_dicts.primary_key:
+            # Not matching on the primary key, so we have to scan the list.
+            list_of_dicts = list_of_dicts.to_list()
+        elif value is not None and (list_item := list_of_dicts.get(value)) is not None:
+            return list_item
+        else:
+            # No match in the index. Handled as an empty list below.
+            list_of_dicts = []
+
     if (not isinstance(list_of_dicts, list)) or list_of_dicts == [] or value is None or key is None:
         if required is True:
             if custom_error_msg:
@@ -0,0 +1,62 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class IndexedList:
+    """
+    Insertion-ordered list of dictionaries indexed on a primary key.
+
+    Used instead of a regular list when building large lists of dictionaries with `append_if_not_duplicate`
+    or `get_item`. Lookups on the primary key are done in constant time instead of
+    scanning the full list for every item.
+
+    All items must contain the primary key and the value must be unique.
+
+    The data must be converted to a regular list using `to_list()` before being returned as structured config.
+    """
+
+    __slots__ = ("_items", "primary_key")
+
+    def __init__(self, primary_key: str) -> None:
+        self.primary_key = primary_key
+        self._items: dict[Any, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._items.values())
+
+    def __repr__(self) -> str:
+        return f"IndexedList(primary_key={self.primary_key!r}, items={self.to_list()!r})"
+
+    def get(self, value: Any, default: Any = None) -> Any:
+        """Return the item where the primary key matches the given value or the default value if there is no match."""
+        return self._items.get(value, default)
+
+    def append(self, item: dict) -> None:
+        """
+        Append the item to the list.
+
+        Raises:
+            ValueError: If there is already an item with the same primary key value.
+        """
+        if (value := item[self.primary_key]) in self._items:
+            msg = f"An item with {self.primary_key} '{value}' already exists in the IndexedList."
+            raise ValueError(msg)
+        self._items[value] = item
+
+    def replace_or_append(self, item: dict) -> None:
+        """Replace the item with the same primary key value, keeping the position in the list, or append the item if there is no match."""
+        self._items[item[self.primary_key]] = item
+
+    def to_list(self) -> list[dict]:
+        """Return the items as a regular list."""
+        return list(self._items.values())
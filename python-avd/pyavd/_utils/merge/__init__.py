@@ -6,42 +6,11 @@ from __future__ import annotations
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
-from deepmerge import Merger
-
-from .mergeonschema import MergeOnSchema
-
 if TYPE_CHECKING:
     from pyavd._schema.avdschema import AvdSchema
 
-
-def _strategy_keep(_config: object, _path: list, base: Any, nxt: Any) -> Any:
-    """Prefer base, otherwise nxt."""
-    if base is not None:
-        return base
-    return nxt
-
-
-def _strategy_prepend_unique(_config: object, _path: list, base: list, nxt: list) -> list:
-    """Prepend nxt items without duplicates in base to base."""
-    nxt_as_set = set(nxt)
-    return nxt + [n for n in base if n not in nxt_as_set]
-
-
-def _strategy_must_match(_config: object, path: list, base: Any, nxt: Any) -> Any:
-    if base != nxt:
-        msg = f"Values of {'.'.join(path)} do not match: {base} != {nxt}"
-        raise ValueError(msg)
-    return base
-
-
-MAP_ANSIBLE_LIST_MERGE_TO_DEEPMERGE_LIST_STRATEGY = {
-    "replace": "override",
-    "keep": _strategy_keep,
-    "append": "append",
-    "prepend": "prepend",
-    "append_rp": "append_unique",
-    "prepend_rp": _strategy_prepend_unique,
-}
+LIST_MERGE_STRATEGIES = ("replace", "keep", "append", "prepend", "append_rp", "prepend_rp")
+SAME_KEY_STRATEGIES = ("override", "use_existing", "must_match")
 
 
 def merge(
@@ -54,7 +23,7 @@ def merge(
     schema: AvdSchema = None,
 ) -> Any:
     """
-    Merge two or more data sets using deepmerge.
+    Merge two or more data sets.
 
     Parameters
     ----------
@@ -83,42 +52,141 @@ def merge(
     if not destructive_merge:
         base = deepcopy(base)
 
-    if list_merge not in MAP_ANSIBLE_LIST_MERGE_TO_DEEPMERGE_LIST_STRATEGY:
-        msg = f"merge: 'list_merge' argument can only be equal to one of {list(MAP_ANSIBLE_LIST_MERGE_TO_DEEPMERGE_LIST_STRATEGY.keys())}"
+    if list_merge not in LIST_MERGE_STRATEGIES:
+        msg = f"merge: 'list_merge' argument can only be equal to one of {list(LIST_MERGE_STRATEGIES)}"
         raise ValueError(msg)
 
-    list_strategies = [MAP_ANSIBLE_LIST_MERGE_TO_DEEPMERGE_LIST_STRATEGY.get(list_merge, "append")]
+    if same_key_strategy not in SAME_KEY_STRATEGIES:
+        msg = f"merge: 'same_key_strategy' argument can only be equal to one of {list(SAME_KEY_STRATEGIES)}"
+        raise ValueError(msg)
 
-    if list_merge != "replace" and schema is not None:
-        # If list_merge is not "replace" and we have a schema, we prepend the list_strategies
-        # with our schema based list merger "MergeOnSchema"
-        # If "primary_key" is not set and equal, we will fallback to the supplied "list_merge" strategy
-        merge_on_schema = MergeOnSchema(schema)
-        list_strategies.insert(0, merge_on_schema.strategy)
+    merger = _Merger(recursive=recursive, list_merge=list_merge, same_key_strategy=same_key_strategy)
+    root_schema = schema.subschema([]) if schema is not None else None
 
-    dict_strategies = ["merge" if recursive else "override"]
+    for nxt in nxt_list:
+        for nxt_item in nxt if isinstance(nxt, list) else [nxt]:
+            merger.merge(base, deepcopy(nxt_item) if not destructive_merge else nxt_item, [], root_schema)
 
-    if same_key_strategy == "must_match":
-        same_key_strategy = _strategy_must_match
+    return base
 
-    merger = Merger(
-        # List of tuples with strategies for each type
-        [(list, list_strategies), (dict, dict_strategies), (set, ["union"])],
-        # Fallback strategy applied to all other types
-        [same_key_strategy],
-        # Strategy for type conflict
-        [same_key_strategy],
-    )
-    for nxt in nxt_list:
-        if isinstance(nxt, list):
-            for nxt_item in nxt:
-                if not destructive_merge:
-                    merger.merge(base, deepcopy(nxt_item))
+
+class _Merger:
+    """
+    Recursive merger used by `merge`.
+
+    The schema of the current data is passed down the recursion, so lists of dictionaries can be merged on their
+    "primary_key" without resolving the schema from the root for every list.
+    If a list has a "primary_key" in the schema, items in nxt with the same primary key value as items in base are merged
+    into the base items. Remaining items in nxt are merged with the regular list merge strategy.
+    """
+
+    __slots__ = ("list_merge", "recursive", "same_key_strategy")
+
+    def __init__(self, recursive: bool, list_merge: str, same_key_strategy: str) -> None:
+        self.recursive = recursive
+        self.list_merge = list_merge
+        self.same_key_strategy = same_key_strategy
+
+    def merge(self, base: Any, nxt: Any, path: list[str], schema: dict | None) -> Any:
+        """Merge nxt onto base and return the result. Dicts in base are updated in-place."""
+        if isinstance(base, list) and isinstance(nxt, list):
+            return self._merge_lists(base, nxt, path, schema)
+
+        if isinstance(base, dict) and isinstance(nxt, dict):
+            if not self.recursive:
+                return nxt
+
+            for key, value in nxt.items():
+                if key not in base:
+                    base[key] = value
                 else:
-                    merger.merge(base, nxt_item)
-        elif not destructive_merge:
-            merger.merge(base, deepcopy(nxt))
-        else:
-            merger.merge(base, nxt)
+                    base[key] = self.merge(base[key], value, [*path, key], _get_key_schema(schema, key))
+            return base
+
+        if isinstance(base, set) and isinstance(nxt, set):
+            return base | nxt
+
+        # All other types and type conflicts.
+        if self.same_key_strategy == "use_existing":
+            return base
+
+        if self.same_key_strategy == "must_match" and base != nxt:
+            msg = f"Values of {'.'.join(path)} do not match: {base} != {nxt}"
+            raise ValueError(msg)
+
+        return nxt
+
+    def _merge_lists(self, base: list, nxt: list, path: list[str], schema: dict | None) -> list:
+        if self.list_merge == "replace":
+            return nxt
+
+        if schema is not None and "primary_key" in schema:
+            nxt = self._merge_on_primary_key(base, nxt, path, schema)
+            if not nxt:
+                # All items were merged into base.
+                return base
+
+        if self.list_merge == "append":
+            return base + nxt
+        if self.list_merge == "prepend":
+            return nxt + base
+        if self.list_merge == "append_rp":
+            return base + _items_not_in(nxt, base)
+        if self.list_merge == "prepend_rp":
+            return nxt + _items_not_in(base, nxt)
+
+        # "keep"
+        return base
 
-    return base
+    def _merge_on_primary_key(self, base: list, nxt: list, path: list[str], schema: dict) -> list:
+        """
+        Merge items from nxt into the items in base with the same primary key value.
+
+        Base is indexed by primary key value, so each item in nxt is matched in constant time.
+        Items with duplicate primary key values in base will all be updated.
+
+        Returns:
+            List of items from nxt which were not merged.
+        """
+        primary_key = schema["primary_key"]
+        item_schema = schema.get("items")
+        try:
+            base_indexes: dict[Any, list[int]] = {}
+            for base_index, base_item in enumerate(base):
+                # Skipping items if they are not dicts or don't have primary_key
+                if isinstance(base_item, dict) and primary_key in base_item:
+                    base_indexes.setdefault(base_item[primary_key], []).append(base_index)
+
+            remaining_nxt = []
+            for nxt_item in nxt:
+                if not (isinstance(nxt_item, dict) and primary_key in nxt_item and nxt_item[primary_key] in base_indexes):
+                    remaining_nxt.append(nxt_item)
+                    continue
+
+                # Perform regular dict merge on the matching items.
+                for base_index in base_indexes[nxt_item[primary_key]]:
+                    base[base_index] = self.merge(base[base_index], nxt_item, path, item_schema)
+
+        except Exception as e:
+            msg = f"An issue occurred while trying to do schema-based merge for the schema path {path} using primary key '{primary_key}'"
+            raise RuntimeError(msg) from e
+
+        return remaining_nxt
+
+
+def _get_key_schema(schema: dict | None, key: Any) -> dict | None:
+    """Return the schema for the given key of a dict or None if the key is not covered by the schema."""
+    if schema is None or schema.get("type") != "dict":
+        return None
+
+    if key in (keys := schema.get("keys", {})):
+        return keys[key]
+
+    return schema.get("dynamic_keys", {}).get(key)
+
+
+def _items_not_in(items: list, existing: list) -> list:
+    """Return the items not found in existing. Hashable items are checked in constant time."""
+    hashable_existing = {item for item in existing if getattr(item, "__hash__", None) is not None}
+    unhashable_existing = [item for item in existing if getattr(item, "__hash__", None) is None]
+    return [item for item in items if not (item in hashable_existing if getattr(item, "__hash__", None) is not None else item in unhashable_existing)]
@@ -0,0 +1,363 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from hashlib import sha1
+from json import dumps as json_dumps
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL
+from pickle import dumps as pickle_dumps
+from pickle import loads as pickle_loads
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from .validation_result import ValidationResult
+
+# avd_facts loaded once per worker process by the pool initializer.
+_WORKER_AVD_FACTS: dict | None = None
+
+
+class DeviceBuildResult:
+    """
+    Object containing the build result for one device.
+
+    Attributes:
+        hostname: Hostname of the device.
+        inputs_validation_result: Validation result of the `eos_designs` inputs for the device.
+        structured_config: Device Structured Configuration as a dictionary.
+        structured_config_validation_result: Validation result of the structured configuration for the device.
+        device_config: Device configuration in EOS CLI format. Empty if not requested or if the structured configuration is invalid.
+        device_doc: Device documentation in Markdown format. Empty if not requested or if the structured configuration is invalid.
+        cached: True if the result was loaded from the cache directory instead of being rebuilt.
+    """
+
+    hostname: str
+    inputs_validation_result: ValidationResult
+    structured_config: dict
+    structured_config_validation_result: ValidationResult | None
+    device_config: str
+    device_doc: str
+    cached: bool
+
+    def __init__(self, hostname: str, inputs_validation_result: ValidationResult) -> None:
+        self.hostname = hostname
+        self.inputs_validation_result = inputs_validation_result
+        self.structured_config = {}
+        self.structured_config_validation_result = None
+        self.device_config = ""
+        self.device_doc = ""
+        self.cached = False
+
+
+def build_fabric(
+    all_inputs: dict[str, dict],
+    max_workers: int | None = None,
+    include_device_config: bool = True,
+    include_device_doc: bool = True,
+    add_md_toc: bool = False,
+    cache_dir: str | Path | None = None,
+) -> Generator[DeviceBuildResult]:
+    """
+    Build structured config, device configuration and device documentation for all devices using a pool of worker processes.
+
+    The per-device stages `validate_inputs`, `get_device_structured_config`, `validate_structured_config`,
+    `get_device_config` and `get_device_doc` are executed in parallel across the worker processes.
+    `get_avd_facts` is executed once in the calling process and the resulting avd_facts are sent once to each worker.
+
+    Results are yielded as soon as each device is completed, so the order of results is not guaranteed.
+
+    Note! As opposed to the other PyAVD functions, the given inputs are not updated in-place,
+    since the conversion of data is done in the worker processes.
+
+    When `cache_dir` is set, the build is incremental. A fingerprint of the inputs and avd_switch_facts of each device
+    is stored in the cache directory together with the results, including the facts of every peer device read while
+    building the structured config of the device, and the fabric-wide VTEP index if it was read. On the next run,
+    devices are only rebuilt if their own inputs, their own facts, the facts of any of the peers they read or the VTEP
+    index they read have changed. Other devices are loaded from the cache.
+    Input validation and `get_avd_facts` are always run for all devices.
+
+    Args:
+        all_inputs: A dictionary where keys are hostnames and values are dictionaries of input variables per device.
+            ```python
+            {
+                "<hostname1>": dict,
+                "<hostname2>": dict,
+                ...
+            }
+            ```
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
+        include_device_config: Render the device configuration for each device.
+        include_device_doc: Render the device documentation for each device.
+        add_md_toc: Add a table of contents for markdown headings in the device documentation.
+        cache_dir: Optional directory used to store fingerprints and results between runs for incremental builds.
+            The directory will be created if it does not exist.
+
+    Returns:
+        Generator of DeviceBuildResult objects, one per device.
+
+    Raises:
+        AristaAvdInvalidInputsError: If the inputs for any device fail validation against the `eos_designs` schema.
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    from . import __version__
+    from ._errors import AristaAvdInvalidInputsError
+    from .get_avd_facts import get_avd_facts
+
+    # pylint: enable=import-outside-toplevel
+
+    # Inputs are converted in the worker processes, so we collect the converted inputs returned from the workers.
+    converted_inputs = {}
+    inputs_digests = {}
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_validate_inputs_worker, hostname, inputs, cache_dir is not None) for hostname, inputs in all_inputs.items()]
+        for future in as_completed(futures):
+            hostname, inputs, validation_result, inputs_digest = future.result()
+            converted_inputs[hostname] = inputs
+            inputs_digests[hostname] = inputs_digest
+            results[hostname] = DeviceBuildResult(hostname, validation_result)
+
+    if failed_hosts := [hostname for hostname, result in results.items() if result.inputs_validation_result.failed]:
+        errors = {hostname: [str(error) for error in results[hostname].inputs_validation_result.validation_errors] for hostname in sorted(failed_hosts)}
+        msg = f"Invalid inputs for {len(failed_hosts)} device(s): {errors}"
+        raise AristaAvdInvalidInputsError(msg)
+
+    # Keep the order of devices as given in the inputs.
+    avd_facts = get_avd_facts({hostname: converted_inputs[hostname] for hostname in all_inputs})
+
+    hostnames_to_build = list(all_inputs)
+    fingerprints = {}
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        facts_digests = {hostname: _digest(facts["switch"]) for hostname, facts in avd_facts["avd_switch_facts"].items()}
+        vteps_digest = _digest(avd_facts["avd_vteps"])
+        fabric_digest = _digest([list(all_inputs), include_device_config, include_device_doc, add_md_toc, __version__])
+        fingerprints = {
+            hostname: {
+                "inputs": inputs_digests[hostname],
+                "facts": facts_digests[hostname],
+                "fabric": fabric_digest,
+                "peers": _digest([avd_facts["avd_overlay_peers"].get(hostname), avd_facts["avd_topology_peers"].get(hostname)]),
+            }
+            for hostname in all_inputs
+        }
+        hostnames_to_build = []
+        for hostname in all_inputs:
+            if (cached_outputs := _load_cached_outputs(cache_dir, hostname, fingerprints[hostname], facts_digests, vteps_digest)) is None:
+                hostnames_to_build.append(hostname)
+                continue
+
+            yield _update_result(results[hostname], *cached_outputs, cached=True)
+
+    # Only record which peer facts are read, when we need it for the cache.
+    record_peer_facts = cache_dir is not None
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(avd_facts,)) as executor:
+        futures = [
+            executor.submit(
+                _build_device_worker, hostname, converted_inputs[hostname], include_device_config, include_device_doc, add_md_toc, record_peer_facts
+            )
+            for hostname in hostnames_to_build
+        ]
+        for future in as_completed(futures):
+            hostname, outputs, accessed_peer_facts, accessed_vteps = future.result()
+            if cache_dir is not None:
+                fingerprint = {
+                    **fingerprints[hostname],
+                    "peer_facts": {peer: facts_digests[peer] for peer in sorted(accessed_peer_facts) if peer in facts_digests},
+                    "vteps": vteps_digest if accessed_vteps else None,
+                }
+                _write_cached_outputs(cache_dir, hostname, fingerprint, outputs)
+
+            yield _update_result(results[hostname], *outputs, cached=False)
+
+
+def _update_result(
+    result: DeviceBuildResult,
+    structured_config: dict,
+    validation_result: ValidationResult,
+    device_config: str,
+    device_doc: str,
+    *,
+    cached: bool,
+) -> DeviceBuildResult:
+    """Update the given DeviceBuildResult with the outputs from the build of the device."""
+    result.structured_config = structured_config
+    result.structured_config_validation_result = validation_result
+    result.device_config = device_config
+    result.device_doc = device_doc
+    result.cached = cached
+    return result
+
+
+def _digest(data: Any) -> str:
+    """
+    Return a digest of the given data.
+
+    The data is serialized as JSON without sorting keys, since keys may be of mixed types.
+    A change in the order of keys will cause a new digest, which will only lead to an unnecessary rebuild.
+    """
+    return sha1(json_dumps(data, default=str).encode("UTF-8"), usedforsecurity=False).hexdigest()  # NOSONAR
+
+
+def _load_cached_outputs(cache_dir: Path, hostname: str, fingerprint: dict, facts_digests: dict[str, str], vteps_digest: str) -> tuple | None:
+    """
+    Return the cached outputs for the device if the cached fingerprint matches the current fingerprint. Otherwise None.
+
+    The fingerprint is stored together with the outputs, so an interrupted build cannot leave outputs with a stale fingerprint.
+    """
+    cache_file = cache_dir.joinpath(f"{hostname}.pickle")
+    if not cache_file.exists():
+        return None
+
+    cached = pickle_loads(cache_file.read_bytes())  # noqa: S301
+    cached_fingerprint: dict = cached["fingerprint"]
+    if "peer_facts" not in cached_fingerprint or "vteps" not in cached_fingerprint:
+        # Written by an older version without all dependencies recorded.
+        return None
+
+    cached_peer_facts: dict = cached_fingerprint.pop("peer_facts")
+    cached_vteps_digest: str | None = cached_fingerprint.pop("vteps")
+    if cached_fingerprint != fingerprint:
+        return None
+
+    if any(facts_digests.get(peer) != peer_facts_digest for peer, peer_facts_digest in cached_peer_facts.items()):
+        return None
+
+    # Any change to the VTEP index may change the HER flood lists, also when a device without a VTEP becomes a VTEP.
+    if cached_vteps_digest is not None and cached_vteps_digest != vteps_digest:
+        return None
+
+    return cached["outputs"]
+
+
+def _write_cached_outputs(cache_dir: Path, hostname: str, fingerprint: dict, outputs: tuple) -> None:
+    """Write the fingerprint and outputs for the device to the cache directory. Written via a temporary file to avoid partial files."""
+    cache_file = cache_dir.joinpath(f"{hostname}.pickle")
+    temp_file = cache_file.with_suffix(".tmp")
+    temp_file.write_bytes(pickle_dumps({"fingerprint": fingerprint, "outputs": outputs}, HIGHEST_PROTOCOL))
+    temp_file.replace(cache_file)
+
+
+def _init_worker(avd_facts: dict) -> None:
+    """
+    Pool initializer storing avd_facts in the worker process, so they are only transferred once per worker.
+
+    Also adds indexes of connected endpoints and tenants shared by the devices built in the worker.
+    The FabricFacts instance of the avd_facts is also shared, so the fabric-wide views are only built once per worker.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ._eos_designs.shared_utils.connected_endpoints_index import ConnectedEndpointsIndex
+    from ._eos_designs.shared_utils.tenants_index import TenantsIndex
+
+    # pylint: enable=import-outside-toplevel
+
+    global _WORKER_AVD_FACTS  # noqa: PLW0603 pylint: disable=global-statement
+    _WORKER_AVD_FACTS = {
+        **avd_facts,
+        "avd_connected_endpoints_index": ConnectedEndpointsIndex(),
+        "avd_tenants_index": TenantsIndex(),
+    }
+
+
+def _validate_inputs_worker(hostname: str, inputs: dict, digest: bool) -> tuple[str, dict, ValidationResult, str | None]:
+    """Validate and convert inputs for one device. Optionally return a digest of the converted inputs. Runs in a worker process."""
+    # pylint: disable=import-outside-toplevel
+    from .validate_inputs import validate_inputs
+
+    # pylint: enable=import-outside-toplevel
+
+    validation_result = validate_inputs(inputs)
+    return hostname, inputs, validation_result, _digest(inputs) if digest else None
+
+
+class _PeerFactsRecorder(dict):
+    """
+    Wrapper of "avd_switch_facts" recording the hostnames of all devices for which facts are read.
+
+    All reads of peer facts in eos_designs are done through `FabricFacts.get_peer_facts`, which calls `.get()`.
+    """
+
+    def __init__(self, avd_switch_facts: dict) -> None:
+        super().__init__(avd_switch_facts)
+        self.accessed: set[str] = set()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self.accessed.add(key)
+        return super().get(key, default)
+
+
+class _VtepsRecorder(dict):
+    """
+    Wrapper of "avd_vteps" recording if the fabric-wide VTEP index is read.
+
+    The index is derived from the facts of all devices, so a device reading it depends on the full index,
+    including any device becoming a VTEP later.
+    """
+
+    def __init__(self, avd_vteps: dict) -> None:
+        super().__init__(avd_vteps)
+        self.accessed = False
+
+    def __getitem__(self, key: str) -> Any:
+        self.accessed = True
+        return super().__getitem__(key)
+
+
+def _build_device_worker(
+    hostname: str,
+    inputs: dict,
+    include_device_config: bool,
+    include_device_doc: bool,
+    add_md_toc: bool,
+    record_peer_facts: bool,
+) -> tuple[str, tuple[dict, ValidationResult, str, str], set[str], bool]:
+    """
+    Build structured config, device configuration and documentation for one device. Runs in a worker process.
+
+    Optionally records the hostnames of peers for which facts were read while building the structured config,
+    and if the fabric-wide VTEP index was read.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ._eos_designs.shared_utils.fabric_facts import FabricFacts
+    from .get_device_config import get_device_config
+    from .get_device_doc import get_device_doc
+    from .get_device_structured_config import get_device_structured_config
+    from .validate_structured_config import validate_structured_config
+
+    # pylint: enable=import-outside-toplevel
+
+    avd_facts = _WORKER_AVD_FACTS
+    if record_peer_facts:
+        avd_switch_facts = _PeerFactsRecorder(avd_facts["avd_switch_facts"])
+        avd_facts = {
+            **avd_facts,
+            "avd_switch_facts": avd_switch_facts,
+            # Not sharing the FabricFacts of the worker, since it must read peer facts through the recorder.
+            "avd_fabric_facts": FabricFacts(avd_switch_facts),
+            "avd_vteps": _VtepsRecorder(avd_facts["avd_vteps"]),
+        }
+
+    structured_config = get_device_structured_config(hostname, inputs, avd_facts)
+    validation_result = validate_structured_config(structured_config)
+
+    device_config = ""
+    device_doc = ""
+    if not validation_result.failed:
+        if include_device_config:
+            device_config = get_device_config(structured_config)
+        if include_device_doc:
+            device_doc = get_device_doc(structured_config, add_md_toc=add_md_toc)
+
+    accessed_peer_facts = set()
+    accessed_vteps = False
+    if record_peer_facts:
+        accessed_peer_facts = avd_facts["avd_switch_facts"].accessed
+        accessed_vteps = avd_facts["avd_vteps"].accessed
+
+    return hostname, (structured_config, validation_result, device_config, device_doc), accessed_peer_facts, accessed_vteps
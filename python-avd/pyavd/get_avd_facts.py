@@ -27,17 +27,26 @@ def get_avd_facts(all_inputs: dict[str, dict]) -> dict[str, dict]:
     Returns:
         Nested dictionary with various internal "facts". The full dict must be given as argument to `pyavd.get_device_structured_config`:
             ```python
-            {"avd_switch_facts": dict, "avd_overlay_peers": dict, "avd_topology_peers": dict}
+            {"avd_switch_facts": dict, "avd_fabric_facts": FabricFacts, "avd_overlay_peers": dict, "avd_topology_peers": dict, "avd_vteps": dict}
             ```
     """
+    # pylint: disable=import-outside-toplevel
+    from ._eos_designs.eos_designs_facts.vteps_index import get_avd_vteps
+    from ._eos_designs.shared_utils.fabric_facts import FabricFacts
+
+    # pylint: enable=import-outside-toplevel
+
     avd_switch_facts_instances = _create_avd_switch_facts_instances(all_inputs)
     avd_switch_facts = _render_avd_switch_facts(avd_switch_facts_instances)
     avd_overlay_peers, avd_topology_peers = _render_peer_facts(avd_switch_facts)
 
     return {
         "avd_switch_facts": avd_switch_facts,
+        # Facts of all devices with direct lookups and fabric-wide views shared by the structured config of all devices.
+        "avd_fabric_facts": FabricFacts(avd_switch_facts),
         "avd_overlay_peers": avd_overlay_peers,
         "avd_topology_peers": avd_topology_peers,
+        "avd_vteps": get_avd_vteps(avd_switch_facts),
     }
 
 
@@ -67,17 +76,36 @@ def _create_avd_switch_facts_instances(all_inputs: dict[str, dict]) -> dict:
     """
     # pylint: disable=import-outside-toplevel
     from ._eos_designs.eos_designs_facts import EosDesignsFacts
+    from ._eos_designs.eos_designs_facts.uplink_peers_index import UplinkPeersIndex
     from ._eos_designs.shared_utils import SharedUtils
+    from ._eos_designs.shared_utils.connected_endpoints_index import ConnectedEndpointsIndex
+    from ._eos_designs.shared_utils.fabric_facts import FabricFacts
+    from ._eos_designs.shared_utils.tenants_index import TenantsIndex
     from .avd_schema_tools import EosDesignsAvdSchemaTools
 
     # pylint: enable=import-outside-toplevel
 
     avd_switch_facts = {}
+    # Reverse index of uplink peers shared by all devices. Built on first use when all devices are added to avd_switch_facts.
+    avd_uplink_peers_index = UplinkPeersIndex(avd_switch_facts)
+    # Index of connected endpoints per switch shared by all devices. Devices with the same inputs share the same index.
+    avd_connected_endpoints_index = ConnectedEndpointsIndex()
+    # Facts of all devices with direct lookups and fabric-wide views shared by all devices.
+    avd_fabric_facts = FabricFacts(avd_switch_facts)
+    # Index of tenants shared by all devices. Devices with the same inputs share the same index.
+    avd_tenants_index = TenantsIndex()
     for hostname, hostvars in all_inputs.items():
         # Set 'inventory_hostname' on the input variables, to keep compatibility with Ansible focused code.
         # Add reference to dict "avd_switch_facts" to access EosDesignsFacts objects of other switches during rendering of one switch.
         mapped_hostvars = ChainMap(
-            {"inventory_hostname": hostname, "avd_switch_facts": avd_switch_facts},
+            {
+                "inventory_hostname": hostname,
+                "avd_switch_facts": avd_switch_facts,
+                "avd_uplink_peers_index": avd_uplink_peers_index,
+                "avd_connected_endpoints_index": avd_connected_endpoints_index,
+                "avd_fabric_facts": avd_fabric_facts,
+                "avd_tenants_index": avd_tenants_index,
+            },
             hostvars,
         )
 
@@ -43,13 +43,12 @@ def get_fabric_documentation(
     # pylint: disable=import-outside-toplevel
     from pyavd.j2filters import add_md_toc
 
-    from .constants import EOS_DESIGNS_JINJA2_PRECOMPILED_TEMPLATE_PATH
-    from .templater import Templar
+    from .templater import EosDesignsTemplar
     # pylint: enable=import-outside-toplevel
 
     fabric_documentation_facts = FabricDocumentationFacts(avd_facts, structured_configs, fabric_name, include_connected_endpoints)
     result = FabricDocumentation()
-    doc_templar = Templar(precompiled_templates_path=EOS_DESIGNS_JINJA2_PRECOMPILED_TEMPLATE_PATH)
+    doc_templar = EosDesignsTemplar()
     if fabric_documentation:
         fabric_documentation_facts_dict = fabric_documentation_facts.render()
         result.fabric_documentation = doc_templar.render_template_from_file("fabric_documentation.j2", fabric_documentation_facts_dict)
@@ -4,11 +4,14 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from jinja2.runtime import Undefined
 from jinja2.utils import Namespace
 
+NUMBERS_PATTERN = re.compile(r"(\d+)")
+
 
 def convert(text: str, ignore_case: bool) -> int | str:
     """Converts the input string to be sorted.
@@ -51,18 +54,30 @@ def natural_sort(iterable: list | dict | str | None, sort_key: str | None = None
     if isinstance(iterable, Undefined) or iterable is None:
         return []
 
-    def alphanum_key(key: Any) -> list:
-        pattern = r"(\d+)"
+    def alphanum_key(key: Any) -> tuple:
         if sort_key is not None and isinstance(key, dict):
             if strict and sort_key not in key:
                 msg = f"Missing key '{sort_key}' in item to sort {key}."
                 raise KeyError(msg)
-            return [convert(c, ignore_case) for c in re.split(pattern, str(key.get(sort_key, key)))]
+            return _natural_sort_key(str(key.get(sort_key, key)), ignore_case)
         if sort_key is not None and isinstance(key, Namespace):
             if strict and not hasattr(key, sort_key):
                 msg = f"Missing attribute '{sort_key}' in item to sort {key}."
                 raise AttributeError(msg)
-            return [convert(c, ignore_case) for c in re.split(pattern, getattr(key, sort_key))]
-        return [convert(c, ignore_case) for c in re.split(pattern, str(key))]
+            return _natural_sort_key(getattr(key, sort_key), ignore_case)
+        return _natural_sort_key(str(key), ignore_case)
+
+    items = list(iterable)
+    keys = [alphanum_key(item) for item in items]
+
+    # Fast path for input which is already sorted, like lists sorted in eos_designs and sorted again in the templates.
+    if all(keys[index] <= keys[index + 1] for index in range(len(keys) - 1)):
+        return items
+
+    return [items[index] for index in sorted(range(len(items)), key=keys.__getitem__)]
+
 
-    return sorted(iterable, key=alphanum_key)
+@lru_cache(maxsize=16384)
+def _natural_sort_key(text: str, ignore_case: bool) -> tuple:
+    """Return the natural sort key for the given string. Cached since the same strings are sorted many times during a build."""
+    return tuple(convert(chunk, ignore_case) for chunk in NUMBERS_PATTERN.split(text))
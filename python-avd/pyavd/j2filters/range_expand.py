@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 
@@ -82,6 +83,31 @@ def expand_module(interface_string: str, data: InterfaceData) -> list:
     return result
 
 
+# Ignoring SONAR hotspot regarding potential DDOS for this PR.
+RANGE_PATTERN = re.compile(r"^(.*?)(((\d+)-)?(\d+)\/)?(((\d+)-)?(\d+)\/)?(((\d+)-)?(\d+))(\.((\d+)-)?(\d+))?")  # NOSONAR
+# Number of groups in this regex.
+RANGE_PATTERN_GROUPS = 17
+# Groups one-by-one:
+# Group 1  (.*?)                                                                           matches prefix ex. Ethernet, Eth, Po, Port-Channel
+# Group 2       (((\d+)-)?(\d+)\/)?                                                        matches module(s) and slash ex. 12/, 1-3/
+# Group 3        ((\d+)-)?                                                                 matches first module and dash ex. 1-
+# Group 4         (\d+)                                                                    matches first module ex. 1
+# Group 5                 (\d+)                                                            matches last module ex. 12, 3
+# Group 6                          (((\d+)-)?(\d+)\/)?                                     matches parent interface(s) and slash ex. 47/, 1-48/
+# Group 7                           ((\d+)-)?                                              matches parent interface(s) and dash ex. 47-
+# Group 8                            (\d+)                                                 matches first parent interface ex. 1
+# Group 9                                    (\d+)                                         matches last parent interface ex. 47, 48
+# Group 10                                            (((\d+)-)?(\d+))                     matches (breakout) interface(s) ex. 1, 1-4, 1-48
+# Group 11                                             ((\d+)-)?                           matches first interfaces and dash ex. 1-, 1-
+# Group 12                                              (\d+)                              matches first interface
+# Group 13                                                      (\d+)                      matches last interface ex. 1, 4, 48
+# Group 14                                                            (\.((\d+)-)?(\d+))?  matches dot and sub-interface(s) ex. .141, .12-15
+# Group 15                                                               ((\d+)-)?         matches first sub-interface and dash ex. 12-
+# Group 16                                                                (\d+)            matches first sub-interface ex. 12
+# Group 17                                                                        (\d+)    matches last sub-interface ex. 141, 15
+# Remember that the groups() object is 0-based and the group numbers above are 1-based
+
+
 def range_expand(range_to_expand: Any) -> list:
     if not isinstance(range_to_expand, (list, str)):
         msg = f"value must be of type list or str, got {type(range_to_expand)}"
@@ -96,62 +122,74 @@ def range_expand(range_to_expand: Any) -> list:
 
     # Must be a str now
     else:
-        prefix = ""
-
-        # Unpack list in string
-        for one_range in range_to_expand.split(","):
-            if one_range is None:
-                continue
-
-            # Find prefix (if any)
-            # Ignoring SONAR hotspot regarding potential DDOS for this PR.
-            regex = r"^(.*?)(((\d+)-)?(\d+)\/)?(((\d+)-)?(\d+)\/)?(((\d+)-)?(\d+))(\.((\d+)-)?(\d+))?"  # NOSONAR
-            # Number of groups in this regex.
-            regex_groups = 17
-            # Groups one-by-one:
-            # Group 1  (.*?)                                                                           matches prefix ex. Ethernet, Eth, Po, Port-Channel
-            # Group 2       (((\d+)-)?(\d+)\/)?                                                        matches module(s) and slash ex. 12/, 1-3/
-            # Group 3        ((\d+)-)?                                                                 matches first module and dash ex. 1-
-            # Group 4         (\d+)                                                                    matches first module ex. 1
-            # Group 5                 (\d+)                                                            matches last module ex. 12, 3
-            # Group 6                          (((\d+)-)?(\d+)\/)?                                     matches parent interface(s) and slash ex. 47/, 1-48/
-            # Group 7                           ((\d+)-)?                                              matches parent interface(s) and dash ex. 47-
-            # Group 8                            (\d+)                                                 matches first parent interface ex. 1
-            # Group 9                                    (\d+)                                         matches last parent interface ex. 47, 48
-            # Group 10                                            (((\d+)-)?(\d+))                     matches (breakout) interface(s) ex. 1, 1-4, 1-48
-            # Group 11                                             ((\d+)-)?                           matches first interfaces and dash ex. 1-, 1-
-            # Group 12                                              (\d+)                              matches first interface
-            # Group 13                                                      (\d+)                      matches last interface ex. 1, 4, 48
-            # Group 14                                                            (\.((\d+)-)?(\d+))?  matches dot and sub-interface(s) ex. .141, .12-15
-            # Group 15                                                               ((\d+)-)?         matches first sub-interface and dash ex. 12-
-            # Group 16                                                                (\d+)            matches first sub-interface ex. 12
-            # Group 17                                                                        (\d+)    matches last sub-interface ex. 141, 15
-            # Remember that the groups() object is 0-based and the group numbers above are 1-based
-            search_result = re.search(regex, one_range)
-            if search_result:
-                if len(search_result.groups()) == regex_groups:
-                    groups = search_result.groups()
-                    data = InterfaceData(one_range=one_range)
-                    # Set prefix if found (otherwise use last set prefix)
-                    if groups[0]:
-                        prefix = groups[0]
-                    if groups[4]:
-                        data.last_module = int(groups[4])
-                    data.first_module = int(groups[3]) if groups[3] else data.last_module
-                    if groups[8]:
-                        data.last_parent_interface = int(groups[8])
-                    data.first_parent_interface = int(groups[7]) if groups[7] else data.last_parent_interface
-                    if groups[12]:
-                        data.last_interface = int(groups[12])
-                    data.first_interface = int(groups[11]) if groups[11] else data.last_interface
-                    if groups[16]:
-                        data.last_subinterface = int(groups[16])
-                    data.first_subinterface = int(groups[15]) if groups[15] else data.last_subinterface
-
-                    result.extend(expand_module(prefix, data))
-
-                else:
-                    msg = f"Invalid range, got {one_range} and found {search_result.groups()}"
-                    raise ValueError(msg)
+        result.extend(_range_expand_string(range_to_expand))
 
     return result
+
+
+def range_expand_to_int_set(range_to_expand: Any) -> frozenset[int]:
+    """
+    Expand a range of integers like vlans "1-3,10" to a set of integers like `{1, 2, 3, 10}`.
+
+    Accepts the same input types as `range_expand`. Expanded strings are cached, so use this instead of converting the
+    output of `range_expand` to integers, when the result is used for membership tests.
+
+    Raises:
+        TypeError: If the input is not a list or str.
+        ValueError: If the range cannot be expanded or the expanded values are not integers.
+    """
+    if isinstance(range_to_expand, list):
+        return frozenset().union(*(range_expand_to_int_set(r) for r in range_to_expand))
+
+    if not isinstance(range_to_expand, str):
+        msg = f"value must be of type list or str, got {type(range_to_expand)}"
+        raise TypeError(msg)
+
+    return _range_expand_string_to_int_set(range_to_expand)
+
+
+@lru_cache(maxsize=4096)
+def _range_expand_string_to_int_set(range_to_expand: str) -> frozenset[int]:
+    return frozenset(map(int, _range_expand_string(range_to_expand)))
+
+
+@lru_cache(maxsize=4096)
+def _range_expand_string(range_to_expand: str) -> tuple[str, ...]:
+    """Expand the given range string. Cached since the same ranges like vlans or interfaces are expanded many times during a build."""
+    result = []
+    prefix = ""
+
+    # Unpack list in string
+    for one_range in range_to_expand.split(","):
+        if one_range is None:
+            continue
+
+        # Find prefix (if any)
+        search_result = RANGE_PATTERN.search(one_range)
+        if search_result:
+            if len(search_result.groups()) == RANGE_PATTERN_GROUPS:
+                groups = search_result.groups()
+                data = InterfaceData(one_range=one_range)
+                # Set prefix if found (otherwise use last set prefix)
+                if groups[0]:
+                    prefix = groups[0]
+                if groups[4]:
+                    data.last_module = int(groups[4])
+                data.first_module = int(groups[3]) if groups[3] else data.last_module
+                if groups[8]:
+                    data.last_parent_interface = int(groups[8])
+                data.first_parent_interface = int(groups[7]) if groups[7] else data.last_parent_interface
+                if groups[12]:
+                    data.last_interface = int(groups[12])
+                data.first_interface = int(groups[11]) if groups[11] else data.last_interface
+                if groups[16]:
+                    data.last_subinterface = int(groups[16])
+                data.first_subinterface = int(groups[15]) if groups[15] else data.last_subinterface
+
+                result.extend(expand_module(prefix, data))
+
+            else:
+                msg = f"Invalid range, got {one_range} and found {search_result.groups()}"
+                raise ValueError(msg)
+
+    return tuple(result)
@@ -4,16 +4,27 @@
 from __future__ import annotations
 
 from pathlib import Path
+from threading import Lock
 from typing import TYPE_CHECKING
 
 from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, StrictUndefined
 
-from .constants import JINJA2_EXTENSIONS, RUNNING_FROM_SRC
+from .constants import (
+    EOS_CLI_CONFIG_GEN_JINJA2_PRECOMPILED_TEMPLATE_PATH,
+    EOS_DESIGNS_JINJA2_PRECOMPILED_TEMPLATE_PATH,
+    JINJA2_EXTENSIONS,
+    RUNNING_FROM_SRC,
+)
 
 if TYPE_CHECKING:
     import os
     from collections.abc import Sequence
 
+    from typing_extensions import Self
+
+# Protects creation of the shared Templar instances when rendering from multiple threads.
+_SHARED_TEMPLAR_LOCK = Lock()
+
 
 class Undefined(StrictUndefined):
     """
@@ -133,6 +144,31 @@ class Templar:
         self.environment.loader = self.loader
 
 
+class EosCliConfigGenTemplar(Templar):
+    """
+    Singleton Templar instance for eos_cli_config_gen templates.
+
+    Reusing the same Jinja2 environment keeps the loaded template modules and compiled templates in memory
+    across calls, instead of importing all templates again for every device.
+    """
+
+    def __new__(cls) -> Self:
+        with _SHARED_TEMPLAR_LOCK:
+            if not hasattr(cls, "instance"):
+                cls.instance = Templar(precompiled_templates_path=EOS_CLI_CONFIG_GEN_JINJA2_PRECOMPILED_TEMPLATE_PATH)
+        return cls.instance
+
+
+class EosDesignsTemplar(Templar):
+    """Singleton Templar instance for eos_designs templates."""
+
+    def __new__(cls) -> Self:
+        with _SHARED_TEMPLAR_LOCK:
+            if not hasattr(cls, "instance"):
+                cls.instance = Templar(precompiled_templates_path=EOS_DESIGNS_JINJA2_PRECOMPILED_TEMPLATE_PATH)
+        return cls.instance
+
+
 class ExtensionFileSystemLoader(FileSystemLoader):
     """Custom Jinja2 loader that filters on extensions."""
 
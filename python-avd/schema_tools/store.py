@@ -5,12 +5,11 @@ from copy import deepcopy
 from functools import lru_cache
 from hashlib import sha1
 from pathlib import Path
-from pickle import HIGHEST_PROTOCOL
-from pickle import dump as pickle_dump
-from pickle import load as pickle_load
 
 from yaml import safe_load
 
+from pyavd._schema.store import dump_schema, load_schema
+
 from .avdschemaresolver import AvdSchemaResolver
 from .constants import PICKLED_SCHEMAS, SCHEMA_PATHS
 
@@ -46,8 +45,7 @@ def create_store(*, load_from_yaml: bool = False, force_rebuild: bool = False) -
 
     # Load from Pickle.
     for schema_id, schema_file in PICKLED_SCHEMAS.items():
-        with Path(schema_file).open("rb") as file:
-            store[schema_id] = pickle_load(file)  # noqa: S301
+        store[schema_id] = load_schema(schema_file, lazy=False)
 
     return store
 
@@ -106,9 +104,10 @@ def _compile_schemas() -> dict:
             schema_store[schema_name] = resolved_schema
 
         # Update pickle file with binary version of the completely resolved schema.
+        # The indexed format allows PyAVD to load each top-level key on demand.
         try:
             with pickle_file.open("wb") as stream:
-                pickle_dump(resolved_schema, stream, HIGHEST_PROTOCOL)
+                dump_schema(resolved_schema, stream)
 
             # Update the .sha1 file with the new hash of the yaml schema file.
             schema_file = SCHEMA_PATHS[schema_name]
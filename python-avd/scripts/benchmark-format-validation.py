@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""
+Micro-benchmark of the IP address format validation in AvdValidator.
+
+Validates all the intended structured configurations from the eos_designs unit tests molecule scenario
+against the eos_cli_config_gen schema, with and without the IP address formats in the schema,
+and prints the cost of the format validation.
+"""
+
+from copy import deepcopy
+from pathlib import Path
+from sys import path
+from timeit import repeat
+
+from yaml import CSafeLoader
+from yaml import load as yaml_load
+
+# Override global path to load pyavd from source instead of any installed version.
+path.insert(0, str(Path(__file__).parents[1]))
+
+from pyavd._schema.avdschema import AvdSchema
+
+STRUCTURED_CONFIGS_PATH = (
+    Path(__file__).parents[2].joinpath("ansible_collections", "arista", "avd", "molecule", "eos_designs_unit_tests", "intended", "structured_configs")
+)
+IP_FORMATS = {"ipv4", "ipv4_cidr", "ipv6", "ipv6_cidr", "ip", "cidr"}
+REPEAT = 5
+
+
+def strip_ip_formats(schema: dict) -> dict:
+    """Return a copy of the schema without the IP address formats."""
+    if isinstance(schema, dict):
+        return {key: strip_ip_formats(value) for key, value in schema.items() if not (key == "format" and isinstance(value, str) and value in IP_FORMATS)}
+    if isinstance(schema, list):
+        return [strip_ip_formats(item) for item in schema]
+    return schema
+
+
+def validate_all(avdschema: AvdSchema, structured_configs: list[dict]) -> None:
+    for structured_config in structured_configs:
+        for _ in avdschema.validate(structured_config):
+            pass
+
+
+def main() -> None:
+    structured_configs = [yaml_load(file.read_text(encoding="UTF-8"), Loader=CSafeLoader) for file in sorted(STRUCTURED_CONFIGS_PATH.glob("*.yml"))]
+    avdschema = AvdSchema(schema_id="eos_cli_config_gen")
+    avdschema_without_ip_formats = AvdSchema(schema=strip_ip_formats(deepcopy(avdschema._schema)))
+
+    # Warm up to compile the schemas and fill the caches.
+    validate_all(avdschema, structured_configs)
+    validate_all(avdschema_without_ip_formats, structured_configs)
+
+    with_formats = min(repeat(lambda: validate_all(avdschema, structured_configs), number=1, repeat=REPEAT))
+    without_formats = min(repeat(lambda: validate_all(avdschema_without_ip_formats, structured_configs), number=1, repeat=REPEAT))
+
+    print(f"Validated {len(structured_configs)} structured configurations (best of {REPEAT})")
+    print(f"Without IP address format validation: {without_formats * 1000:.1f} ms")
+    print(f"With IP address format validation:    {with_formats * 1000:.1f} ms")
+    print(f"Cost of IP address format validation:  {(with_formats - without_formats) * 1000:.1f} ms ({(with_formats / without_formats - 1) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""
+Benchmark of the public pyavd stages on synthetic eos_designs inventories.
+
+Generates inventories at one or more scales with the fabric generator, times each public pyavd stage and records the peak memory.
+The results are written as JSON, so they can be compared with a baseline from an earlier run.
+
+The scaling exponent of each stage between the smallest and the largest scale is reported as well.
+An exponent around 1 means the stage scales linearly with the number of devices, while an exponent around 2 means quadratic scaling.
+
+Example:
+    python -m tests.benchmarks.benchmark_fabric --leaf-pairs 16 --wan-sites 8 --mpls-pes 8 --scale-factors 1,2,4 --output benchmark.json
+    python -m tests.benchmarks.benchmark_fabric --leaf-pairs 16 --scale-factors 1,2,4 --baseline benchmark.json --max-scaling-exponent 1.5
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import asdict, replace
+from json import dump, load
+from math import log
+from pathlib import Path
+from platform import python_version
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from pyavd import __version__ as pyavd_version
+from pyavd import get_avd_facts, get_device_config, get_device_doc, get_device_structured_config, validate_inputs, validate_structured_config
+from pyavd.get_fabric_documentation import get_fabric_documentation
+
+from .fabric_generator import FabricScale, generate_fabric
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+STAGES = (
+    "validate_inputs",
+    "get_avd_facts",
+    "get_device_structured_config",
+    "validate_structured_config",
+    "get_device_config",
+    "get_device_doc",
+    "get_fabric_documentation",
+)
+# Stages faster than this are not considered when comparing with a baseline or calculating the scaling exponent, since they are too noisy.
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+def get_peak_rss() -> int | None:
+    """Return the peak resident memory of the process in bytes or None if not supported on this platform."""
+    try:
+        from resource import RUSAGE_SELF, getrusage  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux.
+    return getrusage(RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def run_stage(stage: str, func: Callable[[], Any], devices: int, stats: dict, *, trace_memory: bool) -> Any:
+    """Run and time one stage, storing the statistics of the stage in the given dict."""
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    start = perf_counter()
+    result = func()
+    seconds = perf_counter() - start
+    stage_stats = {"seconds": seconds, "seconds_per_device": seconds / devices}
+    if trace_memory:
+        stage_stats["peak_traced_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    stage_stats["peak_rss"] = get_peak_rss()
+    stats[stage] = stage_stats
+    return result
+
+
+def run_benchmark(scale: FabricScale, *, trace_memory: bool = False) -> dict:
+    """
+    Run all stages for a synthetic inventory of the given scale.
+
+    Args:
+        scale: Scale parameters of the inventory.
+        trace_memory: Record the peak memory allocated by each stage using tracemalloc. This slows down all stages considerably.
+
+    Returns:
+        Dict with the scale, the number of devices and the statistics of each stage.
+
+    Raises:
+        ValueError: If the generated inputs or structured configurations fail validation, which means the fabric generator must be fixed.
+    """
+    all_inputs = generate_fabric(scale)
+    devices = len(all_inputs)
+    stats = {}
+
+    def _validate_inputs() -> None:
+        for hostname, inputs in all_inputs.items():
+            if (validation_result := validate_inputs(inputs)).failed:
+                msg = f"Invalid generated inputs for '{hostname}': {validation_result.validation_errors}"
+                raise ValueError(msg)
+
+    def _validate_structured_configs() -> None:
+        for hostname, structured_config in structured_configs.items():
+            if (validation_result := validate_structured_config(structured_config)).failed:
+                msg = f"Invalid generated structured config for '{hostname}': {validation_result.validation_errors}"
+                raise ValueError(msg)
+
+    run_stage("validate_inputs", _validate_inputs, devices, stats, trace_memory=trace_memory)
+    avd_facts = run_stage("get_avd_facts", lambda: get_avd_facts(all_inputs), devices, stats, trace_memory=trace_memory)
+    structured_configs = run_stage(
+        "get_device_structured_config",
+        lambda: {hostname: get_device_structured_config(hostname, inputs, avd_facts) for hostname, inputs in all_inputs.items()},
+        devices,
+        stats,
+        trace_memory=trace_memory,
+    )
+    run_stage("validate_structured_config", _validate_structured_configs, devices, stats, trace_memory=trace_memory)
+    run_stage(
+        "get_device_config",
+        lambda: [get_device_config(structured_config) for structured_config in structured_configs.values()],
+        devices,
+        stats,
+        trace_memory=trace_memory,
+    )
+    run_stage(
+        "get_device_doc",
+        lambda: [get_device_doc(structured_config) for structured_config in structured_configs.values()],
+        devices,
+        stats,
+        trace_memory=trace_memory,
+    )
+    run_stage(
+        "get_fabric_documentation",
+        lambda: get_fabric_documentation(avd_facts, structured_configs, "BENCH", include_connected_endpoints=True, topology_csv=True, p2p_links_csv=True),
+        devices,
+        stats,
+        trace_memory=trace_memory,
+    )
+
+    return {"scale": asdict(scale), "devices": devices, "stages": stats}
+
+
+def get_scaling_exponents(runs: list[dict]) -> dict[str, float]:
+    """Return the scaling exponent of each stage between the smallest and the largest run."""
+    if len(runs) < 2:
+        return {}
+
+    first, last = runs[0], runs[-1]
+    exponents = {}
+    for stage in STAGES:
+        first_seconds = first["stages"][stage]["seconds"]
+        last_seconds = last["stages"][stage]["seconds"]
+        if first_seconds < MIN_COMPARABLE_SECONDS or last["devices"] == first["devices"]:
+            continue
+        exponents[stage] = log(last_seconds / first_seconds) / log(last["devices"] / first["devices"])
+    return exponents
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return the stages where the time per device increased by more than the tolerance factor compared to the baseline run with the same number of devices."""
+    baseline_runs = {run["devices"]: run for run in baseline["runs"]}
+    regressions = []
+    for run in results["runs"]:
+        if (baseline_run := baseline_runs.get(run["devices"])) is None:
+            continue
+        for stage in STAGES:
+            seconds = run["stages"][stage]["seconds"]
+            baseline_seconds = baseline_run["stages"][stage]["seconds"]
+            if baseline_seconds < MIN_COMPARABLE_SECONDS:
+                continue
+            if seconds > baseline_seconds * tolerance:
+                regressions.append(f"{stage} with {run['devices']} devices: {seconds:.2f}s vs {baseline_seconds:.2f}s in baseline")
+    return regressions
+
+
+def main(args: list[str] | None = None) -> int:
+    defaults = FabricScale()
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spines", type=int, default=defaults.spines, help="Number of spines in the DC fabric.")
+    parser.add_argument("--leaf-pairs", type=int, default=defaults.leaf_pairs, help="Number of MLAG leaf pairs in the DC fabric.")
+    parser.add_argument("--tenants", type=int, default=defaults.tenants, help="Number of tenants in the DC fabric.")
+    parser.add_argument("--vlans-per-tenant", type=int, default=defaults.vlans_per_tenant, help="Number of VLANs per tenant.")
+    parser.add_argument("--endpoints-per-leaf-pair", type=int, default=defaults.endpoints_per_leaf_pair, help="Number of servers per leaf pair.")
+    parser.add_argument("--wan-sites", type=int, default=defaults.wan_sites, help="Number of WAN sites with one edge router each.")
+    parser.add_argument("--pathfinders", type=int, default=defaults.pathfinders, help="Number of pathfinders in the WAN fabric.")
+    parser.add_argument("--mpls-pes", type=int, default=defaults.mpls_pes, help="Number of PE routers in the MPLS fabric.")
+    parser.add_argument("--mpls-ps", type=int, default=defaults.mpls_ps, help="Number of P routers in the MPLS fabric.")
+    parser.add_argument(
+        "--scale-factors",
+        default="1",
+        help="Comma separated factors applied to the number of leaf pairs, WAN sites and MPLS PEs. One benchmark is run for each factor.",
+    )
+    parser.add_argument("--trace-memory", action="store_true", help="Record the peak memory allocated by each stage. Slows down all stages.")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", type=Path, help="Compare the results with this JSON file from an earlier run.")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Factor of the baseline time above which a stage is reported as a regression.")
+    parser.add_argument("--max-scaling-exponent", type=float, help="Fail if the scaling exponent of any stage is above this value.")
+    parsed_args = parser.parse_args(args)
+
+    base_scale = FabricScale(
+        spines=parsed_args.spines,
+        leaf_pairs=parsed_args.leaf_pairs,
+        tenants=parsed_args.tenants,
+        vlans_per_tenant=parsed_args.vlans_per_tenant,
+        endpoints_per_leaf_pair=parsed_args.endpoints_per_leaf_pair,
+        wan_sites=parsed_args.wan_sites,
+        pathfinders=parsed_args.pathfinders,
+        mpls_pes=parsed_args.mpls_pes,
+        mpls_ps=parsed_args.mpls_ps,
+    )
+
+    # Load the schemas and templates and fill the caches before timing anything, using a minimal inventory with the same fabrics.
+    run_benchmark(
+        FabricScale(
+            spines=1,
+            leaf_pairs=min(base_scale.leaf_pairs, 1),
+            tenants=min(base_scale.tenants, 1),
+            vlans_per_tenant=min(base_scale.vlans_per_tenant, 2),
+            endpoints_per_leaf_pair=min(base_scale.endpoints_per_leaf_pair, 1),
+            wan_sites=min(base_scale.wan_sites, 1),
+            pathfinders=1,
+            mpls_pes=min(base_scale.mpls_pes, 2),
+            mpls_ps=1,
+        ),
+    )
+
+    runs = []
+    for factor in sorted(int(factor) for factor in parsed_args.scale_factors.split(",")):
+        scale = replace(
+            base_scale,
+            leaf_pairs=base_scale.leaf_pairs * factor,
+            wan_sites=base_scale.wan_sites * factor,
+            mpls_pes=base_scale.mpls_pes * factor,
+        )
+        run = run_benchmark(scale, trace_memory=parsed_args.trace_memory)
+        runs.append(run)
+        print(f"{run['devices']} devices:")  # noqa: T201
+        for stage, stage_stats in run["stages"].items():
+            print(f"  {stage:<30} {stage_stats['seconds']:>8.2f}s {stage_stats['seconds_per_device'] * 1000:>8.1f}ms/device")  # noqa: T201
+
+    results = {"pyavd_version": pyavd_version, "python_version": python_version(), "runs": runs, "scaling_exponents": get_scaling_exponents(runs)}
+    for stage, exponent in results["scaling_exponents"].items():
+        print(f"Scaling exponent of {stage}: {exponent:.2f}")  # noqa: T201
+
+    if parsed_args.output:
+        with parsed_args.output.open(mode="w", encoding="UTF-8") as output_file:
+            dump(results, output_file, indent=2)
+
+    failed = False
+    if parsed_args.baseline:
+        with parsed_args.baseline.open(encoding="UTF-8") as baseline_file:
+            regressions = compare_with_baseline(results, load(baseline_file), parsed_args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")  # noqa: T201
+        failed = bool(regressions)
+
+    if parsed_args.max_scaling_exponent is not None:
+        for stage, exponent in results["scaling_exponents"].items():
+            if exponent > parsed_args.max_scaling_exponent:
+                print(f"Scaling exponent of {stage} is above {parsed_args.max_scaling_exponent}: {exponent:.2f}")  # noqa: T201
+                failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
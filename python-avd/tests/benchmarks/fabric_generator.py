@@ -0,0 +1,329 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""
+Generator of synthetic eos_designs inventories at configurable scale.
+
+The generated inventory contains up to three independent fabrics:
+- An EVPN/VXLAN L3LS data center fabric with spines, MLAG leaf pairs, tenants, VLANs and connected endpoints.
+- A CV Pathfinder WAN fabric with pathfinders and one edge router per WAN site.
+- An MPLS fabric with P routers in a ring and PE routers dual-homed to the P routers.
+
+Each fabric is disabled by setting its number of devices to zero.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from dataclasses import dataclass
+from ipaddress import IPv4Address
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+DC_FABRIC_NAME = "BENCH_DC"
+WAN_FABRIC_NAME = "BENCH_WAN"
+MPLS_FABRIC_NAME = "BENCH_MPLS"
+
+# Each device gets a unique management IP from this range.
+MGMT_NETWORK_START = IPv4Address("192.168.0.0")
+MGMT_GATEWAY = "192.168.255.254"
+# First VLAN id used for tenant networks and maximum number of VLANs supported.
+VLAN_ID_BASE = 100
+MAX_VLANS = 3900
+
+
+@dataclass
+class FabricScale:
+    """
+    Scale parameters of the generated inventory.
+
+    Attributes:
+        spines: Number of spines in the DC fabric.
+        leaf_pairs: Number of MLAG leaf pairs in the DC fabric. The DC fabric is not generated if zero.
+        tenants: Number of tenants in the DC fabric. Each tenant has one VRF.
+        vlans_per_tenant: Number of VLANs per tenant. Half of the VLANs are SVIs in the tenant VRF, the others are L2 VLANs.
+        endpoints_per_leaf_pair: Number of servers connected with a port-channel to each leaf pair, carrying all the VLANs.
+        wan_sites: Number of WAN sites with one edge router each. The WAN fabric is not generated if zero.
+        pathfinders: Number of pathfinders in the WAN fabric.
+        mpls_pes: Number of PE routers in the MPLS fabric. The MPLS fabric is not generated if zero.
+        mpls_ps: Number of P routers in the MPLS fabric.
+    """
+
+    spines: int = 4
+    leaf_pairs: int = 8
+    tenants: int = 4
+    vlans_per_tenant: int = 20
+    endpoints_per_leaf_pair: int = 4
+    wan_sites: int = 0
+    pathfinders: int = 2
+    mpls_pes: int = 0
+    mpls_ps: int = 4
+
+    @property
+    def devices(self) -> int:
+        """Total number of devices in the generated inventory."""
+        dc_devices = self.spines + 2 * self.leaf_pairs if self.leaf_pairs else 0
+        wan_devices = self.pathfinders + self.wan_sites if self.wan_sites else 0
+        mpls_devices = self.mpls_ps + self.mpls_pes if self.mpls_pes else 0
+        return dc_devices + wan_devices + mpls_devices
+
+
+def generate_fabric(scale: FabricScale) -> dict[str, dict]:
+    """
+    Generate the eos_designs inputs for all devices of a synthetic inventory.
+
+    The inputs of each device are a separate copy of the group variables of its fabric, like the hostvars of an Ansible inventory.
+
+    Args:
+        scale: Scale parameters of the inventory.
+
+    Returns:
+        Dictionary of eos_designs inputs keyed by hostname, ready to be used with `pyavd.validate_inputs` and `pyavd.get_avd_facts`.
+    """
+    if scale.tenants * scale.vlans_per_tenant > MAX_VLANS:
+        msg = f"The number of VLANs in the DC fabric must be less than {MAX_VLANS}. Got {scale.tenants * scale.vlans_per_tenant}."
+        raise ValueError(msg)
+
+    mgmt_ips = _mgmt_ip_generator()
+    all_inputs = {}
+    if scale.leaf_pairs:
+        all_inputs.update(_generate_dc_fabric(scale, mgmt_ips))
+    if scale.wan_sites:
+        all_inputs.update(_generate_wan_fabric(scale, mgmt_ips))
+    if scale.mpls_pes:
+        all_inputs.update(_generate_mpls_fabric(scale, mgmt_ips))
+    return all_inputs
+
+
+def _mgmt_ip_generator() -> Iterator[str]:
+    index = 1
+    while True:
+        yield f"{MGMT_NETWORK_START + index}/16"
+        index += 1
+
+
+def _expand_hosts(fabric_vars: dict, node_types: dict[str, list[str]]) -> dict[str, dict]:
+    """Return a copy of the fabric variables for each host, with the node type set."""
+    return {hostname: {**deepcopy(fabric_vars), "type": node_type} for node_type, hostnames in node_types.items() for hostname in hostnames}
+
+
+def _generate_dc_fabric(scale: FabricScale, mgmt_ips: Iterator[str]) -> dict[str, dict]:
+    spines = [f"bench-dc-spine{index}" for index in range(1, scale.spines + 1)]
+    leaf_pairs = [(f"bench-dc-leaf{index}a", f"bench-dc-leaf{index}b") for index in range(1, scale.leaf_pairs + 1)]
+    leaves = [leaf for leaf_pair in leaf_pairs for leaf in leaf_pair]
+
+    tenants = []
+    vlan_id = VLAN_ID_BASE
+    for tenant_index in range(1, scale.tenants + 1):
+        svis = []
+        l2vlans = []
+        for vlan_index in range(scale.vlans_per_tenant):
+            if vlan_index % 2:
+                l2vlans.append({"id": vlan_id, "name": f"L2_VLAN{vlan_id}"})
+            else:
+                svis.append({"id": vlan_id, "name": f"SVI_VLAN{vlan_id}", "ip_address_virtual": f"10.{100 + vlan_id // 256}.{vlan_id % 256}.1/24"})
+            vlan_id += 1
+        tenants.append(
+            {
+                "name": f"TENANT{tenant_index}",
+                "mac_vrf_vni_base": 10000 * tenant_index,
+                "vrfs": [{"name": f"VRF{tenant_index}", "vrf_id": tenant_index, "svis": svis}],
+                "l2vlans": l2vlans,
+            },
+        )
+    all_vlans = f"{VLAN_ID_BASE}-{vlan_id - 1}" if vlan_id > VLAN_ID_BASE else None
+
+    servers = []
+    for leaf_pair in leaf_pairs:
+        for endpoint_index in range(1, scale.endpoints_per_leaf_pair + 1):
+            adapter = {
+                "switches": list(leaf_pair),
+                "switch_ports": [f"Ethernet{10 + endpoint_index}"] * 2,
+                "endpoint_ports": ["eth0", "eth1"],
+                "mode": "trunk",
+                "port_channel": {"mode": "active"},
+            }
+            if all_vlans:
+                adapter["vlans"] = all_vlans
+            servers.append({"name": f"{leaf_pair[0][:-1]}-server{endpoint_index}", "adapters": [adapter]})
+
+    fabric_vars = {
+        "fabric_name": DC_FABRIC_NAME,
+        "mgmt_gateway": MGMT_GATEWAY,
+        "overlay_routing_protocol": "ebgp",
+        "bgp_peer_groups": {
+            "evpn_overlay_peers": {"password": "q+VNViP5i4rVjW1cxFv2wA=="},
+            "ipv4_underlay_peers": {"password": "AQQvKeimxJu+uGQ/yYvv9w=="},
+            "mlag_ipv4_underlay_peer": {"password": "vnEaG8gMeQf3d3cN6PktXQ=="},
+        },
+        "spine": {
+            "defaults": {"platform": "vEOS-lab", "bgp_as": "65000", "loopback_ipv4_pool": "10.254.0.0/24"},
+            "nodes": [{"name": spine, "id": index, "mgmt_ip": next(mgmt_ips)} for index, spine in enumerate(spines, start=1)],
+        },
+        "l3leaf": {
+            "defaults": {
+                "platform": "vEOS-lab",
+                "loopback_ipv4_pool": "10.253.0.0/16",
+                "loopback_ipv4_offset": scale.spines,
+                "vtep_loopback_ipv4_pool": "10.252.0.0/16",
+                "uplink_switches": spines,
+                "uplink_interfaces": [f"Ethernet{index}" for index in range(1, scale.spines + 1)],
+                "uplink_ipv4_pool": "10.0.0.0/9",
+                "mlag_interfaces": ["Ethernet51", "Ethernet52"],
+                "mlag_peer_ipv4_pool": "10.251.0.0/16",
+                "mlag_peer_l3_ipv4_pool": "10.250.0.0/16",
+                "virtual_router_mac_address": "00:1c:73:00:dc:01",
+                "spanning_tree_mode": "mstp",
+            },
+            "node_groups": [
+                {
+                    "group": f"BENCH_DC_LEAF_PAIR{pair_index}",
+                    "bgp_as": str(65100 + pair_index),
+                    "nodes": [
+                        {
+                            "name": leaf,
+                            "id": 2 * pair_index - 1 + leaf_index,
+                            "mgmt_ip": next(mgmt_ips),
+                            # Each leaf uses the spine interface matching its id.
+                            "uplink_switch_interfaces": [f"Ethernet{2 * pair_index - 1 + leaf_index}"] * scale.spines,
+                        }
+                        for leaf_index, leaf in enumerate(leaf_pair)
+                    ],
+                }
+                for pair_index, leaf_pair in enumerate(leaf_pairs, start=1)
+            ],
+        },
+        "tenants": tenants,
+        "servers": servers,
+    }
+    return _expand_hosts(fabric_vars, {"spine": spines, "l3leaf": leaves})
+
+
+def _generate_wan_fabric(scale: FabricScale, mgmt_ips: Iterator[str]) -> dict[str, dict]:
+    pathfinders = [f"bench-wan-pathfinder{index}" for index in range(1, scale.pathfinders + 1)]
+    edges = [f"bench-wan-edge{index}" for index in range(1, scale.wan_sites + 1)]
+
+    fabric_vars = {
+        "fabric_name": WAN_FABRIC_NAME,
+        "mgmt_gateway": MGMT_GATEWAY,
+        "wan_mode": "cv-pathfinder",
+        "wan_route_servers": [{"hostname": pathfinder} for pathfinder in pathfinders],
+        "wan_ipsec_profiles": {"control_plane": {"shared_key": "ABCDEF1234567890"}, "data_plane": {"shared_key": "ABCDEF1234567890666"}},
+        "bgp_peer_groups": {"wan_overlay_peers": {"password": "htm4AZe9mIQOO1uiMuGgYQ==", "listen_range_prefixes": ["10.249.0.0/16"]}},
+        "wan_path_groups": [{"name": "INET", "id": 101}, {"name": "MPLS", "id": 102}],
+        "wan_carriers": [{"name": "ISP", "path_group": "INET", "trusted": True}, {"name": "MPLS-SP", "path_group": "MPLS", "trusted": True}],
+        "cv_pathfinder_regions": [
+            {
+                "name": "BENCH_REGION",
+                "id": 1,
+                "sites": [{"name": f"BENCH_SITE{index}", "id": index} for index in range(1, scale.wan_sites + 1)],
+            },
+        ],
+        "cv_pathfinder_global_sites": [{"name": "BENCH_PATHFINDERS"}],
+        "wan_rr": {
+            "defaults": {
+                "platform": "vEOS-lab",
+                "bgp_as": "65199",
+                "loopback_ipv4_pool": "10.248.0.0/24",
+                "vtep_loopback_ipv4_pool": "10.247.0.0/24",
+                "data_plane_cpu_allocation_max": 1,
+            },
+            "nodes": [
+                {
+                    "name": pathfinder,
+                    "id": index,
+                    "mgmt_ip": next(mgmt_ips),
+                    "cv_pathfinder_site": "BENCH_PATHFINDERS",
+                    "l3_interfaces": [
+                        {"name": "Ethernet1", "wan_carrier": "ISP", "wan_circuit_id": f"pf{index}-inet", "ip_address": f"100.64.{index}.1/31"},
+                        {"name": "Ethernet2", "wan_carrier": "MPLS-SP", "wan_circuit_id": f"pf{index}-mpls", "ip_address": f"100.65.{index}.1/31"},
+                    ],
+                }
+                for index, pathfinder in enumerate(pathfinders, start=1)
+            ],
+        },
+        "wan_router": {
+            "defaults": {
+                "platform": "vEOS-lab",
+                "bgp_as": "65199",
+                "loopback_ipv4_pool": "10.246.0.0/16",
+                "vtep_loopback_ipv4_pool": "10.249.0.0/16",
+                "cv_pathfinder_region": "BENCH_REGION",
+            },
+            "node_groups": [
+                {
+                    "group": f"BENCH_SITE{index}",
+                    "cv_pathfinder_site": f"BENCH_SITE{index}",
+                    "nodes": [
+                        {
+                            "name": edge,
+                            "id": index,
+                            "mgmt_ip": next(mgmt_ips),
+                            "l3_interfaces": [
+                                {"name": "Ethernet1", "wan_carrier": "ISP", "wan_circuit_id": f"site{index}-inet", "ip_address": "dhcp"},
+                                {
+                                    "name": "Ethernet2",
+                                    "wan_carrier": "MPLS-SP",
+                                    "wan_circuit_id": f"site{index}-mpls",
+                                    "ip_address": f"{IPv4Address('100.80.0.0') + 2 * index}/31",
+                                },
+                            ],
+                        },
+                    ],
+                }
+                for index, edge in enumerate(edges, start=1)
+            ],
+        },
+        "tenants": [{"name": "WAN_TENANT", "vrfs": [{"name": "default", "vrf_id": 1}, {"name": "PROD", "vrf_id": 100}]}],
+    }
+    return _expand_hosts(fabric_vars, {"wan_rr": pathfinders, "wan_router": edges})
+
+
+def _generate_mpls_fabric(scale: FabricScale, mgmt_ips: Iterator[str]) -> dict[str, dict]:
+    ps = [f"bench-mpls-p{index}" for index in range(1, scale.mpls_ps + 1)]
+    pes = [f"bench-mpls-pe{index}" for index in range(1, scale.mpls_pes + 1)]
+
+    p2p_links = []
+    # P routers are connected in a ring on interfaces Ethernet1 and Ethernet2. Two P routers only need one link.
+    ring_links = len(ps) if len(ps) > 2 else len(ps) - 1
+    p2p_links.extend({"nodes": [ps[index], ps[(index + 1) % len(ps)]], "interfaces": ["Ethernet1", "Ethernet2"]} for index in range(ring_links))
+    # Each PE router is connected to two P routers. The P router interface matches the PE id.
+    for index, pe in enumerate(pes, start=1):
+        for uplink_index in range(min(2, len(ps))):
+            p = ps[(index + uplink_index) % len(ps)]
+            p2p_links.append({"nodes": [pe, p], "interfaces": [f"Ethernet{uplink_index + 1}", f"Ethernet{10 + index}"]})
+
+    fabric_vars = {
+        "fabric_name": MPLS_FABRIC_NAME,
+        "mgmt_gateway": MGMT_GATEWAY,
+        "underlay_routing_protocol": "isis-sr-ldp",
+        "overlay_routing_protocol": "ibgp",
+        "bgp_as": "65300",
+        "core_interfaces": {"p2p_links_ip_pools": [{"name": "core", "ipv4_pool": "10.128.0.0/10"}], "p2p_links": p2p_links},
+        "p": {
+            "defaults": {"platform": "vEOS-lab", "loopback_ipv4_pool": "10.245.0.0/24", "isis_system_id_prefix": "0000.0000"},
+            "nodes": [{"name": p, "id": index, "mgmt_ip": next(mgmt_ips)} for index, p in enumerate(ps, start=1)],
+        },
+        "pe": {
+            "defaults": {
+                "platform": "vEOS-lab",
+                "loopback_ipv4_pool": "10.244.0.0/16",
+                "isis_system_id_prefix": "0000.0001",
+                "virtual_router_mac_address": "00:1c:73:00:dc:02",
+                "overlay_address_families": ["evpn", "vpn-ipv4"],
+                "mpls_route_reflectors": pes[:2],
+            },
+            "nodes": [{"name": pe, "id": index, "mgmt_ip": next(mgmt_ips)} for index, pe in enumerate(pes, start=1)],
+        },
+        "tenants": [
+            {
+                "name": "MPLS_TENANT",
+                "mac_vrf_id_base": 10000,
+                "vrfs": [{"name": "MPLS_VRF", "vrf_id": 1}],
+                "l2vlans": [{"id": vlan_id, "name": f"MPLS_L2_VLAN{vlan_id}"} for vlan_id in range(VLAN_ID_BASE, VLAN_ID_BASE + 10)],
+            },
+        ],
+    }
+    return _expand_hosts(fabric_vars, {"p": ps, "pe": pes})
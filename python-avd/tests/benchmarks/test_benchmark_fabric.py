@@ -0,0 +1,34 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import pytest
+
+from tests.benchmarks.benchmark_fabric import STAGES, compare_with_baseline, get_scaling_exponents, run_benchmark
+from tests.benchmarks.fabric_generator import FabricScale
+
+
+def test_run_benchmark() -> None:
+    """Test the benchmark on a minimal inventory with all fabrics, which also ensures the generated inputs are valid."""
+    scale = FabricScale(spines=2, leaf_pairs=1, tenants=1, vlans_per_tenant=4, endpoints_per_leaf_pair=1, wan_sites=1, pathfinders=1, mpls_pes=2, mpls_ps=2)
+    result = run_benchmark(scale)
+
+    assert result["devices"] == scale.devices == 10
+    assert tuple(result["stages"]) == STAGES
+    assert all(stats["seconds"] > 0 for stats in result["stages"].values())
+
+
+def test_scaling_exponents_and_baseline() -> None:
+    """Test the scaling exponents and the comparison with a baseline on made up results."""
+
+    def make_run(devices: int, seconds: float) -> dict:
+        return {"devices": devices, "stages": {stage: {"seconds": seconds} for stage in STAGES}}
+
+    linear_runs = [make_run(10, 1.0), make_run(40, 4.0)]
+    quadratic_runs = [make_run(10, 1.0), make_run(40, 16.0)]
+    assert get_scaling_exponents(linear_runs) == {stage: pytest.approx(1.0) for stage in STAGES}
+    assert get_scaling_exponents(quadratic_runs) == {stage: pytest.approx(2.0) for stage in STAGES}
+
+    assert compare_with_baseline({"runs": linear_runs}, {"runs": linear_runs}, tolerance=1.5) == []
+    regressions = compare_with_baseline({"runs": quadratic_runs}, {"runs": linear_runs}, tolerance=1.5)
+    assert len(regressions) == len(STAGES)
+    assert all("with 40 devices" in regression for regression in regressions)
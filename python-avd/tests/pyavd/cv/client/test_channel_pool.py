@@ -0,0 +1,51 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from time import monotonic
+
+import pytest
+
+from pyavd._cv.client.channel_pool import ChannelPool
+
+SERVERS = ["cvp1", "cvp2", "cvp3"]
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_round_robin() -> None:
+    pool = ChannelPool(servers=SERVERS, port=443, ssl_context=True)
+    assert [pool.get_channel()._host for _ in range(6)] == [*SERVERS, *SERVERS]
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_skips_unhealthy_servers() -> None:
+    pool = ChannelPool(servers=SERVERS, port=443, ssl_context=True)
+    pool.mark_unhealthy("cvp2")
+    assert [pool.get_channel()._host for _ in range(4)] == ["cvp1", "cvp3", "cvp1", "cvp3"]
+    assert pool.get_servers() == ["cvp1", "cvp3", "cvp2"]
+
+    # Unhealthy servers are used again after the retry interval.
+    pool.channels[1].failed_at = monotonic() - 60
+    assert [pool.get_channel()._host for _ in range(3)] == SERVERS
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_all_servers_unhealthy() -> None:
+    pool = ChannelPool(servers=SERVERS, port=443, ssl_context=True)
+    for server in SERVERS:
+        pool.mark_unhealthy(server)
+    assert [pool.get_channel()._host for _ in range(3)] == SERVERS
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_channel_records_failed_connection() -> None:
+    # Port 1 on localhost is not expected to accept connections.
+    pool = ChannelPool(servers=["127.0.0.1"], port=1, ssl_context=None)
+    channel = pool.get_channel()
+    with pytest.raises(ConnectionError):
+        await channel.__connect__()
+    assert channel.failed_at is not None
+    assert not pool.is_healthy(channel)
+    pool.close()
@@ -0,0 +1,48 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, ClassVar
+
+import pytest
+
+from pyavd._cv.api.arista.configlet.v1 import Configlet, ConfigletKey, ConfigletStreamRequest, ConfigletStreamResponse
+from pyavd._cv.client import configlet
+from pyavd._cv.client.configlet import ConfigletMixin
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class FakeConfigletServiceStub:
+    """Record the requests sent to GetAll and return one Configlet per filter."""
+
+    requests: ClassVar[list[ConfigletStreamRequest]] = []
+
+    def __init__(self, channel: object) -> None:
+        pass
+
+    async def get_all(self, request: ConfigletStreamRequest, **_kwargs: object) -> AsyncIterator[ConfigletStreamResponse]:
+        self.requests.append(request)
+        for partial_eq_filter in request.partial_eq_filter:
+            yield ConfigletStreamResponse(value=Configlet(key=partial_eq_filter.key, digest="abc"))
+
+
+@pytest.mark.parametrize("include_body", [False, True])
+@pytest.mark.asyncio
+async def test_get_configlets_include_body(monkeypatch: pytest.MonkeyPatch, include_body: bool) -> None:
+    monkeypatch.setattr(configlet, "ConfigletServiceStub", FakeConfigletServiceStub)
+    monkeypatch.setattr(FakeConfigletServiceStub, "requests", [])
+    cv_client = SimpleNamespace(_channel=None, _metadata={})
+
+    configlets = await ConfigletMixin.get_configlets(cv_client, workspace_id="workspace", configlet_ids=["avd-SN1", "avd-SN2"], include_body=include_body)
+
+    assert [cv_configlet.key for cv_configlet in configlets] == [
+        ConfigletKey(workspace_id="workspace", configlet_id="avd-SN1"),
+        ConfigletKey(workspace_id="workspace", configlet_id="avd-SN2"),
+    ]
+    # All configlets are fetched with one request, with the body explicitly included or left out.
+    assert len(FakeConfigletServiceStub.requests) == 1
+    assert FakeConfigletServiceStub.requests[0].filter.include_body is include_body
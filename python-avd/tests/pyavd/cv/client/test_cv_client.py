@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+
+from pyavd._cv.client import CVClient
+from pyavd._cv.client.channel_pool import ChannelPool
+from pyavd._cv.client.exceptions import CVClientException
+
+SERVERS = ["cvp1", "cvp2", "cvp3"]
+
+
+class FakeSession:
+    """Fail requests to the given servers and return the URL for the others."""
+
+    def __init__(self, failing_servers: list[str]) -> None:
+        self.failing_servers = failing_servers
+        self.urls = []
+
+    def request(self, _method: str, url: str, **_kwargs: object) -> str:
+        self.urls.append(url)
+        if any(url.startswith(f"https://{server}/") for server in self.failing_servers):
+            raise RequestsConnectionError(url)
+        return url
+
+
+def get_cv_client(failing_servers: list[str]) -> CVClient:
+    cv_client = CVClient(servers=SERVERS, token="token")  # noqa: S106
+    cv_client._channel_pool = ChannelPool(servers=SERVERS, port=443, ssl_context=True)
+    cv_client._session = FakeSession(failing_servers)
+    return cv_client
+
+
+@pytest.mark.asyncio
+async def test_rest_request_fails_over_to_next_server() -> None:
+    cv_client = get_cv_client(["cvp1"])
+    assert cv_client._rest_request("GET", "/path") == "https://cvp2/path"
+    assert not cv_client._channel_pool.is_healthy(cv_client._channel_pool.channels[0])
+
+    # The unhealthy server is tried last on the next request.
+    assert cv_client._rest_request("GET", "/path") == "https://cvp2/path"
+    assert cv_client._session.urls == ["https://cvp1/path", "https://cvp2/path", "https://cvp2/path"]
+    cv_client._channel_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_rest_request_all_servers_failing() -> None:
+    cv_client = get_cv_client(SERVERS)
+    with pytest.raises(CVClientException, match="Unable to connect to any of the CloudVision servers") as exc_info:
+        cv_client._rest_request("GET", "/path")
+    assert isinstance(exc_info.value.__cause__, RequestsConnectionError)
+    assert cv_client._session.urls == [f"https://{server}/path" for server in SERVERS]
+    cv_client._channel_pool.close()
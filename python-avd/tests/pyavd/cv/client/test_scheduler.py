@@ -0,0 +1,103 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from asyncio import sleep
+from collections.abc import Awaitable, Callable
+
+import pytest
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from pyavd._cv.client.exceptions import CVResourceNotFound, CVTimeoutError
+from pyavd._cv.client.scheduler import AdaptiveScheduler, is_transient_error
+
+TRANSIENT_ERROR_TESTS = [
+    # Format: exception, expected_result
+    pytest.param(GRPCError(Status.RESOURCE_EXHAUSTED, "too many requests"), True, id="resource_exhausted"),
+    pytest.param(GRPCError(Status.UNAVAILABLE, "unavailable"), True, id="unavailable"),
+    pytest.param(GRPCError(Status.DEADLINE_EXCEEDED, "deadline"), True, id="deadline_exceeded"),
+    pytest.param(CVTimeoutError("timeout"), True, id="timeout"),
+    pytest.param(ConnectionRefusedError("refused"), True, id="connection_refused"),
+    pytest.param(GRPCError(Status.INVALID_ARGUMENT, "invalid"), False, id="invalid_argument"),
+    pytest.param(CVResourceNotFound("not found"), False, id="not_found"),
+    pytest.param(ValueError("value"), False, id="value_error"),
+]
+
+
+class Calls:
+    """Record the number of concurrent calls and fail the first attempts of each call with the given exception."""
+
+    def __init__(self, failures: int = 0, exception: Exception | None = None) -> None:
+        self.failures = failures
+        self.exception = exception
+        self.attempts: dict[int, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def call(self, index: int) -> Callable[[], Awaitable[int]]:
+        async def _call() -> int:
+            self.attempts[index] = self.attempts.get(index, 0) + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                # Make later calls complete first.
+                await sleep(0.001 * (10 - index % 10))
+                if self.attempts[index] <= self.failures:
+                    raise self.exception
+                return index
+            finally:
+                self.in_flight -= 1
+
+        return _call
+
+
+@pytest.mark.parametrize(("exception", "expected_result"), TRANSIENT_ERROR_TESTS)
+def test_is_transient_error(exception: Exception, expected_result: bool) -> None:
+    assert is_transient_error(exception) is expected_result
+
+
+@pytest.mark.asyncio
+async def test_scheduler_run_returns_results_in_order() -> None:
+    calls = Calls()
+    scheduler = AdaptiveScheduler(initial_limit=5)
+    assert await scheduler.run([calls.call(index) for index in range(30)]) == list(range(30))
+    assert 1 < calls.max_in_flight <= scheduler.max_limit
+
+
+@pytest.mark.asyncio
+async def test_scheduler_respects_limit() -> None:
+    calls = Calls()
+    scheduler = AdaptiveScheduler(initial_limit=3, max_limit=3)
+    await scheduler.run([calls.call(index) for index in range(20)])
+    assert calls.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_scheduler_retries_transient_errors() -> None:
+    calls = Calls(failures=2, exception=GRPCError(Status.RESOURCE_EXHAUSTED, "too many requests"))
+    scheduler = AdaptiveScheduler(initial_limit=8, backoff_base=0.001)
+    assert await scheduler.run([calls.call(index) for index in range(4)]) == list(range(4))
+    assert all(attempts == 3 for attempts in calls.attempts.values())
+    # The limit is halved on every transient error and only slowly increased again on success.
+    assert scheduler.limit < 8
+
+
+@pytest.mark.asyncio
+async def test_scheduler_raises_after_max_retries() -> None:
+    calls = Calls(failures=10, exception=CVTimeoutError("timeout"))
+    scheduler = AdaptiveScheduler(max_retries=2, backoff_base=0.001)
+    with pytest.raises(CVTimeoutError):
+        await scheduler.run([calls.call(index) for index in range(3)])
+    # The other calls are cancelled once the first call runs out of retries.
+    assert max(calls.attempts.values()) == 3
+
+
+@pytest.mark.asyncio
+async def test_scheduler_raises_non_transient_errors_without_retry() -> None:
+    calls = Calls(failures=1, exception=CVResourceNotFound("not found"))
+    scheduler = AdaptiveScheduler(initial_limit=2)
+    with pytest.raises(CVResourceNotFound):
+        await scheduler.run([calls.call(index) for index in range(10)])
+    assert all(attempts == 1 for attempts in calls.attempts.values())
+    # No new calls are started after the first failure.
+    assert len(calls.attempts) < 10
@@ -0,0 +1,35 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from asyncio import sleep
+from types import SimpleNamespace
+
+import pytest
+
+from pyavd._cv.client.scheduler import AdaptiveScheduler
+from pyavd._cv.client.studio import StudioMixin
+
+
+@pytest.mark.asyncio
+async def test_set_multiple_studio_inputs() -> None:
+    calls = []
+
+    async def set_studio_inputs(**kwargs: object) -> str:
+        calls.append(kwargs)
+        # Make later calls complete first.
+        await sleep(0.001 * (5 - len(calls)))
+        return kwargs["studio_id"]
+
+    cv_client = SimpleNamespace(set_studio_inputs=set_studio_inputs, _scheduler=AdaptiveScheduler(initial_limit=3))
+    studio_inputs = [(f"studio{index}", {"key": index}, ["path"] if index % 2 else None) for index in range(5)]
+
+    result = await StudioMixin.set_multiple_studio_inputs(cv_client, workspace_id="ws", studio_inputs=studio_inputs, timeout=5.0)
+
+    # Results are returned in the order of the given studio inputs.
+    assert result == [f"studio{index}" for index in range(5)]
+    assert sorted(calls, key=lambda call: call["studio_id"]) == [
+        {"studio_id": studio_id, "workspace_id": "ws", "inputs": inputs, "input_path": input_path, "timeout": 5.0}
+        for studio_id, inputs, input_path in studio_inputs
+    ]
@@ -0,0 +1,134 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyavd._cv.api.arista.tag.v2 import (
+    CreatorType,
+    ElementType,
+    Tag,
+    TagAssignment,
+    TagAssignmentConfig,
+    TagAssignmentKey,
+    TagConfig,
+    TagKey,
+)
+from pyavd._cv.client import tag
+from pyavd._cv.client.tag import TagMixin
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class FakeStub:
+    """Record the requests sent to GetAll and return the given values for any request."""
+
+    def __init__(self, values: list) -> None:
+        self.values = values
+        self.requests = []
+
+    def __call__(self, _channel: object) -> FakeStub:
+        return self
+
+    async def get_all(self, request: object, **_kwargs: object) -> AsyncIterator[SimpleNamespace]:
+        self.requests.append(request)
+        for value in self.values:
+            yield SimpleNamespace(value=value)
+
+
+def get_tag_key(workspace_id: str, label: str, value: str) -> TagKey:
+    return TagKey(workspace_id=workspace_id, element_type=ElementType.DEVICE, label=label, value=value)
+
+
+def get_tag_assignment_key(workspace_id: str, label: str, value: str, device_id: str) -> TagAssignmentKey:
+    return TagAssignmentKey(workspace_id=workspace_id, element_type=ElementType.DEVICE, label=label, value=value, device_id=device_id)
+
+
+@pytest.mark.asyncio
+async def test_get_tags(monkeypatch: pytest.MonkeyPatch) -> None:
+    mainline_stub = FakeStub([Tag(key=get_tag_key("", "role", "leaf")), Tag(key=get_tag_key("", "role", "spine"))])
+    workspace_stub = FakeStub(
+        [
+            TagConfig(key=get_tag_key("ws", "role", "spine"), remove=True),
+            TagConfig(key=get_tag_key("ws", "role", "border"), remove=False),
+            # Removing a tag which is not in mainline is ignored.
+            TagConfig(key=get_tag_key("ws", "dc", "DC1"), remove=True),
+        ],
+    )
+    monkeypatch.setattr(tag, "TagServiceStub", mainline_stub)
+    monkeypatch.setattr(tag, "TagConfigServiceStub", workspace_stub)
+    cv_client = SimpleNamespace(_channel=None, _metadata={}, _tag_key=TagMixin._tag_key)
+
+    tags = await TagMixin.get_tags(cv_client, workspace_id="ws", element_type="device", creator_type="user", labels=["role", "dc"])
+
+    assert [(cv_tag.key.label, cv_tag.key.value) for cv_tag in tags] == [("role", "leaf"), ("role", "border")]
+    assert tags[1].creator_type == CreatorType.USER
+    # One request for mainline and one for the workspace, each with one filter per label.
+    assert len(mainline_stub.requests) == 1
+    assert len(workspace_stub.requests) == 1
+    for stub, workspace_id in ((mainline_stub, ""), (workspace_stub, "ws")):
+        tag_filters = stub.requests[0].partial_eq_filter
+        assert [(tag_filter.key.workspace_id, tag_filter.key.label) for tag_filter in tag_filters] == [(workspace_id, "role"), (workspace_id, "dc")]
+
+
+@pytest.mark.asyncio
+async def test_get_tags_mainline(monkeypatch: pytest.MonkeyPatch) -> None:
+    mainline_stub = FakeStub([Tag(key=get_tag_key("", "role", "leaf"))])
+    workspace_stub = FakeStub([])
+    monkeypatch.setattr(tag, "TagServiceStub", mainline_stub)
+    monkeypatch.setattr(tag, "TagConfigServiceStub", workspace_stub)
+    cv_client = SimpleNamespace(_channel=None, _metadata={}, _tag_key=TagMixin._tag_key)
+
+    tags = await TagMixin.get_tags(cv_client, workspace_id="", element_type="device")
+
+    assert [(cv_tag.key.label, cv_tag.key.value) for cv_tag in tags] == [("role", "leaf")]
+    # Without labels, a single filter without label is used. The workspace is not fetched for mainline.
+    assert [tag_filter.key.label for tag_filter in mainline_stub.requests[0].partial_eq_filter] == [None]
+    assert workspace_stub.requests == []
+
+
+@pytest.mark.parametrize(
+    ("labels", "device_ids", "expected_filters"),
+    [
+        pytest.param(["role", "dc"], ["SN1"], [("role", None), ("dc", None)], id="labels"),
+        pytest.param(None, ["SN1", "SN2"], [(None, "SN1"), (None, "SN2")], id="device_ids"),
+        pytest.param(None, None, [(None, None)], id="all"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_tag_assignments(monkeypatch: pytest.MonkeyPatch, labels: list | None, device_ids: list | None, expected_filters: list) -> None:
+    mainline_stub = FakeStub(
+        [
+            TagAssignment(key=get_tag_assignment_key("", "role", "leaf", "SN1")),
+            TagAssignment(key=get_tag_assignment_key("", "dc", "DC1", "SN1")),
+        ],
+    )
+    workspace_stub = FakeStub(
+        [
+            TagAssignmentConfig(key=get_tag_assignment_key("ws", "dc", "DC1", "SN1"), remove=True),
+            TagAssignmentConfig(key=get_tag_assignment_key("ws", "dc", "DC2", "SN1"), remove=False),
+        ],
+    )
+    monkeypatch.setattr(tag, "TagAssignmentServiceStub", mainline_stub)
+    monkeypatch.setattr(tag, "TagAssignmentConfigServiceStub", workspace_stub)
+    cv_client = SimpleNamespace(_channel=None, _metadata={}, _tag_assignment_key=TagMixin._tag_assignment_key)
+
+    tag_assignments = await TagMixin.get_tag_assignments(
+        cv_client, workspace_id="ws", element_type="device", creator_type="user", labels=labels, device_ids=device_ids
+    )
+
+    assert [(assignment.key.label, assignment.key.value, assignment.key.device_id) for assignment in tag_assignments] == [
+        ("role", "leaf", "SN1"),
+        ("dc", "DC2", "SN1"),
+    ]
+    # One request for mainline and one for the workspace, each with one filter per label or device.
+    for stub, workspace_id in ((mainline_stub, ""), (workspace_stub, "ws")):
+        assert len(stub.requests) == 1
+        partial_eq_filter = stub.requests[0].partial_eq_filter
+        assert [(assignment_filter.key.label, assignment_filter.key.device_id) for assignment_filter in partial_eq_filter] == expected_filters
+        assert {assignment_filter.key.workspace_id for assignment_filter in partial_eq_filter} == {workspace_id}
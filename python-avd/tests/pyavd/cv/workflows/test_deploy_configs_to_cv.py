@@ -0,0 +1,82 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from hashlib import sha256
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyavd._cv.api.arista.configlet.v1 import Configlet, ConfigletKey
+from pyavd._cv.workflows.deploy_configs_to_cv import deploy_configlets_to_cv, get_config_file_digest
+from pyavd._cv.workflows.models import CVDevice, CVEosConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WORKSPACE_ID = "workspace"
+CONFIG = "hostname leaf1\n!\ninterface Ethernet1\n   description æøå\n!\nend\n"
+
+
+class FakeCVClient:
+    """Return the given Configlets from get_configlets and record the calls."""
+
+    def __init__(self, configlets: list[Configlet]) -> None:
+        self.configlets = configlets
+        self.get_configlets_calls = []
+        self.uploaded_configlets = []
+
+    async def get_configlets(self, **kwargs: object) -> list[Configlet]:
+        self.get_configlets_calls.append(kwargs)
+        return self.configlets
+
+    async def set_configlets_from_files(self, workspace_id: str, configlets: list[tuple[str, str, str, str]]) -> None:
+        assert workspace_id == WORKSPACE_ID
+        self.uploaded_configlets.extend(configlets)
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> CVEosConfig:
+    config_file = tmp_path / "leaf1.cfg"
+    config_file.write_text(CONFIG, encoding="UTF-8")
+    return CVEosConfig(file=str(config_file), device=CVDevice(hostname="leaf1", serial_number="SN1", _exists_on_cv=True))
+
+
+def get_existing_configlet(digest: str | None, display_name: str = "AVD_leaf1") -> Configlet:
+    """Return a Configlet as returned by get_configlets, i.e. without the body."""
+    return Configlet(
+        key=ConfigletKey(workspace_id=WORKSPACE_ID, configlet_id="avd-SN1"),
+        display_name=display_name,
+        description="Configuration created and uploaded by AVD for leaf1",
+        digest=digest,
+    )
+
+
+def test_get_config_file_digest(config: CVEosConfig) -> None:
+    assert get_config_file_digest(config.file) == sha256(CONFIG.encode("UTF-8")).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_deploy_configlets_to_cv_skips_unchanged_configlet(config: CVEosConfig) -> None:
+    # CloudVision returns the digest in upper case.
+    cv_client = FakeCVClient([get_existing_configlet(sha256(CONFIG.encode("UTF-8")).hexdigest().upper())])
+    await deploy_configlets_to_cv([config], WORKSPACE_ID, cv_client)
+    assert cv_client.get_configlets_calls == [{"workspace_id": WORKSPACE_ID, "configlet_ids": ["avd-SN1"], "include_body": False}]
+    assert cv_client.uploaded_configlets == []
+
+
+@pytest.mark.parametrize(
+    "existing_configlets",
+    [
+        pytest.param([get_existing_configlet(sha256(b"hostname leaf1\n").hexdigest())], id="changed_body"),
+        pytest.param([get_existing_configlet(sha256(CONFIG.encode("UTF-8")).hexdigest(), display_name="OTHER")], id="changed_name"),
+        pytest.param([get_existing_configlet(None)], id="missing_digest"),
+        pytest.param([], id="missing_configlet"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_deploy_configlets_to_cv_uploads_changed_configlet(config: CVEosConfig, existing_configlets: list[Configlet]) -> None:
+    cv_client = FakeCVClient(existing_configlets)
+    await deploy_configlets_to_cv([config], WORKSPACE_ID, cv_client)
+    assert cv_client.uploaded_configlets == [("avd-SN1", "AVD_leaf1", "Configuration created and uploaded by AVD for leaf1", config.file)]
@@ -0,0 +1,40 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import pytest
+
+from pyavd._cv.workflows.deploy_studio_inputs_to_cv import deploy_studio_inputs_to_cv
+from pyavd._cv.workflows.models import CVStudioInputs, CVWorkspace, DeployToCvResult
+
+
+class FakeCVClient:
+    """Record the calls to set_multiple_studio_inputs."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def set_multiple_studio_inputs(self, **kwargs: object) -> None:
+        self.calls.append(kwargs)
+
+
+@pytest.mark.asyncio
+async def test_deploy_studio_inputs_to_cv() -> None:
+    studio_inputs = [CVStudioInputs(studio_id="studio1", inputs={"key": "value"}), CVStudioInputs(studio_id="studio2", inputs=[1], input_path=["list"])]
+    result = DeployToCvResult(workspace=CVWorkspace(id="ws"))
+    cv_client = FakeCVClient()
+
+    await deploy_studio_inputs_to_cv(studio_inputs, result, cv_client)
+
+    assert cv_client.calls == [{"workspace_id": "ws", "studio_inputs": [("studio1", {"key": "value"}, []), ("studio2", [1], ["list"])]}]
+    assert result.deployed_studio_inputs == studio_inputs
+
+
+@pytest.mark.asyncio
+async def test_deploy_studio_inputs_to_cv_nothing_to_do() -> None:
+    result = DeployToCvResult(workspace=CVWorkspace(id="ws"))
+    cv_client = FakeCVClient()
+    await deploy_studio_inputs_to_cv([], result, cv_client)
+    assert cv_client.calls == []
+    assert result.deployed_studio_inputs == []
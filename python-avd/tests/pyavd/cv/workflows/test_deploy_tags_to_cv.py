@@ -0,0 +1,135 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import pytest
+
+from pyavd._cv.api.arista.tag.v2 import Tag, TagAssignment, TagAssignmentKey, TagKey
+from pyavd._cv.workflows.deploy_tags_to_cv import deploy_tags_to_cv
+from pyavd._cv.workflows.models import CVDevice, CVDeviceTag, CVInterfaceTag, CVWorkspace
+
+LEAF1 = CVDevice(hostname="leaf1", serial_number="SN1", _exists_on_cv=True)
+LEAF2 = CVDevice(hostname="leaf2", serial_number="SN2", _exists_on_cv=True)
+LEAF3 = CVDevice(hostname="leaf3", serial_number="SN3", _exists_on_cv=False)
+
+
+class FakeCVClient:
+    """Return the given existing tags and tag assignments and record the changes."""
+
+    def __init__(self, tags: list[tuple[str, str]], tag_assignments: list[tuple[str, str, str, str | None]]) -> None:
+        self.tags = [Tag(key=TagKey(label=label, value=value)) for label, value in tags]
+        self.tag_assignments = [
+            TagAssignment(key=TagAssignmentKey(label=label, value=value, device_id=device_id, interface_id=interface_id))
+            for label, value, device_id, interface_id in tag_assignments
+        ]
+        self.get_tags_kwargs = {}
+        self.get_tag_assignments_kwargs = {}
+        self.added_tags = []
+        self.added_tag_assignments = []
+        self.deleted_tag_assignments = []
+
+    async def get_tags(self, **kwargs: object) -> list[Tag]:
+        self.get_tags_kwargs = kwargs
+        return self.tags
+
+    async def set_tags(self, tags: list[tuple[str, str]], **_kwargs: object) -> None:
+        self.added_tags.extend(tags)
+
+    async def get_tag_assignments(self, **kwargs: object) -> list[TagAssignment]:
+        self.get_tag_assignments_kwargs = kwargs
+        return self.tag_assignments
+
+    async def set_tag_assignments(self, tag_assignments: list[tuple], **_kwargs: object) -> None:
+        self.added_tag_assignments.extend(tag_assignments)
+
+    async def delete_tag_assignments(self, tag_assignments: list[tuple], **_kwargs: object) -> None:
+        self.deleted_tag_assignments.extend(tag_assignments)
+
+
+async def run_deploy_tags_to_cv(tags: list[CVDeviceTag | CVInterfaceTag], cv_client: FakeCVClient, *, strict: bool) -> tuple[list, list, list]:
+    skipped_tags = []
+    deployed_tags = []
+    removed_tags = []
+    await deploy_tags_to_cv(tags, CVWorkspace(id="ws"), strict, skipped_tags, deployed_tags, removed_tags, cv_client)
+    return skipped_tags, deployed_tags, removed_tags
+
+
+DEVICE_TAGS = [
+    CVDeviceTag(label="role", value="leaf", device=LEAF1),
+    CVDeviceTag(label="role", value="leaf", device=LEAF2),
+    CVDeviceTag(label="dc", value="DC1", device=LEAF1),
+    CVDeviceTag(label="role", value="leaf", device=LEAF3),
+    CVDeviceTag(label="pod", value="POD1"),
+]
+EXISTING_TAGS = [("role", "leaf"), ("role", "spine"), ("dc", "DC1")]
+EXISTING_TAG_ASSIGNMENTS = [
+    ("role", "leaf", "SN1", None),
+    ("role", "spine", "SN2", None),
+    ("dc", "DC2", "SN1", None),
+    ("other", "value", "SN1", None),
+    ("role", "spine", "SN4", None),
+]
+
+
+@pytest.mark.asyncio
+async def test_deploy_tags_to_cv() -> None:
+    cv_client = FakeCVClient(EXISTING_TAGS, EXISTING_TAG_ASSIGNMENTS)
+    skipped_tags, deployed_tags, removed_tags = await run_deploy_tags_to_cv(DEVICE_TAGS, cv_client, strict=False)
+
+    # Only the labels of the given tags are fetched.
+    assert cv_client.get_tags_kwargs["labels"] == ["dc", "pod", "role"]
+    assert cv_client.get_tag_assignments_kwargs["labels"] == ["dc", "role"]
+    assert cv_client.get_tag_assignments_kwargs["device_ids"] is None
+
+    assert skipped_tags == [DEVICE_TAGS[3]]
+    # Only the missing tag is created.
+    assert cv_client.added_tags == [("pod", "POD1")]
+    # Tags without device and existing assignments are deployed first.
+    assert deployed_tags == [DEVICE_TAGS[4], DEVICE_TAGS[0], DEVICE_TAGS[1], DEVICE_TAGS[2]]
+    assert cv_client.added_tag_assignments == [("role", "leaf", "SN2", None), ("dc", "DC1", "SN1", None)]
+    # Other assignments with the same labels on the given devices are removed. Other labels and other devices are not touched.
+    assert cv_client.deleted_tag_assignments == [("role", "spine", "SN2", None), ("dc", "DC2", "SN1", None)]
+    assert removed_tags == [CVDeviceTag(label="role", value="spine", device=LEAF2), CVDeviceTag(label="dc", value="DC2", device=LEAF1)]
+
+
+@pytest.mark.asyncio
+async def test_deploy_tags_to_cv_strict() -> None:
+    cv_client = FakeCVClient(EXISTING_TAGS, EXISTING_TAG_ASSIGNMENTS)
+    _skipped_tags, _deployed_tags, removed_tags = await run_deploy_tags_to_cv(DEVICE_TAGS, cv_client, strict=True)
+
+    # All assignments of the given devices are fetched.
+    assert cv_client.get_tag_assignments_kwargs["labels"] is None
+    assert cv_client.get_tag_assignments_kwargs["device_ids"] == ["SN1", "SN2"]
+
+    assert cv_client.added_tag_assignments == [("role", "leaf", "SN2", None), ("dc", "DC1", "SN1", None)]
+    # Any other assignment on the given devices is removed. Other devices are not touched.
+    assert cv_client.deleted_tag_assignments == [("role", "spine", "SN2", None), ("dc", "DC2", "SN1", None), ("other", "value", "SN1", None)]
+    assert removed_tags[2] == CVDeviceTag(label="other", value="value", device=LEAF1)
+
+
+@pytest.mark.asyncio
+async def test_deploy_interface_tags_to_cv() -> None:
+    interface_tags = [
+        CVInterfaceTag(label="peer", value="spine1", device=LEAF1, interface="Ethernet1"),
+        CVInterfaceTag(label="peer", value="spine2", device=LEAF1, interface="Ethernet2"),
+    ]
+    # CloudVision returns the interface id with the serial number appended.
+    cv_client = FakeCVClient(
+        [("peer", "spine1"), ("peer", "spine2")],
+        [("peer", "spine1", "SN1", "Ethernet1@SN1"), ("peer", "spine3", "SN1", "Ethernet2@SN1")],
+    )
+    _skipped_tags, deployed_tags, removed_tags = await run_deploy_tags_to_cv(interface_tags, cv_client, strict=False)
+
+    assert cv_client.added_tags == []
+    assert deployed_tags == interface_tags
+    assert cv_client.added_tag_assignments == [("peer", "spine2", "SN1", "Ethernet2")]
+    assert cv_client.deleted_tag_assignments == [("peer", "spine3", "SN1", "Ethernet2")]
+    assert removed_tags == [CVInterfaceTag(label="peer", value="spine3", device=LEAF1, interface="Ethernet2")]
+
+
+@pytest.mark.asyncio
+async def test_deploy_tags_to_cv_nothing_to_do() -> None:
+    cv_client = FakeCVClient([], [])
+    assert await run_deploy_tags_to_cv([CVDeviceTag(label="role", value="leaf", device=LEAF3)], cv_client, strict=False) == ([DEVICE_TAGS[3]], [], [])
+    assert cv_client.get_tags_kwargs == {}
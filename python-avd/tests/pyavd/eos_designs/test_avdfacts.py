@@ -0,0 +1,33 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from functools import cached_property
+
+from pyavd._eos_designs.avdfacts import AvdFacts
+
+
+class ExampleFacts(AvdFacts):
+    @cached_property
+    def hostname(self) -> str:
+        return "leaf1"
+
+    @cached_property
+    def _internal(self) -> str:
+        return "internal"
+
+
+def test_keys() -> None:
+    assert ExampleFacts.keys() == ["hostname"]
+    assert ExampleFacts.internal_keys() == ["_internal"]
+
+
+def test_keys_copy() -> None:
+    # Modifying the returned lists must not change the keys computed for the class.
+    ExampleFacts.keys().append("other")
+    ExampleFacts.internal_keys().append("_other")
+    assert ExampleFacts.keys() == ["hostname"]
+    assert ExampleFacts.internal_keys() == ["_internal"]
+
+    facts = ExampleFacts(hostvars={}, shared_utils=None)
+    assert facts.render() == {"hostname": "leaf1"}
+    assert facts.get("other") is None
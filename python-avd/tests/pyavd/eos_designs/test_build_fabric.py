@@ -0,0 +1,70 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from copy import deepcopy
+from pathlib import Path
+
+from pyavd import DeviceBuildResult, build_fabric, validate_structured_config
+
+
+def test_build_fabric(all_inputs: dict, structured_configs: dict) -> None:
+    """Test build_fabric."""
+    results = {result.hostname: result for result in build_fabric(all_inputs, max_workers=2, include_device_doc=False)}
+
+    assert results.keys() == all_inputs.keys()
+    for hostname, result in results.items():
+        # The structured config returned from build_fabric has been converted during validation.
+        expected_structured_config = structured_configs[hostname]
+        validate_structured_config(expected_structured_config)
+
+        assert isinstance(result, DeviceBuildResult)
+        assert result.inputs_validation_result.failed is False
+        assert result.structured_config == expected_structured_config
+        assert result.structured_config_validation_result.failed is False
+        assert f"hostname {hostname}\n" in result.device_config
+        assert result.device_doc == ""
+
+
+def test_build_fabric_incremental(all_inputs: dict, structured_configs: dict, tmp_path: Path) -> None:
+    """Test build_fabric with a cache directory, only rebuilding devices affected by a change in inputs."""
+    fabric_inputs = {hostname: deepcopy(inputs) for hostname, inputs in all_inputs.items() if inputs.get("fabric_name") == "FLOW_TRACKING_TESTS"}
+    build_kwargs = {"max_workers": 2, "include_device_config": False, "include_device_doc": False, "cache_dir": tmp_path}
+
+    results = {result.hostname: result for result in build_fabric(deepcopy(fabric_inputs), **build_kwargs)}
+    assert results.keys() == fabric_inputs.keys()
+    assert not any(result.cached for result in results.values())
+
+    results = {result.hostname: result for result in build_fabric(deepcopy(fabric_inputs), **build_kwargs)}
+    assert results.keys() == fabric_inputs.keys()
+    assert all(result.cached for result in results.values())
+    for hostname, result in results.items():
+        expected_structured_config = structured_configs[hostname]
+        validate_structured_config(expected_structured_config)
+        assert result.structured_config == expected_structured_config
+
+    # Changing an input which only affects the structured config of the device itself must only rebuild that device.
+    fabric_inputs["flow-tracking-tests-leaf1"]["mac_address_table"] = {"aging_time": 1234}
+    results = {result.hostname: result for result in build_fabric(deepcopy(fabric_inputs), **build_kwargs)}
+    assert [hostname for hostname, result in results.items() if not result.cached] == ["flow-tracking-tests-leaf1"]
+    assert results["flow-tracking-tests-leaf1"].structured_config["mac_address_table"] == {"aging_time": 1234}
+
+
+def test_build_fabric_incremental_new_vtep(all_inputs: dict, structured_configs: dict, tmp_path: Path) -> None:
+    """Test that a device becoming a VTEP rebuilds the HER flood lists of all other VTEPs, even if their own inputs are unchanged."""
+    fabric_inputs = {hostname: deepcopy(inputs) for hostname, inputs in all_inputs.items() if hostname.startswith("OVERLAY_ROUTING_PROTOCOL_HER_L3LEAF")}
+    build_kwargs = {"max_workers": 2, "include_device_config": False, "include_device_doc": False, "cache_dir": tmp_path}
+
+    # Only changing the inputs of leaf2, so the fingerprints of the other devices are unchanged when leaf2 becomes a VTEP.
+    leaf2 = "OVERLAY_ROUTING_PROTOCOL_HER_L3LEAF2"
+    leaf2_inputs = deepcopy(fabric_inputs[leaf2])
+    next(node for node in leaf2_inputs["l3leaf"]["nodes"] if node["name"] == leaf2)["vtep"] = False
+    results = {result.hostname: result for result in build_fabric({**deepcopy(fabric_inputs), leaf2: leaf2_inputs}, **build_kwargs)}
+    assert not any(result.cached for result in results.values())
+    assert results["OVERLAY_ROUTING_PROTOCOL_HER_L3LEAF1"].structured_config != structured_configs["OVERLAY_ROUTING_PROTOCOL_HER_L3LEAF1"]
+
+    results = {result.hostname: result for result in build_fabric(deepcopy(fabric_inputs), **build_kwargs)}
+    assert not any(result.cached for result in results.values())
+    for hostname, result in results.items():
+        expected_structured_config = structured_configs[hostname]
+        validate_structured_config(expected_structured_config)
+        assert result.structured_config == expected_structured_config
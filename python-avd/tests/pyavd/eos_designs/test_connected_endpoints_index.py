@@ -0,0 +1,120 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import re
+from copy import deepcopy
+
+from pyavd._eos_designs.shared_utils import SharedUtils
+from pyavd._eos_designs.shared_utils.connected_endpoints_index import ConnectedEndpointsIndex
+from pyavd.avd_schema_tools import EosDesignsAvdSchemaTools
+from pyavd.get_avd_facts import _create_avd_switch_facts_instances
+
+SERVERS_KEY = {"key": "servers", "type": "server"}
+INPUTS = {
+    "port_profiles": [
+        {"profile": "PARENT", "switches": ["leaf2"]},
+        {"profile": "CHILD", "parent_profile": "PARENT", "mode": "trunk"},
+    ],
+    "servers": [
+        {"name": "server1", "adapters": [{"switches": ["leaf1", "leaf2"], "switch_ports": ["Ethernet1", "Ethernet1"]}]},
+        {
+            "name": "server2",
+            "adapters": [
+                {"switches": ["leaf2", "leaf2"], "switch_ports": ["Ethernet2", "Ethernet3"]},
+                {"profile": "CHILD", "switch_ports": ["Ethernet4"]},
+            ],
+        },
+    ],
+    "network_ports": [
+        {"switches": ["leaf[12]"], "switch_ports": ["Ethernet10"]},
+        {"switches": ["leaf"], "switch_ports": ["Ethernet11"]},
+        {"profile": "PARENT", "switch_ports": ["Ethernet12"]},
+    ],
+}
+
+
+def get_shared_utils(hostname: str, inputs: dict, index: ConnectedEndpointsIndex) -> SharedUtils:
+    hostvars = {**inputs, "inventory_hostname": hostname, "avd_connected_endpoints_index": index}
+    return SharedUtils(hostvars=hostvars, templar=None, schema=EosDesignsAvdSchemaTools().avdschema)
+
+
+def test_connected_endpoint_adapters() -> None:
+    index = ConnectedEndpointsIndex()
+    inputs = deepcopy(INPUTS)
+    leaf1_adapters = index.connected_endpoint_adapters(get_shared_utils("leaf1", inputs, index), SERVERS_KEY)
+    assert [(endpoint["name"], adapter_index) for endpoint, adapter_index, _adapter in leaf1_adapters] == [("server1", 0)]
+    assert leaf1_adapters[0][2]["context"] == "servers[name=server1].adapters[0]"
+
+    # Switches listed twice only give one entry. Switches inherited from the parent profile are included.
+    leaf2_adapters = index.connected_endpoint_adapters(get_shared_utils("leaf2", inputs, index), SERVERS_KEY)
+    assert [(endpoint["name"], adapter_index) for endpoint, adapter_index, _adapter in leaf2_adapters] == [("server1", 0), ("server2", 0), ("server2", 1)]
+
+    assert index.connected_endpoint_adapters(get_shared_utils("leaf3", inputs, index), SERVERS_KEY) == []
+
+    # The inputs are not updated.
+    assert inputs == INPUTS
+
+
+def test_network_ports() -> None:
+    index = ConnectedEndpointsIndex()
+    leaf1 = get_shared_utils("leaf1", deepcopy(INPUTS), index)
+    leaf2 = get_shared_utils("leaf2", deepcopy(INPUTS), index)
+    # The regex must match the full hostname.
+    assert [port_index for port_index, _network_port in index.network_ports(leaf1)] == [0]
+    assert [port_index for port_index, _network_port in index.network_ports(leaf2)] == [0, 2]
+    assert [port_index for port_index, _network_port in index.network_ports(leaf2, include_profile_switches=False)] == [0]
+    assert index.network_ports(leaf2)[1][1]["context"] == "network_ports[2]"
+
+
+def test_index_is_shared_by_devices_with_same_inputs() -> None:
+    index = ConnectedEndpointsIndex()
+    # Each device has its own copy of the inputs, like in Ansible or when the inputs are read per device.
+    leaf1 = get_shared_utils("leaf1", deepcopy(INPUTS), index)
+    leaf2 = get_shared_utils("leaf2", deepcopy(INPUTS), index)
+    leaf1_adapters = index.connected_endpoint_adapters(leaf1, SERVERS_KEY)
+    leaf2_adapters = index.connected_endpoint_adapters(leaf2, SERVERS_KEY)
+    index.network_ports(leaf1)
+    index.network_ports(leaf2)
+    assert len(index._adapters_per_switch["servers"]) == 1
+    assert len(index._network_ports) == 1
+    # The adapter connected to both switches is the same indexed object.
+    assert leaf1_adapters[0][2] is leaf2_adapters[0][2]
+
+    # A device with other inputs gets its own index.
+    other_inputs = deepcopy(INPUTS)
+    other_inputs["servers"][0]["adapters"][0]["switches"] = ["leaf3", "leaf2"]
+    leaf3 = get_shared_utils("leaf3", other_inputs, index)
+    leaf3_adapters = index.connected_endpoint_adapters(leaf3, SERVERS_KEY)
+    assert len(index._adapters_per_switch["servers"]) == 2
+    assert [(endpoint["name"], adapter_index) for endpoint, adapter_index, _adapter in leaf3_adapters] == [("server1", 0)]
+    # The index of the first inputs is unchanged.
+    assert index.connected_endpoint_adapters(leaf1, SERVERS_KEY) == leaf1_adapters
+
+
+def test_index_matches_scan_of_all_endpoints(all_inputs: dict) -> None:
+    """The index must give the same adapters and network ports as the previous scan of all endpoints for every device."""
+    avd_switch_facts = _create_avd_switch_facts_instances(all_inputs)
+    for facts in avd_switch_facts.values():
+        shared_utils: SharedUtils = facts["switch"].shared_utils
+        hostname = shared_utils.hostname
+        index = shared_utils.connected_endpoints_index
+        for connected_endpoints_key in shared_utils.connected_endpoints_keys:
+            scanned_adapters = [
+                (connected_endpoint["name"], adapter_index)
+                for connected_endpoint in shared_utils.hostvars[connected_endpoints_key["key"]]
+                for adapter_index, adapter in enumerate(connected_endpoint.get("adapters", []))
+                if hostname
+                in shared_utils.get_merged_adapter_settings(
+                    {**adapter, "context": f"{connected_endpoints_key['key']}[name={connected_endpoint['name']}].adapters[{adapter_index}]"}
+                ).get("switches", [])
+            ]
+            indexed_adapters = index.connected_endpoint_adapters(shared_utils, connected_endpoints_key)
+            assert [(connected_endpoint["name"], adapter_index) for connected_endpoint, adapter_index, _adapter in indexed_adapters] == scanned_adapters
+
+        scanned_network_ports = [
+            port_index
+            for port_index, network_port in enumerate(shared_utils.hostvars.get("network_ports") or [])
+            if any(re.match(rf"^{switch_regex}$", hostname) for switch_regex in network_port.get("switches", []))
+        ]
+        indexed_network_ports = index.network_ports(shared_utils, include_profile_switches=False)
+        assert [port_index for port_index, _network_port in indexed_network_ports] == scanned_network_ports
@@ -0,0 +1,42 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import pytest
+
+from pyavd._eos_designs.shared_utils.fabric_facts import FabricFacts
+from pyavd._errors import AristaAvdInvalidInputsError
+from pyavd._utils import get
+
+AVD_SWITCH_FACTS = {
+    "spine1": {"switch": {"type": "spine", "evpn_role": "server", "mpls_overlay_role": "server"}},
+    "leaf1": {"switch": {"type": "l3leaf", "evpn_role": "client", "mpls_overlay_role": "client"}},
+    "leaf2": {"switch": {"type": "l3leaf", "evpn_role": "client"}},
+    "l2leaf1": {"switch": {"type": "l2leaf"}},
+}
+
+
+def test_get_peer_facts() -> None:
+    fabric_facts = FabricFacts(AVD_SWITCH_FACTS)
+    assert fabric_facts.hostnames == ["spine1", "leaf1", "leaf2", "l2leaf1"]
+    for hostname in AVD_SWITCH_FACTS:
+        # Same result as the previous lookup with the dotted path.
+        assert fabric_facts.get_peer_facts(hostname) is get({"avd_switch_facts": AVD_SWITCH_FACTS}, f"avd_switch_facts..{hostname}..switch", separator="..")
+    assert fabric_facts.get_peer_facts("leaf1") is AVD_SWITCH_FACTS["leaf1"]["switch"]
+    # Hostnames with dots are supported.
+    assert FabricFacts({"leaf1.example.com": {"switch": {"type": "l3leaf"}}}).get_peer_facts("leaf1.example.com") == {"type": "l3leaf"}
+
+
+def test_get_peer_facts_missing() -> None:
+    fabric_facts = FabricFacts(AVD_SWITCH_FACTS)
+    assert fabric_facts.get_peer_facts("leaf3", required=False) is None
+    with pytest.raises(AristaAvdInvalidInputsError, match="Facts not found for node 'leaf3'"):
+        fabric_facts.get_peer_facts("leaf3")
+
+
+def test_devices_by_role() -> None:
+    avd_switch_facts = {}
+    fabric_facts = FabricFacts(avd_switch_facts)
+    # The dict is filled after creating the instance, like in get_avd_facts.
+    avd_switch_facts.update(AVD_SWITCH_FACTS)
+    assert fabric_facts.devices_by_evpn_role == {"server": ["spine1"], "client": ["leaf1", "leaf2"]}
+    assert fabric_facts.devices_by_mpls_overlay_role == {"server": ["spine1"], "client": ["leaf1"]}
@@ -2,6 +2,7 @@
 # Use of this source code is governed by the Apache License 2.0
 # that can be found in the LICENSE file.
 from pyavd import get_avd_facts
+from pyavd._eos_designs.shared_utils.fabric_facts import FabricFacts
 
 
 def test_get_avd_facts(all_inputs: dict) -> None:
@@ -16,3 +17,8 @@ def test_get_avd_facts(all_inputs: dict) -> None:
     assert isinstance(avd_facts["avd_overlay_peers"], dict)
     assert "avd_topology_peers" in avd_facts
     assert isinstance(avd_facts["avd_topology_peers"], dict)
+    # The FabricFacts instance shared by the structured config of all devices looks up the rendered facts.
+    assert isinstance(avd_facts["avd_fabric_facts"], FabricFacts)
+    assert avd_facts["avd_fabric_facts"].hostnames == list(avd_facts["avd_switch_facts"])
+    for hostname, facts in avd_facts["avd_switch_facts"].items():
+        assert avd_facts["avd_fabric_facts"].get_peer_facts(hostname) is facts["switch"]
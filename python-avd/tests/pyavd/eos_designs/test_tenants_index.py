@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from copy import deepcopy
+from types import SimpleNamespace
+
+from pyavd._eos_designs.shared_utils.tenants_index import TenantsIndex, VlansIndex
+from pyavd.get_avd_facts import _create_avd_switch_facts_instances
+from pyavd.j2filters import natural_sort
+
+NETWORK_SERVICES_KEYS = [{"name": "tenants"}, {"name": "tenants_b"}]
+INPUTS = {
+    "tenants": [
+        {
+            "name": "TENANT_A",
+            "l2vlans": [{"id": 20, "name": "V20", "tags": ["blue"]}, {"id": 3, "name": "V3"}, {"id": 100, "name": "V100", "tags": ["red", "blue"]}],
+            "vrfs": [
+                {"name": "VRF10", "svis": [{"id": 110, "name": "S110"}, {"id": 11, "name": "S11"}]},
+                {"name": "VRF2", "svis": []},
+            ],
+        },
+        {"name": "TENANT_B", "l2vlans": [{"id": 30, "name": "V30", "tags": ["red"]}]},
+    ],
+    "tenants_b": [{"name": "TENANT_A", "l2vlans": [{"id": 40, "name": "V40"}]}],
+}
+
+
+def get_shared_utils(inputs: dict, filter_tenants: list) -> SimpleNamespace:
+    return SimpleNamespace(hostvars=inputs, network_services_keys=NETWORK_SERVICES_KEYS, filter_tenants=filter_tenants)
+
+
+def test_vlans_index() -> None:
+    vlans = INPUTS["tenants"][0]["l2vlans"] + [{"id": 20, "name": "V20_DUPLICATE", "tags": ["red"]}]
+    index = VlansIndex(vlans)
+    # Sorted on the vlan id, keeping the order of the inputs for the same vlan id.
+    assert [vlan["name"] for vlan in index.get(frozenset(range(4096)))] == ["V3", "V20", "V20_DUPLICATE", "V100"]
+    assert [vlan["name"] for vlan in index.get(frozenset([3, 100, 200]))] == ["V3", "V100"]
+    assert [vlan["name"] for vlan in index.get(frozenset([3, 100]), ["all"])] == ["V3", "V100"]
+    # Vlans without tags have the tag "all".
+    assert [vlan["name"] for vlan in index.get(frozenset([3, 20, 100]), ["red", "all"])] == ["V3", "V20", "V20_DUPLICATE", "V100"]
+    # All vlans with a matching vlan id are returned, even if only one of them has the tag.
+    assert [vlan["name"] for vlan in index.get(frozenset([3, 20, 100]), ["red"])] == ["V20", "V20_DUPLICATE", "V100"]
+    assert index.get(frozenset([3, 20, 100]), ["green"]) == []
+    # The vlans are not copied.
+    assert index.get(frozenset([3]))[0] is vlans[1]
+
+
+def test_get_tenants() -> None:
+    index = TenantsIndex()
+    inputs = deepcopy(INPUTS)
+    indexed_tenants = index.get_tenants(get_shared_utils(inputs, ["all"]))
+    # In the order of the network services keys and of the inputs.
+    assert [indexed_tenant.tenant for indexed_tenant in indexed_tenants] == [*inputs["tenants"], *inputs["tenants_b"]]
+    # The VRFs are sorted.
+    assert [indexed_vrf.vrf["name"] for indexed_vrf in indexed_tenants[0].vrfs] == ["VRF2", "VRF10"]
+    assert [svi["name"] for svi in indexed_tenants[0].vrfs[1].svis.get(frozenset([11, 110]))] == ["S11", "S110"]
+    assert indexed_tenants[2].l2vlans.get(frozenset([40]))[0] is inputs["tenants_b"][0]["l2vlans"][0]
+
+    tenant_a = index.get_tenants(get_shared_utils(inputs, ["TENANT_A", "TENANT_C", "TENANT_A"]))
+    assert tenant_a == [indexed_tenants[0], indexed_tenants[2]]
+    assert index.get_tenants(get_shared_utils(inputs, ["TENANT_B"])) == [indexed_tenants[1]]
+    assert index.get_tenants(get_shared_utils(inputs, [])) == []
+
+    # The inputs are not updated.
+    assert inputs == INPUTS
+
+
+def test_index_is_shared_by_devices_with_same_inputs() -> None:
+    index = TenantsIndex()
+    # Each device has its own copy of the inputs, like in Ansible or when the inputs are read per device.
+    indexed_tenants = index.get_tenants(get_shared_utils(deepcopy(INPUTS), ["all"]))
+    assert index.get_tenants(get_shared_utils(deepcopy(INPUTS), ["all"])) is indexed_tenants
+    assert len(index._tenants) == 1
+
+    # A device with other inputs gets its own index.
+    other_inputs = deepcopy(INPUTS)
+    other_inputs["tenants"][1]["l2vlans"][0]["id"] = 31
+    other_indexed_tenants = index.get_tenants(get_shared_utils(other_inputs, ["all"]))
+    assert len(index._tenants) == 2
+    assert other_indexed_tenants[1].l2vlans.get(frozenset([30, 31]))[0]["id"] == 31
+    # The index of the first inputs is unchanged.
+    assert index.get_tenants(get_shared_utils(deepcopy(INPUTS), ["all"])) is indexed_tenants
+
+
+def test_index_matches_scan_of_all_tenants(all_inputs: dict) -> None:
+    """The index must give the same tenants, VRFs, l2vlans and SVIs as the previous scan of all tenants for every device."""
+    avd_switch_facts = _create_avd_switch_facts_instances(all_inputs)
+    index: TenantsIndex = next(iter(avd_switch_facts.values()))["switch"]._hostvars["avd_tenants_index"]
+    checked_devices = 0
+    for facts in avd_switch_facts.values():
+        shared_utils = facts["switch"].shared_utils
+        if not shared_utils.any_network_services:
+            continue
+
+        checked_devices += 1
+        filter_tenants = shared_utils.filter_tenants
+        filter_tags = shared_utils.filter_tags
+        accepted_vlans = shared_utils.accepted_vlans
+        scanned_tenants = [
+            tenant
+            for network_services_key in shared_utils.network_services_keys
+            for tenant in shared_utils.hostvars[network_services_key["name"]]
+            if tenant["name"] in filter_tenants or "all" in filter_tenants
+        ]
+        indexed_tenants = index.get_tenants(shared_utils)
+        assert [indexed_tenant.tenant for indexed_tenant in indexed_tenants] == scanned_tenants
+
+        for tenant, indexed_tenant in zip(scanned_tenants, indexed_tenants, strict=True):
+            scanned_l2vlans = [
+                l2vlan
+                for l2vlan in natural_sort(tenant.get("l2vlans", []), "id")
+                if int(l2vlan["id"]) in accepted_vlans and ("all" in filter_tags or set(l2vlan.get("tags", ["all"])).intersection(filter_tags))
+            ]
+            indexed_l2vlans = [
+                l2vlan
+                for l2vlan in indexed_tenant.l2vlans.get(accepted_vlans, filter_tags)
+                if "all" in filter_tags or set(l2vlan.get("tags", ["all"])).intersection(filter_tags)
+            ]
+            assert indexed_l2vlans == scanned_l2vlans
+
+            scanned_vrfs = natural_sort(tenant.get("vrfs", []), "name")
+            assert [indexed_vrf.vrf for indexed_vrf in indexed_tenant.vrfs] == scanned_vrfs
+            for vrf, indexed_vrf in zip(scanned_vrfs, indexed_tenant.vrfs, strict=True):
+                scanned_svis = [svi for svi in natural_sort(vrf.get("svis", []), "id") if int(svi["id"]) in accepted_vlans]
+                assert indexed_vrf.svis.get(accepted_vlans) == scanned_svis
+
+    assert checked_devices
+    # Devices with the same inputs share the same index.
+    assert len(index._tenants) < len(avd_switch_facts)
@@ -0,0 +1,45 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from types import SimpleNamespace
+
+from pyavd._eos_designs.eos_designs_facts.uplink_peers_index import UplinkPeersIndex
+from pyavd.get_avd_facts import _create_avd_switch_facts_instances
+
+
+def test_uplink_peers_index() -> None:
+    avd_switch_facts = {}
+    index = UplinkPeersIndex(avd_switch_facts)
+    # The dict is filled after creating the index, like in get_avd_facts.
+    avd_switch_facts.update(
+        {
+            "leaf1": {"switch": SimpleNamespace(uplink_peers=["spine1", "spine2"])},
+            "spine1": {"switch": SimpleNamespace(uplink_peers=[])},
+            "leaf2": {"switch": SimpleNamespace(uplink_peers=["spine2", "spine1"])},
+            "l2leaf1": {"switch": SimpleNamespace(uplink_peers=["leaf1"])},
+        },
+    )
+    assert index.downstream_switches("spine1") == ["leaf1", "leaf2"]
+    assert index.downstream_switches("spine2") == ["leaf1", "leaf2"]
+    assert index.downstream_switches("leaf1") == ["l2leaf1"]
+    assert index.downstream_switches("l2leaf1") == []
+    assert index.downstream_switches("unknown") == []
+
+
+def test_uplink_peers_index_matches_fabric_scan(all_inputs: dict) -> None:
+    """The index must give the same switches in the same order as the previous scan of all fabric devices."""
+    avd_switch_facts = _create_avd_switch_facts_instances(all_inputs)
+    # All instances share the same index through hostvars.
+    index: UplinkPeersIndex = next(iter(avd_switch_facts.values()))["switch"]._hostvars["avd_uplink_peers_index"]
+
+    downstream_switches_found = False
+    for hostname, facts in avd_switch_facts.items():
+        scanned_switches = [
+            fabric_switch
+            for fabric_switch in facts["switch"].shared_utils.all_fabric_devices
+            if hostname in avd_switch_facts[fabric_switch]["switch"].uplink_peers
+        ]
+        assert index.downstream_switches(hostname) == scanned_switches
+        downstream_switches_found = downstream_switches_found or bool(scanned_switches)
+
+    assert downstream_switches_found
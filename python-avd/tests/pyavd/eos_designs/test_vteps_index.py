@@ -0,0 +1,47 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from pyavd._eos_designs.eos_designs_facts.vteps_index import get_avd_vteps
+from pyavd.j2filters import range_expand
+
+
+def test_get_avd_vteps() -> None:
+    avd_switch_facts = {
+        "leaf10": {"switch": {"vtep_ip": "10.0.0.10", "dc_name": "DC2", "vlans": "10,20"}},
+        "spine1": {"switch": {"vlans": "10-30"}},
+        "leaf2a": {"switch": {"vtep_ip": "10.0.0.2", "dc_name": "DC1", "vlans": "10-12"}},
+        "leaf2b": {"switch": {"vtep_ip": "10.0.0.2", "dc_name": "DC1", "vlans": "10-12"}},
+        "leaf3": {"switch": {"vtep_ip": "10.0.0.3"}},
+    }
+    assert get_avd_vteps(avd_switch_facts) == {
+        # Sorted naturally on the VTEP IP, keeping the order of the devices for the same VTEP IP.
+        "vteps": [
+            {"hostname": "leaf2a", "vtep_ip": "10.0.0.2", "dc_name": "DC1"},
+            {"hostname": "leaf2b", "vtep_ip": "10.0.0.2", "dc_name": "DC1"},
+            {"hostname": "leaf3", "vtep_ip": "10.0.0.3", "dc_name": None},
+            {"hostname": "leaf10", "vtep_ip": "10.0.0.10", "dc_name": "DC2"},
+        ],
+        "vlans": {
+            "10": [0, 1, 3],
+            "11": [0, 1],
+            "12": [0, 1],
+            "20": [3],
+        },
+    }
+
+
+def test_get_avd_vteps_without_vteps() -> None:
+    assert get_avd_vteps({"spine1": {"switch": {"vlans": "10"}}}) == {"vteps": [], "vlans": {}}
+
+
+def test_get_avd_vteps_matches_avd_facts(avd_facts: dict) -> None:
+    """The VTEP index must give each VTEP exactly the vlans of its facts."""
+    avd_vteps = avd_facts["avd_vteps"]
+    vteps_per_vlan = {vlan: {avd_vteps["vteps"][index]["hostname"] for index in indexes} for vlan, indexes in avd_vteps["vlans"].items()}
+    for hostname, facts in avd_facts["avd_switch_facts"].items():
+        if facts["switch"].get("vtep_ip") is None:
+            assert hostname not in {vtep["hostname"] for vtep in avd_vteps["vteps"]}
+            continue
+
+        vlans = {vlan for vlan, hostnames in vteps_per_vlan.items() if hostname in hostnames}
+        assert vlans == {str(int(vlan)) for vlan in range_expand(facts["switch"].get("vlans", []))}
@@ -121,6 +121,15 @@ class TestNaturalSortFilter:
                 does_not_raise(),
                 id="list-of-dict-with-sort-key-respect-case",
             ),
+            pytest.param(
+                ["Ethernet1", "Ethernet2", "Ethernet10", "Ethernet10"],
+                None,
+                False,
+                True,
+                ["Ethernet1", "Ethernet2", "Ethernet10", "Ethernet10"],
+                does_not_raise(),
+                id="already-sorted-list",
+            ),
             pytest.param(
                 [
                     {"name": "ACL-10", "counters_per_entry": True},
@@ -142,3 +151,9 @@ class TestNaturalSortFilter:
         with expected_raise:
             resp = natural_sort(item_to_natural_sort, sort_key, strict=strict, ignore_case=ignore_case)
             assert resp == sorted_list
+
+    def test_natural_sort_returns_new_list(self) -> None:
+        already_sorted = ["Ethernet1", "Ethernet2", "Ethernet10"]
+        resp = natural_sort(already_sorted)
+        assert resp == already_sorted
+        assert resp is not already_sorted
@@ -9,6 +9,7 @@ from typing import Any
 import pytest
 
 from pyavd.j2filters import range_expand
+from pyavd.j2filters.range_expand import range_expand_to_int_set
 
 RANGE_TO_EXPAND_INVALID_VALUES = [
     pytest.param(True, TypeError, "value must be of type list or str, got <class 'bool'>", id="Wrong input type - bool"),
@@ -66,6 +67,15 @@ RANGE_TO_EXPAND_VALID_TESTS = [
     pytest.param("Gi1/0/1-2", ["Gi1/0/1", "Gi1/0/2"]),
 ]
 
+RANGE_TO_EXPAND_TO_INT_SET_VALID_TESTS = [
+    # (<input>, <expected_output>)
+    pytest.param("", frozenset()),
+    pytest.param([], frozenset()),
+    pytest.param("1-3", frozenset({1, 2, 3})),
+    pytest.param("1-3,10,2", frozenset({1, 2, 3, 10})),
+    pytest.param(["1-2", "4", "2-3"], frozenset({1, 2, 3, 4})),
+]
+
 
 class TestRangeExpandFilter:
     @pytest.mark.parametrize(("input_value", "expected_raise", "expected_raise_message"), RANGE_TO_EXPAND_INVALID_VALUES)
@@ -77,3 +87,25 @@ class TestRangeExpandFilter:
     def test_range_expand_valid(self, range_to_expand: list | str, expected_output: list) -> None:
         resp = range_expand(range_to_expand)
         assert resp == expected_output
+
+    def test_range_expand_returns_new_list(self) -> None:
+        resp = range_expand("Ethernet1-2")
+        resp.append("Ethernet3")
+        assert range_expand("Ethernet1-2") == ["Ethernet1", "Ethernet2"]
+
+    @pytest.mark.parametrize(("range_to_expand", "expected_output"), RANGE_TO_EXPAND_TO_INT_SET_VALID_TESTS)
+    def test_range_expand_to_int_set_valid(self, range_to_expand: list | str, expected_output: frozenset) -> None:
+        resp = range_expand_to_int_set(range_to_expand)
+        assert resp == expected_output
+
+    @pytest.mark.parametrize(
+        ("input_value", "expected_raise"),
+        [
+            pytest.param(33, TypeError, id="Wrong input type - int"),
+            pytest.param("Ethernet1", ValueError, id="Not integers"),
+            pytest.param("4-2", ValueError, id="Wrong range"),
+        ],
+    )
+    def test_range_expand_to_int_set_invalid(self, input_value: Any, expected_raise: Exception) -> None:
+        with pytest.raises(expected_raise):
+            range_expand_to_int_set(input_value)
@@ -167,3 +167,19 @@ class TestAvdSchema:
         assert len(validation_errors) > 0
         for validation_error in validation_errors:
             assert isinstance(validation_error, AvdValidationError)
+
+    def test_avd_schema_validate_dynamic_valid_values(self) -> None:
+        test_schema = {
+            "type": "dict",
+            "keys": {
+                "vrfs": {"type": "list", "items": {"type": "dict", "keys": {"name": {"type": "str"}}}},
+                "vrf": {"type": "str", "valid_values": ["default"], "dynamic_valid_values": ["vrfs.name"]},
+            },
+        }
+        avdschema = AvdSchema(test_schema)
+        assert not list(avdschema.validate({"vrfs": [{"name": "foo"}, {"name": "bar"}], "vrf": "bar"}))
+        assert not list(avdschema.validate({"vrfs": [{"name": "foo"}], "vrf": "default"}))
+        # Dynamic valid values from previous validations must not be valid.
+        validation_errors = list(avdschema.validate({"vrfs": [{"name": "foo"}], "vrf": "bar"}))
+        assert len(validation_errors) == 1
+        assert str(validation_errors[0]) == "'Validation Error: vrf': 'bar' is not one of ['default', 'foo']"
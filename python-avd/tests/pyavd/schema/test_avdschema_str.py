@@ -14,8 +14,6 @@ from pyavd._errors import AvdValidationError
 from pyavd._schema.avdschema import AvdSchema
 
 # TODO: Test dynamic valid values.
-#       Test formats once that is implemented - replacing format.
-#       Test format
 #       Test default value with required False.
 
 TEST_SCHEMA = {
@@ -100,3 +98,27 @@ def test_generated_schema(test_value: Any, expected_errors: tuple | None, expect
     else:
         # No errors expected.
         assert not validation_errors
+
+
+FORMAT_TESTS = [
+    # Format, valid values, invalid values
+    ("ipv4", ("10.0.0.1", "0.0.0.0", "255.255.255.255"), ("10.0.0.256", "10.0.0", "10.0.0.1/32", "010.0.0.1", "foo")),  # noqa: S104
+    ("ipv4_cidr", ("10.0.0.0/8", "10.0.0.1/32", "0.0.0.0/0"), ("10.0.0.1", "10.0.0.1/33", "10.0.0.1/", "10.0.0.300/24", "2001:db8::/32")),
+    ("ipv6", ("2001:db8::1", "::", "fd5a:fe45:8831:06c5::a", "::ffff:10.0.0.1"), ("2001:db8::g", "2001:db8::1/64", "fe80::1%Ethernet1", "10.0.0.1")),
+    ("ipv6_cidr", ("2001:db8::/32", "2001:db8::1/128", "::/0"), ("2001:db8::1", "2001:db8::/129", "2001:db8::/01", "10.0.0.0/8")),
+    ("ip", ("10.0.0.1", "2001:db8::1"), ("10.0.0.1/32", "2001:db8::/32", "foo")),
+    ("cidr", ("10.0.0.0/8", "2001:db8::/32"), ("10.0.0.1", "2001:db8::1", "foo/24")),
+]
+
+
+@pytest.mark.parametrize(("value_format", "valid_values", "invalid_values"), FORMAT_TESTS)
+def test_format(value_format: str, valid_values: tuple, invalid_values: tuple) -> None:
+    avd_schema = AvdSchema({"type": "dict", "keys": {"test_value": {"type": "str", "format": value_format}}})
+    for valid_value in valid_values:
+        assert not list(avd_schema.validate({"test_value": valid_value})), valid_value
+
+    for invalid_value in invalid_values:
+        validation_errors = list(avd_schema.validate({"test_value": invalid_value}))
+        assert len(validation_errors) == 1, invalid_value
+        assert isinstance(validation_errors[0], AvdValidationError)
+        assert f"The value '{invalid_value}' is not a valid" in str(validation_errors[0])
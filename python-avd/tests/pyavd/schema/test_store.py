@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import gc
+import weakref
+from copy import deepcopy
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dump, dumps, loads
+
+from pyavd._schema.avddataconverter import AvdDataConverter
+from pyavd._schema.avdschema import AvdSchema
+from pyavd._schema.avdvalidator import AvdValidator
+from pyavd._schema.store import LazySchemaKeys, SchemaStore, create_store, dump_schema, load_schema
+
+TEST_SCHEMA = {
+    "type": "dict",
+    "keys": {
+        "key1": {"type": "str", "required": True},
+        "key2": {"type": "list", "items": {"type": "int"}},
+    },
+    "dynamic_keys": {"key1": {"type": "bool"}},
+}
+
+
+def test_dump_and_load_schema(tmp_path: Path) -> None:
+    schema_file = tmp_path.joinpath("test.schema.pickle")
+    with schema_file.open("wb") as stream:
+        dump_schema(TEST_SCHEMA, stream)
+
+    schema = load_schema(schema_file)
+    keys = schema["keys"]
+    assert isinstance(keys, LazySchemaKeys)
+    # Order of the schema and the keys is retained.
+    assert list(schema) == list(TEST_SCHEMA)
+    assert list(keys) == ["key1", "key2"]
+    assert "key2" in keys
+    assert "key3" not in keys
+    assert keys.required_keys == {"key1"}
+    # Key schemas are loaded on demand.
+    assert not keys._loaded
+    assert keys["key2"] == TEST_SCHEMA["keys"]["key2"]
+    assert list(keys._loaded) == ["key2"]
+    assert schema == TEST_SCHEMA
+
+    # Copies and pickles of the lazy keys are regular dicts.
+    assert type(deepcopy(keys)) is dict
+    assert loads(dumps(schema)) == TEST_SCHEMA  # noqa: S301
+
+    schema = load_schema(schema_file, lazy=False)
+    assert type(schema["keys"]) is dict
+    assert schema == TEST_SCHEMA
+
+
+def test_load_schema_regular_pickle(tmp_path: Path) -> None:
+    schema_file = tmp_path.joinpath("test.schema.pickle")
+    with schema_file.open("wb") as stream:
+        dump(TEST_SCHEMA, stream, HIGHEST_PROTOCOL)
+
+    assert load_schema(schema_file) == TEST_SCHEMA
+
+
+def test_create_store() -> None:
+    store = create_store()
+    assert isinstance(store, SchemaStore)
+    assert list(store) == ["avd_meta_schema", "eos_cli_config_gen", "eos_designs"]
+    assert store["eos_designs"]["type"] == "dict"
+    assert store["eos_designs"] is store["eos_designs"]
+
+
+def test_store_get_compiled(tmp_path: Path) -> None:
+    schema_file = tmp_path.joinpath("test.schema.pickle")
+    with schema_file.open("wb") as stream:
+        dump_schema(TEST_SCHEMA, stream)
+    store = SchemaStore({"test": schema_file})
+
+    validator = store.get_compiled("test", AvdValidator)
+    assert isinstance(validator, AvdValidator)
+    assert validator.schema is store["test"]
+    # Compiled once per schema and compiler.
+    assert store.get_compiled("test", AvdValidator) is validator
+    assert isinstance(store.get_compiled("test", AvdDataConverter), AvdDataConverter)
+
+
+def test_avdschema_compiled_schemas() -> None:
+    # Builtin schemas share the validator and converter compiled by the store.
+    avdschema = AvdSchema(schema_id="eos_designs")
+    assert AvdSchema(schema_id="eos_designs")._validator is avdschema._validator
+    assert AvdSchema(schema_id="eos_designs")._dataconverter is avdschema._dataconverter
+
+    # Other schemas are compiled per instance and released with it.
+    avdschema = AvdSchema(schema=TEST_SCHEMA)
+    validator = weakref.ref(avdschema._validator)
+    assert AvdSchema(schema=TEST_SCHEMA)._validator is not validator()
+    del avdschema
+    gc.collect()
+    assert validator() is None
@@ -0,0 +1,51 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from jinja2 import TemplateNotFound
+
+from pyavd.constants import EOS_CLI_CONFIG_GEN_JINJA2_CONFIG_TEMPLATE, EOS_CLI_CONFIG_GEN_JINJA2_PRECOMPILED_TEMPLATE_PATH, RUNNING_FROM_SRC
+from pyavd.templater import EosCliConfigGenTemplar, EosDesignsTemplar, Templar
+
+
+def test_shared_templar_is_reused() -> None:
+    templar = EosCliConfigGenTemplar()
+    assert isinstance(templar, Templar)
+    assert EosCliConfigGenTemplar() is templar
+    assert EosDesignsTemplar() is EosDesignsTemplar()
+
+    # The compiled template is kept in the Jinja2 cache of the shared environment.
+    template = templar.environment.get_template(EOS_CLI_CONFIG_GEN_JINJA2_CONFIG_TEMPLATE)
+    EosCliConfigGenTemplar().render_template_from_file(EOS_CLI_CONFIG_GEN_JINJA2_CONFIG_TEMPLATE, {})
+    assert EosCliConfigGenTemplar().environment.get_template(EOS_CLI_CONFIG_GEN_JINJA2_CONFIG_TEMPLATE) is template
+
+
+def test_shared_templar_created_once_across_threads() -> None:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        templars = list(executor.map(lambda _: EosDesignsTemplar(), range(32)))
+    assert all(templar is templars[0] for templar in templars)
+
+
+def test_shared_templars_are_separate_per_template_path() -> None:
+    eos_cli_config_gen_templar = EosCliConfigGenTemplar()
+    eos_designs_templar = EosDesignsTemplar()
+    assert eos_cli_config_gen_templar is not eos_designs_templar
+    assert eos_cli_config_gen_templar.environment is not eos_designs_templar.environment
+    # The eos_designs templar must not find the eos_cli_config_gen templates.
+    with pytest.raises(TemplateNotFound):
+        eos_designs_templar.environment.get_template(EOS_CLI_CONFIG_GEN_JINJA2_CONFIG_TEMPLATE)
+
+
+@pytest.mark.skipif(not RUNNING_FROM_SRC, reason="Search paths are only used when running from source")
+def test_templar_with_searchpaths_is_not_shared(tmp_path: Path) -> None:
+    tmp_path.joinpath("custom.j2").write_text("hello {{ name }}")
+    templar = Templar(precompiled_templates_path=EOS_CLI_CONFIG_GEN_JINJA2_PRECOMPILED_TEMPLATE_PATH, searchpaths=[str(tmp_path)])
+    assert templar is not EosCliConfigGenTemplar()
+    assert templar.render_template_from_file("custom.j2", {"name": "world"}) == "hello world"
+
+    # The search path of the other instance does not leak into the shared instance.
+    with pytest.raises(TemplateNotFound):
+        EosCliConfigGenTemplar().render_template_from_file("custom.j2", {"name": "world"})
@@ -37,3 +37,25 @@ class TestMerge:
         merge_result = {}
         merge(merge_result, acl1, acl2, list_merge="replace", schema=schema)
         assert merge_result == acl2
+
+    @pytest.mark.parametrize(
+        ("list_merge", "expected"),
+        [
+            pytest.param("append", [{"name": "a", "v": 2}, {"name": "b"}, {"name": "c"}], id="append"),
+            pytest.param("prepend", [{"name": "c"}, {"name": "a", "v": 2}, {"name": "b"}], id="prepend"),
+            pytest.param("append_rp", [{"name": "a", "v": 2}, {"name": "b"}, {"name": "c"}], id="append_rp"),
+            pytest.param("prepend_rp", [{"name": "c"}, {"name": "a", "v": 2}, {"name": "b"}], id="prepend_rp"),
+            pytest.param("keep", [{"name": "a", "v": 2}, {"name": "b"}], id="keep"),
+        ],
+    )
+    def test_list_merge_with_primary_key(self, list_merge: str, expected: list) -> None:
+        """Items with matching primary keys are merged. Remaining items are merged with the given list_merge strategy."""
+        schema = AvdSchema({"type": "dict", "keys": {"items": {"type": "list", "primary_key": "name", "items": {"type": "dict"}}}})
+        merge_result = {"items": [{"name": "a", "v": 1}, {"name": "b"}]}
+        merge(merge_result, {"items": [{"name": "a", "v": 2}, {"name": "c"}]}, list_merge=list_merge, schema=schema)
+        assert merge_result == {"items": expected}
+
+    def test_same_key_strategy_must_match(self) -> None:
+        assert merge({"a": {"b": 1}}, {"a": {"b": 1}}, same_key_strategy="must_match") == {"a": {"b": 1}}
+        with pytest.raises(ValueError, match=r"Values of a\.b do not match"):
+            merge({"a": {"b": 1}}, {"a": {"b": 2}}, same_key_strategy="must_match")
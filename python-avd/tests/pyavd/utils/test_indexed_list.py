@@ -0,0 +1,64 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import pytest
+
+from pyavd._errors import AristaAvdDuplicateDataError
+from pyavd._utils import IndexedList, append_if_not_duplicate, get_item
+
+CONTEXT = {"context": "Ethernet interfaces", "context_keys": ["name"]}
+
+
+def test_indexed_list_append_if_not_duplicate() -> None:
+    indexed_list = IndexedList("name")
+    append_if_not_duplicate(list_of_dicts=indexed_list, primary_key="name", new_dict={"name": "Ethernet2", "description": "foo"}, **CONTEXT)
+    append_if_not_duplicate(list_of_dicts=indexed_list, primary_key="name", new_dict={"name": "Ethernet1"}, **CONTEXT)
+    # Identical item is ignored
+    append_if_not_duplicate(list_of_dicts=indexed_list, primary_key="name", new_dict={"name": "Ethernet2", "description": "foo"}, **CONTEXT)
+    assert indexed_list.to_list() == [{"name": "Ethernet2", "description": "foo"}, {"name": "Ethernet1"}]
+
+    with pytest.raises(AristaAvdDuplicateDataError):
+        append_if_not_duplicate(list_of_dicts=indexed_list, primary_key="name", new_dict={"name": "Ethernet2", "description": "bar"}, **CONTEXT)
+
+
+def test_indexed_list_get_item() -> None:
+    indexed_list = IndexedList("id")
+    indexed_list.replace_or_append({"id": 1, "name": "one"})
+    indexed_list.replace_or_append({"id": 2, "name": "two"})
+    assert get_item(indexed_list, "id", 2) == {"id": 2, "name": "two"}
+    assert get_item(indexed_list, "id", 3) is None
+    assert get_item(indexed_list, "id", 3, default="missing") == "missing"
+    # Lookup on another key than the primary key falls back to scanning the items.
+    assert get_item(indexed_list, "name", "one") == {"id": 1, "name": "one"}
+
+
+def test_indexed_list_replace_or_append() -> None:
+    indexed_list = IndexedList("id")
+    indexed_list.replace_or_append({"id": 1, "name": "one"})
+    indexed_list.replace_or_append({"id": 2, "name": "two"})
+    indexed_list.replace_or_append({"id": 1, "name": "new"})
+    assert len(indexed_list) == 2
+    assert indexed_list.to_list() == [{"id": 1, "name": "new"}, {"id": 2, "name": "two"}]
+
+
+def test_indexed_list_append() -> None:
+    indexed_list = IndexedList("id")
+    indexed_list.append({"id": 1, "name": "one"})
+    with pytest.raises(ValueError, match="already exists"):
+        indexed_list.append({"id": 1, "name": "other"})
+    assert indexed_list.to_list() == [{"id": 1, "name": "one"}]
+
+
+def test_indexed_list_append_if_not_duplicate_other_primary_key() -> None:
+    context = {"context": "VLANs", "context_keys": ["id", "name"]}
+    indexed_list = IndexedList("id")
+    append_if_not_duplicate(list_of_dicts=indexed_list, primary_key="name", new_dict={"id": 1, "name": "one"}, **context)
+    # New name and new id is appended.
+    append_if_not_duplicate(list_of_dicts=indexed_list, primary_key="name", new_dict={"id": 2, "name": "two"}, **context)
+    # Same name with conflicting data is a duplicate, even if the id is different.
+    with pytest.raises(AristaAvdDuplicateDataError):
+        append_if_not_duplicate(list_of_dicts=indexed_list, primary_key="name", new_dict={"id": 3, "name": "two"}, **context)
+    # New name with an existing id must not silently replace the existing item.
+    with pytest.raises(AristaAvdDuplicateDataError):
+        append_if_not_duplicate(list_of_dicts=indexed_list, primary_key="name", new_dict={"id": 1, "name": "new"}, **context)
+    assert indexed_list.to_list() == [{"id": 1, "name": "one"}, {"id": 2, "name": "two"}]